@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from urllib import parse
 
 from codemagic.utilities import log
 
+from .api_key_pool import ApiKeyPool
+from .api_key_pool import get_bearer_token
+from .api_request_memo import ApiRequestMemo
+from .api_request_metrics import ApiRequestMetrics
+from .api_response_cache import ApiResponseCache
+from .api_response_stream import ApiResponseStream
 from .api_session import AppStoreConnectApiSession
 from .app_store_publishing import AppStoreVersionPhasedReleases
 from .apps import Apps
@@ -47,6 +55,11 @@ class AppStoreConnectApiClient:
         unauthorized_request_retries: int = 1,
         server_error_retries: int = 1,
         enable_jwt_cache: bool = False,
+        max_concurrent_requests: int = AppStoreConnectApiSession.DEFAULT_MAX_CONCURRENT_REQUESTS,
+        enable_response_cache: bool = False,
+        memoize_requests: bool = False,
+        additional_api_keys: Sequence[ApiKey] = (),
+        request_metrics: Optional[ApiRequestMetrics] = None,
     ):
         """
         :param key_identifier: Your private key ID from App Store Connect (Ex: 2X9R4HXF34)
@@ -56,16 +69,37 @@ class AppStoreConnectApiClient:
         :param log_requests: Whether or not to log App Store Connect API requests and responses to STDOUT
         :param enable_jwt_cache: Whether or not to allow loading and writing generated App Store Connect
                                  JSON Web Token from or to a file cache.
+        :param max_concurrent_requests: Maximum number of App Store Connect API requests that are
+                                        allowed to be in flight at once when requests are made concurrently
+        :param enable_response_cache: Whether or not to cache App Store Connect API responses on disk
+                                      and revalidate them using conditional requests
+        :param memoize_requests: Whether or not to reuse responses of identical GET requests for the
+                                 lifetime of the client. Memoized responses are invalidated when
+                                 resources of the same type are modified using this client.
+        :param additional_api_keys: Other API keys from the same team. If given, requests are spread
+                                    over all the keys based on their remaining hourly request quota.
+        :param request_metrics: If given, timings, response sizes and retries of all the requests
+                                are recorded to it
         """
         self._logger = log.get_logger(self.__class__)
         self._api_key = ApiKey(key_identifier, issuer_id, private_key)
-        self._jwt_manager = JsonWebTokenManager(self._api_key, enable_cache=enable_jwt_cache)
+        self._api_key_pool: Optional[ApiKeyPool] = None
+        if additional_api_keys:
+            self._api_key_pool = ApiKeyPool([self._api_key, *additional_api_keys], enable_jwt_cache=enable_jwt_cache)
+            self._jwt_manager = self._api_key_pool.get_key(key_identifier).jwt_manager
+        else:
+            self._jwt_manager = JsonWebTokenManager(self._api_key, enable_cache=enable_jwt_cache)
         self.session = AppStoreConnectApiSession(
             self.generate_auth_headers,
             log_requests=log_requests,
             unauthorized_request_retries=unauthorized_request_retries,
             server_error_retries=server_error_retries,
-            revoke_auth_info=self._jwt_manager.revoke,
+            revoke_auth_info=self.revoke_auth_headers,
+            max_concurrent_requests=max_concurrent_requests,
+            response_cache=ApiResponseCache(f"{issuer_id}/{key_identifier}") if enable_response_cache else None,
+            request_memo=ApiRequestMemo() if memoize_requests else None,
+            api_key_pool=self._api_key_pool,
+            request_metrics=request_metrics,
         )
 
     @property
@@ -74,39 +108,120 @@ class AppStoreConnectApiClient:
         return jwt.token
 
     def generate_auth_headers(self) -> Dict[str, str]:
+        if self._api_key_pool is not None:
+            return self._api_key_pool.generate_auth_headers()
         return {"Authorization": f"Bearer {self.jwt}"}
 
+    def revoke_auth_headers(self, auth_headers: Dict[str, str]):
+        if self._api_key_pool is not None:
+            self._api_key_pool.revoke_auth_headers(auth_headers)
+        else:
+            self._jwt_manager.revoke(get_bearer_token(auth_headers))
+
     @classmethod
     def _get_pagination_page_size(cls, page_size: Optional[int], limit: Optional[int]) -> Optional[int]:
         if page_size is not None and limit is not None:
             return min(page_size, limit)
         return page_size or limit
 
-    def _paginate(
+    def _iter_paginate(
         self,
         url: str,
-        params: Dict,
+        params: Optional[Dict],
         page_size: Optional[int],
         limit: Optional[int],
-    ) -> PaginateResult:
+    ) -> Iterator[PaginateResult]:
+        """
+        Lazily go through the pages of given listing endpoint. Every yielded result
+        holds the data and included resources of one page, which is fetched only
+        when the previous one has been consumed. Data of the last yielded page is
+        truncated so that at most `limit` items are yielded in total.
+        """
         params = {k: v for k, v in (params or {}).items() if v is not None}
         page_size = self._get_pagination_page_size(page_size, limit)
         if page_size is None:
             response = self.session.get(url, params=params).json()
         else:
             response = self.session.get(url, params={"limit": page_size, **params}).json()
-        result = PaginateResult(response.get("data", []), response.get("included", []))
-        while "next" in response["links"] and (limit is None or len(result.data) < limit):
-            # Query params from previous pagination call can be included in the next URL
-            # and duplicate parameters are not allowed, so we need to filter those out.
-            parsed_url = parse.urlparse(response["links"]["next"])
-            included_params = parse.parse_qs(parsed_url.query)
-            step_params = {k: v for k, v in params.items() if k not in included_params}
+
+        items_count = 0
+        while True:
+            data = response.get("data", [])
+            if limit is not None:
+                data = data[: limit - items_count]
+            items_count += len(data)
+            yield PaginateResult(data, response.get("included", []))
+
+            if "next" not in response["links"] or (limit is not None and items_count >= limit):
+                break
+            step_params = self._get_next_page_params(response["links"]["next"], params)
             response = self.session.get(response["links"]["next"], params=step_params).json()
-            result.data.extend(response["data"])
-            result.included.extend(response.get("included", []))
+
+    @classmethod
+    def _get_next_page_params(cls, next_page_url: str, params: Dict) -> Dict:
+        # Query params from previous pagination call can be included in the next URL
+        # and duplicate parameters are not allowed, so we need to filter those out.
+        parsed_url = parse.urlparse(next_page_url)
+        included_params = parse.parse_qs(parsed_url.query)
+        return {k: v for k, v in params.items() if k not in included_params}
+
+    def _iter_paginate_items(
+        self,
+        url: str,
+        params: Optional[Dict],
+        page_size: Optional[int],
+        limit: Optional[int],
+    ) -> Iterator[Dict]:
+        """
+        Lazily go through the data of given listing endpoint without included resources.
+        Response bodies are streamed and items are yielded one by one as soon as those
+        are decoded, so that pages of large resources are not decoded all at once.
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        page_size = self._get_pagination_page_size(page_size, limit)
+        page_url: Optional[str] = url
+        page_params = params if page_size is None else {"limit": page_size, **params}
+
+        items_count = 0
+        while page_url is not None:
+            response_stream = ApiResponseStream(self.session.get(page_url, params=page_params, stream=True))
+            try:
+                for item in response_stream.iter_items():
+                    yield item
+                    items_count += 1
+                    if limit is not None and items_count >= limit:
+                        return
+                page_url = response_stream.get_members()["links"].get("next")
+            finally:
+                response_stream.close()
+            if page_url is not None:
+                page_params = self._get_next_page_params(page_url, params)
+
+    def _paginate(
+        self,
+        url: str,
+        params: Optional[Dict],
+        page_size: Optional[int],
+        limit: Optional[int],
+    ) -> PaginateResult:
+        result = PaginateResult([], [])
+        for page in self._iter_paginate(url, params, page_size, limit):
+            result.data.extend(page.data)
+            result.included.extend(page.included)
         return result
 
+    def iter_paginate(self, url, params=None, page_size: Optional[int] = 100, limit=None) -> Iterator[Dict]:
+        return self._iter_paginate_items(url, params, page_size, limit)
+
+    def iter_paginate_with_included(
+        self,
+        url,
+        params=None,
+        page_size: Optional[int] = 100,
+        limit=None,
+    ) -> Iterator[PaginateResult]:
+        return self._iter_paginate(url, params, page_size, limit)
+
     def paginate(self, url, params=None, page_size: Optional[int] = 100, limit=None) -> List[Dict]:
         return self._paginate(url, params, page_size, limit).data
 
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import jwt
+
+from codemagic.utilities import log
+
+from .api_rate_limiter import ApiRateLimiter
+from .json_web_token_manager import JsonWebTokenManager
+from .type_declarations import ApiKey
+from .type_declarations import KeyIdentifier
+
+
+def get_bearer_token(auth_headers: Dict[str, str]) -> Optional[str]:
+    authorization = auth_headers.get("Authorization", "")
+    return authorization[len("Bearer ") :] if authorization.startswith("Bearer ") else None
+
+
+class PooledApiKey:
+    """
+    App Store Connect API key together with its own JSON web tokens and request quota
+    """
+
+    def __init__(self, api_key: ApiKey, enable_jwt_cache: bool = False):
+        self.api_key = api_key
+        self.jwt_manager = JsonWebTokenManager(api_key, enable_cache=enable_jwt_cache)
+        self.rate_limiter = ApiRateLimiter()
+
+    @property
+    def identifier(self) -> KeyIdentifier:
+        return self.api_key.identifier
+
+    def generate_auth_headers(self) -> Dict[str, str]:
+        token = self.jwt_manager.get_jwt().token
+        return {"Authorization": f"Bearer {token}"}
+
+
+class ApiKeyPool:
+    """
+    Spread App Store Connect API requests over several API keys of the same team.
+    Hourly request quota is accounted for every key separately, and requests are
+    signed with the key that has the most requests left. Keys whose quota is not
+    known yet take turns. Once the quota of a key is exhausted, requests fail over
+    to other keys of the pool.
+    """
+
+    def __init__(self, api_keys: Sequence[ApiKey], enable_jwt_cache: bool = False):
+        if not api_keys:
+            raise ValueError("API key pool requires at least one API key")
+        self._logger = log.get_logger(self.__class__)
+        self._keys: Dict[KeyIdentifier, PooledApiKey] = {}
+        for api_key in api_keys:
+            self._keys.setdefault(api_key.identifier, PooledApiKey(api_key, enable_jwt_cache=enable_jwt_cache))
+        # Keys can be selected concurrently by API session workers
+        self._lock = threading.Lock()
+        self._next_key_index = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> List[PooledApiKey]:
+        return list(self._keys.values())
+
+    def get_key(self, key_identifier: KeyIdentifier) -> PooledApiKey:
+        return self._keys[key_identifier]
+
+    def find_key(self, auth_headers: Dict[str, str]) -> Optional[PooledApiKey]:
+        """
+        Find the key that was used to sign the token in given authorization headers
+        """
+        token = get_bearer_token(auth_headers)
+        if token is None:
+            return None
+        try:
+            key_identifier = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError:
+            return None
+        return self._keys.get(KeyIdentifier(key_identifier)) if key_identifier else None
+
+    def select_key(self) -> PooledApiKey:
+        with self._lock:
+            keys = self.keys
+            # Start from a different key every time so that keys with equal quota take turns
+            keys = keys[self._next_key_index :] + keys[: self._next_key_index]
+            self._next_key_index = (self._next_key_index + 1) % len(keys)
+        return max(keys, key=lambda key: key.rate_limiter.available_requests)
+
+    def has_available_key(self) -> bool:
+        return any(key.rate_limiter.available_requests >= 1 for key in self._keys.values())
+
+    def exhaust_key(self, auth_headers: Dict[str, str]) -> bool:
+        """
+        Mark the quota of the key that signed given authorization headers as exhausted.
+        Returns whether there are other keys in the pool that can be used instead.
+        """
+        key = self.find_key(auth_headers)
+        if key is None or len(self._keys) == 1:
+            return False
+        key.rate_limiter.exhaust()
+        if not self.has_available_key():
+            return False
+        self._logger.debug("Request quota of App Store Connect API key %r is exhausted", key.identifier)
+        return True
+
+    def generate_auth_headers(self) -> Dict[str, str]:
+        return self.select_key().generate_auth_headers()
+
+    def revoke_auth_headers(self, auth_headers: Dict[str, str]):
+        key = self.find_key(auth_headers)
+        if key is not None:
+            key.jwt_manager.revoke(get_bearer_token(auth_headers))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from typing import NamedTuple
+from typing import Optional
+
+from codemagic.utilities import log
+
+
+class RateLimit(NamedTuple):
+    limit: int
+    remaining: int
+
+    @classmethod
+    def from_header(cls, header_value: Optional[str]) -> Optional[RateLimit]:
+        """
+        Parse rate limit information from App Store Connect API response header X-Rate-Limit.
+        Header value has format "user-hour-lim:3600;user-hour-rem:3545;". See
+        https://developer.apple.com/documentation/appstoreconnectapi/identifying_rate_limits
+        """
+        if not header_value:
+            return None
+        values = dict(re.findall(r"([\w-]+):(\d+)", header_value))
+        try:
+            return RateLimit(int(values["user-hour-lim"]), int(values["user-hour-rem"]))
+        except KeyError:
+            return None
+
+
+class ApiRateLimiter:
+    """
+    Client side token bucket for App Store Connect API requests. The bucket is
+    configured by the rate limit information from API responses: its capacity is
+    the hourly request limit, and it refills evenly during the hour. Until the
+    first rate limit information is received requests are not throttled.
+    """
+
+    REFILL_PERIOD_SECONDS = 60 * 60
+    # Default hourly request limit of App Store Connect API keys
+    DEFAULT_HOURLY_LIMIT = 3600
+
+    def __init__(self):
+        self._logger = log.get_logger(self.__class__)
+        self._lock = threading.Lock()
+        self._capacity: Optional[float] = None
+        self._tokens: float = 0.0
+        self._updated_at = time.monotonic()
+
+    @property
+    def _refill_rate(self) -> float:
+        if not self._capacity:
+            return 0.0
+        return self._capacity / self.REFILL_PERIOD_SECONDS
+
+    def _refill(self):
+        now = time.monotonic()
+        if self._capacity is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._refill_rate)
+        self._updated_at = now
+
+    def update(self, rate_limit: RateLimit):
+        with self._lock:
+            self._refill()
+            if self._capacity is None:
+                self._tokens = float(rate_limit.remaining)
+            else:
+                # Server knows best how many requests are left, but requests that are
+                # still in flight have already taken their token from the bucket.
+                self._tokens = min(self._tokens, float(rate_limit.remaining))
+            self._capacity = float(rate_limit.limit)
+
+    def exhaust(self):
+        """
+        Mark the bucket empty, for example when App Store Connect API rejected a request due to
+        exceeded rate limit without reporting the remaining number of requests
+        """
+        with self._lock:
+            self._refill()
+            if self._capacity is None:
+                self._capacity = float(self.DEFAULT_HOURLY_LIMIT)
+            self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def available_requests(self) -> float:
+        """
+        Number of requests that can be made without waiting. Unlimited until
+        the first rate limit information is received.
+        """
+        with self._lock:
+            self._refill()
+            if self._capacity is None:
+                return math.inf
+            return self._tokens
+
+    def acquire(self):
+        """
+        Take a token from the bucket, wait until the bucket has been refilled if it is empty
+        """
+        with self._lock:
+            self._refill()
+            if self._capacity is None:
+                return
+            self._tokens -= 1
+            wait_seconds = -self._tokens / self._refill_rate if self._tokens < 0 and self._refill_rate else 0.0
+
+        if wait_seconds > 0:
+            self._logger.debug("App Store Connect API rate limit is nearly exhausted, wait %.2fs", wait_seconds)
+            time.sleep(wait_seconds)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+from concurrent.futures import Future
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+import requests
+
+from codemagic.utilities import log
+
+from .api_response_cache import ApiResponseCache
+
+
+class ApiRequestMemo:
+    """
+    In-memory read-through cache for App Store Connect API GET requests that lives as long
+    as the API client that uses it. Identical requests that are made concurrently are
+    coalesced into one, so that only the first of them is actually sent while the others
+    wait for its response. Memoized responses are invalidated by requests that modify
+    resources of the same type.
+    """
+
+    def __init__(self):
+        self._logger = log.get_logger(self.__class__)
+        self._lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._responses: Dict[str, Tuple[FrozenSet[str], requests.Response]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        # Incremented on every invalidation so that responses to the requests that were
+        # already in flight during invalidation are not memoized as those can be stale.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def _is_bypassed(self) -> bool:
+        return getattr(self._thread_local, "bypass", False)
+
+    @contextlib.contextmanager
+    def bypass(self) -> Iterator[None]:
+        """
+        Always send GET requests that are made from the current thread within this context
+        and refresh the memoized responses. Useful for polling changes on the server side.
+        """
+        original_bypass = self._is_bypassed
+        self._thread_local.bypass = True
+        try:
+            yield
+        finally:
+            self._thread_local.bypass = original_bypass
+
+    def _log_access(self, status: str, url: str):
+        self._logger.debug("Memoized response %s for GET %s (%d hits, %d misses)", status, url, self.hits, self.misses)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping],
+        do_request: Callable[[], requests.Response],
+    ) -> requests.Response:
+        key = ApiResponseCache.get_request_key(url, params)
+        bypass = self._is_bypassed
+
+        with self._lock:
+            if not bypass and key in self._responses:
+                self.hits += 1
+                self._log_access("hit", url)
+                return self._responses[key][1]
+
+            in_flight = None if bypass else self._in_flight.get(key)
+            if in_flight is not None:
+                self.hits += 1
+                self._log_access("hit from request in flight", url)
+                is_request_owner = False
+            else:
+                self.misses += 1
+                self._log_access("miss", url)
+                in_flight = Future()
+                if not bypass:
+                    self._in_flight[key] = in_flight
+                is_request_owner = True
+            generation = self._generation
+
+        if not is_request_owner:
+            return in_flight.result()
+        return self._fetch(key, url, params, in_flight, generation, do_request)
+
+    def _fetch(
+        self,
+        key: str,
+        url: str,
+        params: Optional[Mapping],
+        in_flight: Future,
+        generation: int,
+        do_request: Callable[[], requests.Response],
+    ) -> requests.Response:
+        try:
+            response = do_request()
+        except BaseException as error:
+            with self._lock:
+                self._forget_in_flight(key, in_flight)
+            in_flight.set_exception(error)
+            raise
+
+        with self._lock:
+            self._forget_in_flight(key, in_flight)
+            if generation == self._generation:
+                # Responses are invalidated also by changes to resources that were included in them
+                resource_types = frozenset(ApiResponseCache.get_resource_types(url, params))
+                self._responses[key] = (resource_types, response)
+        in_flight.set_result(response)
+        return response
+
+    def _forget_in_flight(self, key: str, in_flight: Future):
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+
+    def invalidate(self, url: str):
+        """
+        Forget memoized responses that reference any of the resource types from given URL
+        """
+        resource_types = set(ApiResponseCache.get_resource_types(url))
+        with self._lock:
+            self._generation += 1
+            invalidated_keys = [
+                key
+                for key, (memoized_resource_types, _response) in self._responses.items()
+                if memoized_resource_types & resource_types
+            ]
+            for key in invalidated_keys:
+                del self._responses[key]
+        if invalidated_keys:
+            self._logger.debug("Invalidated %d memoized responses for %s", len(invalidated_keys), url)
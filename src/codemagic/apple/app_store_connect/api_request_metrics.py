@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import re
+import threading
+import time
+from collections import Counter
+from collections import defaultdict
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from urllib import parse
+
+import requests
+
+from codemagic.utilities import log
+
+from .api_rate_limiter import RateLimit
+
+_API_VERSION = re.compile(r"^v\d+$")
+
+
+class ApiRequestMetric(NamedTuple):
+    """
+    Timings and outcome of one attempt to send an App Store Connect API request
+    """
+
+    method: str
+    url: str
+    status_code: int
+    attempt: int
+    started_at: float
+    time_to_headers: float
+    duration: float
+    response_size: Optional[int]
+    rate_limit: Optional[RateLimit]
+    action: Optional[str]
+    thread: str
+
+    @property
+    def endpoint(self) -> str:
+        """
+        Request method and URL path where resource identifiers are replaced with
+        a placeholder, so that requests to the same endpoint can be grouped together
+        """
+        segments = parse.urlsplit(self.url).path.split("/")
+        path = "/".join(
+            "{id}" if any(c.isdigit() for c in segment) and not _API_VERSION.match(segment) else segment
+            for segment in segments
+        )
+        return f"{self.method} {path}"
+
+    def dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "url": self.url,
+            "endpoint": self.endpoint,
+            "status_code": self.status_code,
+            "attempt": self.attempt,
+            "started_at": round(self.started_at, 6),
+            "time_to_headers": round(self.time_to_headers, 6),
+            "duration": round(self.duration, 6),
+            "response_size": self.response_size,
+            "rate_limit": self.rate_limit._asdict() if self.rate_limit else None,
+            "action": self.action,
+            "thread": self.thread,
+        }
+
+
+class ApiRequestMetrics:
+    """
+    Opt-in instrumentation of App Store Connect API requests. Every attempt to send a request
+    is recorded with its timings, response size, retry attempt, rate limit and the action that
+    made it. Recorded requests are saved either as JSON Lines, one compact object per request,
+    or as Chrome trace (when trace path has `.json` suffix) that can be opened with Perfetto
+    or chrome://tracing. Timings are measured on the client side: time to headers is the time
+    from sending the request until response headers were parsed, which includes establishing
+    the connection when it was not reused, and duration includes receiving the body unless
+    the response is streamed. Response size is the number of body bytes received over the
+    network. Streamed bodies are measured later, once the recorded metrics are read.
+    """
+
+    SLOWEST_ENDPOINTS_COUNT = 5
+
+    def __init__(self, trace_path: Optional[pathlib.Path] = None):
+        self._logger = log.get_logger(self.__class__)
+        self._trace_path = trace_path
+        self._lock = threading.Lock()
+        self._metrics: List[ApiRequestMetric] = []
+        self._streamed_responses: Dict[int, requests.Response] = {}
+        self._started_at = time.time()
+        self.action: Optional[str] = None
+
+    @property
+    def metrics(self) -> List[ApiRequestMetric]:
+        with self._lock:
+            for index, response in self._streamed_responses.items():
+                response_size = self._get_response_size(response)
+                self._metrics[index] = self._metrics[index]._replace(response_size=response_size)
+            self._streamed_responses.clear()
+            return list(self._metrics)
+
+    @classmethod
+    def _get_response_size(cls, response: requests.Response) -> Optional[int]:
+        """
+        Number of bytes that were received for the response body so far
+        """
+        try:
+            return response.raw.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        try:
+            return int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+
+    def record(
+        self,
+        response: requests.Response,
+        attempt: int,
+        started_at: float,
+        duration: float,
+        is_streamed: bool = False,
+    ) -> ApiRequestMetric:
+        metric = ApiRequestMetric(
+            method=(response.request.method or "") if response.request else "",
+            url=response.url,
+            status_code=response.status_code,
+            attempt=attempt,
+            started_at=started_at,
+            time_to_headers=response.elapsed.total_seconds(),
+            duration=duration,
+            response_size=None,
+            rate_limit=RateLimit.from_header(response.headers.get("X-Rate-Limit")),
+            action=self.action,
+            thread=threading.current_thread().name,
+        )
+        is_received = not is_streamed or not response.ok
+        if is_received:
+            # Bodies of failed responses are read for logging and auditing regardless of streaming
+            _ = response.content
+            metric = metric._replace(response_size=self._get_response_size(response))
+        with self._lock:
+            if not is_received:
+                # Streamed body is received later by the caller, measure it once it is needed
+                self._streamed_responses[len(self._metrics)] = response
+            self._metrics.append(metric)
+        return metric
+
+    def _get_chrome_trace(self, metrics: List[ApiRequestMetric]) -> Dict[str, Any]:
+        thread_ids: Dict[str, int] = {}
+        trace_events = []
+        for metric in metrics:
+            args = metric.dict()
+            trace_events.append(
+                {
+                    "name": metric.endpoint,
+                    "cat": metric.action or "api",
+                    "ph": "X",
+                    "ts": round((metric.started_at - self._started_at) * 1_000_000),
+                    "dur": round(metric.duration * 1_000_000),
+                    "pid": 1,
+                    "tid": thread_ids.setdefault(metric.thread, len(thread_ids) + 1),
+                    "args": {k: v for k, v in args.items() if k not in ("endpoint", "action", "thread")},
+                },
+            )
+        thread_names = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+            for name, tid in thread_ids.items()
+        ]
+        return {"traceEvents": [*thread_names, *trace_events], "displayTimeUnit": "ms"}
+
+    def save_trace(self) -> Optional[pathlib.Path]:
+        if self._trace_path is None:
+            return None
+
+        metrics = self.metrics
+        self._trace_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._trace_path.open("w") as fd:
+            if self._trace_path.suffix == ".json":
+                json.dump(self._get_chrome_trace(metrics), fd, separators=(",", ":"))
+            else:
+                for metric in metrics:
+                    fd.write(json.dumps(metric.dict(), separators=(",", ":")))
+                    fd.write("\n")
+        return self._trace_path
+
+    def get_summary(self) -> List[str]:
+        metrics = self.metrics
+        if not metrics:
+            return ["No App Store Connect API requests were made"]
+
+        total_bytes = sum(metric.response_size or 0 for metric in metrics)
+        total_seconds = sum(metric.duration for metric in metrics)
+        retries = sum(1 for metric in metrics if metric.attempt > 1)
+        lines = [
+            (
+                f"App Store Connect API requests: {len(metrics)} ({retries} retried), "
+                f"{total_seconds:.2f}s in total, {total_bytes / 1024:.1f} KiB received"
+            ),
+            "Requests per action:",
+        ]
+        actions = Counter(metric.action or "-" for metric in metrics)
+        lines.extend(f"  {action}: {count}" for action, count in actions.most_common())
+
+        durations: Dict[str, List[float]] = defaultdict(list)
+        for metric in metrics:
+            durations[metric.endpoint].append(metric.duration)
+        slowest_endpoints = sorted(durations.items(), key=lambda item: sum(item[1]), reverse=True)
+        lines.append("Slowest endpoints:")
+        lines.extend(
+            f"  {endpoint}: {len(seconds)} requests, {sum(seconds):.2f}s in total, "
+            f"{sum(seconds) / len(seconds):.3f}s on average, {max(seconds):.3f}s at most"
+            for endpoint, seconds in slowest_endpoints[: self.SLOWEST_ENDPOINTS_COUNT]
+        )
+        return lines
+
+    def close(self):
+        """
+        Save the trace and log summary of the recorded requests
+        """
+        trace_path = self.save_trace()
+        for line in self.get_summary():
+            self._logger.info(line)
+        if trace_path:
+            self._logger.info(f"App Store Connect API request trace was saved to {trace_path}")
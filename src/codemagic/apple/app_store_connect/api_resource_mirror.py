@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+from codemagic.apple.resources import BundleId
+from codemagic.apple.resources import BundleIdCapability
+from codemagic.apple.resources import Device
+from codemagic.apple.resources import Profile
+from codemagic.apple.resources import Resource
+from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
+from codemagic.apple.resources import SigningCertificate
+from codemagic.utilities import log
+
+from .provisioning import BundleIds
+from .provisioning import Devices
+from .provisioning import Profiles
+from .provisioning import SigningCertificates
+from .resource_manager import ResourceManager
+
+if TYPE_CHECKING:
+    from .api_client import AppStoreConnectApiClient
+
+R = TypeVar("R", bound=Resource)
+Seconds = float
+
+
+class MirroredResourceType(NamedTuple):
+    resource_type: ResourceType
+    resource_class: Type[Resource]
+    resource_manager_class: Type[ResourceManager]
+    ordering: str = "name"
+    # Sparse fieldset that is listed on every sync. Blob fields are left out from it, and are
+    # reused from the mirror unless the value of the blob key field has changed.
+    fields: Tuple[str, ...] = ()
+    blob_fields: Tuple[str, ...] = ()
+    blob_key_field: Optional[str] = None
+    include: Tuple[str, ...] = ()
+    included_fields: Optional[Mapping[ResourceType, Sequence[str]]] = None
+    # Type of the included resources that are mirrored together with the listed resources
+    included_resource_type: Optional[ResourceType] = None
+
+
+class MirrorSyncResult(NamedTuple):
+    resource_type: ResourceType
+    total: int
+    created: int
+    updated: int
+    removed: int
+    reused_blobs: int
+    duration: Seconds
+
+
+class _StoreResult(NamedTuple):
+    created: int
+    updated: int
+    removed: int
+
+
+MIRRORED_RESOURCE_TYPES: Tuple[MirroredResourceType, ...] = (
+    MirroredResourceType(
+        ResourceType.BUNDLE_ID,
+        BundleId,
+        BundleIds,
+        include=("bundleIdCapabilities",),
+        included_resource_type=ResourceType.BUNDLE_ID_CAPABILITIES,
+    ),
+    MirroredResourceType(
+        ResourceType.CERTIFICATES,
+        SigningCertificate,
+        SigningCertificates,
+        ordering="displayName",
+        fields=("displayName", "expirationDate", "name", "platform", "serialNumber", "certificateType"),
+        blob_fields=("certificateContent", "csrContent"),
+        blob_key_field="serialNumber",
+    ),
+    MirroredResourceType(ResourceType.DEVICES, Device, Devices),
+    MirroredResourceType(
+        ResourceType.PROFILES,
+        Profile,
+        Profiles,
+        fields=(
+            "name",
+            "platform",
+            "uuid",
+            "createdDate",
+            "profileState",
+            "profileType",
+            "expirationDate",
+            "bundleId",
+            "certificates",
+            "devices",
+        ),
+        blob_fields=("profileContent",),
+        blob_key_field="uuid",
+        include=("bundleId", "certificates"),
+        included_fields={ResourceType.BUNDLE_ID: ("identifier",), ResourceType.CERTIFICATES: ("serialNumber",)},
+    ),
+)
+
+
+class ApiResourceMirror:
+    """
+    Local SQLite mirror of App Store Connect provisioning resources and their relationships.
+    Resources are stored as they are returned from the API, and attribute values are indexed
+    so that filtered listings can be answered without App Store Connect API requests.
+    Mirrored resource types are refreshed with `sync`, which lists the resources using sparse
+    fieldsets and reads large blobs, such as profile and certificate contents, only for new
+    and changed resources. Mirrored resources older than `max_age` are considered stale.
+    """
+
+    DEFAULT_MAX_AGE: Seconds = 60 * 60
+    SCHEMA_VERSION = 1
+    # SQLite limits the number of parameters per statement
+    MAX_INDEXED_VALUES = 500
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resources (
+            resource_type TEXT NOT NULL,
+            id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (resource_type, id)
+        );
+        CREATE TABLE IF NOT EXISTS resource_values (
+            resource_type TEXT NOT NULL,
+            id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            value TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS resource_values_lookup ON resource_values (resource_type, name, value);
+        CREATE INDEX IF NOT EXISTS resource_values_resource ON resource_values (resource_type, id);
+        CREATE TABLE IF NOT EXISTS relationships (
+            resource_type TEXT NOT NULL,
+            id TEXT NOT NULL,
+            relationship TEXT NOT NULL,
+            related_type TEXT NOT NULL,
+            related_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS relationships_lookup ON relationships (resource_type, id, relationship);
+        CREATE INDEX IF NOT EXISTS relationships_reverse_lookup ON relationships (related_type, related_id);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            resource_type TEXT PRIMARY KEY,
+            synced_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, database_path: pathlib.Path, max_age: Seconds = DEFAULT_MAX_AGE):
+        self._logger = log.get_logger(self.__class__)
+        self.database_path = database_path
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._opened_at = time.time()
+
+    @classmethod
+    def get_default_path(cls, namespace: str) -> pathlib.Path:
+        temp_dir = pathlib.Path(tempfile.gettempdir())
+        digest = hashlib.sha256(namespace.encode()).hexdigest()
+        return temp_dir / ".codemagic-cli-tools" / "mirror" / f"app_store_connect_{digest}.sqlite3"
+
+    @classmethod
+    def get_mirrored_resource_type(cls, resource: Type[Resource]) -> Optional[MirroredResourceType]:
+        for mirrored_resource_type in MIRRORED_RESOURCE_TYPES:
+            if mirrored_resource_type.resource_class is resource:
+                return mirrored_resource_type
+        return None
+
+    @classmethod
+    def get_resource_type(cls, resource: Type[Resource]) -> Optional[ResourceType]:
+        if resource is BundleIdCapability:
+            return ResourceType.BUNDLE_ID_CAPABILITIES
+        mirrored_resource_type = cls.get_mirrored_resource_type(resource)
+        return mirrored_resource_type.resource_type if mirrored_resource_type else None
+
+    @classmethod
+    def is_mirrored(cls, resource: Type[Resource]) -> bool:
+        return cls.get_resource_type(resource) is not None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.database_path), timeout=30, check_same_thread=False)
+        schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version != self.SCHEMA_VERSION:
+            with connection:
+                for table in ("resources", "resource_values", "relationships", "sync_state"):
+                    connection.execute(f"DROP TABLE IF EXISTS {table}")
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        connection.executescript(self._SCHEMA)
+        self._connection = connection
+        return connection
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_synced_at(self, resource: Type[Resource]) -> Optional[float]:
+        resource_type = self.get_resource_type(resource)
+        if resource_type is None:
+            return None
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute("SELECT synced_at FROM sync_state WHERE resource_type = ?", (resource_type.value,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def is_fresh(self, resource: Type[Resource]) -> bool:
+        synced_at = self.get_synced_at(resource)
+        return synced_at is not None and time.time() - synced_at <= self.max_age
+
+    def is_synced_since_opened(self, resource: Type[Resource]) -> bool:
+        """
+        Whether mirrored resources of given type were refreshed after this mirror was opened
+        """
+        synced_at = self.get_synced_at(resource)
+        return synced_at is not None and synced_at >= self._opened_at
+
+    def invalidate(self, resource: Type[Resource]):
+        """
+        Mark mirrored resources of given type stale so that they are refreshed before next use
+        """
+        resource_type = self.get_resource_type(resource)
+        if resource_type is None or not self.database_path.exists():
+            return
+        with self._lock, self._get_connection() as connection:
+            connection.execute("DELETE FROM sync_state WHERE resource_type = ?", (resource_type.value,))
+
+    def list(self, resource: Type[R], resource_filter: Optional[ResourceManager.Filter] = None) -> List[R]:
+        """
+        List mirrored resources of given type that match the filter. Restrictions that
+        App Store Connect API applies exactly are looked up from the index of resource values,
+        and the found resources are checked against the whole filter the same way as API does.
+        """
+        resource_type = self.get_resource_type(resource)
+        if resource_type is None:
+            raise ValueError(f"{resource.s} are not mirrored")
+
+        if resource_filter is None:
+            resource_filter = ResourceManager.Filter()
+
+        query = "SELECT data FROM resources WHERE resource_type = ?"
+        query_params: List[Any] = [resource_type.value]
+        exact_field_names = resource_filter.get_exact_field_names()
+        for field_name, field_value in resource_filter._iter_restrictions():
+            values = field_value if resource_filter._is_multi_value(field_value) else [field_value]
+            if field_name not in exact_field_names or len(values) > self.MAX_INDEXED_VALUES:
+                continue
+            placeholders = ", ".join("?" for _ in values)
+            if field_name == "id":
+                query += f" AND id IN ({placeholders})"
+            else:
+                query += (
+                    " AND id IN (SELECT id FROM resource_values "
+                    f"WHERE resource_type = ? AND name = ? AND value IN ({placeholders}))"
+                )
+                query_params.extend((resource_type.value, resource_filter._get_field_name(field_name)))
+            query_params.extend(ResourceManager.Filter._get_param_value(value) for value in values)
+
+        with self._lock:
+            rows = self._get_connection().execute(f"{query} ORDER BY position", query_params).fetchall()
+        resources = [resource(json.loads(data)) for (data,) in rows]
+        if not resource_filter:
+            return resources
+        return [mirrored_resource for mirrored_resource in resources if resource_filter.matches(mirrored_resource)]
+
+    def read(self, resource: Type[R], resource_id: ResourceId) -> Optional[R]:
+        resource_type = self.get_resource_type(resource)
+        if resource_type is None:
+            raise ValueError(f"{resource.s} are not mirrored")
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT data FROM resources WHERE resource_type = ? AND id = ?",
+                    (resource_type.value, resource_id),
+                )
+                .fetchone()
+            )
+        return resource(json.loads(row[0])) if row else None
+
+    def list_related_ids(
+        self,
+        resource: Type[Resource],
+        resource_id: ResourceId,
+        relationship: str,
+    ) -> List[ResourceId]:
+        resource_type = self.get_resource_type(resource)
+        if resource_type is None:
+            raise ValueError(f"{resource.s} are not mirrored")
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute(
+                    "SELECT related_id FROM relationships WHERE resource_type = ? AND id = ? AND relationship = ?",
+                    (resource_type.value, resource_id, relationship),
+                )
+                .fetchall()
+            )
+        return [ResourceId(related_id) for (related_id,) in rows]
+
+    def sync(
+        self,
+        client: AppStoreConnectApiClient,
+        resource_types: Optional[Sequence[ResourceType]] = None,
+    ) -> List[MirrorSyncResult]:
+        """
+        Refresh mirrored resources of given types from App Store Connect API. By default
+        all supported resource types are refreshed, different types concurrently.
+        """
+        mirrored_resource_types = [
+            mirrored_resource_type
+            for mirrored_resource_type in MIRRORED_RESOURCE_TYPES
+            if resource_types is None
+            or mirrored_resource_type.resource_type in resource_types
+            or mirrored_resource_type.included_resource_type in resource_types
+        ]
+        results = client.session.map(
+            lambda mirrored_resource_type: self._sync_resource_type(client, mirrored_resource_type),
+            mirrored_resource_types,
+        )
+        return [result for resource_type_results in results for result in resource_type_results]
+
+    def _get_mirrored_blobs(self, mirrored_resource_type: MirroredResourceType) -> Dict[str, Dict[str, Any]]:
+        if not mirrored_resource_type.blob_fields:
+            return {}
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute(
+                    "SELECT id, data FROM resources WHERE resource_type = ?",
+                    (mirrored_resource_type.resource_type.value,),
+                )
+                .fetchall()
+            )
+        return {resource_id: json.loads(data).get("attributes") or {} for resource_id, data in rows}
+
+    def _reuse_blobs(
+        self,
+        mirrored_resource_type: MirroredResourceType,
+        resource_data: Dict,
+        mirrored_attributes: Optional[Dict[str, Any]],
+    ) -> bool:
+        key_field = mirrored_resource_type.blob_key_field
+        attributes = resource_data.setdefault("attributes", {})
+        if mirrored_attributes is None or key_field is None:
+            return False
+        if mirrored_attributes.get(key_field) != attributes.get(key_field):
+            return False
+        if any(blob_field not in mirrored_attributes for blob_field in mirrored_resource_type.blob_fields):
+            return False
+        for blob_field in mirrored_resource_type.blob_fields:
+            attributes[blob_field] = mirrored_attributes[blob_field]
+        return True
+
+    def _read_blobs(
+        self,
+        client: AppStoreConnectApiClient,
+        mirrored_resource_type: MirroredResourceType,
+        resources_data: Dict[str, Dict],
+    ):
+        resource_type = mirrored_resource_type.resource_type
+        fields = [*mirrored_resource_type.blob_fields]
+        if mirrored_resource_type.blob_key_field:
+            fields.append(mirrored_resource_type.blob_key_field)
+
+        resource_ids = list(resources_data.keys())
+        batch_size = ResourceManager.Filter.MAX_VALUES_PER_REQUEST
+        for offset in range(0, len(resource_ids), batch_size):
+            params = {
+                "filter[id]": ",".join(resource_ids[offset : offset + batch_size]),
+                f"fields[{resource_type.value}]": ",".join(fields),
+            }
+            for blob_data in client.iter_paginate(f"{client.API_URL}/{resource_type.value}", params, page_size=200):
+                attributes = resources_data[blob_data["id"]].setdefault("attributes", {})
+                attributes.update(blob_data.get("attributes") or {})
+
+    def _sync_resource_type(
+        self,
+        client: AppStoreConnectApiClient,
+        mirrored_resource_type: MirroredResourceType,
+    ) -> List[MirrorSyncResult]:
+        started_at = time.monotonic()
+        synced_at = time.time()
+        resource_type = mirrored_resource_type.resource_type
+        params = {
+            "sort": mirrored_resource_type.ordering,
+            **mirrored_resource_type.resource_manager_class._get_fieldset_params(
+                resource_type,
+                fields=mirrored_resource_type.fields,
+                include=mirrored_resource_type.include,
+                included_fields=mirrored_resource_type.included_fields,
+            ),
+        }
+
+        mirrored_blobs = self._get_mirrored_blobs(mirrored_resource_type)
+        resources_data: Dict[str, Dict] = {}
+        included_data: Dict[str, Dict] = {}
+        missing_blobs: Dict[str, Dict] = {}
+        reused_blobs = 0
+        pages = client.iter_paginate_with_included(f"{client.API_URL}/{resource_type.value}", params, page_size=200)
+        for page in pages:
+            for resource_data in page.data:
+                resources_data[resource_data["id"]] = resource_data
+                if not mirrored_resource_type.blob_fields:
+                    continue
+                if self._reuse_blobs(mirrored_resource_type, resource_data, mirrored_blobs.get(resource_data["id"])):
+                    reused_blobs += 1
+                else:
+                    missing_blobs[resource_data["id"]] = resource_data
+            for item in page.included:
+                if item["type"] == getattr(mirrored_resource_type.included_resource_type, "value", None):
+                    included_data[item["id"]] = item
+
+        if missing_blobs:
+            self._read_blobs(client, mirrored_resource_type, missing_blobs)
+
+        results = []
+        with self._lock, self._get_connection() as connection:
+            store_result = self._store(connection, resource_type, resources_data.values(), mirrored_resource_type)
+            results.append(
+                MirrorSyncResult(
+                    resource_type,
+                    len(resources_data),
+                    *store_result,
+                    reused_blobs=reused_blobs,
+                    duration=time.monotonic() - started_at,
+                ),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state (resource_type, synced_at) VALUES (?, ?)",
+                (resource_type.value, synced_at),
+            )
+            if mirrored_resource_type.included_resource_type is not None:
+                included_type = mirrored_resource_type.included_resource_type
+                store_result = self._store(connection, included_type, included_data.values())
+                results.append(
+                    MirrorSyncResult(
+                        included_type,
+                        len(included_data),
+                        *store_result,
+                        reused_blobs=0,
+                        duration=time.monotonic() - started_at,
+                    ),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (resource_type, synced_at) VALUES (?, ?)",
+                    (included_type.value, synced_at),
+                )
+
+        for result in results:
+            self._logger.debug(
+                "Synced %d %s to mirror: %d created, %d updated, %d removed, %d blobs reused",
+                result.total,
+                result.resource_type.value,
+                result.created,
+                result.updated,
+                result.removed,
+                result.reused_blobs,
+            )
+        return results
+
+    @classmethod
+    def _iter_indexed_values(
+        cls,
+        resource_data: Dict,
+        blob_fields: Set[str],
+    ) -> Iterable[Tuple[str, str]]:
+        for name, value in (resource_data.get("attributes") or {}).items():
+            if name in blob_fields or value is None or isinstance(value, (dict, list)):
+                continue
+            yield name, ResourceManager.Filter._get_param_value(value)
+
+    @classmethod
+    def _iter_relationships(cls, resource_data: Dict) -> Iterable[Tuple[str, str, str]]:
+        for relationship, relationship_data in (resource_data.get("relationships") or {}).items():
+            related_data = relationship_data.get("data")
+            if related_data is None:
+                # Relationship linkage is returned only for included relationships
+                continue
+            for related in related_data if isinstance(related_data, list) else [related_data]:
+                yield relationship, related["type"], related["id"]
+
+    def _store(
+        self,
+        connection: sqlite3.Connection,
+        resource_type: ResourceType,
+        resources_data: Iterable[Dict],
+        mirrored_resource_type: Optional[MirroredResourceType] = None,
+    ) -> _StoreResult:
+        blob_fields = set(mirrored_resource_type.blob_fields if mirrored_resource_type else ())
+        mirrored = dict(
+            connection.execute(
+                "SELECT id, data FROM resources WHERE resource_type = ?",
+                (resource_type.value,),
+            ).fetchall(),
+        )
+        created, updated = 0, 0
+        listed_ids = set()
+        for position, resource_data in enumerate(resources_data):
+            resource_id = resource_data["id"]
+            listed_ids.add(resource_id)
+            data = json.dumps(resource_data, sort_keys=True)
+            key = (resource_type.value, resource_id)
+            if mirrored.get(resource_id) == data:
+                connection.execute(
+                    "UPDATE resources SET position = ? WHERE resource_type = ? AND id = ?",
+                    (position, *key),
+                )
+                continue
+
+            if resource_id in mirrored:
+                updated += 1
+                self._delete(connection, resource_type, resource_id)
+            else:
+                created += 1
+            connection.execute(
+                "INSERT INTO resources (resource_type, id, position, data) VALUES (?, ?, ?, ?)",
+                (*key, position, data),
+            )
+            connection.executemany(
+                "INSERT INTO resource_values (resource_type, id, name, value) VALUES (?, ?, ?, ?)",
+                [(*key, name, value) for name, value in self._iter_indexed_values(resource_data, blob_fields)],
+            )
+            connection.executemany(
+                (
+                    "INSERT INTO relationships (resource_type, id, relationship, related_type, related_id) "
+                    "VALUES (?, ?, ?, ?, ?)"
+                ),
+                [(*key, *relationship) for relationship in self._iter_relationships(resource_data)],
+            )
+
+        removed_ids = set(mirrored.keys()) - listed_ids
+        for resource_id in removed_ids:
+            self._delete(connection, resource_type, resource_id)
+        return _StoreResult(created, updated, len(removed_ids))
+
+    @classmethod
+    def _delete(cls, connection: sqlite3.Connection, resource_type: ResourceType, resource_id: str):
+        for table in ("resources", "resource_values", "relationships"):
+            connection.execute(
+                f"DELETE FROM {table} WHERE resource_type = ? AND id = ?",
+                (resource_type.value, resource_id),
+            )
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+import tempfile
+import threading
+import time
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib import parse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from codemagic.utilities import log
+
+Seconds = float
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    content: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    resource_types: List[str]
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = self.content.encode()
+        return response
+
+
+class ApiResponseCache:
+    """
+    Disk cache for App Store Connect API GET responses. Responses are stored together
+    with their validators (ETag and Last-Modified headers) so that they can be revalidated
+    using conditional requests. Responses without validators are considered to be fresh
+    for the duration of `ttl`. Least recently used entries are evicted once the total
+    size of the cache exceeds `max_size` bytes. Only responses that consist of rarely
+    changing resources listed in `CACHEABLE_RESOURCE_TYPES` are cached, as the state
+    of other resources, such as builds or review submissions, is expected to be current.
+    """
+
+    DEFAULT_TTL: Seconds = 5 * 60
+    DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+    CACHEABLE_RESOURCE_TYPES = frozenset(
+        (
+            "betaGroups",
+            "bundleIdCapabilities",
+            "bundleIds",
+            "certificates",
+            "devices",
+            "profiles",
+        ),
+    )
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_directory: Optional[pathlib.Path] = None,
+        ttl: Seconds = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self._logger = log.get_logger(self.__class__)
+        self._directory = (cache_directory or self.get_default_directory()) / self._get_digest(namespace)
+        self._ttl = ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_default_directory(cls) -> pathlib.Path:
+        temp_dir = pathlib.Path(tempfile.gettempdir())
+        return temp_dir / ".codemagic-cli-tools" / "cache" / "app_store_connect_responses"
+
+    @classmethod
+    def _get_digest(cls, value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    @classmethod
+    def get_resource_types(cls, url: str, params: Optional[Mapping] = None) -> List[str]:
+        """
+        Resource types and relationships that are referenced in the path of given
+        App Store Connect API URL. For example URL path `/v1/bundleIds/{id}/profiles`
+        references resource types `bundleIds` and `profiles`. Types of the related
+        resources that are requested using `include` query parameter are referenced
+        too, for example `include=bundleId,devices` references `bundleIds` and `devices`.
+        """
+        path_segments = parse.urlparse(url).path.strip("/").split("/")
+        resource_types = [
+            segment
+            for segment in path_segments[1:]
+            if segment != "relationships" and re.fullmatch(r"[a-z]+(?:[A-Z][a-z]*)*", segment)
+        ]
+        for key, value in cls._get_query_params(url, params):
+            if key != "include":
+                continue
+            for relationship in filter(None, value.split(",")):
+                # Relationships to single resources are named in singular, for example `bundleId`
+                resource_type = relationship if relationship.endswith("s") else f"{relationship}s"
+                if resource_type not in resource_types:
+                    resource_types.append(resource_type)
+        return resource_types
+
+    @classmethod
+    def is_cacheable(cls, url: str, params: Optional[Mapping]) -> bool:
+        resource_types = cls.get_resource_types(url, params)
+        return bool(resource_types) and cls.CACHEABLE_RESOURCE_TYPES.issuperset(resource_types)
+
+    @classmethod
+    def _get_query_params(cls, url: str, params: Optional[Mapping]) -> List[Tuple[str, str]]:
+        query_params = parse.parse_qsl(parse.urlparse(url).query)
+        query_params.extend((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return sorted(query_params)
+
+    @classmethod
+    def get_request_key(cls, url: str, params: Optional[Mapping]) -> str:
+        """
+        Key that is the same for all requests to given URL with the same query parameters
+        regardless of whether the parameters are included in the URL or given separately
+        """
+        base_url = parse.urlparse(url)._replace(query="", fragment="").geturl()
+        return json.dumps([base_url, cls._get_query_params(url, params)])
+
+    def _get_entry_path(self, url: str, params: Optional[Mapping]) -> pathlib.Path:
+        key = self.get_request_key(url, params)
+        return self._directory / f"{self._get_digest(key)}.json"
+
+    def _iter_entries(self) -> Iterable[pathlib.Path]:
+        return self._directory.glob("*.json")
+
+    def _remove(self, entry_path: pathlib.Path):
+        try:
+            entry_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def get(self, url: str, params: Optional[Mapping]) -> Optional[CachedResponse]:
+        entry_path = self._get_entry_path(url, params)
+        try:
+            cached_response = CachedResponse(**json.loads(entry_path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            self._remove(entry_path)
+            return None
+
+        if not cached_response.has_validators and self._is_expired(cached_response):
+            self._remove(entry_path)
+            return None
+
+        # Keep track of recently used entries for eviction
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return cached_response
+
+    def _is_expired(self, cached_response: CachedResponse) -> bool:
+        return time.time() - cached_response.stored_at > self._ttl
+
+    def put(self, url: str, params: Optional[Mapping], response: requests.Response):
+        cached_response = CachedResponse(
+            url=response.url or url,
+            content=response.content.decode(response.encoding or "utf-8"),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            stored_at=time.time(),
+            resource_types=self.get_resource_types(url, params),
+        )
+        entry_path = self._get_entry_path(url, params)
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.{threading.get_ident()}")
+            temp_path.write_text(json.dumps(cached_response._asdict()))
+            temp_path.replace(entry_path)
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry_path in self._iter_entries():
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+            self._remove(entry_path)
+            total_size -= size
+
+    def invalidate(self, url: str):
+        """
+        Remove cached responses that reference any of the resource types from given URL
+        """
+        resource_types: Set[str] = set(self.get_resource_types(url))
+        if not resource_types:
+            return
+
+        invalidated_count = 0
+        with self._lock:
+            for entry_path in self._iter_entries():
+                try:
+                    cached_resource_types = set(json.loads(entry_path.read_text())["resource_types"])
+                except FileNotFoundError:
+                    continue
+                except (ValueError, KeyError, TypeError):
+                    cached_resource_types = resource_types
+                if cached_resource_types & resource_types:
+                    self._remove(entry_path)
+                    invalidated_count += 1
+        self._logger.debug("Invalidated %d cached responses for %s", invalidated_count, ", ".join(resource_types))
+
+    def clear(self):
+        with self._lock:
+            for entry_path in self._iter_entries():
+                self._remove(entry_path)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+import requests
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ApiResponseStream:
+    """
+    Incremental decoder for JSON documents returned by App Store Connect API. Members
+    of the top level object are decoded while the response body is being received,
+    and elements of the streamed array member (`data` of listing responses) are handed
+    over one at a time. This way a page of large resources, such as profiles or
+    certificates, is never held in memory as a whole both as text and as decoded
+    objects, and the first resources are available before the page is fully received.
+    Other members, for example `links` and `included`, are decoded as a whole.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response: requests.Response, array_key: str = "data"):
+        self._response = response
+        self._array_key = array_key
+        self._chunks = self._iter_chunks(response)
+        self._text_decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+        self._is_started = False
+        self._is_finished = False
+        self._members: Dict[str, Any] = {}
+
+    @classmethod
+    def _iter_chunks(cls, response: requests.Response) -> Iterator[bytes]:
+        if response.raw is None:
+            # Response was not received over network, for example it was restored from cache
+            return iter([response.content])
+        return response.iter_content(cls.CHUNK_SIZE)
+
+    def _read_chunk(self) -> bool:
+        if self._is_exhausted:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            text = self._text_decoder.decode(b"", final=True)
+            self._is_exhausted = True
+        else:
+            text = self._text_decoder.decode(chunk)
+        # Drop the part that is already decoded so that only pending text is kept in memory
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        return chunk is not None
+
+    def _read_more(self) -> bool:
+        """
+        Read at least as much text as is pending already so that values spanning over
+        many chunks are not decoded over and over again from the beginning
+        """
+        pending_length = len(self._buffer) - self._position
+        has_read = False
+        while self._read_chunk():
+            has_read = True
+            if len(self._buffer) - self._position >= 2 * pending_length:
+                break
+        return has_read
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _peek(self) -> str:
+        """
+        Skip whitespace and return the next character of the document without consuming it
+        """
+        while True:
+            whitespace = _WHITESPACE.match(self._buffer, self._position)
+            assert whitespace is not None
+            self._position = whitespace.end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_chunk() and self._position >= len(self._buffer):
+                raise self._error("Unexpected end of JSON document")
+
+    def _consume(self, expected_character: str):
+        if self._peek() != expected_character:
+            raise self._error(f"Expecting {expected_character!r}")
+        self._position += 1
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # Numbers can continue in the next chunk, so make sure the value is followed by something
+            if end < len(self._buffer) or not self._read_more():
+                self._position = end
+                return value
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._consume("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._peek() == "]":
+                self._position += 1
+                return
+            self._consume(",")
+
+    def _next_member_key(self) -> Optional[str]:
+        if not self._is_started:
+            self._consume("{")
+            self._is_started = True
+            if self._peek() == "}":
+                self._position += 1
+                return None
+        elif self._peek() == "}":
+            self._position += 1
+            return None
+        else:
+            self._consume(",")
+
+        key = self._decode_value()
+        if not isinstance(key, str):
+            raise self._error("Expecting property name enclosed in double quotes")
+        self._consume(":")
+        return key
+
+    def _iter_members(self) -> Iterator[str]:
+        while not self._is_finished:
+            key = self._next_member_key()
+            if key is None:
+                self._is_finished = True
+                return
+            yield key
+
+    def iter_items(self) -> Iterator[Any]:
+        """
+        Decode members of the document until the streamed array is found, and
+        yield its elements one by one as soon as they are received
+        """
+        for key in self._iter_members():
+            if key == self._array_key and self._peek() == "[":
+                yield from self._iter_array()
+                return
+            self._members[key] = self._decode_value()
+
+        value = self._members.pop(self._array_key, None)
+        if isinstance(value, list):
+            yield from value
+        elif value is not None:
+            yield value
+
+    def get_members(self) -> Dict[str, Any]:
+        """
+        Decode the rest of the document and return its members except
+        for the array elements that were already yielded
+        """
+        for key in self._iter_members():
+            self._members[key] = self._decode_value()
+        return self._members
+
+    def close(self):
+        self._response.close()
@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+import contextlib
+import email.utils
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from codemagic.utilities import auditing
 from codemagic.utilities import log
 
 from .api_error import AppStoreConnectApiError
+from .api_key_pool import ApiKeyPool
+from .api_rate_limiter import ApiRateLimiter
+from .api_rate_limiter import RateLimit
+from .api_request_memo import ApiRequestMemo
+from .api_request_metrics import ApiRequestMetrics
+from .api_response_cache import ApiResponseCache
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class AppStoreConnectApiSession(requests.Session):
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(
         self,
         auth_headers_factory: Callable[[], Dict[str, str]],
         log_requests: bool = False,
         unauthorized_request_retries: int = 1,
         server_error_retries: int = 1,
-        revoke_auth_info: Callable[[], None] = lambda: None,
+        revoke_auth_info: Callable[[Dict[str, str]], None] = lambda _auth_headers: None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        rate_limit_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+        max_retry_wait_seconds: float = 60.0,
+        response_cache: Optional[ApiResponseCache] = None,
+        request_memo: Optional[ApiRequestMemo] = None,
+        api_key_pool: Optional[ApiKeyPool] = None,
+        request_metrics: Optional[ApiRequestMetrics] = None,
     ):
         super().__init__()
         self._auth_headers_factory = auth_headers_factory
@@ -26,8 +57,45 @@ class AppStoreConnectApiSession(requests.Session):
         self._logger = log.get_logger(self.__class__, log_to_stream=log_requests)
         self._unauthorized_retries = unauthorized_request_retries
         self._server_error_retries = server_error_retries
+        self._rate_limit_retries = rate_limit_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._max_retry_wait_seconds = max_retry_wait_seconds
+        # Shared by all workers that use this session so that they slow down
+        # together before App Store Connect API starts rejecting requests.
+        self._rate_limiter = ApiRateLimiter()
+        # Requests signed by keys from the pool are accounted against the quota of the signing key
+        self._api_key_pool = api_key_pool
+        self._response_cache = response_cache
+        self._request_memo = request_memo
+        self._thread_local = threading.local()
+        self._request_metrics = request_metrics
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._connection_pool_lock = threading.Lock()
+        self._connection_pool_size = 0
+        self._ensure_connection_pool_size(self._max_concurrent_requests)
+
+    def _ensure_connection_pool_size(self, pool_size: int):
+        """
+        Keep enough connections alive so that concurrent workers do not
+        need to open a new connection for every request they make
+        """
+        with self._connection_pool_lock:
+            if pool_size <= self._connection_pool_size:
+                return
+            replaced_adapters = {self.get_adapter("https://"), self.get_adapter("http://")}
+            adapter = HTTPAdapter(pool_maxsize=pool_size)
+            self.mount("https://", adapter)
+            self.mount("http://", adapter)
+            self._connection_pool_size = pool_size
+            for replaced_adapter in replaced_adapters:
+                # Release connections pooled by the previous adapter as it is no longer reachable
+                replaced_adapter.close()
 
-    def _log_response(self, response):
+    def _log_response(self, response, is_streamed: bool = False):
+        if is_streamed and response.ok:
+            # Reading the body here would defeat streaming, it is decoded incrementally by the caller
+            self._logger.info(f"<<< {response.status_code} <streamed response body>")
+            return
         try:
             self._logger.info(f"<<< {response.status_code} {response.json()}")
         except ValueError:
@@ -41,8 +109,15 @@ class AppStoreConnectApiSession(requests.Session):
             body = {k: (v if "password" not in k.lower() else "*******") for k, v in body.items()}
         self._logger.info(f">>> {method} {url} {body}")
 
-    def _handle_unauthorized_request_response(self, attempt: int, response: requests.Response):
-        self._revoke_auth_info()
+    def _handle_unauthorized_request_response(
+        self,
+        attempt: int,
+        response: requests.Response,
+        auth_headers: Dict[str, str],
+    ):
+        # Revoke only the credentials that were used for this request as concurrent
+        # requests could have already refreshed them in the meanwhile.
+        self._revoke_auth_info(auth_headers)
         if attempt >= self._unauthorized_retries:
             self._logger.info(f"Unauthorized request retries are exhausted with {attempt} attempts, stop trying")
             raise AppStoreConnectApiError(response)
@@ -54,44 +129,211 @@ class AppStoreConnectApiSession(requests.Session):
             self._logger.info(f"Server error retries are exhausted with {attempt} attempts, stop trying")
             raise AppStoreConnectApiError(response)
 
-        self._logger.info(f"Request failed due to server error {response.status_code} on attempt #{attempt}, try again")
+        wait_seconds = self._get_backoff_seconds(attempt)
+        self._logger.info(
+            f"Request failed due to server error {response.status_code} on attempt #{attempt}, "
+            f"try again in {wait_seconds:.2f}s",
+        )
+        time.sleep(wait_seconds)
 
-    def _do_request(
-        self,
-        *request_args,
-        unauthorized_attempt: int = 1,
-        server_error_attempt: int = 1,
-        **request_kwargs,
-    ) -> requests.Response:
-        self._log_request(*request_args, **request_kwargs)
-        headers = request_kwargs.pop("headers", {})
-        headers.update(self._auth_headers_factory())
-        request_kwargs["headers"] = headers
-        response = super().request(*request_args, **request_kwargs)
-        self._log_response(response)
-
-        if response.ok:
-            return response
-
-        # Request failed, save request info and see if we can retry it
-        auditing.save_http_request_audit(response, audit_directory_name="failed-http-requests")
-
-        if response.status_code == 401:
-            self._handle_unauthorized_request_response(unauthorized_attempt, response)
-            unauthorized_attempt = unauthorized_attempt + 1
-        elif response.status_code >= 500:
-            self._handle_server_error_response(server_error_attempt, response)
-            server_error_attempt = server_error_attempt + 1
-        else:
-            # Neither authorization failure nor server error, fail immediately
+    def _handle_rate_limit_response(self, attempt: int, response: requests.Response):
+        if attempt >= self._rate_limit_retries:
+            self._logger.info(f"Rate limit retries are exhausted with {attempt} attempts, stop trying")
             raise AppStoreConnectApiError(response)
 
-        return self._do_request(
-            *request_args,
-            unauthorized_attempt=unauthorized_attempt,
-            server_error_attempt=server_error_attempt,
-            **request_kwargs,
+        retry_after = self._get_retry_after_seconds(response)
+        wait_seconds = self._get_backoff_seconds(attempt) if retry_after is None else retry_after
+        self._logger.info(
+            f"Request failed due to exceeded rate limit on attempt #{attempt}, try again in {wait_seconds:.2f}s",
+        )
+        time.sleep(wait_seconds)
+
+    def _get_backoff_seconds(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter: random delay between zero and exponentially
+        growing upper bound, so that concurrent clients do not retry in lockstep.
+        """
+        max_wait_seconds = min(self._max_retry_wait_seconds, self._retry_backoff_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, max_wait_seconds)
+
+    def _get_retry_after_seconds(self, response: requests.Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            seconds = retry_at.timestamp() - time.time()
+        return min(max(seconds, 0.0), self._max_retry_wait_seconds)
+
+    def _get_rate_limiter(self, auth_headers: Dict[str, str]) -> ApiRateLimiter:
+        pooled_key = self._api_key_pool.find_key(auth_headers) if self._api_key_pool else None
+        if pooled_key is None:
+            return self._rate_limiter
+        return pooled_key.rate_limiter
+
+    def _update_rate_limit(self, response: requests.Response, rate_limiter: ApiRateLimiter):
+        rate_limit = RateLimit.from_header(response.headers.get("X-Rate-Limit"))
+        if rate_limit is not None:
+            rate_limiter.update(rate_limit)
+
+    def _fail_over_api_key(self, auth_headers: Dict[str, str]) -> bool:
+        if self._api_key_pool is None or not self._api_key_pool.exhaust_key(auth_headers):
+            return False
+        self._logger.info("Request failed due to exceeded rate limit of the API key, try again using another key")
+        return True
+
+    def _do_request(self, *request_args, **request_kwargs) -> requests.Response:
+        unauthorized_attempt = 1
+        server_error_attempt = 1
+        rate_limit_attempt = 1
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self._log_request(*request_args, **request_kwargs)
+            headers = request_kwargs.pop("headers", {})
+            auth_headers = self._auth_headers_factory()
+            headers.update(auth_headers)
+            request_kwargs["headers"] = headers
+            rate_limiter = self._get_rate_limiter(auth_headers)
+            rate_limiter.acquire()
+            started_at = time.time()
+            response = super().request(*request_args, **request_kwargs)
+            is_streamed = request_kwargs.get("stream", False)
+            if self._request_metrics is not None:
+                self._request_metrics.record(response, attempt, started_at, time.time() - started_at, is_streamed)
+            self._log_response(response, is_streamed=is_streamed)
+            self._update_rate_limit(response, rate_limiter)
+
+            if response.ok:
+                return response
+
+            # Request failed, save request info and see if we can retry it
+            auditing.save_http_request_audit(response, audit_directory_name="failed-http-requests")
+
+            if response.status_code == 401:
+                self._handle_unauthorized_request_response(unauthorized_attempt, response, auth_headers)
+                unauthorized_attempt += 1
+            elif response.status_code == 429 and self._fail_over_api_key(auth_headers):
+                continue
+            elif response.status_code == 429:
+                self._handle_rate_limit_response(rate_limit_attempt, response)
+                rate_limit_attempt += 1
+            elif response.status_code >= 500:
+                self._handle_server_error_response(server_error_attempt, response)
+                server_error_attempt += 1
+            else:
+                # Neither authorization failure, rate limit nor server error, fail immediately
+                raise AppStoreConnectApiError(response)
+
+    def _do_cached_request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        assert self._response_cache is not None
+
+        if method.upper() != "GET":
+            try:
+                return self._do_request(method, url, *args, **kwargs)
+            finally:
+                # Resources could have been changed, make sure that stale data is not served
+                self._response_cache.invalidate(url)
+
+        params = kwargs.get("params")
+        if not self._response_cache.is_cacheable(url, params):
+            return self._do_request(method, url, *args, **kwargs)
+
+        # Cached responses are stored as a whole, so there is nothing to gain from streaming them.
+        # Cacheable resources are few in number, and thus their pages are small anyway.
+        kwargs.pop("stream", None)
+        cached_response = self._response_cache.get(url, params)
+        if cached_response and not cached_response.has_validators and not self._is_fresh_response_required:
+            self._logger.info(f">>> {method.upper()} {url} {params} served from cache")
+            return cached_response.as_response()
+        elif cached_response:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **cached_response.get_conditional_headers()}
+
+        response = self._do_request(method, url, *args, **kwargs)
+        if cached_response and response.status_code == 304:
+            return cached_response.as_response()
+
+        self._response_cache.put(url, params, response)
+        return response
+
+    def _do_cacheable_request(self, *args, **kwargs) -> requests.Response:
+        if self._response_cache is None:
+            return self._do_request(*args, **kwargs)
+        return self._do_cached_request(*args, **kwargs)
+
+    def _do_memoized_request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        assert self._request_memo is not None
+
+        if method.upper() != "GET":
+            try:
+                return self._do_cacheable_request(method, url, *args, **kwargs)
+            finally:
+                self._request_memo.invalidate(url)
+        elif kwargs.get("stream"):
+            # Streamed listing pages are decoded incrementally and are not
+            # kept in memory, which would not be the case if those were shared
+            return self._do_cacheable_request(method, url, *args, **kwargs)
+
+        return self._request_memo.get(
+            url,
+            kwargs.get("params"),
+            lambda: self._do_cacheable_request(method, url, *args, **kwargs),
         )
 
     def request(self, *args, **kwargs) -> requests.Response:
-        return self._do_request(*args, **kwargs)
+        if self._request_memo is None:
+            return self._do_cacheable_request(*args, **kwargs)
+        return self._do_memoized_request(*args, **kwargs)
+
+    @property
+    def _is_fresh_response_required(self) -> bool:
+        return getattr(self._thread_local, "fresh_responses", False)
+
+    @contextlib.contextmanager
+    def fresh_responses(self) -> Iterator[None]:
+        """
+        Context manager to make sure that GET requests from the current thread are sent
+        to App Store Connect API instead of reusing responses that were memoized earlier
+        in this session or cached on disk. Use it when polling for changes that happen
+        on App Store Connect side.
+        """
+        original_fresh_responses = self._is_fresh_response_required
+        self._thread_local.fresh_responses = True
+        try:
+            with self._request_memo.bypass() if self._request_memo else contextlib.nullcontext():
+                yield
+        finally:
+            self._thread_local.fresh_responses = original_fresh_responses
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self._max_concurrent_requests
+
+    def map(self, function: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+        """
+        Call `function` with every item from `items` concurrently and return the results
+        in the order of the items. Workers share this session, so requests made by the function
+        reuse the pooled connections, authentication and retry logic of the session.
+        At most `max_workers` calls are in flight at once, which defaults to the maximum number
+        of concurrent requests of the session. Connection pool is enlarged if more workers are
+        requested. First exception raised by the function is propagated once all the calls are done.
+        """
+        items = list(items)
+        if max_workers is None:
+            max_workers = self._max_concurrent_requests
+        max_workers = max(1, min(max_workers, len(items)))
+        if max_workers == 1:
+            return [function(item) for item in items]
+
+        self._ensure_connection_pool_size(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.__class__.__name__) as executor:
+            futures = [executor.submit(function, item) for item in items]
+        return [future.result() for future in futures]
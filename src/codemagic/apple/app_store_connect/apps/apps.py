@@ -1,11 +1,17 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
 from codemagic.apple.app_store_connect.resource_manager import ResourceManager
+from codemagic.apple.app_store_connect.type_declarations import PaginateResult
 from codemagic.apple.app_store_connect.versioning import AppStoreVersions
 from codemagic.apple.resources import App
 from codemagic.apple.resources import AppStoreState
@@ -17,6 +23,7 @@ from codemagic.apple.resources import LinkedResourceData
 from codemagic.apple.resources import Platform
 from codemagic.apple.resources import PreReleaseVersion
 from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
 
 
 class Apps(ResourceManager[App]):
@@ -38,6 +45,15 @@ class Apps(ResourceManager[App]):
         app_store_versions: Optional[str] = None
         app_store_versions_platform: Optional[Platform] = None
         app_store_versions_app_store_state: Optional[AppStoreState] = None
+        # App Store Connect API matches bundle identifiers by prefix, for example filter
+        # by "com.example.app" also returns apps with bundle ID "com.example.app.extension".
+        # Require exact match by checking the bundle identifiers of the received apps.
+        bundle_id_strict_match: bool = False
+
+        _OPTION_FIELDS = ("bundle_id_strict_match",)
+
+        def get_local_field_names(self) -> Set[str]:
+            return {"bundle_id"} if self.bundle_id_strict_match else set()
 
         @classmethod
         def _get_field_name(cls, field_name) -> str:
@@ -52,20 +68,52 @@ class Apps(ResourceManager[App]):
         NAME = "name"
         SKU = "sku"
 
-    def list(self, resource_filter: Filter = Filter(), ordering=Ordering.NAME, reverse=False) -> List[App]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[App]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_apps
         """
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        apps = self.client.paginate(f"{self.client.API_URL}/apps", params=params)
-        return [App(app) for app in apps]
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.APPS, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/apps", resource_filter, params, included)
 
-    def read(self, app: Union[LinkedResourceData, ResourceId]) -> App:
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[App]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_apps
+        """
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
+
+    def read(
+        self,
+        app: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> App:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_app_information
         """
         app_id = self._get_resource_id(app)
-        response = self.client.session.get(f"{self.client.API_URL}/apps/{app_id}").json()
+        params = self._get_fieldset_params(ResourceType.APPS, fields=fields, include=include)
+        response = self.client.session.get(f"{self.client.API_URL}/apps/{app_id}", params=params).json()
         return App(response["data"])
 
     def list_builds(self, app: Union[LinkedResourceData, ResourceId]) -> List[Build]:
@@ -111,6 +159,33 @@ class Apps(ResourceManager[App]):
         url = f"{self.client.API_URL}/apps/{app_id}/appStoreVersions"
         return self.client.paginate(url, params=params, limit=limit, page_size=page_size)
 
+    def list_app_store_versions_data_with_included(
+        self,
+        app: Union[LinkedResourceData, ResourceId],
+        resource_filter: AppStoreVersions.Filter = AppStoreVersions.Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included_fields: Optional[Mapping[ResourceType, Sequence[str]]] = None,
+        page_size: Optional[int] = 200,
+    ) -> PaginateResult:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_all_app_store_versions_for_an_app
+
+        List raw data of the App Store versions and the related resources included in the responses
+        """
+        app_id = self._get_resource_id(app)
+        params = {
+            **resource_filter.as_query_params(),
+            **self._get_fieldset_params(
+                ResourceType.APP_STORE_VERSIONS,
+                fields=fields,
+                include=include,
+                included_fields=included_fields,
+            ),
+        }
+        url = f"{self.client.API_URL}/apps/{app_id}/appStoreVersions"
+        return self.client.paginate_with_included(url, params=params, page_size=page_size)
+
     def list_app_store_versions(
         self,
         app: Union[LinkedResourceData, ResourceId],
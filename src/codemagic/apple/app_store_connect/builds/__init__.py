@@ -1 +1,4 @@
+from .build_waiter import BuildWaiter
+from .build_waiter import BuildWaitProgress
+from .build_waiter import BuildWaitState
 from .builds import Builds
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import enum
+import time
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from codemagic.apple.app_store_connect.api_error import AppStoreConnectApiError
+from codemagic.apple.resources import Build
+from codemagic.apple.resources import BuildBetaDetail
+from codemagic.apple.resources import BuildProcessingState
+from codemagic.apple.resources import ExternalBetaState
+from codemagic.apple.resources import InternalBetaState
+from codemagic.apple.resources import ResourceId
+
+from .builds import Builds
+
+
+class BuildWaitState(enum.Enum):
+    DISCOVERING = "discovering"
+    FOUND = "found"
+    PROCESSING = "processing"
+    PROCESSED = "processed"
+    FAILED = "failed"
+    TIMED_OUT = "timed out"
+
+    @property
+    def is_final(self) -> bool:
+        return self not in (BuildWaitState.DISCOVERING, BuildWaitState.PROCESSING)
+
+
+@dataclass
+class BuildWaitProgress:
+    key: str
+    state: BuildWaitState
+    checks: int
+    elapsed_seconds: float
+    build: Optional[Build] = None
+    build_beta_detail: Optional[BuildBetaDetail] = None
+    next_check_in: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _WaitEntry:
+    key: str
+    timeout: float
+    started_at: float
+    interval: float
+    next_check_at: float
+    builds_filter: Optional[Builds.Filter] = None
+    build_id: Optional[ResourceId] = None
+    wait_beta_detail: bool = True
+    checks: int = 0
+
+
+class BuildWaiter:
+    """
+    Wait for multiple builds at once until they either show up in App Store Connect
+    after upload, or until they and their beta details are processed.
+
+    Processing state of all builds that are due for a check is fetched together with
+    their beta details using one batched list request per tick. Checks are done often
+    at first and less frequently the longer the wait takes: the interval between checks
+    grows exponentially up to `max_interval` seconds, but never past the timeout of a build.
+    """
+
+    def __init__(
+        self,
+        builds: Builds,
+        on_progress: Optional[Callable[[BuildWaitProgress], None]] = None,
+        initial_interval: float = 5,
+        max_interval: float = 30,
+        backoff_factor: float = 2,
+    ):
+        self._builds = builds
+        self._on_progress = on_progress
+        self._initial_interval = min(initial_interval, max_interval)
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._entries: Dict[str, _WaitEntry] = {}
+
+    @property
+    def is_waiting(self) -> bool:
+        return bool(self._entries)
+
+    def add_discovery(self, key: str, builds_filter: Builds.Filter, timeout: float):
+        """
+        Wait until the most recently uploaded build matching the filter becomes available
+        """
+        self._add(key, timeout, builds_filter=builds_filter)
+
+    def add_processing(self, key: str, build_id: ResourceId, timeout: float, wait_beta_detail: bool = True):
+        """
+        Wait until the build, and optionally its beta detail, are processed
+        """
+        self._add(key, timeout, build_id=build_id, wait_beta_detail=wait_beta_detail)
+
+    def _add(self, key: str, timeout: float, **entry_options):
+        if key in self._entries:
+            raise ValueError(f'Already waiting for build "{key}"')
+        now = time.monotonic()
+        self._entries[key] = _WaitEntry(
+            key=key,
+            timeout=timeout,
+            started_at=now,
+            interval=self._initial_interval,
+            next_check_at=now,
+            **entry_options,
+        )
+
+    def get_seconds_until_next_check(self) -> Optional[float]:
+        if not self._entries:
+            return None
+        next_check_at = min(entry.next_check_at for entry in self._entries.values())
+        return max(0.0, next_check_at - time.monotonic())
+
+    def check(self) -> List[BuildWaitProgress]:
+        """
+        Check all builds that are due for a check. Returns progress of the builds
+        whose wait is over, those are not tracked by the waiter anymore.
+        """
+        now = time.monotonic()
+        due_entries = [entry for entry in self._entries.values() if entry.next_check_at <= now]
+        progresses = [
+            self._discover(entry, entry.builds_filter) for entry in due_entries if entry.builds_filter is not None
+        ]
+        progresses.extend(self._check_processing([entry for entry in due_entries if entry.build_id is not None]))
+
+        finished = []
+        for progress in progresses:
+            if progress.state.is_final:
+                del self._entries[progress.key]
+                finished.append(progress)
+            if self._on_progress:
+                self._on_progress(progress)
+        return finished
+
+    def wait(self) -> Dict[str, BuildWaitProgress]:
+        """
+        Block until the wait for all added builds is over
+        """
+        results: Dict[str, BuildWaitProgress] = {}
+        while self._entries:
+            results.update((progress.key, progress) for progress in self.check())
+            seconds_until_next_check = self.get_seconds_until_next_check()
+            if seconds_until_next_check:
+                time.sleep(seconds_until_next_check)
+        return results
+
+    def _discover(self, entry: _WaitEntry, builds_filter: Builds.Filter) -> BuildWaitProgress:
+        try:
+            with self._builds.client.session.fresh_responses():
+                builds = self._builds.list(
+                    builds_filter,
+                    ordering=self._builds.Ordering.UPLOADED_DATE,
+                    reverse=True,
+                )
+        except AppStoreConnectApiError as api_error:
+            return self._get_progress(entry, BuildWaitState.FAILED, error=str(api_error))
+
+        if builds:
+            return self._get_progress(entry, BuildWaitState.FOUND, build=builds[0])
+        return self._reschedule(entry, BuildWaitState.DISCOVERING)
+
+    def _check_processing(self, entries: List[_WaitEntry]) -> List[BuildWaitProgress]:
+        if not entries:
+            return []
+
+        builds_filter = self._builds.Filter(id=[entry.build_id for entry in entries if entry.build_id])
+        try:
+            with self._builds.client.session.fresh_responses():
+                listed_builds = self._builds.iter_list_with_include(BuildBetaDetail, builds_filter)
+                builds = {build.id: (build, build_beta_detail) for build, build_beta_detail in listed_builds}
+        except AppStoreConnectApiError as api_error:
+            return [self._get_progress(entry, BuildWaitState.FAILED, error=str(api_error)) for entry in entries]
+
+        progresses = []
+        for entry in entries:
+            listed_build = builds.get(entry.build_id) if entry.build_id else None
+            if listed_build is None:
+                error = f"Build {entry.build_id} was not found from App Store Connect"
+                progresses.append(self._get_progress(entry, BuildWaitState.FAILED, error=error))
+            else:
+                progresses.append(self._get_processing_progress(entry, *listed_build))
+        return progresses
+
+    def _get_processing_progress(
+        self,
+        entry: _WaitEntry,
+        build: Build,
+        build_beta_detail: Optional[BuildBetaDetail],
+    ) -> BuildWaitProgress:
+        processing_state = build.attributes.processingState
+        if processing_state is BuildProcessingState.PROCESSING:
+            return self._reschedule(entry, BuildWaitState.PROCESSING, build=build, build_beta_detail=build_beta_detail)
+        elif processing_state in (BuildProcessingState.FAILED, BuildProcessingState.INVALID):
+            error = f"Uploaded build {build.id} is {processing_state.value.lower()}"
+            return self._get_progress(entry, BuildWaitState.FAILED, build=build, error=error)
+        elif entry.wait_beta_detail and (build_beta_detail is None or self._is_processing(build_beta_detail)):
+            return self._reschedule(entry, BuildWaitState.PROCESSING, build=build, build_beta_detail=build_beta_detail)
+        return self._get_progress(entry, BuildWaitState.PROCESSED, build=build, build_beta_detail=build_beta_detail)
+
+    @classmethod
+    def _is_processing(cls, build_beta_detail: BuildBetaDetail) -> bool:
+        return (
+            build_beta_detail.attributes.externalBuildState is ExternalBetaState.PROCESSING
+            and build_beta_detail.attributes.internalBuildState is InternalBetaState.PROCESSING
+        )
+
+    def _reschedule(self, entry: _WaitEntry, state: BuildWaitState, **progress_options) -> BuildWaitProgress:
+        now = time.monotonic()
+        remaining_seconds = entry.timeout - (now - entry.started_at)
+        if remaining_seconds <= 0:
+            return self._get_progress(entry, BuildWaitState.TIMED_OUT, **progress_options)
+
+        wait_seconds = min(entry.interval, remaining_seconds)
+        entry.next_check_at = now + wait_seconds
+        entry.interval = min(entry.interval * self._backoff_factor, self._max_interval)
+        return self._get_progress(entry, state, next_check_in=wait_seconds, **progress_options)
+
+    @classmethod
+    def _get_progress(cls, entry: _WaitEntry, state: BuildWaitState, **progress_options) -> BuildWaitProgress:
+        entry.checks += 1
+        return BuildWaitProgress(
+            key=entry.key,
+            state=state,
+            checks=entry.checks,
+            elapsed_seconds=time.monotonic() - entry.started_at,
+            **progress_options,
+        )
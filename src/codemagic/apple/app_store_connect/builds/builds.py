@@ -1,5 +1,8 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
@@ -8,6 +11,7 @@ from typing import TypeVar
 from typing import Union
 
 from codemagic.apple.app_store_connect.resource_manager import ResourceManager
+from codemagic.apple.app_store_connect.type_declarations import PaginateResult
 from codemagic.apple.resources import App
 from codemagic.apple.resources import AppStoreVersion
 from codemagic.apple.resources import BetaReviewState
@@ -38,7 +42,7 @@ class Builds(ResourceManager[Build]):
     class Filter(ResourceManager.Filter):
         app: Optional[ResourceId] = None
         expired: Optional[bool] = None
-        id: Optional[ResourceId] = None
+        id: Optional[Union[ResourceId, Sequence[ResourceId]]] = None
         processing_state: Optional[BuildProcessingState] = None
         beta_app_review_submission_beta_review_state: Optional[Union[BetaReviewState, Sequence[BetaReviewState]]] = None
         version: Optional[Union[str, int]] = None
@@ -61,27 +65,108 @@ class Builds(ResourceManager[Build]):
         VERSION = "version"
         BETA_REVIEW_STATE = "betaReviewState"
 
-    def read(self, build: Union[LinkedResourceData, ResourceId]) -> Build:
+    def read(
+        self,
+        build: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> Build:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_build_information
         """
         build_id = self._get_resource_id(build)
-        response = self.client.session.get(f"{self.client.API_URL}/builds/{build_id}").json()
+        params = self._get_fieldset_params(ResourceType.BUILDS, fields=fields, include=include)
+        response = self.client.session.get(f"{self.client.API_URL}/builds/{build_id}", params=params).json()
         return Build(response["data"])
 
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.UPLOADED_DATE,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[Build]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_builds
+        """
+
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.BUILDS, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/builds", resource_filter, params, included)
+
     def list(
         self,
         resource_filter: Filter = Filter(),
         ordering=Ordering.UPLOADED_DATE,
         reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
     ) -> List[Build]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_builds
         """
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
+
+    def list_data_with_included(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.UPLOADED_DATE,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included_fields: Optional[Mapping[ResourceType, Sequence[str]]] = None,
+        page_size: Optional[int] = 200,
+    ) -> PaginateResult:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_builds
+
+        List raw data of the builds and the related resources included in the responses
+        """
+        params = {
+            "sort": ordering.as_param(reverse),
+            **resource_filter.as_query_params(),
+            **self._get_fieldset_params(
+                ResourceType.BUILDS,
+                fields=fields,
+                include=include,
+                included_fields=included_fields,
+            ),
+        }
+        return self.client.paginate_with_included(f"{self.client.API_URL}/builds", params, page_size=page_size)
+
+    def iter_list_with_include(
+        self,
+        include_type: Type[IncludedResource],
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.UPLOADED_DATE,
+        reverse=False,
+    ) -> Iterator[Tuple[Build, Optional[IncludedResource]]]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_builds
 
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        builds = self.client.paginate(f"{self.client.API_URL}/builds", params=params)
-        return [Build(build) for build in builds]
+        List builds together with their related resource of given type. Related resource
+        is None for the builds whose related resource was not included in the response.
+        """
+        included_field = self._get_include_field_name(include_type)
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.BUILDS, include=[included_field]),
+        }
+        included: Dict[Tuple[str, str], Dict] = {}
+        for build in self._iter_filtered(f"{self.client.API_URL}/builds", resource_filter, params, included):
+            relationship = getattr(build.relationships, included_field, None)
+            linked_data = relationship.get_linked_data() if relationship else None
+            if linked_data and (linked_data[0].type.value, linked_data[0].id) in included:
+                yield build, include_type(included[(linked_data[0].type.value, linked_data[0].id)])
+            else:
+                yield build, None
 
     def read_app(self, build: Union[Build, ResourceId]) -> App:
         """
@@ -182,4 +267,6 @@ class Builds(ResourceManager[Build]):
     def _get_include_field_name(cls, include_type: Type[IncludedResource]) -> str:
         if include_type is App:
             return "app"
+        if include_type is BuildBetaDetail:
+            return "buildBetaDetail"
         raise ValueError(f"Unknown include type {include_type}")
@@ -1,8 +1,13 @@
+import contextlib
+import os
 import pathlib
 import tempfile
+import threading
 from datetime import datetime
 from datetime import timedelta
+from typing import ContextManager
 from typing import Dict
+from typing import Iterator
 from typing import NamedTuple
 from typing import Optional
 from typing import Union
@@ -15,6 +20,9 @@ from codemagic.utilities import log
 from .type_declarations import ApiKey
 from .type_declarations import KeyIdentifier
 
+if os.name != "nt":
+    import fcntl
+
 Seconds = int
 JwtPayload = Dict[str, Union[int, str]]
 
@@ -43,33 +51,79 @@ class JsonWebTokenManager(StringConverterMixin):
         audience="appstoreconnect-v1",
         algorithm="ES256",
         enable_cache: bool = False,
+        token_refresh_margin: Seconds = 60,
     ):
         self._logger = log.get_logger(self.__class__)
         self._enable_cache = enable_cache
         # Authentication and expiration information used to generate JWT
         self._token_duration = token_duration
+        # Tokens are replaced ahead of expiration so that they don't expire while requests are in flight
+        self._token_refresh_margin = token_refresh_margin
         self._key = api_key
         # JWT properties
         self._algorithm = algorithm
         self._audience = audience
         # Internal cache
         self._jwt: Optional[JWT] = None
+        # Token can be requested concurrently by API session workers
+        self._lock = threading.RLock()
 
     @property
-    def cache_path(self):
+    def _cache_directory(self) -> pathlib.Path:
         temp_dir = pathlib.Path(tempfile.gettempdir())
-        return temp_dir / ".codemagic-cli-tools" / "cache" / "app_store_connect_jwt" / self._key.identifier
+        return temp_dir / ".codemagic-cli-tools" / "cache" / "app_store_connect_jwt"
 
-    def revoke(self):
-        self._jwt = None
-        self._revoke_disk_cache()
+    @property
+    def cache_path(self):
+        return self._cache_directory / self._key.identifier
 
-    def _revoke_disk_cache(self):
+    @property
+    def _cache_lock_path(self) -> pathlib.Path:
+        return self._cache_directory / f"{self._key.identifier}.lock"
+
+    @contextlib.contextmanager
+    def _acquire_cache_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive advisory lock on the disk cache so that separate processes
+        using the same key do not read, generate and write tokens concurrently.
+        """
+        lock_path = self._cache_lock_path
+        lock_path.parent.mkdir(exist_ok=True, parents=True)
+        with lock_path.open("a") as lock_file:
+            if os.name != "nt":
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name != "nt":
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _disk_cache_lock(self) -> ContextManager[None]:
+        if not self._enable_cache:
+            return contextlib.nullcontext()
+        return self._acquire_cache_lock()
+
+    def revoke(self, token: Optional[str] = None):
+        """
+        Revoke given token from memory and disk cache. In case the token is omitted,
+        then currently used token is revoked. Tokens other than the one that is
+        revoked are left intact as those were already refreshed by someone else.
+        """
+        with self._lock:
+            if token is None or (self._jwt and self._jwt.token == token):
+                self._jwt = None
+            with self._disk_cache_lock():
+                self._revoke_disk_cache(token)
+
+    def _revoke_disk_cache(self, token: Optional[str] = None):
         self._logger.debug("Revoke JWT disk cache for App Store Connect key %r", self._key.identifier)
         if not self._enable_cache:
             return
 
         try:
+            if token is not None and self.cache_path.read_text().strip() != token:
+                self._logger.debug("Cached JWT was already refreshed, skip revoking it")
+                return
             self.cache_path.unlink()
         except FileNotFoundError:
             pass
@@ -78,7 +132,11 @@ class JsonWebTokenManager(StringConverterMixin):
         if not self._enable_cache:
             return
         self.cache_path.parent.mkdir(exist_ok=True, parents=True)
-        self.cache_path.write_text(token)
+        # Write to a temporary file first and then move it in place so that
+        # other processes never see partially written tokens.
+        temp_path = self.cache_path.with_name(f".{self._key.identifier}.{os.getpid()}.{threading.get_ident()}")
+        temp_path.write_text(token)
+        temp_path.replace(self.cache_path)
         self._logger.debug("Cached App Store Connect JWT for key %s", self._key.identifier)
 
     def _encode_token(self, jwt_payload: JwtPayload):
@@ -118,7 +176,7 @@ class JsonWebTokenManager(StringConverterMixin):
         if issuer_id != self._key.issuer_id:
             self._revoke_disk_cache()
             raise JwtCacheError("Cached token is invalid", self._key.identifier)
-        elif self._is_expired(expires_at):
+        elif self._should_refresh(expires_at):
             self._revoke_disk_cache()
             raise JwtCacheError("Cached token is expired", expires_at)
 
@@ -140,14 +198,19 @@ class JsonWebTokenManager(StringConverterMixin):
     def _is_expired(cls, expires_at: datetime) -> bool:
         return datetime.now() > expires_at
 
+    def _should_refresh(self, expires_at: datetime) -> bool:
+        return self._is_expired(expires_at - timedelta(seconds=self._token_refresh_margin))
+
     def get_jwt(self) -> JWT:
-        if self._jwt and not self._is_expired(self._jwt.expires_at):
+        with self._lock:
+            if self._jwt and not self._should_refresh(self._jwt.expires_at):
+                return self._jwt
+
+            with self._disk_cache_lock():
+                try:
+                    self._jwt = self._load_jwt_from_disk()
+                except JwtCacheError as e:
+                    self._logger.debug("Failed to load App Store Connect JWT from disk cache: %s", e.args[0])
+                    self._jwt = self._generate_jwt()
+                    self._write_disk_cache(self._jwt.token)
             return self._jwt
-
-        try:
-            self._jwt = self._load_jwt_from_disk()
-        except JwtCacheError as e:
-            self._logger.debug("Failed to load App Store Connect JWT from disk cache: %s", e.args[0])
-            self._jwt = self._generate_jwt()
-            self._write_disk_cache(self._jwt.token)
-        return self._jwt
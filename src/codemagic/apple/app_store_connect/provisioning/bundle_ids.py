@@ -2,9 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import Type
+from typing import TypeVar
 from typing import Union
 
 from codemagic.apple.app_store_connect.resource_manager import ResourceManager
@@ -13,6 +20,7 @@ from codemagic.apple.resources import BundleIdCapability
 from codemagic.apple.resources import BundleIdPlatform
 from codemagic.apple.resources import LinkedResourceData
 from codemagic.apple.resources import Profile
+from codemagic.apple.resources import Resource
 from codemagic.apple.resources import ResourceId
 from codemagic.apple.resources import ResourceType
 from codemagic.utilities.decorators import deprecated
@@ -20,6 +28,8 @@ from codemagic.utilities.decorators import deprecated
 if TYPE_CHECKING:
     from .profiles import Profiles
 
+IncludedResource = TypeVar("IncludedResource", bound=Resource)
+
 
 class BundleIds(ResourceManager[BundleId]):
     """
@@ -33,20 +43,38 @@ class BundleIds(ResourceManager[BundleId]):
 
     @dataclass
     class Filter(ResourceManager.Filter):
-        id: Optional[str] = None
+        id: Optional[Union[str, Sequence[str]]] = None
         identifier: Optional[str] = None
         name: Optional[str] = None
         platform: Optional[BundleIdPlatform] = None
         seed_id: Optional[str] = None
+        # App Store Connect API matches bundle identifiers by prefix, for example filter
+        # by "com.example.app" also returns "com.example.app.extension". Require exact match
+        # by checking the identifiers of the received bundle IDs.
+        identifier_strict_match: bool = False
+
+        _OPTION_FIELDS = ("identifier_strict_match",)
 
-        def matches(self, bundle_id: BundleId) -> bool:
+        def get_local_field_names(self) -> Set[str]:
             # Double check that platform matches since this filter does not work on Apple's
             # side as of 02.03.2021 and API 1.2. All other filters are applied as expected.
+            local_field_names = {"platform"}
+            if self.identifier_strict_match:
+                local_field_names.add("identifier")
+            return local_field_names
+
+        def get_exact_field_names(self) -> Set[str]:
+            return super().get_exact_field_names() - {"identifier"}
+
+        def _restriction_matches(self, field_name: str, field_value: Any, resource: Resource) -> bool:
+            if field_name == "identifier" and not self.identifier_strict_match:
+                # Match identifiers by prefix the same way as App Store Connect API does
+                return self._get_resource_value(field_name, resource).startswith(field_value)
+            if field_name != "platform":
+                return super()._restriction_matches(field_name, field_value, resource)
             # In case either platform 'IOS' or 'MAC_OS' is specified, then we need to also
             # accept bundle ids with platform 'UNIVERSAL' since it covers both.
-            if not self.platform:
-                return True
-            return bundle_id.attributes.platform in (self.platform, BundleIdPlatform.UNIVERSAL)
+            return self._get_resource_value(field_name, resource) in (field_value, BundleIdPlatform.UNIVERSAL)
 
     class Ordering(ResourceManager.Ordering):
         ID = "id"
@@ -54,6 +82,19 @@ class BundleIds(ResourceManager[BundleId]):
         PLATFORM = "platform"
         SEED_ID = "seedId"
 
+    _INCLUDE_LIMITS = {
+        "bundleIdCapabilities": 50,
+        "profiles": 50,
+    }
+
+    @classmethod
+    def _get_include_field_name(cls, include_type: Type[IncludedResource]) -> str:
+        if include_type is Profile:
+            return "profiles"
+        elif include_type is BundleIdCapability:
+            return "bundleIdCapabilities"
+        raise ValueError(f"Unknown include type {include_type}")
+
     def create(
         self,
         identifier: str,
@@ -96,26 +137,84 @@ class BundleIds(ResourceManager[BundleId]):
         bundle_id_resource_id = self._get_resource_id(bundle_id)
         self.client.session.delete(f"{self.client.API_URL}/bundleIds/{bundle_id_resource_id}")
 
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[BundleId]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_bundle_ids
+        """
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.BUNDLE_ID, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/bundleIds", resource_filter, params, included)
+
     def list(
         self,
         resource_filter: Filter = Filter(),
         ordering=Ordering.NAME,
         reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
     ) -> List[BundleId]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_bundle_ids
         """
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        url = f"{self.client.API_URL}/bundleIds"
-        bundle_ids = (BundleId(bundle_id) for bundle_id in self.client.paginate(url, params=params))
-        return [bundle_id for bundle_id in bundle_ids if resource_filter.matches(bundle_id)]
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
 
-    def read(self, bundle_id: Union[LinkedResourceData, ResourceId]) -> BundleId:
+    def iter_list_with_include(
+        self,
+        include_type: Type[IncludedResource],
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+    ) -> Iterator[Tuple[BundleId, Optional[List[IncludedResource]]]]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_bundle_ids
+
+        List bundle IDs together with their related resources of given type. Related resources
+        are None for the bundle IDs that have more of those than App Store Connect API includes
+        in the response. Those need to be listed separately.
+        """
+        included_field = self._get_include_field_name(include_type)
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.BUNDLE_ID, include=[included_field]),
+        }
+        included: Dict[Tuple[str, str], Dict] = {}
+        bundle_ids = self._iter_filtered(f"{self.client.API_URL}/bundleIds", resource_filter, params, included)
+        for bundle_id in bundle_ids:
+            relationship = getattr(bundle_id.relationships, included_field, None)
+            linked_data = relationship.get_linked_data() if relationship else None
+            if linked_data is None or any((data.type.value, data.id) not in included for data in linked_data):
+                yield bundle_id, None
+            else:
+                yield bundle_id, [include_type(included[(data.type.value, data.id)]) for data in linked_data]
+
+    def read(
+        self,
+        bundle_id: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> BundleId:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_bundle_id_information
         """
         bundle_id_resource_id = self._get_resource_id(bundle_id)
-        response = self.client.session.get(f"{self.client.API_URL}/bundleIds/{bundle_id_resource_id}").json()
+        params = self._get_fieldset_params(ResourceType.BUNDLE_ID, fields=fields, include=include)
+        response = self.client.session.get(
+            f"{self.client.API_URL}/bundleIds/{bundle_id_resource_id}",
+            params=params,
+        ).json()
         return BundleId(response["data"])
 
     def list_profile_ids(self, bundle_id: Union[BundleId, ResourceId]) -> List[LinkedResourceData]:
@@ -143,6 +242,7 @@ class BundleIds(ResourceManager[BundleId]):
         if url is None:
             url = f"{self.client.API_URL}/bundleIds/{bundle_id}/profiles"
         profiles = [Profile(profile) for profile in self.client.paginate(url)]
+        # Listing related profiles does not support filtering on App Store Connect API side
         if resource_filter:
             return [profile for profile in profiles if resource_filter.matches(profile)]
         return profiles
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -53,20 +57,52 @@ class Devices(ResourceManager[Device]):
         ).json()
         return Device(response["data"], created=True)
 
-    def list(self, resource_filter: Filter = Filter(), ordering=Ordering.NAME, reverse=False) -> List[Device]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[Device]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_devices
+        """
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.DEVICES, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/devices", resource_filter, params, included)
+
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[Device]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_devices
         """
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        devices = self.client.paginate(f"{self.client.API_URL}/devices", params=params)
-        return [Device(device) for device in devices]
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
 
-    def read(self, device: Union[LinkedResourceData, ResourceId]) -> Device:
+    def read(
+        self,
+        device: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> Device:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_device_information
         """
         device_id = self._get_resource_id(device)
-        response = self.client.session.get(f"{self.client.API_URL}/devices/{device_id}").json()
+        params = self._get_fieldset_params(ResourceType.DEVICES, fields=fields, include=include)
+        response = self.client.session.get(f"{self.client.API_URL}/devices/{device_id}", params=params).json()
         return Device(response["data"])
 
     def modify(
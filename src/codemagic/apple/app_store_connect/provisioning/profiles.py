@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -29,25 +32,22 @@ class Profiles(ResourceManager[Profile]):
 
     @dataclass
     class Filter(ResourceManager.Filter):
-        id: Optional[Union[str, ResourceId]] = None
+        id: Optional[Union[str, ResourceId, Sequence[ResourceId]]] = None
         name: Optional[str] = None
         profile_state: Optional[ProfileState] = None
         profile_type: Optional[ProfileType] = None
 
-        def matches(self, profile: Profile) -> bool:
-            return (
-                self._field_matches(self.id, profile.id)
-                and self._field_matches(self.name, profile.attributes.name)
-                and self._field_matches(self.profile_state, profile.attributes.profileState)
-                and self._field_matches(self.profile_type, profile.attributes.profileType)
-            )
-
     class Ordering(ResourceManager.Ordering):
         ID = "id"
         NAME = "name"
         PROFILE_STATE = "profileState"
         PROFILE_TYPE = "profileType"
 
+    _INCLUDE_LIMITS = {
+        "certificates": 50,
+        "devices": 50,
+    }
+
     def create(
         self,
         name: str,
@@ -105,20 +105,52 @@ class Profiles(ResourceManager[Profile]):
         profile_id = self._get_resource_id(profile)
         self.client.session.delete(f"{self.client.API_URL}/profiles/{profile_id}")
 
-    def list(self, resource_filter: Filter = Filter(), ordering=Ordering.NAME, reverse=False) -> List[Profile]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[Profile]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_and_download_profiles
+        """
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.PROFILES, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/profiles", resource_filter, params, included)
+
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[Profile]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_and_download_profiles
         """
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        profiles = self.client.paginate(f"{self.client.API_URL}/profiles", params=params)
-        return [Profile(profile) for profile in profiles]
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
 
-    def read(self, profile: Union[LinkedResourceData, ResourceId]) -> Profile:
+    def read(
+        self,
+        profile: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> Profile:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_and_download_profile_information
         """
         profile_id = self._get_resource_id(profile)
-        response = self.client.session.get(f"{self.client.API_URL}/profiles/{profile_id}").json()
+        params = self._get_fieldset_params(ResourceType.PROFILES, fields=fields, include=include)
+        response = self.client.session.get(f"{self.client.API_URL}/profiles/{profile_id}", params=params).json()
         return Profile(response["data"])
 
     def read_bundle_id(self, profile: Union[Profile, ResourceId]) -> BundleId:
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -49,25 +52,52 @@ class SigningCertificates(ResourceManager[SigningCertificate]):
         ).json()
         return SigningCertificate(response["data"], created=True)
 
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        ordering=Ordering.DISPLAY_NAME,
+        reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[SigningCertificate]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_and_download_certificates
+        """
+        params = {
+            "sort": ordering.as_param(reverse),
+            **self._get_fieldset_params(ResourceType.CERTIFICATES, fields=fields, include=include),
+        }
+        return self._iter_filtered(f"{self.client.API_URL}/certificates", resource_filter, params, included)
+
     def list(
         self,
         resource_filter: Filter = Filter(),
         ordering=Ordering.DISPLAY_NAME,
         reverse=False,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
     ) -> List[SigningCertificate]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_and_download_certificates
         """
-        params = {"sort": ordering.as_param(reverse), **resource_filter.as_query_params()}
-        certificates = self.client.paginate(f"{self.client.API_URL}/certificates", params=params)
-        return [SigningCertificate(certificate) for certificate in certificates]
+        return list(
+            self.iter_list(resource_filter, ordering, reverse, fields=fields, include=include, included=included),
+        )
 
-    def read(self, certificate: Union[LinkedResourceData, ResourceId]) -> SigningCertificate:
+    def read(
+        self,
+        certificate: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> SigningCertificate:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_and_download_certificate_information
         """
         certificate_id = self._get_resource_id(certificate)
-        response = self.client.session.get(f"{self.client.API_URL}/certificates/{certificate_id}").json()
+        params = self._get_fieldset_params(ResourceType.CERTIFICATES, fields=fields, include=include)
+        response = self.client.session.get(f"{self.client.API_URL}/certificates/{certificate_id}", params=params).json()
         return SigningCertificate(response["data"])
 
     def delete(self, certificate: Union[LinkedResourceData, ResourceId]) -> None:
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import abc
 import enum
+import heapq
 import shlex
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Generic
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -20,6 +27,7 @@ from codemagic.apple.resources import ResourceId
 from codemagic.apple.resources import ResourceReference
 from codemagic.apple.resources import ResourceType
 from codemagic.utilities import case_conversion
+from codemagic.utilities import log
 
 R = TypeVar("R", bound=Resource)
 R_co = TypeVar("R_co", bound=Resource, covariant=True)
@@ -44,6 +52,9 @@ if TYPE_CHECKING:
             ...
 
     class ListingResourceManager(PResourceManager[R], Protocol):
+        def iter_list(self, *, resource_filter: ResourceManager.Filter, **listing_options) -> Iterator[R]:
+            ...
+
         def list(self, *, resource_filter: ResourceManager.Filter, **listing_options) -> List[R]:
             ...
 
@@ -76,6 +87,13 @@ else:
 
 class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
     class Filter:
+        # Restriction values are sent as comma separated lists in the request URL.
+        # Split long value lists between multiple requests to keep the URLs short.
+        MAX_VALUES_PER_REQUEST = 50
+        # Filter fields that do not restrict the listing by themselves,
+        # but configure how the other restrictions are applied
+        _OPTION_FIELDS: Tuple[str, ...] = ()
+
         @classmethod
         def _get_field_name(cls, field_name) -> str:
             return case_conversion.snake_to_camel(field_name)
@@ -90,16 +108,96 @@ class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
                 return ",".join(cls._get_param_value(element) for element in field_value)
             return str(field_value)
 
+        def _iter_restrictions(self) -> Iterator[Tuple[str, Any]]:
+            for field_name, value in self.__dict__.items():
+                if value is not None and field_name not in self._OPTION_FIELDS:
+                    yield field_name, value
+
         def _get_restrictions(self) -> Dict[str, str]:
             return {
                 self._get_field_name(field_name): self._get_param_value(value)
-                for field_name, value in self.__dict__.items()
-                if value is not None
+                for field_name, value in self._iter_restrictions()
             }
 
         def as_query_params(self) -> Dict[str, str]:
             return {f"filter[{field}]": p for field, p in self._get_restrictions().items()}
 
+        @classmethod
+        def _is_multi_value(cls, field_value) -> bool:
+            return isinstance(field_value, Sequence) and not isinstance(field_value, str)
+
+        def iter_query_params(self) -> Iterator[Dict[str, str]]:
+            """
+            Query parameters for every request that is needed to list the resources matching
+            this filter. Restriction with more than `MAX_VALUES_PER_REQUEST` values, such as
+            a filter by a large number of resource IDs, is split between multiple requests.
+            Each request is sorted on its own, resource managers merge the results afterwards.
+            """
+            for field_name, value in self._iter_restrictions():
+                if self._is_multi_value(value) and len(value) > self.MAX_VALUES_PER_REQUEST:
+                    break
+            else:
+                yield self.as_query_params()
+                return
+
+            query_param = f"filter[{self._get_field_name(field_name)}]"
+            values = list(dict.fromkeys(value))
+            for offset in range(0, len(values), self.MAX_VALUES_PER_REQUEST):
+                batch = values[offset : offset + self.MAX_VALUES_PER_REQUEST]
+                yield {**self.as_query_params(), query_param: self._get_param_value(batch)}
+
+        def get_local_field_names(self) -> Set[str]:
+            """
+            Names of the restrictions that App Store Connect API either does not apply or
+            applies more loosely than requested. Those need to be checked on listed resources.
+            """
+            return set()
+
+        def get_exact_field_names(self) -> Set[str]:
+            """
+            Names of the restrictions that App Store Connect API applies as exact matches
+            of resource values. Those can be looked up from an index of resource values.
+            """
+            restriction_names = {field_name for field_name, _ in self._iter_restrictions()}
+            return restriction_names - self.get_local_field_names()
+
+        def _get_resource_value(self, field_name: str, resource: Resource) -> Any:
+            if field_name == "id":
+                return resource.id
+            return getattr(resource.attributes, case_conversion.snake_to_camel(field_name))
+
+        def _is_resource_field(self, field_name: str, resource: Resource) -> bool:
+            """
+            Check whether restriction `field_name` applies to the ID or an attribute of given
+            resource. Restrictions on related resources, such as `app` of builds, cannot be
+            checked from the resource itself.
+            """
+            if field_name == "id":
+                return True
+            return hasattr(resource.attributes, case_conversion.snake_to_camel(field_name))
+
+        def _restriction_matches(self, field_name: str, field_value: Any, resource: Resource) -> bool:
+            resource_value = self._get_resource_value(field_name, resource)
+            if self._is_multi_value(field_value):
+                return resource_value in field_value
+            return self._field_matches(field_value, resource_value)
+
+        def matches(self, resource: Resource, field_names: Optional[Iterable[str]] = None) -> bool:
+            """
+            Check whether given resource satisfies the restrictions of this filter.
+            Optionally only restrictions for given `field_names` are checked. Restrictions
+            on related resources are skipped as those can only be applied by App Store
+            Connect API.
+            """
+            for field_name, field_value in self._iter_restrictions():
+                if field_names is not None and field_name not in field_names:
+                    continue
+                if not self._is_resource_field(field_name, resource):
+                    continue
+                if not self._restriction_matches(field_name, field_value, resource):
+                    return False
+            return True
+
         @classmethod
         def _field_matches(cls, field_value, resource_value):
             if field_value is None:
@@ -107,7 +205,7 @@ class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
             return field_value == resource_value
 
         def __bool__(self):
-            return any(self.__dict__.values())
+            return any(True for _ in self._iter_restrictions())
 
         def __str__(self):
             restrictions = self._get_restrictions()
@@ -119,6 +217,10 @@ class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
         def as_param(self, reverse=False) -> str:
             return f'{"-" if reverse else ""}{self.value}'
 
+    # Number of related resources that App Store Connect API includes for to-many relationships.
+    # Defaults on API side are lower than the maximums, which are requested here instead.
+    _INCLUDE_LIMITS: Dict[str, int] = {}
+
     def __init__(self, client: AppStoreConnectApiClient):
         self.client = client
 
@@ -127,6 +229,111 @@ class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
     def resource_type(self) -> Type[R]:
         raise NotImplementedError()
 
+    def _iter_filtered(
+        self,
+        url: str,
+        resource_filter: ResourceManager.Filter,
+        params: Optional[Dict[str, str]] = None,
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[R]:
+        """
+        List resources from given URL so that App Store Connect API applies as much of the
+        filter as possible. Only restrictions that the API cannot apply exactly are checked
+        on the client side for the received resources. In case `included` mapping is given,
+        then resources included in the responses are indexed there by their type and ID.
+        When the filter is split between multiple requests, the results are merged using the
+        local comparison from `_get_sort_key`, which does not necessarily match the collation
+        of App Store Connect API. Results that cannot be ordered by their attributes are
+        listed one request after another.
+        """
+        local_field_names = resource_filter.get_local_field_names()
+        restriction_names = [field_name for field_name, _ in resource_filter._iter_restrictions()]
+        if restriction_names:
+            log.get_logger(self.__class__).debug(
+                "Filter %s by %s on App Store Connect API, check %s locally",
+                self.resource_type.s,
+                ", ".join(restriction_names),
+                ", ".join(name for name in restriction_names if name in local_field_names) or "-",
+            )
+
+        batches = [
+            self._iter_filtered_batch(url, resource_filter, {**(params or {}), **query_params}, included)
+            for query_params in resource_filter.iter_query_params()
+        ]
+        if len(batches) == 1:
+            yield from batches[0]
+            return
+
+        sort_key = self._get_sort_key((params or {}).get("sort"))
+        if sort_key is None:
+            for batch in batches:
+                yield from batch
+        else:
+            # Every batch is sorted on its own, merge them to keep the sort order across the whole listing
+            key, reverse = sort_key
+            yield from heapq.merge(*batches, key=key, reverse=reverse)
+
+    def _iter_filtered_batch(
+        self,
+        url: str,
+        resource_filter: ResourceManager.Filter,
+        params: Dict[str, str],
+        included: Optional[Dict[Tuple[str, str], Dict]],
+    ) -> Iterator[R]:
+        local_field_names = resource_filter.get_local_field_names()
+        for resource_data in self._iter_resource_data(url, params, included):
+            resource = self.resource_type(resource_data)
+            if not local_field_names or resource_filter.matches(resource, local_field_names):
+                yield resource
+
+    @classmethod
+    def _get_sort_key(cls, sort: Optional[str]) -> Optional[Tuple[Callable[[Resource], Tuple], bool]]:
+        """
+        Key function and direction to merge resources that App Store Connect API returned
+        sorted by given `sort` query parameter. Values are compared with Python comparison
+        operators, enumerations by their values, and missing values follow the present ones
+        in ascending order. This can differ from the API ordering, for example for letter case
+        or non-ASCII characters in strings. None is returned if the resources cannot be ordered
+        by their own attributes, for example when sorting by related resources.
+        """
+        if not sort:
+            return None
+        sort_fields = sort.split(",")
+        directions = {sort_field.startswith("-") for sort_field in sort_fields}
+        if len(directions) != 1 or any("." in sort_field for sort_field in sort_fields):
+            return None
+        field_names = [sort_field.lstrip("-") for sort_field in sort_fields]
+
+        def get_key(resource: Resource) -> Tuple:
+            key = []
+            for field_name in field_names:
+                value: Any
+                if field_name == "id":
+                    value = resource.id
+                else:
+                    value = getattr(resource.attributes, field_name, None)
+                if isinstance(value, enum.Enum):
+                    value = value.value
+                key.append((value is None, value))
+            return tuple(key)
+
+        return get_key, directions.pop()
+
+    def _iter_resource_data(
+        self,
+        url: str,
+        params: Dict[str, str],
+        included: Optional[Dict[Tuple[str, str], Dict]],
+    ) -> Iterator[Dict]:
+        if included is None:
+            # Resources are created as soon as those are decoded from the response stream
+            yield from self.client.iter_paginate(url, params=params)
+            return
+
+        for page in self.client.iter_paginate_with_included(url, params=params):
+            included.update(((item["type"], item["id"]), item) for item in page.included)
+            yield from page.data
+
     @classmethod
     def _get_include_field_name(cls, include_type: Type[R]) -> str:
         raise NotImplemented  # noqa: F901
@@ -182,3 +389,30 @@ class ResourceManager(Generic[R], metaclass=abc.ABCMeta):
             "id": cls._get_resource_id(resource),
             "type": resource_type.value,
         }
+
+    @classmethod
+    def _get_fieldset_params(
+        cls,
+        resource_type: ResourceType,
+        *,
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included_fields: Optional[Mapping[ResourceType, Sequence[str]]] = None,
+    ) -> Dict[str, str]:
+        """
+        Query parameters to request a sparse fieldset of given resource type and to include
+        related resources in the same response. By default, all attributes are returned
+        and related resources are not included. Sparse fieldsets for the included resources
+        can be requested using `included_fields`.
+        """
+        params: Dict[str, str] = {}
+        if fields:
+            params[f"fields[{resource_type.value}]"] = ",".join(fields)
+        for included_type, included_type_fields in (included_fields or {}).items():
+            params[f"fields[{included_type.value}]"] = ",".join(included_type_fields)
+        if include:
+            params["include"] = ",".join(include)
+        for relationship in include:
+            if relationship in cls._INCLUDE_LIMITS:
+                params[f"limit[{relationship}]"] = str(cls._INCLUDE_LIMITS[relationship])
+        return params
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -26,16 +30,30 @@ class BetaGroups(ResourceManager[BetaGroup]):
         name: Optional[str] = None
         app: Optional[ResourceId] = None
 
-    def list(self, resource_filter: Filter = Filter()) -> List[BetaGroup]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[BetaGroup]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_beta_groups
         """
-        response = self.client.paginate(
-            f"{self.client.API_URL}/betaGroups",
-            params=resource_filter.as_query_params(),
-        )
+        params = self._get_fieldset_params(ResourceType.BETA_GROUPS, fields=fields, include=include)
+        return self._iter_filtered(f"{self.client.API_URL}/betaGroups", resource_filter, params, included)
 
-        return [BetaGroup(item) for item in response]
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[BetaGroup]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_beta_groups
+        """
+        return list(self.iter_list(resource_filter, fields=fields, include=include, included=included))
 
     def add_build(self, beta_group: Union[ResourceId, BetaGroup], build: Union[ResourceId, Build]):
         """
@@ -1,4 +1,5 @@
 from typing import Optional
+from typing import Sequence
 from typing import Type
 from typing import Union
 
@@ -24,13 +25,17 @@ class AppStoreVersionLocalizations(ResourceManager[AppStoreVersionLocalization])
     def read(
         self,
         app_store_version_localization: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
     ) -> AppStoreVersionLocalization:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_app_store_version_localization_information
         """
         app_store_version_localization_id = self._get_resource_id(app_store_version_localization)
+        params = self._get_fieldset_params(ResourceType.APP_STORE_VERSION_LOCALIZATIONS, fields=fields, include=include)
         response = self.client.session.get(
             f"{self.client.API_URL}/appStoreVersionLocalizations/{app_store_version_localization_id}",
+            params=params,
         ).json()
         return AppStoreVersionLocalization(response["data"])
 
@@ -88,12 +88,21 @@ class AppStoreVersions(ResourceManager[AppStoreVersion]):
         response = self.client.session.post(f"{self.client.API_URL}/appStoreVersions", json=payload).json()
         return AppStoreVersion(response["data"], created=True)
 
-    def read(self, app_store_version: Union[LinkedResourceData, ResourceId]) -> AppStoreVersion:
+    def read(
+        self,
+        app_store_version: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> AppStoreVersion:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_app_store_version_information
         """
         app_store_version_id = self._get_resource_id(app_store_version)
-        response = self.client.session.get(f"{self.client.API_URL}/appStoreVersions/{app_store_version_id}").json()
+        params = self._get_fieldset_params(ResourceType.APP_STORE_VERSIONS, fields=fields, include=include)
+        response = self.client.session.get(
+            f"{self.client.API_URL}/appStoreVersions/{app_store_version_id}",
+            params=params,
+        ).json()
         return AppStoreVersion(response["data"])
 
     def read_build_data(
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -40,12 +44,27 @@ class BetaAppReviewSubmissions(ResourceManager[BetaAppReviewSubmission]):
         response = self.client.session.post(f"{self.client.API_URL}/betaAppReviewSubmissions", json=payload).json()
         return BetaAppReviewSubmission(response["data"], created=True)
 
-    def list(self, resource_filter: Filter = Filter()) -> List[BetaAppReviewSubmission]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[BetaAppReviewSubmission]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_beta_app_review_submissions
         """
-        beta_review_submissions = self.client.paginate(
-            f"{self.client.API_URL}/betaAppReviewSubmissions",
-            params=resource_filter.as_query_params(),
-        )
-        return [BetaAppReviewSubmission(submission) for submission in beta_review_submissions]
+        params = self._get_fieldset_params(ResourceType.BETA_APP_REVIEW_SUBMISSIONS, fields=fields, include=include)
+        return self._iter_filtered(f"{self.client.API_URL}/betaAppReviewSubmissions", resource_filter, params, included)
+
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[BetaAppReviewSubmission]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_beta_app_review_submissions
+        """
+        return list(self.iter_list(resource_filter, fields=fields, include=include, included=included))
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -28,12 +32,21 @@ class BetaBuildLocalizations(ResourceManager[BetaBuildLocalization]):
         build: Optional[ResourceId] = None
         locale: Optional[Locale] = None
 
-    def read(self, localization: Union[ResourceId, LinkedResourceData]) -> BetaBuildLocalization:
+    def read(
+        self,
+        localization: Union[ResourceId, LinkedResourceData],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> BetaBuildLocalization:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/read_beta_build_localization_information
         """
         resource_id = self._get_resource_id(localization)
-        response = self.client.session.get(f"{self.client.API_URL}/betaBuildLocalizations/{resource_id}").json()
+        params = self._get_fieldset_params(ResourceType.BETA_BUILD_LOCALIZATIONS, fields=fields, include=include)
+        response = self.client.session.get(
+            f"{self.client.API_URL}/betaBuildLocalizations/{resource_id}",
+            params=params,
+        ).json()
         return BetaBuildLocalization(response["data"])
 
     def create(
@@ -88,15 +101,30 @@ class BetaBuildLocalizations(ResourceManager[BetaBuildLocalization]):
         ).json()
         return BetaBuildLocalization(response["data"])
 
-    def list(self, resource_filter: Filter = Filter()) -> List[BetaBuildLocalization]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[BetaBuildLocalization]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/list_beta_build_localizations
+        """
+        params = self._get_fieldset_params(ResourceType.BETA_BUILD_LOCALIZATIONS, fields=fields, include=include)
+        return self._iter_filtered(f"{self.client.API_URL}/betaBuildLocalizations", resource_filter, params, included)
+
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[BetaBuildLocalization]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_beta_build_localizations
         """
-        beta_build_localizations = self.client.paginate(
-            f"{self.client.API_URL}/betaBuildLocalizations",
-            params=resource_filter.as_query_params(),
-        )
-        return [BetaBuildLocalization(localization) for localization in beta_build_localizations]
+        return list(self.iter_list(resource_filter, fields=fields, include=include, included=included))
 
     def delete(self, localization: Union[ResourceId, LinkedResourceData]):
         """
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -13,6 +15,7 @@ from codemagic.apple.resources import Platform
 from codemagic.apple.resources import PreReleaseVersion
 from codemagic.apple.resources import Resource
 from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
 
 IncludedResource = TypeVar("IncludedResource", bound=Resource)
 
@@ -45,18 +48,35 @@ class PreReleaseVersions(ResourceManager[PreReleaseVersion]):
         limit: Optional[int] = None,
         fields: Sequence[str] = tuple(),
         page_size: Optional[int] = 100,
+        include: Sequence[str] = tuple(),
     ) -> List[dict]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/list_prerelease_versions
         """
-        params = resource_filter.as_query_params()
-        if fields:
-            params["fields[preReleaseVersions]"] = ",".join(fields)
+        params = {
+            **resource_filter.as_query_params(),
+            **self._get_fieldset_params(ResourceType.PRE_RELEASE_VERSIONS, fields=fields, include=include),
+        }
         url = f"{self.client.API_URL}/preReleaseVersions"
         return self.client.paginate(url, params=params, limit=limit, page_size=page_size)
 
-    def list(self, resource_filter: Filter = Filter()) -> List[PreReleaseVersion]:
-        pre_release_versions_data = self.list_data(resource_filter=resource_filter)
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[PreReleaseVersion]:
+        if included is None:
+            pre_release_versions_data = self.list_data(resource_filter=resource_filter, fields=fields, include=include)
+        else:
+            params = {
+                **resource_filter.as_query_params(),
+                **self._get_fieldset_params(ResourceType.PRE_RELEASE_VERSIONS, fields=fields, include=include),
+            }
+            result = self.client.paginate_with_included(f"{self.client.API_URL}/preReleaseVersions", params=params)
+            included.update(((item["type"], item["id"]), item) for item in result.included)
+            pre_release_versions_data = result.data
         return [PreReleaseVersion(prerelease_version) for prerelease_version in pre_release_versions_data]
 
     def list_builds_data(
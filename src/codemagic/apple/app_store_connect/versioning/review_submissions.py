@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -58,23 +61,47 @@ class ReviewSubmissions(ResourceManager[ReviewSubmission]):
         response = self.client.session.post(f"{self.client.API_URL}/reviewSubmissions", json=payload).json()
         return ReviewSubmission(response["data"], created=True)
 
-    def read(self, review_submission: Union[LinkedResourceData, ResourceId]) -> ReviewSubmission:
+    def read(
+        self,
+        review_submission: Union[LinkedResourceData, ResourceId],
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+    ) -> ReviewSubmission:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/get_v1_reviewsubmissions_id
         """
         review_submission_id = self._get_resource_id(review_submission)
-        response = self.client.session.get(f"{self.client.API_URL}/reviewSubmissions/{review_submission_id}").json()
+        params = self._get_fieldset_params(ResourceType.REVIEW_SUBMISSIONS, fields=fields, include=include)
+        response = self.client.session.get(
+            f"{self.client.API_URL}/reviewSubmissions/{review_submission_id}",
+            params=params,
+        ).json()
         return ReviewSubmission(response["data"])
 
-    def list(self, resource_filter: Filter = Filter()) -> List[ReviewSubmission]:
+    def iter_list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> Iterator[ReviewSubmission]:
+        """
+        https://developer.apple.com/documentation/appstoreconnectapi/get_v1_reviewsubmissions
+        """
+        params = self._get_fieldset_params(ResourceType.REVIEW_SUBMISSIONS, fields=fields, include=include)
+        return self._iter_filtered(f"{self.client.API_URL}/reviewSubmissions", resource_filter, params, included)
+
+    def list(
+        self,
+        resource_filter: Filter = Filter(),
+        fields: Sequence[str] = tuple(),
+        include: Sequence[str] = tuple(),
+        included: Optional[Dict[Tuple[str, str], Dict]] = None,
+    ) -> List[ReviewSubmission]:
         """
         https://developer.apple.com/documentation/appstoreconnectapi/get_v1_reviewsubmissions
         """
-        review_submissions = self.client.paginate(
-            f"{self.client.API_URL}/reviewSubmissions",
-            params=resource_filter.as_query_params(),
-        )
-        return [ReviewSubmission(submission_info) for submission_info in review_submissions]
+        return list(self.iter_list(resource_filter, fields=fields, include=include, included=included))
 
     def modify(
         self,
@@ -5,23 +5,30 @@ import enum
 import re
 from abc import ABC
 from abc import ABCMeta
-from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
+from typing import get_type_hints
 from typing import overload
 
 from codemagic.models import JsonSerializable
 from codemagic.models import JsonSerializableMeta
+from codemagic.models.enums import ResourceEnum
 from codemagic.utilities import log
 
 from .enums import ResourceType
@@ -35,6 +42,8 @@ class ResourceId(str):
 
 
 class DictSerializable:
+    __slots__: Tuple[str, ...] = ()
+
     _OMIT_KEYS: Tuple[str, ...] = ("_raw",)
     _OMIT_IF_NONE_KEYS: Tuple[str, ...] = tuple()
 
@@ -60,20 +69,91 @@ class DictSerializable:
             return True
         return False
 
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        return iter(self.__dict__.items())
+
     def dict(self) -> Dict:
-        return {k: self._serialize(v) for k, v in self.__dict__.items() if not self._should_omit(k, v)}
+        return {k: self._serialize(v) for k, v in self._iter_items() if not self._should_omit(k, v)}
+
+
+FieldDecoder = Callable[[str], Any]
+
+
+class FieldMap(NamedTuple):
+    names: FrozenSet[str]
+    required_names: Tuple[str, ...]
+    decoders: Dict[str, FieldDecoder]
 
 
 @dataclass
 class GracefulDataclassMixin(ABC):
+    _field_map: ClassVar[Optional[FieldMap]] = None
+
+    @classmethod
+    def get_field_map(cls) -> FieldMap:
+        """
+        Field names and decoders of the dataclass. Those are computed once per class
+        as resolving dataclass fields for every created instance is expensive.
+        """
+        field_map = cls.__dict__.get("_field_map")
+        if field_map is None:
+            fields = dataclasses.fields(cls)
+            field_map = FieldMap(
+                names=frozenset(field.name for field in fields),
+                required_names=tuple(
+                    field.name
+                    for field in fields
+                    if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+                ),
+                decoders=cls._get_field_decoders(),
+            )
+            cls._field_map = field_map
+        return field_map
+
+    @classmethod
+    def _get_field_decoders(cls) -> Dict[str, FieldDecoder]:
+        """
+        Decoders for fields that are annotated as enumerations or timestamps. Raw string
+        values of such fields can be converted before the dataclass is instantiated.
+        """
+        try:
+            type_hints = get_type_hints(cls)
+        except (NameError, TypeError):
+            # Annotations that cannot be resolved at runtime are left for `__post_init__` to handle
+            return {}
+
+        decoders: Dict[str, FieldDecoder] = {}
+        for field in dataclasses.fields(cls):
+            field_type = type_hints.get(field.name)
+            if getattr(field_type, "__origin__", None) is Union:
+                # Optional[X] is a shorthand for Union[X, None]
+                union_types = [t for t in getattr(field_type, "__args__", ()) if t is not type(None)]  # noqa: E721
+                field_type = union_types[0] if len(union_types) == 1 else None
+            if isinstance(field_type, type) and issubclass(field_type, ResourceEnum):
+                decoders[field.name] = field_type
+            elif field_type is datetime:
+                decoders[field.name] = Resource.from_iso_8601
+        return decoders
+
+    @classmethod
+    def decode_fields(cls, fields: Dict[str, Any]) -> Dict[str, Any]:
+        for field_name, decoder in cls.get_field_map().decoders.items():
+            field_value = fields.get(field_name)
+            if isinstance(field_value, str):
+                fields[field_name] = decoder(field_value)
+        return fields
+
     @classmethod
     def get_fields(cls) -> Set[str]:
-        return {f.name for f in dataclasses.fields(cls)}
+        return set(cls.get_field_map().names)
 
     @classmethod
     def get_defined_fields(cls, parent_class: Type, given_fields: Dict[str, Any]) -> Dict[str, Any]:
+        defined_fields = cls.get_field_map().names
+        if defined_fields.issuperset(given_fields):
+            return dict(given_fields)
+
         logger = log.get_logger(cls, log_to_stream=False)
-        defined_fields = cls.get_fields()
         fields = {}
         for field_name, field_value in given_fields.items():
             if field_name in defined_fields:
@@ -82,6 +162,15 @@ class GracefulDataclassMixin(ABC):
                 logger.warning("Unknown field %r for resource %s.%s", field_name, parent_class.__name__, cls.__name__)
         return fields
 
+    @classmethod
+    def get_omitted_fields(cls, given_fields: Dict[str, Any]) -> Dict[str, None]:
+        """
+        Required fields that are missing from given fields. This is expected in case
+        only a sparse fieldset of the resource was requested from the API, and such
+        fields are left undefined.
+        """
+        return {field_name: None for field_name in cls.get_field_map().required_names if field_name not in given_fields}
+
 
 @dataclass
 class PagingInformation(DictSerializable):
@@ -147,13 +236,49 @@ class Relationship(DictSerializable):
         if isinstance(self.meta, dict):
             self.meta = PagingInformation(**self.meta)
 
+    def get_linked_data(self) -> Optional[List[Data]]:
+        """
+        Linkage data of the related resources in case it was included in the response.
+        Returns None if related resources were not included, or if only some of them
+        were included because of the relationship limit.
+        """
+        if self.data is None:
+            return None
+        data = self.data if isinstance(self.data, list) else [self.data]
+        if self.meta is not None and self.meta.paging.total > len(data):
+            return None
+        return data
+
+
+_ISO_8601_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})$",
+)
+_timezones: Dict[str, timezone] = {"Z": timezone.utc}
+
+
+def _get_timezone(offset: str) -> timezone:
+    try:
+        return _timezones[offset]
+    except KeyError:
+        pass
+    sign = -1 if offset[0] == "-" else 1
+    tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:])))
+    _timezones[offset] = tz
+    return tz
+
 
 class LinkedResourceData(DictSerializable, JsonSerializable):
+    __slots__ = ("_raw", "type", "id")
+
     def __init__(self, api_response: Dict):
         self._raw = api_response
         self.type = ResourceType(api_response["type"])
         self.id: ResourceId = ResourceId(api_response["id"])
 
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        yield "type", self.type
+        yield "id", self.id
+
     def __str__(self):
         return "\n".join(
             [
@@ -186,22 +311,29 @@ class PrettyNameMeta(JsonSerializableMeta):
 
 # workaround for Inconsistent metaclass structure for "Resource" error
 class PrettyNameAbcMeta(PrettyNameMeta, ABCMeta):
-    pass
+    _LAZY_PROPERTIES = ("links", "attributes", "relationships")
+
+    def __new__(mcs, name, bases, namespace, **kwargs):  # noqa: N804
+        # Resources are created in large numbers from listings. Keep the instances
+        # compact by not giving them instance dictionaries unless explicitly asked.
+        namespace.setdefault("__slots__", ())
+        # Subclasses declare `attributes` and `relationships` only to narrow down their
+        # types. Class level defaults must not shadow the lazy properties from `Resource`.
+        for property_name in mcs._LAZY_PROPERTIES:
+            if property_name in namespace and not isinstance(namespace[property_name], property):
+                del namespace[property_name]
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
 
 
 class Resource(LinkedResourceData, metaclass=PrettyNameAbcMeta):
-    _OMIT_IF_NONE_KEYS = ("relationships",)
+    """
+    Base class for App Store Connect API resources. Resource links, attributes and
+    relationships are decoded from the API response on first access.
+    """
 
-    def __init_subclass__(cls) -> None:
-        """
-        hack to work around the fact that we are overriding the `attributes` and ``relationships`` properties with
-        variables instead of properties
+    __slots__ = ("_created", "_links", "_attributes", "_relationships")
 
-        they are always given values in ``__init__``, but that runs after the check in ``ABCMeta``
-        """
-        cls.attributes = None  # type:ignore[assignment]
-        cls.relationships = None  # type:ignore[assignment]
-        super().__init_subclass__()
+    _OMIT_IF_NONE_KEYS = ("relationships",)
 
     @dataclass
     class Attributes(DictSerializable, GracefulDataclassMixin):
@@ -226,7 +358,13 @@ class Resource(LinkedResourceData, metaclass=PrettyNameAbcMeta):
             # In case the resource does not have attributes
             defined_fields = {}
         else:
-            defined_fields = cls.Attributes.get_defined_fields(cls, api_response["attributes"])
+            given_fields = api_response.get("attributes", {})
+            defined_fields = cls.Attributes.decode_fields(
+                {
+                    **cls.Attributes.get_omitted_fields(given_fields),
+                    **cls.Attributes.get_defined_fields(cls, given_fields),
+                },
+            )
         return cls.Attributes(**defined_fields)
 
     @classmethod
@@ -241,36 +379,55 @@ class Resource(LinkedResourceData, metaclass=PrettyNameAbcMeta):
             # In case the resource does not have relationships
             defined_fields = {}
         else:
-            defined_fields = cls.Relationships.get_defined_fields(cls, api_response["relationships"])
+            given_fields = api_response["relationships"]
+            defined_fields = {
+                **cls.Relationships.get_omitted_fields(given_fields),
+                **cls.Relationships.get_defined_fields(cls, given_fields),
+            }
         return cls.Relationships(**defined_fields)
 
     def __init__(self, api_response: Dict, created: bool = False):
         super().__init__(api_response)
         self._created = created
-        self.links: ResourceLinks = ResourceLinks(**api_response["links"])
-        self.attributes = self._create_attributes(api_response)
-        if "relationships" in api_response:
-            self.relationships = self._create_relationships(api_response)
-        else:
-            self.relationships = None
+        self._links: Optional[ResourceLinks] = None
+        self._attributes: Optional[Resource.Attributes] = None
+        self._relationships: Optional[Resource.Relationships] = None
+
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        yield from super()._iter_items()
+        yield "links", self.links
+        yield "attributes", self.attributes
+        yield "relationships", self.relationships
+
+    @property
+    def links(self) -> ResourceLinks:
+        if self._links is None:
+            self._links = ResourceLinks(**self._raw["links"])
+        return self._links
+
+    @links.setter
+    def links(self, value: ResourceLinks) -> None:
+        self._links = value
 
     @property
-    @abstractmethod
     def attributes(self) -> Attributes:
-        ...
+        if self._attributes is None:
+            self._attributes = self._create_attributes(self._raw)
+        return self._attributes
 
     @attributes.setter
     def attributes(self, value: Attributes) -> None:
-        ...
+        self._attributes = value
 
     @property
-    @abstractmethod
     def relationships(self) -> Optional[Relationships]:
-        ...
+        if self._relationships is None and "relationships" in self._raw:
+            self._relationships = self._create_relationships(self._raw)
+        return self._relationships
 
     @relationships.setter
     def relationships(self, value: Optional[Relationships]) -> None:
-        ...
+        self._relationships = value
 
     @property
     def created(self) -> bool:
@@ -290,6 +447,22 @@ class Resource(LinkedResourceData, metaclass=PrettyNameAbcMeta):
     def from_iso_8601(cls, iso_8601_timestamp: Optional[str]):
         if iso_8601_timestamp is None:
             return None
+
+        match = _ISO_8601_PATTERN.match(iso_8601_timestamp)
+        if match:
+            # Single pass fast path for both of the formats listed below
+            year, month, day, hour, minute, second, fraction, offset = match.groups()
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+                tzinfo=_get_timezone(offset),
+            )
+
         try:
             return datetime.strptime(iso_8601_timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
         except ValueError:
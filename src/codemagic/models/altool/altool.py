@@ -5,6 +5,7 @@ import os
 import pathlib
 import re
 import subprocess
+import threading
 import time
 from contextlib import contextmanager
 from functools import lru_cache
@@ -12,6 +13,7 @@ from itertools import chain
 from typing import TYPE_CHECKING
 from typing import AnyStr
 from typing import Callable
+from typing import Dict
 from typing import Generator
 from typing import Optional
 from typing import Sequence
@@ -45,6 +47,11 @@ class AltoolCommandError(Exception):
 
 
 class Altool(RunningCliAppMixin, StringConverterMixin):
+    # altool looks up API keys from a fixed location by key identifier, so concurrent
+    # commands share the key file, which is removed once the last of them is done
+    _api_key_users: Dict[pathlib.Path, int] = {}
+    _api_key_users_lock = threading.Lock()
+
     def __init__(
         self,
         key_identifier: Optional[KeyIdentifier] = None,
@@ -97,13 +104,28 @@ class Altool(RunningCliAppMixin, StringConverterMixin):
         else:
             return AuthenticationMethod.NONE
 
-    def _save_api_key_to_disk(self):
+    def _save_api_key_to_disk(self) -> pathlib.Path:
+        assert self._private_key is not None  # Make mypy happy
         keys_dir = pathlib.Path("~/.private_keys").expanduser()
-        keys_dir.mkdir(exist_ok=True)
         key_path = keys_dir / f"AuthKey_{self._key_identifier}.p8"
-        key_path.write_text(self._private_key)
+        with self._api_key_users_lock:
+            if not self._api_key_users.get(key_path):
+                keys_dir.mkdir(exist_ok=True)
+                key_path.write_text(self._private_key)
+            self._api_key_users[key_path] = self._api_key_users.get(key_path, 0) + 1
         return key_path
 
+    def _remove_api_key_from_disk(self, key_path: pathlib.Path):
+        with self._api_key_users_lock:
+            self._api_key_users[key_path] -= 1
+            if self._api_key_users[key_path] > 0:
+                return
+            del self._api_key_users[key_path]
+            try:
+                key_path.unlink()
+            except FileNotFoundError:
+                pass
+
     @contextmanager
     def _get_authentication_flags(self) -> Generator[StrTuple, None, None]:
         private_key_path: Optional[pathlib.Path] = None
@@ -116,18 +138,20 @@ class Altool(RunningCliAppMixin, StringConverterMixin):
             elif self._authentication_method is AuthenticationMethod.USERNAME_AND_EMAIL:
                 assert isinstance(self._username, str)  # Make mypy happy
                 assert isinstance(self._password, str)  # Make mypy happy
+                # Password is passed to altool process in its environment, see `_get_command_environment`
                 flags = ("--username", self._username, "--password", "@env:APP_STORE_CONNECT_PASSWORD")
-                os.environ["APP_STORE_CONNECT_PASSWORD"] = self._password
             else:
                 flags = tuple()
             yield flags
         finally:
             if private_key_path:
-                private_key_path.unlink()
-            try:
-                os.environ.pop("APP_STORE_CONNECT_PASSWORD")
-            except KeyError:
-                pass
+                self._remove_api_key_from_disk(private_key_path)
+
+    def _get_command_environment(self) -> Optional[Dict[str, str]]:
+        if self._authentication_method is not AuthenticationMethod.USERNAME_AND_EMAIL:
+            return None
+        assert isinstance(self._password, str)  # Make mypy happy
+        return {**os.environ, "APP_STORE_CONNECT_PASSWORD": self._password}
 
     def _construct_action_command(
         self,
@@ -235,6 +259,7 @@ class Altool(RunningCliAppMixin, StringConverterMixin):
         cli_app: Optional[CliApp],
     ) -> Optional[AltoolResult]:
         obfuscate_patterns = [self._password] if self._password else []
+        env = self._get_command_environment()
         try:
             if cli_app:
                 process = cli_app.execute(
@@ -242,6 +267,7 @@ class Altool(RunningCliAppMixin, StringConverterMixin):
                     obfuscate_patterns,
                     show_output=False,
                     stderr=subprocess.STDOUT,
+                    env=env,
                 )
                 stdout = process.stdout
                 process.raise_for_returncode()
@@ -249,6 +275,7 @@ class Altool(RunningCliAppMixin, StringConverterMixin):
                 stdout = subprocess.check_output(
                     command,
                     stderr=subprocess.STDOUT,
+                    env=env,
                 ).decode()
         except subprocess.CalledProcessError as cpe:
             result = self._get_action_result(cpe.stdout)
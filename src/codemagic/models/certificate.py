@@ -25,6 +25,7 @@ from .certificate_p12_exporter import P12Exporter
 from .json_serializable import JsonSerializable
 from .private_key import SUPPORTED_PUBLIC_KEY_TYPES
 from .private_key import PrivateKey
+from .private_key import get_public_key_fingerprint
 
 
 class Certificate(JsonSerializable, RunningCliAppMixin, StringConverterMixin):
@@ -206,6 +207,16 @@ class Certificate(JsonSerializable, RunningCliAppMixin, StringConverterMixin):
         exporter = P12Exporter(self, private_key, container_password)
         return exporter.export(_export_path)
 
+    def get_public_key_fingerprint(self) -> str:
+        """
+        SHA-256 hash of the DER encoded SubjectPublicKeyInfo of the certificate's public key.
+        Certificate is signed with a private key if their public key fingerprints are equal.
+        """
+        certificate_public_key = self.certificate.public_key()
+        if not isinstance(certificate_public_key, SUPPORTED_PUBLIC_KEY_TYPES):
+            raise TypeError("Public key type is not supported", type(certificate_public_key))
+        return get_public_key_fingerprint(certificate_public_key)
+
     def is_signed_with(self, private_key: PrivateKey) -> bool:
         certificate_public_key = self.certificate.public_key()
         if not isinstance(certificate_public_key, SUPPORTED_PUBLIC_KEY_TYPES):
@@ -1,9 +1,16 @@
 import contextlib
 import enum
 import re
+import threading
+from typing import Any
+from typing import Dict
+from typing import Tuple
 
 from codemagic.utilities import log
 
+_graceful_members: Dict[Tuple[enum.EnumMeta, Any], enum.Enum] = {}
+_graceful_members_lock = threading.Lock()
+
 
 class ResourceEnumMeta(enum.EnumMeta):
     """
@@ -20,19 +27,42 @@ class ResourceEnumMeta(enum.EnumMeta):
     enable_name_transformation = False
 
     def __call__(cls, value, *args, **kwargs):  # noqa: N805
+        if not args and not kwargs:
+            # Fast path for the most common use case: member lookup by its value
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
         try:
             return super().__call__(value, *args, **kwargs)
         except ValueError as ve:
             if not cls.graceful_fallback:
                 cls._transform_class_name()
                 raise
-            logger = log.get_logger(cls, log_to_stream=False)
-            logger.warning("Undefined Resource enumeration: %s", ve)
-            try:
-                enum_class = ResourceEnum(f"Graceful{cls.__name__}", {value: value})
-                return enum_class(value)
-            except TypeError:
-                raise ve
+            return cls._get_graceful_member(value, ve)
+
+    def _get_graceful_member(cls, value, error):  # noqa: N805
+        """
+        Fallback enumeration members are created only once per undefined value
+        so that the same value always resolves to the same member.
+        """
+        try:
+            return _graceful_members[(cls, value)]
+        except KeyError:
+            pass
+        except TypeError:
+            raise error
+
+        with _graceful_members_lock:
+            if (cls, value) not in _graceful_members:
+                try:
+                    enum_class = ResourceEnum(f"Graceful{cls.__name__}", {value: value})
+                except TypeError:
+                    raise error
+                logger = log.get_logger(cls, log_to_stream=False)
+                logger.warning("Undefined Resource enumeration: %s", error)
+                _graceful_members[(cls, value)] = enum_class(value)
+        return _graceful_members[(cls, value)]
 
     def _transform_class_name(cls):  # noqa: N805
         """
@@ -19,6 +19,8 @@ class JsonSerializableMeta(type):
 
 
 class JsonSerializable(metaclass=JsonSerializableMeta):
+    __slots__ = ()
+
     @abstractmethod
     def dict(self) -> Dict:
         raise NotImplementedError(f"Method {self.__class__.__name__}.{self.dict.__name__} is not implemented")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from typing import AnyStr
 from typing import Optional
 from typing import Union
@@ -121,3 +122,18 @@ class PrivateKey(StringConverterMixin):
             serialization.Encoding.OpenSSH,
             serialization.PublicFormat.OpenSSH,
         )
+
+    def get_public_key_fingerprint(self) -> str:
+        """
+        SHA-256 hash of the DER encoded SubjectPublicKeyInfo of the public key
+        that corresponds to this private key
+        """
+        return get_public_key_fingerprint(self.public_key)
+
+
+def get_public_key_fingerprint(public_key: CryptographyPublicKey) -> str:
+    subject_public_key_info = public_key.public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return hashlib.sha256(subject_public_key_info).hexdigest().upper()
@@ -11,9 +11,9 @@ from typing import Sequence
 from typing import Tuple
 from typing import Union
 
-from codemagic.apple import AppStoreConnectApiClient
 from codemagic.apple.app_store_connect import IssuerId
 from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.builds import BuildWaitProgress
 from codemagic.apple.resources import App
 from codemagic.apple.resources import AppStoreState
 from codemagic.apple.resources import AppStoreVersion
@@ -52,6 +52,8 @@ from .arguments import AppStoreVersionLocalizationInfo
 from .arguments import BetaBuildInfo
 from .arguments import CertificateArgument
 from .arguments import Types
+from .mixins import BulkMutationMixin
+from .mixins import LocalizationSyncMixin
 from .mixins import ResourceManagerMixin
 from .mixins import SigningFileSaverMixin
 from .resource_printer import ResourcePrinter
@@ -63,6 +65,8 @@ AppStoreVersionLocalizationInfos = Union[
 
 
 class AbstractBaseAction(
+    BulkMutationMixin,
+    LocalizationSyncMixin,
     ResourceManagerMixin,
     SigningFileSaverMixin,
     PathFinderMixin,
@@ -93,11 +97,6 @@ class AbstractBaseAction(
 
     # Define signatures for self-reference to other action groups
 
-    @property
-    @abstractmethod
-    def api_client(self) -> AppStoreConnectApiClient:
-        ...
-
     @classmethod
     def echo(cls, message: str, *args, **kwargs) -> None:
         ...
@@ -105,6 +104,19 @@ class AbstractBaseAction(
     def _assert_api_client_credentials(self, custom_error: Optional[str] = None):
         ...
 
+    def _log_build_processing_message(self, build_id: ResourceId, max_processing_minutes: int):
+        ...
+
+    def _log_build_wait_progress(self, progress: BuildWaitProgress):
+        ...
+
+    @classmethod
+    def _get_build_processing_timeout_message(cls, build_id: ResourceId, max_processing_minutes: int) -> str:
+        from .action_groups import BuildsActionGroup
+
+        _ = BuildsActionGroup._get_build_processing_timeout_message  # Implementation
+        raise NotImplementedError()
+
     # Action signatures in alphabetical order
 
     @abstractmethod
@@ -323,6 +335,8 @@ class AbstractBaseAction(
         self,
         application_id: ResourceId,
         excluded_build_id: Optional[Union[ResourceId, Sequence[ResourceId]]] = None,
+        max_concurrent_requests: Optional[Union[int, Types.MaxConcurrentRequests]] = None,
+        dry_run: bool = False,
         should_print: bool = False,
     ) -> List[Build]:
         from .action_groups import AppsActionGroup
@@ -359,6 +373,8 @@ class AbstractBaseAction(
         application_id: ResourceId,
         platform: Optional[Platform] = None,
         review_submission_state: Optional[Union[ReviewSubmissionState, Sequence[ReviewSubmissionState]]] = None,
+        max_concurrent_requests: Optional[Union[int, Types.MaxConcurrentRequests]] = None,
+        dry_run: bool = False,
         should_print: bool = False,
     ) -> List[ReviewSubmission]:
         from .action_groups import AppsActionGroup
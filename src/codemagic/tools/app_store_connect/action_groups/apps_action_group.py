@@ -30,6 +30,7 @@ from ..arguments import BuildArgument
 from ..arguments import BundleIdArgument
 from ..arguments import CommonArgument
 from ..arguments import ReviewSubmissionArgument
+from ..arguments import Types
 
 if TYPE_CHECKING:
     from codemagic.apple.app_store_connect.resource_manager import ListingResourceManager
@@ -55,6 +56,7 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         AppStoreVersionArgument.PLATFORM_OPTIONAL,
         AppStoreVersionArgument.APP_STORE_STATE,
         action_group=AppStoreConnectActionGroup.APPS,
+        action_options={"discards_listed_resources": True},
     )
     def list_apps(
         self,
@@ -72,9 +74,6 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         Find and list apps added in App Store Connect
         """
 
-        def predicate(app):
-            return app.attributes.bundleId == bundle_id_identifier
-
         apps_filter = self.api_client.apps.Filter(
             bundle_id=bundle_id_identifier,
             id=application_id,
@@ -83,13 +82,13 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             app_store_versions=version_string,
             app_store_versions_platform=platform,
             app_store_versions_app_store_state=app_store_state,
+            bundle_id_strict_match=bundle_id_identifier_strict_match,
         )
 
         return self._list_resources(
             apps_filter,
             cast("ListingResourceManager[App]", self.api_client.apps),
             should_print,
-            filter_predicate=predicate if bundle_id_identifier and bundle_id_identifier_strict_match else None,
         )
 
     @cli.action(
@@ -168,12 +167,16 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         "expire-builds",
         AppArgument.APPLICATION_ID_RESOURCE_ID,
         BuildArgument.BUILD_ID_RESOURCE_ID_EXCLUDE_OPTIONAL,
+        CommonArgument.MAX_CONCURRENT_REQUESTS,
+        CommonArgument.DRY_RUN,
         action_group=AppStoreConnectActionGroup.APPS,
     )
     def expire_app_builds(
         self,
         application_id: ResourceId,
         excluded_build_id: Optional[Union[ResourceId, Sequence[ResourceId]]] = None,
+        max_concurrent_requests: Optional[Union[int, Types.MaxConcurrentRequests]] = None,
+        dry_run: bool = False,
         should_print: bool = False,
     ) -> List[Build]:
         """
@@ -187,13 +190,17 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             builds_to_skip.update(excluded_build_id)
 
         builds = self.list_builds(application_id=application_id, not_expired=True, should_print=should_print)
-        return [
-            self.expire_build(
-                build_id=build.id,
-            )
-            for build in builds
-            if build.id not in builds_to_skip
-        ]
+        bulk_mutation_result = self._run_bulk_mutation(
+            self.api_client.session,
+            lambda build: self.api_client.builds.modify(build, expired=True),
+            [build for build in builds if build.id not in builds_to_skip],
+            "Expire",
+            lambda build: f"{Build} {build.id}",
+            max_concurrent_requests=Types.MaxConcurrentRequests.resolve_value(max_concurrent_requests),
+            dry_run=dry_run,
+        )
+        self.printer.print_resources(bulk_mutation_result.results, True)
+        return bulk_mutation_result.results
 
     @cli.action(
         "expire-build-submitted-for-review",
@@ -233,6 +240,8 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         AppArgument.APPLICATION_ID_RESOURCE_ID,
         AppStoreVersionArgument.PLATFORM_OPTIONAL,
         ReviewSubmissionArgument.REVIEW_SUBMISSION_STATE,
+        CommonArgument.MAX_CONCURRENT_REQUESTS,
+        CommonArgument.DRY_RUN,
         action_group=AppStoreConnectActionGroup.APPS,
     )
     def cancel_review_submissions(
@@ -240,6 +249,8 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         application_id: ResourceId,
         platform: Optional[Platform] = None,
         review_submission_state: Optional[Union[ReviewSubmissionState, Sequence[ReviewSubmissionState]]] = None,
+        max_concurrent_requests: Optional[Union[int, Types.MaxConcurrentRequests]] = None,
+        dry_run: bool = False,
         should_print: bool = False,
     ) -> List[ReviewSubmission]:
         """
@@ -253,7 +264,17 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             should_print,
         )
 
-        return [self.cancel_review_submission(submission.id) for submission in review_submissions]
+        bulk_mutation_result = self._run_bulk_mutation(
+            self.api_client.session,
+            lambda submission: self.api_client.review_submissions.modify(submission, canceled=True),
+            review_submissions,
+            "Cancel",
+            lambda submission: f"{ReviewSubmission} {submission.id}",
+            max_concurrent_requests=Types.MaxConcurrentRequests.resolve_value(max_concurrent_requests),
+            dry_run=dry_run,
+        )
+        self.printer.print_resources(bulk_mutation_result.results, True)
+        return bulk_mutation_result.results
 
     @cli.action(
         "list-review-submissions",
@@ -261,6 +282,7 @@ class AppsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         AppStoreVersionArgument.PLATFORM_OPTIONAL,
         ReviewSubmissionArgument.REVIEW_SUBMISSION_STATE,
         action_group=AppStoreConnectActionGroup.APPS,
+        action_options={"discards_listed_resources": True},
     )
     def list_review_submissions(
         self,
@@ -45,6 +45,7 @@ class BetaAppReviewSubmissionsActionGroup(AbstractBaseAction, metaclass=ABCMeta)
         "list",
         BuildArgument.BUILD_ID_RESOURCE_ID,
         action_group=AppStoreConnectActionGroup.BETA_APP_REVIEW_SUBMISSIONS,
+        action_options={"discards_listed_resources": True},
     )
     def list_beta_app_review_submissions(
         self,
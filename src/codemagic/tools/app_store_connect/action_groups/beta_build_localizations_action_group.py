@@ -47,6 +47,7 @@ class BetaBuildLocalizationsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         BuildArgument.BUILD_ID_RESOURCE_ID,
         BuildArgument.LOCALE_OPTIONAL,
         action_group=AppStoreConnectActionGroup.BETA_BUILDS_LOCALIZATIONS,
+        action_options={"discards_listed_resources": True},
     )
     def list_beta_build_localizations(
         self,
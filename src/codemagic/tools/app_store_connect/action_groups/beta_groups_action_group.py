@@ -31,31 +31,14 @@ class BetaGroupsActionGroup(AbstractBaseAction):
         )
 
         matched_beta_groups, matched_beta_group_names = self._get_beta_groups(build_id, beta_group_names)
-
-        errors = []
-        for beta_group in matched_beta_groups:
-            beta_group_name = beta_group.attributes.name
-            try:
-                self.api_client.beta_groups.add_build(beta_group, build_id)
-            except AppStoreConnectApiError as e:
-                errors.append((beta_group_name, e.error_response))
-            else:
-                self.logger.info(Colors.GREEN(f"Added build '{build_id}' to '{beta_group_name}' beta group"))
-
-        missing_beta_group_names = set(beta_group_names) - matched_beta_group_names
-        if missing_beta_group_names:
-            self.logger.warning(
-                Colors.YELLOW(
-                    "\n".join(f"Cannot find Beta group with the name '{name}'" for name in missing_beta_group_names),
-                ),
-            )
-
-        if errors:
-            error_lines = [
-                f"Failed to add a build '{build_id}' to '{group_name}' beta group. {error_response}"
-                for group_name, error_response in errors
-            ]
-            raise AppStoreConnectError("\n".join(error_lines))
+        self._log_missing_beta_groups(beta_group_names, matched_beta_group_names)
+        self._run_bulk_mutation(
+            self.api_client.session,
+            lambda beta_group: self.api_client.beta_groups.add_build(beta_group, build_id),
+            matched_beta_groups,
+            "Add",
+            lambda beta_group: f"build '{build_id}' to '{beta_group.attributes.name}' beta group",
+        )
 
     @cli.action(
         "remove-build",
@@ -72,17 +55,16 @@ class BetaGroupsActionGroup(AbstractBaseAction):
         )
 
         matched_beta_groups, matched_beta_group_names = self._get_beta_groups(build_id, beta_group_names)
+        self._log_missing_beta_groups(beta_group_names, matched_beta_group_names)
+        self._run_bulk_mutation(
+            self.api_client.session,
+            lambda beta_group: self.api_client.beta_groups.remove_build(beta_group, build_id),
+            matched_beta_groups,
+            "Remove",
+            lambda beta_group: f"build '{build_id}' from '{beta_group.attributes.name}' beta group",
+        )
 
-        errors = []
-        for beta_group in matched_beta_groups:
-            beta_group_name = beta_group.attributes.name
-            try:
-                self.api_client.beta_groups.remove_build(beta_group, build_id)
-            except AppStoreConnectApiError as e:
-                errors.append((beta_group_name, e.error_response))
-            else:
-                self.logger.info(Colors.GREEN(f"Removed build '{build_id}' from '{beta_group_name}' beta group"))
-
+    def _log_missing_beta_groups(self, beta_group_names: Sequence[str], matched_beta_group_names: Set[str]):
         missing_beta_group_names = set(beta_group_names) - matched_beta_group_names
         if missing_beta_group_names:
             self.logger.warning(
@@ -91,13 +73,6 @@ class BetaGroupsActionGroup(AbstractBaseAction):
                 ),
             )
 
-        if errors:
-            error_lines = [
-                f"Failed to remove a build '{build_id}' from '{group_name}' beta group. {error_response}"
-                for group_name, error_response in errors
-            ]
-            raise AppStoreConnectError("\n".join(error_lines))
-
     def _get_beta_groups(
         self,
         build_id: ResourceId,
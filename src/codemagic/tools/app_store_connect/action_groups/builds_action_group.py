@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import time
+import functools
 from abc import ABCMeta
 from typing import TYPE_CHECKING
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -11,13 +12,16 @@ from typing import cast
 
 from codemagic import cli
 from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.builds import BuildWaiter
+from codemagic.apple.app_store_connect.builds import BuildWaitProgress
+from codemagic.apple.app_store_connect.builds import BuildWaitState
+from codemagic.apple.app_store_connect.versioning import BetaBuildLocalizations
 from codemagic.apple.resources import App
 from codemagic.apple.resources import AppStoreVersion
+from codemagic.apple.resources import BetaBuildLocalization
 from codemagic.apple.resources import Build
 from codemagic.apple.resources import BuildBetaDetail
 from codemagic.apple.resources import BuildProcessingState
-from codemagic.apple.resources import ExternalBetaState
-from codemagic.apple.resources import InternalBetaState
 from codemagic.apple.resources import Locale
 from codemagic.apple.resources import PreReleaseVersion
 from codemagic.apple.resources import ResourceId
@@ -65,6 +69,7 @@ class BuildsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         AppArgument.APPLICATION_ID_RESOURCE_ID_OPTIONAL,
         *ArgumentGroups.LIST_BUILDS_FILTERING_ARGUMENTS,
         action_group=AppStoreConnectActionGroup.BUILDS,
+        action_options={"discards_listed_resources": True},
         deprecation_info=cli.ActionDeprecationInfo("list-builds", "0.49.0"),
     )
     def list_builds(
@@ -236,93 +241,45 @@ class BuildsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             beta_test_info_items.append(BetaBuildInfo(whats_new=whats_new, locale=locale))
 
         self.logger.info(Colors.BLUE("\nUpdate beta build localization info in TestFlight for uploaded build"))
-        for item in beta_test_info_items:
-            self.create_beta_build_localization(build_id=build_id, locale=item.locale, whats_new=item.whats_new)
+        if not beta_test_info_items:
+            return
 
-    def _wait_until_build_is_processed(
-        self,
-        build: Build,
-        processing_started_at: float,
-        max_processing_minutes: int,
-        retry_wait_seconds: int,
-    ) -> Build:
-        is_first_attempt = True
-        while time.time() - processing_started_at < max_processing_minutes * 60:
-            if build.attributes.processingState is BuildProcessingState.PROCESSING:
-                if is_first_attempt:
-                    self._log_build_processing_message(build.id, max_processing_minutes)
-
-                msg_template = (
-                    "Build %s is still being processed on App Store Connect side, waiting %d seconds "
-                    "and checking again"
-                )
-                self.logger.info(msg_template, build.id, retry_wait_seconds)
-                time.sleep(retry_wait_seconds)
-                try:
-                    build = self.api_client.builds.read(build)
-                except AppStoreConnectApiError as api_error:
-                    raise AppStoreConnectError(str(api_error))
-            elif build.attributes.processingState in (BuildProcessingState.FAILED, BuildProcessingState.INVALID):
-                raise IOError(f"Uploaded build {build.id} is {build.attributes.processingState.value.lower()}")
-            else:
-                self.logger.info(Colors.GREEN("Processing build %s is completed"), build.id)
-                return build
-            is_first_attempt = False
-
-        raise IOError(
-            (
-                f"Waiting for build {build.id} processing timed out in {max_processing_minutes} minutes. "
-                f"You can configure maximum timeout using {PublishArgument.MAX_BUILD_PROCESSING_WAIT.flag} "
-                f"command line option, or {Types.MaxBuildProcessingWait.environment_variable_key} environment variable."
-            ),
-        )
+        primary_locale: Optional[Locale] = None
+        if any(item.locale is None for item in beta_test_info_items):
+            app = self.api_client.builds.read_app(build_id)
+            primary_locale = app.attributes.primaryLocale
+            msg_template = "Using application %s primary locale %s for beta build localization"
+            self.logger.info(msg_template, app.attributes.name, primary_locale.value)
 
-    def _wait_until_build_beta_detail_is_processed(
-        self,
-        build: Build,
-        processing_started_at: float,
-        max_processing_minutes: int,
-        retry_wait_seconds: int,
-    ) -> BuildBetaDetail:
-        is_first_attempt = True
-        build_beta_detail = None
-        while time.time() - processing_started_at < max_processing_minutes * 60:
-            try:
-                build_beta_detail = self.api_client.builds.read_beta_detail(build)
-            except AppStoreConnectApiError as api_error:
-                raise AppStoreConnectError(str(api_error))
-
-            if (
-                build_beta_detail.attributes.externalBuildState is not ExternalBetaState.PROCESSING
-                or build_beta_detail.attributes.internalBuildState is not InternalBetaState.PROCESSING
-            ):
-                self.logger.info(
-                    Colors.GREEN("Processing build %s beta detail %s is completed"),
-                    build.id,
-                    build_beta_detail.id,
-                )
-                return build_beta_detail
-
-            if is_first_attempt:
-                self._log_build_beta_detail_processing_message(build.id, max_processing_minutes)
-
-            msg_template = (
-                "Build %s beta details %s are still being processed on App Store Connect side, "
-                "waiting %d seconds and checking again"
-            )
-            self.logger.info(msg_template, build.id, build_beta_detail.id, retry_wait_seconds)
-            time.sleep(retry_wait_seconds)
-            is_first_attempt = False
-
-        build_beta_detail_id = build_beta_detail.id if build_beta_detail else "N/A"
-        raise IOError(
-            (
-                f"Waiting for build {build.id} beta detail {build_beta_detail_id} processing "
-                f"timed out in {max_processing_minutes} minutes. "
-                f"You can configure maximum timeout using {PublishArgument.MAX_BUILD_PROCESSING_WAIT.flag} "
-                f"command line option, or {Types.MaxBuildProcessingWait.environment_variable_key} environment variable."
-            ),
+        beta_localizations_filter = BetaBuildLocalizations.Filter(build=build_id)
+        try:
+            existing_localizations = self.api_client.beta_build_localizations.list(beta_localizations_filter)
+        except AppStoreConnectApiError:
+            existing_localizations = []
+
+        desired_localizations: Dict[Locale, Dict[str, Optional[str]]] = {
+            cast(Locale, item.locale or primary_locale): {"whats_new": item.whats_new} for item in beta_test_info_items
+        }
+        # The notes are automatically created for default locale some time after the build is
+        # submitted to App Store Connect. Localizations that exist already are modified if needed,
+        # localizations for the other locales are created.
+        results = self._sync_localizations(
+            self.api_client.session,
+            {localization.attributes.locale: localization for localization in existing_localizations},
+            desired_localizations,
+            create=functools.partial(self.api_client.beta_build_localizations.create, build_id),
+            modify=self.api_client.beta_build_localizations.modify,
         )
+        self._log_localization_sync_results(BetaBuildLocalization, results)
+
+        failed_results = [result for result in results if result.error is not None]
+        if failed_results:
+            error_lines = [
+                f"Failed to {'update' if result.localization else 'create'} {BetaBuildLocalization} "
+                f"for locale {result.locale}. {result.error}"
+                for result in failed_results
+            ]
+            raise AppStoreConnectError("\n".join(error_lines))
 
     def wait_until_build_is_processed(
         self,
@@ -338,27 +295,29 @@ class BuildsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         Returns updated build instance that is already processed.
         """
         self.logger.info(Colors.BLUE(f"\nWait until build {build.id} and its beta details are processed"))
+        self._log_build_processing_message(build.id, max_processing_minutes)
 
-        processing_started_at = time.time()
-
-        build = self._wait_until_build_is_processed(
-            build,
-            processing_started_at,
-            max_processing_minutes,
-            retry_wait_seconds,
-        )
-        build_beta_detail = self._wait_until_build_beta_detail_is_processed(
-            build,
-            processing_started_at,
-            max_processing_minutes,
-            retry_wait_seconds,
+        build_waiter = BuildWaiter(
+            self.api_client.builds,
+            on_progress=self._log_build_wait_progress,
+            max_interval=retry_wait_seconds,
         )
+        build_waiter.add_processing(build.id, build.id, max_processing_minutes * 60)
+        progress = build_waiter.wait()[build.id]
+
+        if progress.state is BuildWaitState.TIMED_OUT:
+            raise IOError(self._get_build_processing_timeout_message(build.id, max_processing_minutes))
+        elif progress.state is BuildWaitState.FAILED and progress.build is not None:
+            raise IOError(progress.error)
+        elif progress.state is BuildWaitState.FAILED or progress.build is None:
+            raise AppStoreConnectError(progress.error)
 
         self.logger.info(Colors.GREEN("\nProcessed build and beta details are"))
-        self.printer.print_resource(build, True)
-        self.printer.print_resource(build_beta_detail, True)
+        self.printer.print_resource(progress.build, True)
+        if progress.build_beta_detail:
+            self.printer.print_resource(progress.build_beta_detail, True)
 
-        return build
+        return progress.build
 
     def _log_build_processing_message(self, build_id: ResourceId, max_processing_minutes: int):
         processing_message_template = (
@@ -368,10 +327,24 @@ class BuildsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         )
         self.logger.info(Colors.BLUE(processing_message_template), build_id, max_processing_minutes)
 
-    def _log_build_beta_detail_processing_message(self, build_beta_detail_id: ResourceId, max_processing_minutes: int):
-        processing_message_template = (
-            "Processing build beta detail information by Apple can take some time after "
-            "the build is already processed. Timeout for waiting the processing "
-            "to finish for build beta detail %s is set to %d minutes."
+    def _log_build_wait_progress(self, progress: BuildWaitProgress):
+        build = progress.build
+        if build is None:
+            return
+        elif progress.state is BuildWaitState.PROCESSED:
+            self.logger.info(Colors.GREEN("Processing build %s is completed"), build.id)
+        elif progress.state is BuildWaitState.PROCESSING:
+            if build.attributes.processingState is BuildProcessingState.PROCESSING:
+                subject = f"Build {build.id} is"
+            else:
+                subject = f"Build {build.id} beta details are"
+            msg_template = "%s still being processed on App Store Connect side, waiting %d seconds and checking again"
+            self.logger.info(msg_template, subject, round(progress.next_check_in or 0))
+
+    @classmethod
+    def _get_build_processing_timeout_message(cls, build_id: ResourceId, max_processing_minutes: int) -> str:
+        return (
+            f"Waiting for build {build_id} processing timed out in {max_processing_minutes} minutes. "
+            f"You can configure maximum timeout using {PublishArgument.MAX_BUILD_PROCESSING_WAIT.flag} "
+            f"command line option, or {Types.MaxBuildProcessingWait.environment_variable_key} environment variable."
         )
-        self.logger.info(Colors.BLUE(processing_message_template), build_beta_detail_id, max_processing_minutes)
@@ -86,6 +86,7 @@ class BundleIdsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         BundleIdArgument.PLATFORM_OPTIONAL,
         BundleIdArgument.IDENTIFIER_STRICT_MATCH,
         action_group=AppStoreConnectActionGroup.BUNDLE_IDS,
+        action_options={"discards_listed_resources": True},
         deprecation_info=cli.ActionDeprecationInfo("list-bundle-ids", "0.49.0"),
     )
     def list_bundle_ids(
@@ -100,19 +101,16 @@ class BundleIdsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         List Bundle IDs from Apple Developer portal matching given constraints
         """
 
-        def predicate(bundle_id):
-            return bundle_id.attributes.identifier == bundle_id_identifier
-
         bundle_id_filter = self.api_client.bundle_ids.Filter(
             identifier=bundle_id_identifier,
             name=bundle_id_name,
             platform=platform,
+            identifier_strict_match=bundle_id_identifier_strict_match,
         )
         bundle_ids = self._list_resources(
             bundle_id_filter,
             cast("ListingResourceManager[BundleId]", self.api_client.bundle_ids),
             should_print,
-            filter_predicate=predicate if bundle_id_identifier_strict_match else None,
         )
 
         return bundle_ids
@@ -164,17 +162,36 @@ class BundleIdsActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             name=profile_name,
         )
 
-        profiles = []
-        for resource_id in set(bundle_id_resource_ids):
-            bundle_id_profiles = self._list_related_resources(
-                resource_id,
-                BundleId,
+        # Profiles of up to 50 bundle IDs are included in one bundle IDs listing request.
+        # Profiles need to be listed separately only for bundle IDs that have more of those.
+        resource_ids = list(dict.fromkeys(bundle_id_resource_ids))
+        bundle_ids_filter = self.api_client.bundle_ids.Filter(id=resource_ids)
+        self.logger.info(f"Get {Profile.s} for {BundleId.plural(len(resource_ids))} {', '.join(resource_ids)}")
+
+        profiles: List[Profile] = []
+        found_bundle_id_resource_ids = set()
+        try:
+            for bundle_id, bundle_id_profiles in self.api_client.bundle_ids.iter_list_with_include(
                 Profile,
-                self.api_client.bundle_ids.list_profiles,
-                profiles_filter,
-                should_print,
-            )
-            profiles.extend(bundle_id_profiles)
+                resource_filter=bundle_ids_filter,
+            ):
+                if bundle_id_profiles is None:
+                    bundle_id_profiles = self.api_client.bundle_ids.list_profiles(bundle_id)
+                bundle_id_profiles = [profile for profile in bundle_id_profiles if profiles_filter.matches(profile)]
+                found_bundle_id_resource_ids.add(bundle_id.id)
+                self.printer.log_found(Profile, bundle_id_profiles, profiles_filter, BundleId, bundle_id)
+                self.printer.print_resources(bundle_id_profiles, should_print)
+                profiles.extend(bundle_id_profiles)
+        except AppStoreConnectApiError as api_error:
+            raise AppStoreConnectError(
+                str(api_error),
+                api_error_response=api_error.error_response,
+            ) from api_error
+
+        missing_resource_ids = [r for r in resource_ids if r not in found_bundle_id_resource_ids]
+        if missing_resource_ids:
+            missing = ", ".join(missing_resource_ids)
+            raise AppStoreConnectError(f"{BundleId.plural(len(missing_resource_ids))} not found: {missing}")
 
         if save:
             self._save_profiles(profiles)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import pathlib
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from typing import List
 from typing import Optional
@@ -31,6 +33,9 @@ if TYPE_CHECKING:
 
 
 class CertificatesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
+    # Parse certificates in a thread pool only if there are enough of them to pay off
+    _CONCURRENT_PARSING_THRESHOLD = 16
+
     @cli.action(
         "create",
         CertificateArgument.CERTIFICATE_TYPE,
@@ -142,6 +147,7 @@ class CertificatesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         CertificateArgument.P12_CONTAINER_PASSWORD,
         CommonArgument.SAVE,
         action_group=AppStoreConnectActionGroup.CERTIFICATES,
+        action_options={"discards_listed_resources": True},
         deprecation_info=cli.ActionDeprecationInfo("list-certificates", "0.49.0"),
     )
     def list_certificates(
@@ -188,14 +194,11 @@ class CertificatesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             certificate_filter,
             cast("ListingResourceManager[SigningCertificate]", self.api_client.signing_certificates),
             should_print,
+            is_result_required=bool(private_key or save),
         )
 
         if private_key:
-            certificates = [
-                certificate
-                for certificate in certificates
-                if Certificate.from_ans1(certificate.asn1_content).is_signed_with(private_key)
-            ]
+            certificates = self._filter_certificates_by_private_key(certificates, private_key)
             self.printer.log_filtered(SigningCertificate, certificates, "for given private key")
             for certificate in certificates:
                 self.logger.info(f"- {certificate.get_display_info()}")
@@ -208,3 +211,25 @@ class CertificatesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             )
 
         return certificates
+
+    def _filter_certificates_by_private_key(
+        self,
+        certificates: Sequence[SigningCertificate],
+        private_key: PrivateKey,
+    ) -> List[SigningCertificate]:
+        """
+        Find certificates that are signed with given private key by comparing the
+        public key fingerprints of the certificates against the private key's one
+        """
+        private_key_fingerprint = private_key.get_public_key_fingerprint()
+        if len(certificates) < self._CONCURRENT_PARSING_THRESHOLD:
+            fingerprints = [self._get_public_key_fingerprint(certificate) for certificate in certificates]
+        else:
+            max_workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.__class__.__name__) as executor:
+                fingerprints = list(executor.map(self._get_public_key_fingerprint, certificates))
+        return [
+            certificate
+            for certificate, fingerprint in zip(certificates, fingerprints)
+            if fingerprint == private_key_fingerprint
+        ]
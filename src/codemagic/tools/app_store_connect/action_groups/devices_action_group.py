@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from abc import ABCMeta
+from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -9,14 +12,18 @@ from typing import Union
 from typing import cast
 
 from codemagic import cli
+from codemagic.apple import AppStoreConnectApiError
 from codemagic.apple.resources import BundleIdPlatform
 from codemagic.apple.resources import Device
 from codemagic.apple.resources import DeviceStatus
+from codemagic.apple.resources import ErrorResponse
+from codemagic.apple.resources.resource import DictSerializable
 from codemagic.cli import Colors
 
 from ..abstract_base_action import AbstractBaseAction
 from ..action_group import AppStoreConnectActionGroup
 from ..arguments import BundleIdArgument
+from ..arguments import CommonArgument
 from ..arguments import DeviceArgument
 from ..arguments import Types
 from ..errors import AppStoreConnectError
@@ -26,6 +33,28 @@ if TYPE_CHECKING:
     from codemagic.apple.app_store_connect.resource_manager import ListingResourceManager
 
 
+@dataclass
+class DeviceRegistrationFailure(DictSerializable):
+    udid: str
+    error: ErrorResponse
+
+
+@dataclass
+class DeviceRegistrationReport(DictSerializable):
+    created: List[Device] = field(default_factory=list)
+    existing: List[Device] = field(default_factory=list)
+    failed: List[DeviceRegistrationFailure] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        lines = [f"Created devices: {len(self.created)}"]
+        lines.extend(f"- {device.attributes.udid} {device.attributes.name} ({device.id})" for device in self.created)
+        lines.append(f"Already registered devices: {len(self.existing)}")
+        lines.extend(f"- {device.attributes.udid} {device.attributes.name} ({device.id})" for device in self.existing)
+        lines.append(f"Failed registrations: {len(self.failed)}")
+        lines.extend(f"- {failure.udid}: {failure.error}" for failure in self.failed)
+        return "\n".join(lines)
+
+
 class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
     @cli.action(
         "list",
@@ -33,6 +62,7 @@ class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         DeviceArgument.DEVICE_NAME_OPTIONAL,
         DeviceArgument.DEVICE_STATUS,
         action_group=AppStoreConnectActionGroup.DEVICES,
+        action_options={"discards_listed_resources": True},
         deprecation_info=cli.ActionDeprecationInfo("list-devices", "0.49.0"),
     )
     def list_devices(
@@ -63,6 +93,8 @@ class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         DeviceArgument.DEVICE_NAME,
         DeviceArgument.DEVICE_UDIDS,
         DeviceArgument.IGNORE_REGISTRATION_ERRORS,
+        DeviceArgument.BATCH_REGISTRATION,
+        CommonArgument.MAX_CONCURRENT_REQUESTS,
         action_group=AppStoreConnectActionGroup.DEVICES,
         deprecation_info=cli.ActionDeprecationInfo("register-device", "0.49.0"),
     )
@@ -79,6 +111,8 @@ class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             ]
         ] = None,
         ignore_registration_errors: bool = DeviceArgument.IGNORE_REGISTRATION_ERRORS.get_default(),
+        batch_registration: bool = DeviceArgument.BATCH_REGISTRATION.get_default(),
+        max_concurrent_requests: Optional[Union[int, Types.MaxConcurrentRequests]] = None,
         should_print: bool = True,
     ) -> List[Device]:
         """
@@ -102,6 +136,19 @@ class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             else:
                 device_udids_values.append(device_udids)
 
+        if batch_registration:
+            report = self._register_devices_in_batch(
+                platform,
+                device_name,
+                device_udids_values,
+                Types.MaxConcurrentRequests.resolve_value(max_concurrent_requests),
+            )
+            self.printer.print_value(report, should_print)
+            if report.failed and not ignore_registration_errors:
+                failures = (f"Failed to register device {failure.udid}: {failure.error}" for failure in report.failed)
+                raise AppStoreConnectError("\n".join(failures))
+            return [*report.created, *report.existing]
+
         registered_devices = []
         for device_udid in device_udids_values:
             try:
@@ -122,3 +169,50 @@ class DevicesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             self.echo("") if should_print else None
 
         return registered_devices
+
+    def _register_devices_in_batch(
+        self,
+        platform: BundleIdPlatform,
+        device_name: str,
+        device_udids: Sequence[str],
+        max_concurrent_requests: int,
+    ) -> DeviceRegistrationReport:
+        # Apple compares UDIDs case-insensitively, hence normalized UDIDs are used for matching
+        requested_udids: Dict[str, str] = {}
+        for device_udid in device_udids:
+            requested_udids.setdefault(device_udid.lower(), device_udid)
+
+        self.logger.info(Colors.BLUE(f"List registered {Device.s} to find existing UDIDs"))
+        try:
+            registered_devices = self.api_client.devices.list()
+        except AppStoreConnectApiError as api_error:
+            raise AppStoreConnectError(str(api_error)) from api_error
+
+        report = DeviceRegistrationReport()
+        for device in registered_devices:
+            if requested_udids.pop(device.attributes.udid.lower(), None) is not None:
+                report.existing.append(device)
+
+        new_udids = list(requested_udids.values())
+        self.logger.info(
+            f"{len(report.existing)} of {len(report.existing) + len(new_udids)} UDIDs are already registered, "
+            f"register {len(new_udids)} new {Device.plural(len(new_udids))}",
+        )
+
+        def register(device_udid: str) -> Union[Device, DeviceRegistrationFailure]:
+            try:
+                device = self.api_client.devices.create(name=device_name, platform=platform, udid=device_udid)
+            except AppStoreConnectApiError as api_error:
+                self.logger.warning(Colors.RED(f"Failed to register device {device_udid}"))
+                return DeviceRegistrationFailure(device_udid, api_error.error_response)
+            self.printer.log_created(device)
+            return device
+
+        for result in self.api_client.session.map(register, new_udids, max_workers=max_concurrent_requests):
+            if isinstance(result, DeviceRegistrationFailure):
+                report.failed.append(result)
+            else:
+                report.created.append(result)
+        if report.created:
+            self._invalidate_mirrored_resources(Device)
+        return report
@@ -132,6 +132,7 @@ class ProfilesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
         ProfileArgument.PROFILE_NAME,
         CommonArgument.SAVE,
         action_group=AppStoreConnectActionGroup.PROFILES,
+        action_options={"discards_listed_resources": True},
         deprecation_info=cli.ActionDeprecationInfo("list-profiles", "0.49.0"),
     )
     def list_profiles(
@@ -154,6 +155,7 @@ class ProfilesActionGroup(AbstractBaseAction, metaclass=ABCMeta):
             profile_filter,
             cast("ListingResourceManager[Profile]", self.api_client.profiles),
             should_print,
+            is_result_required=save,
         )
 
         if save:
@@ -5,3 +5,4 @@ from .latest_build_number_actions import GetLatestTestflightBuildNumberAction
 from .publish_action import PublishAction
 from .submit_to_app_store_action import SubmitToAppStoreAction
 from .submit_to_testflight_action import SubmitToTestFlightAction
+from .sync_action import SyncAction
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from abc import ABCMeta
 from itertools import chain
+from typing import Dict
 from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -18,6 +21,7 @@ from codemagic.apple.resources import DeviceStatus
 from codemagic.apple.resources import Profile
 from codemagic.apple.resources import ProfileState
 from codemagic.apple.resources import ProfileType
+from codemagic.apple.resources import ResourceId
 from codemagic.apple.resources import SigningCertificate
 from codemagic.cli import Colors
 from codemagic.models import PrivateKey
@@ -31,6 +35,11 @@ from ..arguments import Types
 from ..errors import AppStoreConnectError
 
 
+class _ProfileRelationships(NamedTuple):
+    bundle_id: Optional[ResourceId]
+    certificate_ids: Optional[Set[ResourceId]]
+
+
 class FetchSigningFilesAction(AbstractBaseAction, metaclass=ABCMeta):
     @cli.action(
         "fetch-signing-files",
@@ -151,24 +160,6 @@ class FetchSigningFilesAction(AbstractBaseAction, metaclass=ABCMeta):
         create_resource: bool,
         platform: Optional[BundleIdPlatform] = None,
     ):
-        def has_certificate(profile) -> bool:
-            try:
-                profile_certificates = self.api_client.profiles.list_certificate_ids(profile)
-                return bool(certificate_ids.issubset({c.id for c in profile_certificates}))
-            except AppStoreConnectApiError as err:
-                error = f"Listing {SigningCertificate.s} for {Profile} {profile.id} failed unexpectedly"
-                self.logger.warning(Colors.YELLOW(f"{error}: {err.error_response}"))
-                return False
-
-        def missing_profile(bundle_id) -> bool:
-            try:
-                bundle_ids_profiles = self.api_client.bundle_ids.list_profile_ids(bundle_id)
-                return not (profile_ids & {p.id for p in bundle_ids_profiles})
-            except AppStoreConnectApiError as err:
-                error = f"Listing {Profile.s} for {BundleId} {bundle_id.id} failed unexpectedly"
-                self.logger.warning(Colors.YELLOW(f"{error}: {err.error_response}"))
-                return True
-
         certificate_ids = {c.id for c in certificates}
         profiles = self.list_bundle_id_profiles(
             [bundle_id.id for bundle_id in bundle_ids],
@@ -176,6 +167,12 @@ class FetchSigningFilesAction(AbstractBaseAction, metaclass=ABCMeta):
             profile_state=ProfileState.ACTIVE,
             should_print=False,
         )
+        profiles_relationships = self._get_profiles_relationships(profiles)
+
+        def has_certificate(profile: Profile) -> bool:
+            profile_certificate_ids = profiles_relationships[profile.id].certificate_ids
+            return profile_certificate_ids is not None and certificate_ids.issubset(profile_certificate_ids)
+
         profiles = list(filter(has_certificate, profiles))
 
         certificate_names = ", ".join(c.get_display_info() for c in certificates)
@@ -184,8 +181,8 @@ class FetchSigningFilesAction(AbstractBaseAction, metaclass=ABCMeta):
         for profile in profiles:
             self.logger.info(f"- {profile.get_display_info()}")
 
-        profile_ids = {p.id for p in profiles}
-        bundle_ids_without_profiles = list(filter(missing_profile, bundle_ids))
+        bundle_ids_with_profiles = {profiles_relationships[p.id].bundle_id for p in profiles}
+        bundle_ids_without_profiles = [b for b in bundle_ids if b.id not in bundle_ids_with_profiles]
         if bundle_ids_without_profiles and not create_resource:
             missing = ", ".join(f'"{bid.attributes.identifier}" [{bid.id}]' for bid in bundle_ids_without_profiles)
             raise AppStoreConnectError(f"Did not find {profile_type} {Profile.s} for {BundleId.s}: {missing}")
@@ -199,6 +196,52 @@ class FetchSigningFilesAction(AbstractBaseAction, metaclass=ABCMeta):
         profiles.extend(created_profiles)
         return profiles
 
+    def _get_profiles_relationships(self, profiles: Sequence[Profile]) -> Dict[ResourceId, _ProfileRelationships]:
+        """
+        Find certificates and bundle IDs of given profiles. Those are included in the profiles
+        listing response, and profiles are looked up in batches by their IDs. Certificates need
+        to be listed separately only for profiles that have more of them than the API includes.
+        """
+        relationships = {p.id: _ProfileRelationships(None, None) for p in profiles}
+        if not profiles:
+            return relationships
+
+        profiles_filter = self.api_client.profiles.Filter(id=list(relationships.keys()))
+        try:
+            for profile in self.api_client.profiles.iter_list(
+                resource_filter=profiles_filter,
+                fields=["bundleId", "certificates"],
+                include=["bundleId", "certificates"],
+            ):
+                if profile.relationships is None:
+                    continue
+                bundle_id_data = profile.relationships.bundleId.get_linked_data()
+                certificates_data = profile.relationships.certificates.get_linked_data()
+                certificate_ids: Optional[Set[ResourceId]] = None
+                if certificates_data is not None:
+                    certificate_ids = {ResourceId(c.id) for c in certificates_data}
+                relationships[profile.id] = _ProfileRelationships(
+                    bundle_id=ResourceId(bundle_id_data[0].id) if bundle_id_data else None,
+                    certificate_ids=certificate_ids,
+                )
+        except AppStoreConnectApiError as err:
+            error = f"Listing {SigningCertificate.s} for {Profile.s} failed unexpectedly"
+            self.logger.warning(Colors.YELLOW(f"{error}: {err.error_response}"))
+            return relationships
+
+        for profile_id, profile_relationships in relationships.items():
+            if profile_relationships.certificate_ids is not None:
+                continue
+            try:
+                profile_certificates = self.api_client.profiles.list_certificate_ids(profile_id)
+            except AppStoreConnectApiError as err:
+                error = f"Listing {SigningCertificate.s} for {Profile} {profile_id} failed unexpectedly"
+                self.logger.warning(Colors.YELLOW(f"{error}: {err.error_response}"))
+            else:
+                profile_certificate_ids = {c.id for c in profile_certificates}
+                relationships[profile_id] = profile_relationships._replace(certificate_ids=profile_certificate_ids)
+        return relationships
+
     def _create_missing_profiles(
         self,
         bundle_ids_without_profiles: Sequence[BundleId],
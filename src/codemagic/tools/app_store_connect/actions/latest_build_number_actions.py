@@ -3,6 +3,9 @@ from __future__ import annotations
 import dataclasses
 import operator
 from abc import ABC
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import cast
@@ -12,6 +15,7 @@ from codemagic.apple import AppStoreConnectApiError
 from codemagic.apple.resources import BuildVersionInfo
 from codemagic.apple.resources import Platform
 from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
 from codemagic.cli import Argument
 from codemagic.cli import Colors
 from codemagic.utilities import versions
@@ -67,6 +71,41 @@ class AbstractGetLatestBuildNumberAction(AbstractBaseAction, ABC):
         else:
             self.printer.print_value(latest_build_info.build_number, True)
 
+    @classmethod
+    def __get_related_resource_id(cls, resource_data: Dict, relationship: str) -> Optional[str]:
+        relationship_data = resource_data.get("relationships", {}).get(relationship, {}).get("data")
+        return relationship_data["id"] if relationship_data else None
+
+    @classmethod
+    def __get_included_versions(cls, included: List[Dict], resource_type: ResourceType, field: str) -> Dict[str, str]:
+        return {item["id"]: item["attributes"][field] for item in included if item["type"] == resource_type.value}
+
+    @classmethod
+    def __get_latest(cls, build_infos: Iterable[_LatestBuildInfo]) -> Optional[_LatestBuildInfo]:
+        return max(
+            build_infos,
+            key=lambda bi: (versions.sorting_key(bi.version), versions.sorting_key(bi.build_number)),
+            default=None,
+        )
+
+    def __probe_versions(
+        self,
+        resource_versions: List[_ResourceVersion],
+        probe: Callable[[_ResourceVersion], Optional[_LatestBuildInfo]],
+    ) -> Optional[_LatestBuildInfo]:
+        """
+        Check given versions concurrently in batches, starting from the highest version.
+        Versions lower than the batch where the first build was found are not checked.
+        """
+        batch_size = self.api_client.session.max_concurrent_requests
+        for offset in range(0, len(resource_versions), batch_size):
+            batch = resource_versions[offset : offset + batch_size]
+            build_infos = self.api_client.session.map(probe, batch)
+            latest_build_info = next((build_info for build_info in build_infos if build_info), None)
+            if latest_build_info:
+                return latest_build_info
+        return None
+
     def __get_ordered_pre_release_version_numbers(
         self,
         application_id: ResourceId,
@@ -132,39 +171,119 @@ class AbstractGetLatestBuildNumberAction(AbstractBaseAction, ABC):
             default=None,
         )
 
-    def __get_testflight_latest_build_info(
+    def __list_testflight_latest_build_info(
         self,
-        pre_release_versions: List[_ResourceVersion],
+        application_id: ResourceId,
+        pre_release_version: Optional[str],
+        platform: Optional[Platform],
         build_expired_status: Optional[bool],
     ) -> Optional[_LatestBuildInfo]:
-        for pre_release_version in pre_release_versions:
+        builds_filter = self.api_client.builds.Filter(
+            app=application_id,
+            expired=build_expired_status,
+            pre_release_version_version=pre_release_version,
+            pre_release_version_platform=platform,
+        )
+        builds_data = self.api_client.builds.list_data_with_included(
+            builds_filter,
+            fields=("version", "preReleaseVersion"),
+            include=("preReleaseVersion",),
+            included_fields={ResourceType.PRE_RELEASE_VERSIONS: ("version",)},
+        )
+        pre_release_versions = self.__get_included_versions(
+            builds_data.included,
+            ResourceType.PRE_RELEASE_VERSIONS,
+            "version",
+        )
+        build_infos = []
+        for build_data in builds_data.data:
+            pre_release_version_id = self.__get_related_resource_id(build_data, "preReleaseVersion")
+            if pre_release_version_id not in pre_release_versions:
+                continue
+            build_info = _LatestBuildInfo(
+                build_id=build_data["id"],
+                build_number=build_data["attributes"]["version"],
+                pre_release_version=pre_release_versions[pre_release_version_id],
+            )
+            build_infos.append(build_info)
+        return self.__get_latest(build_infos)
+
+    def __probe_testflight_latest_build_info(
+        self,
+        application_id: ResourceId,
+        pre_release_version: Optional[str],
+        platform: Optional[Platform],
+        build_expired_status: Optional[bool],
+    ) -> Optional[_LatestBuildInfo]:
+        def probe(pre_release_version: _ResourceVersion) -> Optional[_LatestBuildInfo]:
             max_build = self.__get_pre_release_version_max_build(pre_release_version.id, build_expired_status)
             if not max_build:
-                continue
+                return None
             return _LatestBuildInfo(
                 build_id=max_build.id,
                 build_number=max_build.version,
                 pre_release_version=pre_release_version.version,
             )
-        return None
 
-    def __get_app_store_latest_build_info(
+        pre_release_versions = self.__get_ordered_pre_release_version_numbers(
+            application_id,
+            pre_release_version,
+            platform,
+        )
+        return self.__probe_versions(pre_release_versions, probe)
+
+    def __list_app_store_latest_build_info(
+        self,
+        application_id: ResourceId,
+        version_string: Optional[str],
+        platform: Optional[Platform],
+    ) -> Optional[_LatestBuildInfo]:
+        versions_filter = self.api_client.app_store_versions.Filter(
+            platform=platform,
+            version_string=version_string,
+        )
+        app_store_versions_data = self.api_client.apps.list_app_store_versions_data_with_included(
+            application_id,
+            resource_filter=versions_filter,
+            fields=("versionString", "build"),
+            include=("build",),
+            included_fields={ResourceType.BUILDS: ("version",)},
+        )
+        build_numbers = self.__get_included_versions(app_store_versions_data.included, ResourceType.BUILDS, "version")
+        build_infos = []
+        for app_store_version_data in app_store_versions_data.data:
+            build_id = self.__get_related_resource_id(app_store_version_data, "build")
+            if build_id not in build_numbers:
+                continue
+            build_info = _LatestBuildInfo(
+                build_id=build_id,
+                build_number=build_numbers[build_id],
+                app_store_version=app_store_version_data["attributes"]["versionString"],
+            )
+            build_infos.append(build_info)
+        return self.__get_latest(build_infos)
+
+    def __probe_app_store_latest_build_info(
         self,
-        app_store_versions: List[_ResourceVersion],
+        application_id: ResourceId,
+        version_string: Optional[str],
+        platform: Optional[Platform],
     ) -> Optional[_LatestBuildInfo]:
-        for app_store_version in app_store_versions:
+        def probe(app_store_version: _ResourceVersion) -> Optional[_LatestBuildInfo]:
             max_build_data = self.api_client.app_store_versions.read_build_data(
                 ResourceId(app_store_version.id),
                 fields=("version",),
             )
             if not max_build_data:
-                continue
+                return None
             return _LatestBuildInfo(
                 build_id=ResourceId(max_build_data["id"]),
                 build_number=max_build_data["attributes"]["version"],
                 app_store_version=app_store_version.version,
             )
-        return None
+
+        app_store_versions = self.__get_ordered_app_store_version_numbers(application_id, version_string, platform)
+        return self.__probe_versions(app_store_versions, probe)
 
     def _get_testflight_latest_build_info(
         self,
@@ -173,13 +292,15 @@ class AbstractGetLatestBuildNumberAction(AbstractBaseAction, ABC):
         platform: Optional[Platform] = None,
         build_expired_status: Optional[bool] = None,
     ) -> Optional[_LatestBuildInfo]:
+        lookup_args = (application_id, pre_release_version, platform, build_expired_status)
         try:
-            pre_release_version_numbers = self.__get_ordered_pre_release_version_numbers(
-                application_id,
-                pre_release_version,
-                platform,
-            )
-            return self.__get_testflight_latest_build_info(pre_release_version_numbers, build_expired_status)
+            try:
+                return self.__list_testflight_latest_build_info(*lookup_args)
+            except AppStoreConnectApiError as api_error:
+                if api_error.status_code != 400:
+                    raise
+                self.logger.debug("Listing builds with pre-release versions failed, check versions one by one")
+                return self.__probe_testflight_latest_build_info(*lookup_args)
         except AppStoreConnectApiError as api_error:
             raise AppStoreConnectError(str(api_error))
 
@@ -189,13 +310,15 @@ class AbstractGetLatestBuildNumberAction(AbstractBaseAction, ABC):
         version_string: Optional[str] = None,
         platform: Optional[Platform] = None,
     ) -> Optional[_LatestBuildInfo]:
+        lookup_args = (application_id, version_string, platform)
         try:
-            app_store_version_numbers = self.__get_ordered_app_store_version_numbers(
-                application_id,
-                version_string,
-                platform,
-            )
-            return self.__get_app_store_latest_build_info(app_store_version_numbers)
+            try:
+                return self.__list_app_store_latest_build_info(*lookup_args)
+            except AppStoreConnectApiError as api_error:
+                if api_error.status_code != 400:
+                    raise
+                self.logger.debug("Listing App Store versions with builds failed, check versions one by one")
+                return self.__probe_app_store_latest_build_info(*lookup_args)
         except AppStoreConnectApiError as api_error:
             raise AppStoreConnectError(str(api_error))
 
@@ -216,8 +339,15 @@ class GetLatestBuildNumberAction(AbstractGetLatestBuildNumberAction, ABC):
         """
         Get the highest build number of the highest version used for the given app.
         """
-        app_store_build_info = self._get_app_store_latest_build_info(application_id, platform=platform)
-        testflight_build_info = self._get_testflight_latest_build_info(application_id, platform=platform)
+        # App Store and TestFlight lookups are independent, do them side by side
+        lookups: List[Callable[..., Optional[_LatestBuildInfo]]] = [
+            self._get_app_store_latest_build_info,
+            self._get_testflight_latest_build_info,
+        ]
+        app_store_build_info, testflight_build_info = self.api_client.session.map(
+            lambda lookup: lookup(application_id, platform=platform),
+            lookups,
+        )
 
         latest_build_info: _LatestBuildInfo
         if app_store_build_info is not None and testflight_build_info is not None:
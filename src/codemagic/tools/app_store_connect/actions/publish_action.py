@@ -1,25 +1,31 @@
 from __future__ import annotations
 
 import dataclasses
-import itertools
 import pathlib
 import time
 from abc import ABCMeta
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Union
 
 from codemagic import cli
-from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.builds import BuildWaiter
+from codemagic.apple.app_store_connect.builds import BuildWaitProgress
+from codemagic.apple.app_store_connect.builds import BuildWaitState
 from codemagic.apple.resources import App
 from codemagic.apple.resources import Build
 from codemagic.apple.resources import Locale
 from codemagic.apple.resources import Platform
 from codemagic.apple.resources import ReleaseType
-from codemagic.apple.resources import ResourceId
 from codemagic.cli import Argument
 from codemagic.cli import Colors
 from codemagic.models import Altool
@@ -84,11 +90,35 @@ class SubmitToAppStoreOptions:
     disable_phased_release: Optional[bool] = None
 
 
+@dataclass
+class _PublishingPackage:
+    application_package: Union[Ipa, MacOsPackage]
+    testflight_options: Optional[SubmitToTestFlightOptions] = None
+    app_store_options: Optional[SubmitToAppStoreOptions] = None
+    beta_test_info_options: Optional[AddBetaTestInfoOptions] = None
+    beta_group_options: Optional[AddBuildToBetaGroupOptions] = None
+    # Publishing progress
+    build: Optional[Build] = None
+
+    @property
+    def has_post_upload_actions(self) -> bool:
+        return any(
+            [self.testflight_options, self.app_store_options, self.beta_test_info_options, self.beta_group_options],
+        )
+
+    @property
+    def requires_processed_build(self) -> bool:
+        return bool(self.testflight_options or self.app_store_options or self.beta_group_options)
+
+
+_PUBLISHING_ERRORS = (AppStoreConnectError, IOError, ValueError)
+
 ACTION_ARGUMENTS = (
     PublishArgument.APPLICATION_PACKAGE_PATH_PATTERNS,
     PublishArgument.APPLE_ID,
     PublishArgument.APP_SPECIFIC_PASSWORD,
     *ArgumentGroups.PACKAGE_UPLOAD_ARGUMENTS,
+    PublishArgument.MAX_CONCURRENT_UPLOADS,
     PublishArgument.MAX_BUILD_FIND_WAIT,
     PublishArgument.MAX_BUILD_PROCESSING_WAIT,
     *PublishArgument.with_custom_argument_group(
@@ -289,7 +319,7 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
     @cli.action(
         "publish",
         *ACTION_ARGUMENTS,
-        action_options={"requires_api_client": False},
+        action_options={"requires_api_client": False, "memoize_requests": True},
     )
     def publish(
         self,
@@ -302,6 +332,7 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         skip_package_validation: Optional[bool] = None,  # Deprecated
         enable_package_validation: Optional[bool] = None,
         skip_package_upload: Optional[bool] = None,
+        max_concurrent_uploads: Optional[Union[Types.MaxConcurrentUploads, int]] = None,
         altool_retries_count: Optional[Types.AltoolRetriesCount] = None,
         altool_retry_wait: Optional[Types.AltoolRetryWait] = None,
         altool_verbose_logging: Optional[bool] = None,
@@ -325,32 +356,30 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
 
         application_packages = self._get_publishing_application_packages(application_package_path_patterns)
         altool = self._get_altool(apple_id, app_specific_password, altool_verbose_logging)
-        failed_packages: List[str] = []
-
-        for application_package in application_packages:
-            try:
-                self._publish_application_package(
-                    altool,
-                    application_package,
-                    enable_package_validation,
-                    skip_package_upload,
-                    Types.AltoolRetriesCount.resolve_value(altool_retries_count),
-                    Types.AltoolRetryWait.resolve_value(altool_retry_wait),
-                )
-                self._process_application_after_upload(
+        publishing_packages = [
+            _PublishingPackage(
+                application_package,
+                *self._get_app_store_connect_submit_options(
                     application_package,
-                    Types.MaxFindBuildWait.resolve_value(max_find_build_wait),
-                    Types.MaxBuildProcessingWait.resolve_value(max_build_processing_wait),
-                    *self._get_app_store_connect_submit_options(
-                        application_package,
-                        submit_to_testflight,
-                        submit_to_app_store,
-                        **app_store_connect_submit_options,
-                    ),
-                )
-            except (AppStoreConnectError, IOError, ValueError) as error:
-                failed_packages.append(str(application_package.path))
-                self.logger.error(Colors.RED(error.args[0]))
+                    submit_to_testflight,
+                    submit_to_app_store,
+                    **app_store_connect_submit_options,
+                ),
+            )
+            for application_package in application_packages
+        ]
+
+        failed_packages = self._publish_application_packages(
+            publishing_packages,
+            altool,
+            enable_package_validation,
+            skip_package_upload,
+            Types.AltoolRetriesCount.resolve_value(altool_retries_count),
+            Types.AltoolRetryWait.resolve_value(altool_retry_wait),
+            Types.MaxConcurrentUploads.resolve_value(max_concurrent_uploads),
+            Types.MaxFindBuildWait.resolve_value(max_find_build_wait),
+            Types.MaxBuildProcessingWait.resolve_value(max_build_processing_wait),
+        )
 
         if failed_packages:
             raise AppStoreConnectError(f'Failed to publish {", ".join(failed_packages)}')
@@ -366,6 +395,120 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         )
         self.logger.info(message)
 
+    def _publish_application_packages(
+        self,
+        publishing_packages: List[_PublishingPackage],
+        altool: Altool,
+        enable_package_validation: Optional[bool],
+        skip_package_upload: Optional[bool],
+        altool_retries: int,
+        altool_retry_wait: float,
+        max_concurrent_uploads: int,
+        max_find_build_minutes: int,
+        max_processing_minutes: int,
+        retry_wait_seconds: int = 30,
+    ) -> List[str]:
+        """
+        Publish application packages as a pipeline: up to `max_concurrent_uploads` packages
+        are uploaded at the same time, uploaded builds are discovered and waited for by a
+        shared build waiter, and post-processing for each build is started as soon as the
+        build is ready. Failure to publish one package does not affect the others.
+        Returns paths of the packages that could not be published.
+        """
+        if not publishing_packages:
+            return []
+
+        failed_paths: Set[pathlib.Path] = set()
+        publishing_packages_by_key = {str(p.application_package.path): p for p in publishing_packages}
+        build_waiter: Optional[BuildWaiter] = None
+        if any(publishing_package.has_post_upload_actions for publishing_package in publishing_packages):
+            build_waiter = BuildWaiter(
+                self.api_client.builds,
+                on_progress=self._log_publishing_build_wait_progress,
+                max_interval=retry_wait_seconds,
+            )
+
+        def on_publishing_error(publishing_package: _PublishingPackage, error: Exception):
+            failed_paths.add(publishing_package.application_package.path)
+            self.logger.error(Colors.RED(error.args[0]))
+
+        def collect_post_processing_results(futures: Dict[Future, _PublishingPackage]):
+            for future in [f for f in futures if f.done()]:
+                try:
+                    future.result()
+                except _PUBLISHING_ERRORS as error:
+                    on_publishing_error(futures[future], error)
+                del futures[future]
+
+        upload_executor = ThreadPoolExecutor(max_workers=max_concurrent_uploads, thread_name_prefix="upload")
+        post_processing_executor = ThreadPoolExecutor(
+            max_workers=len(publishing_packages),
+            thread_name_prefix="post_processing",
+        )
+        with upload_executor, post_processing_executor:
+            uploads: Dict[Future, _PublishingPackage] = {
+                upload_executor.submit(
+                    self._publish_application_package,
+                    altool,
+                    publishing_package.application_package,
+                    enable_package_validation,
+                    skip_package_upload,
+                    altool_retries,
+                    altool_retry_wait,
+                ): publishing_package
+                for publishing_package in publishing_packages
+            }
+            post_processing: Dict[Future, _PublishingPackage] = {}
+
+            while uploads or (build_waiter and build_waiter.is_waiting):
+                for upload in [u for u in uploads if u.done()]:
+                    publishing_package = uploads.pop(upload)
+                    try:
+                        upload.result()
+                        if build_waiter and publishing_package.has_post_upload_actions:
+                            self._find_uploaded_build(publishing_package, build_waiter, max_find_build_minutes)
+                    except _PUBLISHING_ERRORS as error:
+                        on_publishing_error(publishing_package, error)
+
+                for progress in build_waiter.check() if build_waiter else []:
+                    publishing_package = publishing_packages_by_key[progress.key]
+                    try:
+                        build_to_process = self._on_build_wait_finished(
+                            publishing_package,
+                            progress,
+                            max_find_build_minutes,
+                            max_processing_minutes,
+                        )
+                    except _PUBLISHING_ERRORS as error:
+                        on_publishing_error(publishing_package, error)
+                        continue
+
+                    if build_to_process and build_waiter:
+                        build_waiter.add_processing(progress.key, build_to_process.id, max_processing_minutes * 60)
+                    else:
+                        future = post_processing_executor.submit(self._process_uploaded_build, publishing_package)
+                        post_processing[future] = publishing_package
+
+                collect_post_processing_results(post_processing)
+                if build_waiter and build_waiter.is_waiting:
+                    # Sleep until the next build check is due, or until some upload finishes
+                    timeout = build_waiter.get_seconds_until_next_check()
+                    if uploads:
+                        wait(uploads, timeout=timeout, return_when=FIRST_COMPLETED)
+                    else:
+                        time.sleep(timeout or 0)
+                elif uploads:
+                    wait(uploads, return_when=FIRST_COMPLETED)
+
+            wait(post_processing)
+            collect_post_processing_results(post_processing)
+
+        return [
+            str(publishing_package.application_package.path)
+            for publishing_package in publishing_packages
+            if publishing_package.application_package.path in failed_paths
+        ]
+
     def _publish_application_package(
         self,
         altool: Altool,
@@ -389,47 +532,117 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         else:
             self.logger.info(Colors.YELLOW('\nSkip uploading "%s" to App Store Connect'), application_package.path)
 
-    def _process_application_after_upload(
+    def _find_uploaded_build(
         self,
-        application_package: Union[Ipa, MacOsPackage],
-        max_find_build_wait: int,
-        max_build_processing_wait: int,
-        testflight_options: Optional[SubmitToTestFlightOptions],
-        app_store_options: Optional[SubmitToAppStoreOptions],
-        beta_test_info_options: Optional[AddBetaTestInfoOptions],
-        beta_group_options: Optional[AddBuildToBetaGroupOptions],
-    ) -> None:
-        if not any([testflight_options, app_store_options, beta_test_info_options, beta_group_options]):
-            return  # Nothing to do with the application...
-
+        publishing_package: _PublishingPackage,
+        build_waiter: BuildWaiter,
+        max_find_build_minutes: int,
+    ):
+        application_package = publishing_package.application_package
         app = self._get_uploaded_build_application(application_package)
-        build = self._get_uploaded_build(app, application_package, max_find_build_wait)
+        self.logger.info(Colors.BLUE('\nFind uploaded build for "%s"'), application_package.path)
+        builds_filter = self.api_client.builds.Filter(
+            app=app.id,
+            version=application_package.version_code,
+            pre_release_version_version=application_package.version,
+            pre_release_version_platform=self._get_application_package_platform(application_package),
+        )
+        build_waiter.add_discovery(str(application_package.path), builds_filter, max_find_build_minutes * 60)
+
+    def _on_build_wait_finished(
+        self,
+        publishing_package: _PublishingPackage,
+        progress: BuildWaitProgress,
+        max_find_build_minutes: int,
+        max_processing_minutes: int,
+    ) -> Optional[Build]:
+        """
+        Handle uploaded build that was either found from App Store Connect or whose processing
+        has finished. Returns the build in case its processing needs to be waited for before
+        post-processing of the uploaded package can be started.
+        :raises IOError in case the build could not be found or processed
+        """
+        application_package = publishing_package.application_package
+        build = progress.build
+        if progress.state is BuildWaitState.TIMED_OUT and build is None:
+            raise IOError(self._get_find_build_timeout_message(application_package))
+        elif progress.state is BuildWaitState.TIMED_OUT and build is not None:
+            raise IOError(self._get_build_processing_timeout_message(build.id, max_processing_minutes))
+        elif progress.state is BuildWaitState.FAILED or build is None:
+            raise IOError(progress.error)
+
+        publishing_package.build = build
+        if progress.state is BuildWaitState.PROCESSED:
+            self.logger.info(Colors.GREEN('\nProcessed build and beta details for "%s" are'), application_package.path)
+            self.printer.print_resource(build, True)
+            if progress.build_beta_detail:
+                self.printer.print_resource(progress.build_beta_detail, True)
+            return None
+
+        self.logger.info(Colors.GREEN('\nUploaded build for "%s" is'), application_package.path)
+        self.printer.print_resource(build, True)
 
-        if beta_test_info_options:
-            self.add_beta_test_info(build.id, **beta_test_info_options.__dict__)
+        if publishing_package.beta_test_info_options:
+            self.add_beta_test_info(build.id, **publishing_package.beta_test_info_options.__dict__)
+        if not publishing_package.requires_processed_build or max_processing_minutes == 0:
+            return None
 
-        if testflight_options or app_store_options or beta_group_options:
-            self.wait_until_build_is_processed(build, max_build_processing_wait)
+        self.logger.info(Colors.BLUE(f"\nWait until build {build.id} and its beta details are processed"))
+        self._log_build_processing_message(build.id, max_processing_minutes)
+        return build
 
-        if beta_group_options:
+    def _log_publishing_build_wait_progress(self, progress: BuildWaitProgress):
+        if progress.state is not BuildWaitState.DISCOVERING:
+            self._log_build_wait_progress(progress)
+        elif progress.checks == 1:
+            self.logger.info(
+                "Build has finished uploading but is not available in App Store Connect yet. "
+                'Could not find the build matching the uploaded version of "%s", waiting %d seconds to try again.',
+                progress.key,
+                round(progress.next_check_in or 0),
+            )
+        else:
+            self.logger.info(
+                'Could not find the build matching the uploaded version of "%s", waiting %d seconds to try again.',
+                progress.key,
+                round(progress.next_check_in or 0),
+            )
+
+    @classmethod
+    def _get_find_build_timeout_message(cls, application_package: Union[Ipa, MacOsPackage]) -> str:
+        return (
+            "The build was successfully uploaded to App Store Connect but processing the corresponding artifact "
+            f'"{application_package.path}" by Apple took longer than expected. Further actions like updating the '
+            '"What to test information" or submitting the build to beta review could not be performed at the moment '
+            "but can be completed manually in TestFlight once the build has finished processing.\n"
+            f"You can configure maximum timeout using {PublishArgument.MAX_BUILD_FIND_WAIT.flag} "
+            f"command line option, or {Types.MaxFindBuildWait.environment_variable_key} environment variable."
+        )
+
+    def _process_uploaded_build(self, publishing_package: _PublishingPackage) -> None:
+        build = publishing_package.build
+        assert build is not None
+
+        if publishing_package.beta_group_options:
             self.add_build_to_beta_groups(
                 build.id,
-                beta_group_names=beta_group_options.beta_group_names,
+                beta_group_names=publishing_package.beta_group_options.beta_group_names,
             )
 
-        if testflight_options:
-            # Overwrite waiting since we already waited above.
+        if publishing_package.testflight_options:
+            # Overwrite waiting since we already waited in publishing loop.
             self.submit_to_testflight(
                 build.id,
                 max_build_processing_wait=0,
-                **dataclasses.asdict(testflight_options),
+                **dataclasses.asdict(publishing_package.testflight_options),
             )
 
+        app_store_options = publishing_package.app_store_options
         if app_store_options:
             if not app_store_options.version_string:
                 app_store_options = dataclasses.replace(
                     app_store_options,
-                    version_string=application_package.version,
+                    version_string=publishing_package.application_package.version,
                 )
             self.submit_to_app_store(
                 build.id,
@@ -437,63 +650,6 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
                 **dataclasses.asdict(app_store_options),
             )
 
-    def _find_build(
-        self,
-        app_id: ResourceId,
-        application_package: Union[Ipa, MacOsPackage],
-        max_find_build_minutes: int,
-        retry_wait_seconds: int,
-    ) -> Build:
-        """
-        Find corresponding build for the uploaded ipa or macOS package.
-        Take into account that sometimes the build is not immediately available
-        after the upload and as a result the API calls may not return it. Implement a
-        simple retrying logic to overcome this issue.
-        """
-        builds_filter = self.api_client.builds.Filter(
-            app=app_id,
-            version=application_package.version_code,
-            pre_release_version_version=application_package.version,
-            pre_release_version_platform=self._get_application_package_platform(application_package),
-        )
-
-        not_found_message = "Could not find the build matching the uploaded version"
-        default_retry_message = f"{not_found_message}, waiting {retry_wait_seconds} seconds to try again."
-        first_retry_message = (
-            f"Build has finished uploading but is not available in App Store Connect yet. "
-            f"{default_retry_message} Timeout in {max_find_build_minutes} minutes."
-        )
-
-        find_started_at = time.time()
-        for attempt in itertools.count():
-            try:
-                found_builds = self.api_client.builds.list(
-                    builds_filter,
-                    ordering=self.api_client.builds.Ordering.UPLOADED_DATE,
-                    reverse=True,
-                )
-            except AppStoreConnectApiError as api_error:
-                raise AppStoreConnectError(str(api_error))
-
-            if found_builds:
-                return found_builds[0]
-            elif int(time.time() - find_started_at) <= max_find_build_minutes * 60:
-                self.logger.info(first_retry_message if attempt == 0 else default_retry_message)
-                time.sleep(retry_wait_seconds)
-            else:
-                self.logger.info(f"{not_found_message}. Timeout reached, stop trying.\n")
-                break  # No more time left, give up.
-
-        error_message = (
-            "The build was successfully uploaded to App Store Connect but processing the corresponding artifact "
-            f'"{application_package.path}" by Apple took longer than expected. Further actions like updating the '
-            '"What to test information" or submitting the build to beta review could not be performed at the moment '
-            "but can be completed manually in TestFlight once the build has finished processing.\n"
-            f"You can configure maximum timeout using {PublishArgument.MAX_BUILD_FIND_WAIT.flag} "
-            f"command line option, or {Types.MaxFindBuildWait.environment_variable_key} environment variable."
-        )
-        raise IOError(error_message)
-
     def _get_uploaded_build_application(self, application_package: Union[Ipa, MacOsPackage]) -> App:
         bundle_id = application_package.bundle_identifier
         self.logger.info(Colors.BLUE("\nFind application entry from App Store Connect for uploaded binary"))
@@ -509,24 +665,6 @@ class PublishAction(AbstractBaseAction, metaclass=ABCMeta):
         self.printer.print_resource(app, True)
         return app
 
-    def _get_uploaded_build(
-        self,
-        app: App,
-        application_package: Union[Ipa, MacOsPackage],
-        max_find_build_minutes: int,
-        retry_wait_seconds: int = 30,
-    ) -> Build:
-        self.logger.info(Colors.BLUE("\nFind uploaded build"))
-        build = self._find_build(
-            app.id,
-            application_package,
-            max_find_build_minutes,
-            retry_wait_seconds,
-        )
-        self.logger.info(Colors.GREEN("\nUploaded build is"))
-        self.printer.print_resource(build, True)
-        return build
-
     def _get_publishing_application_packages(
         self,
         path_patterns: Sequence[pathlib.Path],
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import re
 import shlex
 import time
 from abc import ABCMeta
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict
 from typing import Iterator
@@ -17,9 +21,11 @@ from codemagic.apple import AppStoreConnectApiError
 from codemagic.apple.resources import App
 from codemagic.apple.resources import AppStoreVersion
 from codemagic.apple.resources import AppStoreVersionLocalization
+from codemagic.apple.resources import AppStoreVersionPhasedRelease
 from codemagic.apple.resources import Build
 from codemagic.apple.resources import Locale
 from codemagic.apple.resources import Platform
+from codemagic.apple.resources import PreReleaseVersion
 from codemagic.apple.resources import ReleaseType
 from codemagic.apple.resources import ResourceId
 from codemagic.apple.resources import ReviewSubmission
@@ -52,6 +58,7 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
         BuildArgument.BUILD_ID_RESOURCE_ID,
         *ArgumentGroups.SUBMIT_TO_APP_STORE_OPTIONAL_ARGUMENTS,
         action_group=AppStoreConnectActionGroup.BUILDS,
+        action_options={"memoize_requests": True},
     )
     def submit_to_app_store(
         self,
@@ -160,7 +167,8 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
 
         waited_duration = 0
         while timeout > waited_duration:
-            cancelling_submissions = self.api_client.review_submissions.list(review_submissions_filter)
+            with self.api_client.session.fresh_responses():
+                cancelling_submissions = self.api_client.review_submissions.list(review_submissions_filter)
             if not cancelling_submissions:
                 self.logger.info(Colors.GREEN("Previous submissions are successfully cancelled"))
                 return
@@ -182,35 +190,78 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
     ) -> Tuple[ReviewSubmission, ReviewSubmissionItem]:
         self.logger.info(Colors.BLUE(f"\nSubmit build {build_id!r} to App Store review"))
 
-        try:
-            build, app = self.api_client.builds.read_with_include(build_id, App)
-        except AppStoreConnectApiError as api_error:
-            raise AppStoreConnectError(str(api_error)) from api_error
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="submit_prefetch") as prefetch_executor:
+            # Reads that do not depend on each other are started as soon as their inputs are
+            # known, so that they are done while previous submissions are being cancelled and
+            # the build is being processed, instead of running one after another afterwards.
+            pre_release_version_future: Optional[Future[PreReleaseVersion]] = None
+            if app_store_version_info.version_string is None:
+                pre_release_version_future = prefetch_executor.submit(
+                    self.get_build_pre_release_version,
+                    build_id,
+                    should_print=False,
+                )
 
-        if cancel_previous_submissions:
-            self._cancel_previous_submissions(application_id=app.id, platform=platform)
+            try:
+                build, app = self.api_client.builds.read_with_include(build_id, App)
+            except AppStoreConnectApiError as api_error:
+                raise AppStoreConnectError(str(api_error)) from api_error
 
-        if max_processing_minutes:
-            build = self.wait_until_build_is_processed(build, max_processing_minutes)
+            is_first_app_store_version_future: Optional[Future[bool]] = None
+            if any(localization.whats_new for localization in app_store_version_localization_infos):
+                is_first_app_store_version_future = prefetch_executor.submit(
+                    self._is_first_app_store_version,
+                    app,
+                    app_store_version_info.platform,
+                )
 
-        if app_store_version_info.version_string is None:
-            self.logger.info("\nVersion string is not specified. Obtain it from build's pre-release version...")
-            pre_release_version = self.get_build_pre_release_version(build_id, should_print=False)
-            app_store_version_info.version_string = pre_release_version.attributes.version
+            if cancel_previous_submissions:
+                self._cancel_previous_submissions(application_id=app.id, platform=platform)
 
-        self.logger.info(
-            Colors.BLUE(f"\nUsing version {app_store_version_info.version_string} for App Store submission"),
-        )
+            # Cancelling a submission moves the App Store version from review back to an editable
+            # state, so the editable version can be looked up only once cancellation is completed.
+            editable_app_store_version_future = prefetch_executor.submit(
+                self._get_editable_app_store_version,
+                app,
+                app_store_version_info.platform,
+            )
 
-        app_store_version = self._ensure_app_store_version(app, build, app_store_version_info)
+            if max_processing_minutes:
+                build = self.wait_until_build_is_processed(build, max_processing_minutes)
 
-        self._manage_app_store_version_phased_release(app_store_version, phased_release)
+            if pre_release_version_future is not None:
+                self.logger.info("\nVersion string is not specified. Obtain it from build's pre-release version...")
+                pre_release_version = pre_release_version_future.result()
+                app_store_version_info.version_string = pre_release_version.attributes.version
 
-        self._create_or_update_app_store_version_localizations(
-            app,
-            app_store_version,
-            app_store_version_localization_infos,
-        )
+            self.logger.info(
+                Colors.BLUE(f"\nUsing version {app_store_version_info.version_string} for App Store submission"),
+            )
+
+            editable_app_store_version = editable_app_store_version_future.result()
+            phased_release_future: Optional[Future[Optional[AppStoreVersionPhasedRelease]]] = None
+            if editable_app_store_version is not None and phased_release is not None:
+                # Phased release of an existing version does not change when the version is updated
+                phased_release_future = prefetch_executor.submit(
+                    self.api_client.app_store_versions.read_app_store_version_phased_release,
+                    editable_app_store_version,
+                )
+
+            app_store_version = self._ensure_app_store_version(
+                app,
+                build,
+                app_store_version_info,
+                editable_app_store_version,
+            )
+
+            self._manage_app_store_version_phased_release(app_store_version, phased_release, phased_release_future)
+
+            self._create_or_update_app_store_version_localizations(
+                app,
+                app_store_version,
+                app_store_version_localization_infos,
+                is_first_app_store_version_future.result() if is_first_app_store_version_future else None,
+            )
 
         review_submission = self._create_review_submission(app, platform)
         review_submission_item = self.create_review_submission_item(
@@ -264,8 +315,9 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
         app: App,
         build: Build,
         app_store_version_info: AppStoreVersionInfo,
+        editable_app_store_version: Optional[AppStoreVersion],
     ) -> AppStoreVersion:
-        app_store_version = self._get_editable_app_store_version(app, app_store_version_info.platform)
+        app_store_version = editable_app_store_version
         if app_store_version is None:
             # Version does not exist, create a new version for App Store review submission
             self.logger.info(f"\n{AppStoreVersion} does not exist for build {build.id}")
@@ -286,63 +338,48 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
         app: App,
         app_store_version: AppStoreVersion,
         app_store_version_localizations: List[AppStoreVersionLocalizationInfo],
+        is_first_app_store_version: Optional[bool] = None,
     ):
-        is_first_app_store_version = self._is_first_app_store_version(app, app_store_version.attributes.platform)
-        existing_localizations = self._get_existing_app_store_version_localizations(app_store_version)
-        for localization in app_store_version_localizations:
-            if is_first_app_store_version:  # Release notes are not allowed for first releases
+        if not app_store_version_localizations:
+            return
+
+        # Release notes are not allowed for first releases
+        has_release_notes = any(localization.whats_new for localization in app_store_version_localizations)
+        if has_release_notes and is_first_app_store_version is None:
+            is_first_app_store_version = self._is_first_app_store_version(app, app_store_version.attributes.platform)
+        if has_release_notes and is_first_app_store_version:
+            for localization in app_store_version_localizations:
                 localization.whats_new = None
-            localization_id = existing_localizations.get(localization.locale or app.attributes.primaryLocale)
-
-            try:
-                self._create_or_update_app_store_version_localization(
-                    localization_id,
-                    app,
-                    app_store_version,
-                    localization,
-                )
-            except AppStoreConnectApiError as error:
-                verb = "update" if localization_id else "create new"
-                message = f"Failed to {verb} {AppStoreVersionLocalization} for locale {localization.locale}:"
-                self.echo(f"{Colors.YELLOW(message)}\n{error}\n")
 
-    def _create_or_update_app_store_version_localization(
-        self,
-        existing_localization_id: Optional[ResourceId],
-        app: App,
-        app_store_version: AppStoreVersion,
-        localization: AppStoreVersionLocalizationInfo,
-    ):
-        if localization.locale:
-            locale_description = f"locale {localization.locale}"
-        else:
-            locale_description = f"default locale ({app.attributes.primaryLocale})"
+        desired_localizations: Dict[Locale, Dict[str, Optional[str]]] = {}
+        for localization in app_store_version_localizations:
+            attributes = dataclasses.asdict(localization)
+            # Use app's primary locale if not defined
+            locale = attributes.pop("locale") or app.attributes.primaryLocale
+            desired_localizations[locale] = attributes
 
-        if existing_localization_id is None:
-            self.echo(Colors.GREEN(f"Create new {AppStoreVersionLocalization} for {locale_description}"))
-            app_store_version_localization = self.api_client.app_store_version_localizations.create(
+        try:
+            existing_localizations = self.api_client.app_store_versions.list_app_store_version_localizations(
                 app_store_version,
-                localization.locale or app.attributes.primaryLocale,  # Use app's primary locale if not defined
-                description=localization.description,
-                keywords=localization.keywords,
-                marketing_url=localization.marketing_url,
-                promotional_text=localization.promotional_text,
-                support_url=localization.support_url,
-                whats_new=localization.whats_new,
             )
-        else:
-            self.echo(Colors.GREEN(f"Update {AppStoreVersionLocalization} for {locale_description}"))
-            app_store_version_localization = self.api_client.app_store_version_localizations.modify(
-                existing_localization_id,
-                description=localization.description,
-                keywords=localization.keywords,
-                marketing_url=localization.marketing_url,
-                promotional_text=localization.promotional_text,
-                support_url=localization.support_url,
-                whats_new=localization.whats_new,
-            )
-        self.printer.print_resource(app_store_version_localization, True)
-        self.echo("")
+        except AppStoreConnectApiError as api_error:
+            raise AppStoreConnectError(str(api_error)) from api_error
+
+        results = self._sync_localizations(
+            self.api_client.session,
+            {localization.attributes.locale: localization for localization in existing_localizations},
+            desired_localizations,
+            create=functools.partial(self.api_client.app_store_version_localizations.create, app_store_version),
+            modify=self.api_client.app_store_version_localizations.modify,
+        )
+        self._log_localization_sync_results(AppStoreVersionLocalization, results)
+
+        for result in results:
+            if result.error is None:
+                continue
+            verb = "update" if result.localization else "create new"
+            message = f"Failed to {verb} {AppStoreVersionLocalization} for locale {result.locale}:"
+            self.echo(f"{Colors.YELLOW(message)}\n{result.error}\n")
 
     def _update_existing_app_store_version(
         self,
@@ -388,13 +425,6 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
         )
         return len(app_store_versions) < 2
 
-    def _get_existing_app_store_version_localizations(
-        self,
-        app_store_version: AppStoreVersion,
-    ) -> Dict[Locale, ResourceId]:
-        localizations = self.api_client.app_store_versions.list_app_store_version_localizations(app_store_version)
-        return {localization.attributes.locale: localization.id for localization in localizations}
-
     def _get_editable_app_store_version(self, app: App, platform: Platform) -> Optional[AppStoreVersion]:
         def sorting_key(app_store_version: Optional[AppStoreVersion]) -> versions.Version:
             assert app_store_version is not None  # Make mypy happy
@@ -477,27 +507,45 @@ class SubmitToAppStoreAction(AbstractBaseAction, metaclass=ABCMeta):
         self,
         app_store_version: AppStoreVersion,
         should_enable_phased_release: Optional[bool],
+        phased_release_future: Optional[Future[Optional[AppStoreVersionPhasedRelease]]] = None,
     ):
         if should_enable_phased_release is True:
-            self._enable_app_store_version_phased_release(app_store_version)
+            self._enable_app_store_version_phased_release(app_store_version, phased_release_future)
         elif should_enable_phased_release is False:
-            self._disable_app_store_version_phased_release(app_store_version)
+            self._disable_app_store_version_phased_release(app_store_version, phased_release_future)
         else:
             pass  # Leave it as is without changing anything
         self.echo("")
 
-    def _enable_app_store_version_phased_release(self, app_store_version: AppStoreVersion):
+    def _get_app_store_version_phased_release(
+        self,
+        app_store_version: AppStoreVersion,
+        phased_release_future: Optional[Future[Optional[AppStoreVersionPhasedRelease]]],
+    ) -> Optional[AppStoreVersionPhasedRelease]:
+        if phased_release_future is not None:
+            return phased_release_future.result()
+        return self.api_client.app_store_versions.read_app_store_version_phased_release(app_store_version)
+
+    def _enable_app_store_version_phased_release(
+        self,
+        app_store_version: AppStoreVersion,
+        phased_release_future: Optional[Future[Optional[AppStoreVersionPhasedRelease]]] = None,
+    ):
         self.echo(Colors.BLUE(f"\nEnable phased release for App Store Version {app_store_version.id}"))
-        phased_release = self.api_client.app_store_versions.read_app_store_version_phased_release(app_store_version)
+        phased_release = self._get_app_store_version_phased_release(app_store_version, phased_release_future)
         if phased_release:
             self.echo(Colors.GREEN(f"Phased release is already enabled for App Store Version {app_store_version.id}"))
         else:
             phased_release = self.enable_app_store_version_phased_release(app_store_version, should_print=False)
         self.printer.print_resource(phased_release, should_print=True)
 
-    def _disable_app_store_version_phased_release(self, app_store_version: AppStoreVersion):
+    def _disable_app_store_version_phased_release(
+        self,
+        app_store_version: AppStoreVersion,
+        phased_release_future: Optional[Future[Optional[AppStoreVersionPhasedRelease]]] = None,
+    ):
         self.echo(Colors.BLUE(f"\nDisable phased release for App Store Version {app_store_version.id}"))
-        phased_release = self.api_client.app_store_versions.read_app_store_version_phased_release(app_store_version)
+        phased_release = self._get_app_store_version_phased_release(app_store_version, phased_release_future)
         if not phased_release:
             self.echo(Colors.GREEN(f"Phased release is already disabled for App Store Version {app_store_version.id}"))
         else:
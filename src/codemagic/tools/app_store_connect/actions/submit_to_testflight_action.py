@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABCMeta
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from typing import Optional
 from typing import Union
@@ -10,6 +12,7 @@ from codemagic.apple import AppStoreConnectApiError
 from codemagic.apple.resources import App
 from codemagic.apple.resources import BetaAppLocalization
 from codemagic.apple.resources import BetaAppReviewSubmission
+from codemagic.apple.resources import PreReleaseVersion
 from codemagic.apple.resources import ResourceId
 from codemagic.cli import Colors
 
@@ -27,6 +30,7 @@ class SubmitToTestFlightAction(AbstractBaseAction, metaclass=ABCMeta):
         BuildArgument.BUILD_ID_RESOURCE_ID,
         *ArgumentGroups.SUBMIT_TO_TESTFLIGHT_OPTIONAL_ARGUMENTS,
         action_group=AppStoreConnectActionGroup.BUILDS,
+        action_options={"memoize_requests": True},
     )
     def submit_to_testflight(
         self,
@@ -42,33 +46,45 @@ class SubmitToTestFlightAction(AbstractBaseAction, metaclass=ABCMeta):
 
         self.logger.info(Colors.BLUE(f"\nSubmit build {build_id!r} to TestFlight beta review"))
 
-        try:
-            build, app = self.api_client.builds.read_with_include(build_id, App)
-        except AppStoreConnectApiError as api_error:
-            raise AppStoreConnectError(str(api_error)) from api_error
-
-        try:
-            self._assert_app_has_testflight_information(app)
-        except ValueError as ve:
-            raise AppStoreConnectError(str(ve)) from ve
-
-        if max_processing_minutes:
-            build = self.wait_until_build_is_processed(build, max_processing_minutes)
-
-        if expire_build_submitted_for_review:
-            pre_release_version = self.api_client.builds.read_pre_release_version(build)
-            self.logger.info(Colors.BLUE("\nExpire previous build before creating submission"))
-            self.expire_build_submitted_for_review(
-                application_id=app.id,
-                platform=pre_release_version.attributes.platform if pre_release_version else None,
-                should_print=False,
-            )
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="submit_prefetch") as prefetch_executor:
+            # Pre-release version depends only on the build, read it while the app is being validated
+            pre_release_version_future: Optional[Future[Optional[PreReleaseVersion]]] = None
+            if expire_build_submitted_for_review:
+                pre_release_version_future = prefetch_executor.submit(
+                    self.api_client.builds.read_pre_release_version,
+                    build_id,
+                )
+
+            try:
+                build, app = self.api_client.builds.read_with_include(build_id, App)
+            except AppStoreConnectApiError as api_error:
+                raise AppStoreConnectError(str(api_error)) from api_error
+
+            try:
+                self._assert_app_has_testflight_information(app)
+            except ValueError as ve:
+                raise AppStoreConnectError(str(ve)) from ve
+
+            if max_processing_minutes:
+                build = self.wait_until_build_is_processed(build, max_processing_minutes)
+
+            if pre_release_version_future is not None:
+                pre_release_version = pre_release_version_future.result()
+                self.logger.info(Colors.BLUE("\nExpire previous build before creating submission"))
+                self.expire_build_submitted_for_review(
+                    application_id=app.id,
+                    platform=pre_release_version.attributes.platform if pre_release_version else None,
+                    should_print=False,
+                )
 
         return self.create_beta_app_review_submission(build.id)
 
     def _assert_app_has_testflight_information(self, app: App):
-        missing_beta_app_information = self._get_missing_beta_app_information(app)
-        missing_beta_app_review_information = self._get_missing_beta_app_review_information(app)
+        # Beta app localizations and review details are independent, check them concurrently
+        missing_beta_app_information, missing_beta_app_review_information = self.api_client.session.map(
+            lambda get_missing_information: get_missing_information(app),
+            [self._get_missing_beta_app_information, self._get_missing_beta_app_review_information],
+        )
 
         if not missing_beta_app_information and not missing_beta_app_review_information:
             return  # All information required for TestFlight submission seems to be present
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from abc import ABCMeta
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from codemagic import cli
+from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.api_resource_mirror import MirrorSyncResult
+from codemagic.apple.resources import ResourceType
+from codemagic.cli import Colors
+
+from ..abstract_base_action import AbstractBaseAction
+from ..arguments import ResourceMirrorArgument
+from ..errors import AppStoreConnectError
+
+
+class SyncAction(AbstractBaseAction, metaclass=ABCMeta):
+    @cli.action("sync", ResourceMirrorArgument.RESOURCE_TYPES)
+    def sync(
+        self,
+        resource_types: Optional[Sequence[ResourceType]] = None,
+        should_print: bool = True,
+    ) -> List[MirrorSyncResult]:
+        """
+        Synchronize local mirror of App Store Connect provisioning resources
+        """
+
+        database_path = self.resource_mirror.database_path
+        self.logger.info(Colors.BLUE(f"Synchronize App Store Connect resources to {database_path}"))
+        try:
+            results = self.resource_mirror.sync(self.api_client, resource_types)
+        except AppStoreConnectApiError as api_error:
+            raise AppStoreConnectError(str(api_error), api_error_response=api_error.error_response) from api_error
+
+        if should_print:
+            self._log_mirror_sync_results(results)
+        return results
+
+    def _log_mirror_sync_results(self, results: Sequence[MirrorSyncResult]):
+        headers = ("Resource type", "Total", "Created", "Updated", "Removed", "Reused blobs", "Duration")
+        rows = [
+            (
+                result.resource_type.value,
+                str(result.total),
+                str(result.created),
+                str(result.updated),
+                str(result.removed),
+                str(result.reused_blobs),
+                f"{result.duration:.2f}s",
+            )
+            for result in results
+        ]
+        widths = [max(len(header), *(len(row[i]) for row in rows)) for i, header in enumerate(headers)]
+        self.logger.info("  ".join(f"{header:<{width}}" for header, width in zip(headers, widths)))
+        for row in rows:
+            line = "  ".join(f"{value:<{width}}" for value, width in zip(row, widths))
+            has_changes = row[2:5] != ("0", "0", "0")
+            self.logger.info(Colors.GREEN(line) if has_changes else line)
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import os
 import pathlib
+import sys
 from functools import lru_cache
+from typing import List
 from typing import Optional
+from typing import Sequence
 
 import jwt
 
 from codemagic import cli
+from codemagic.apple.app_store_connect import ApiKey
 from codemagic.apple.app_store_connect import AppStoreConnectApiClient
 from codemagic.apple.app_store_connect import IssuerId
 from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.api_request_metrics import ApiRequestMetrics
+from codemagic.apple.app_store_connect.api_resource_mirror import ApiResourceMirror
 from codemagic.mixins import PathFinderMixin
 from codemagic.models import Certificate
 from codemagic.models import ProvisioningProfile
@@ -51,6 +58,9 @@ class AppStoreConnect(
     actions.PublishAction,
     actions.SubmitToAppStoreAction,
     actions.SubmitToTestFlightAction,
+    actions.SyncAction,
+    mixins.BulkMutationMixin,
+    mixins.LocalizationSyncMixin,
     mixins.ResourceManagerMixin,
     mixins.SigningFileSaverMixin,
     PathFinderMixin,
@@ -64,11 +74,19 @@ class AppStoreConnect(
         key_identifier: Optional[KeyIdentifier],
         issuer_id: Optional[IssuerId],
         private_key: Optional[str],
+        additional_key_identifiers: Sequence[KeyIdentifier] = (),
         log_requests: bool = False,
         unauthorized_request_retries: int = 1,
         server_error_retries: int = 1,
         enable_jwt_cache: bool = False,
+        enable_response_cache: bool = False,
+        memoize_requests: bool = False,
+        from_mirror: bool = False,
+        mirror_path: Optional[pathlib.Path] = None,
+        mirror_max_age: int = Types.ResourceMirrorMaxAge.default_value,
+        api_request_trace_path: Optional[pathlib.Path] = None,
         json_output: bool = False,
+        json_lines_output: bool = False,
         profiles_directory: pathlib.Path = ProvisioningProfile.DEFAULT_LOCATION,
         certificates_directory: pathlib.Path = Certificate.DEFAULT_LOCATION,
         **kwargs,
@@ -76,44 +94,96 @@ class AppStoreConnect(
         super().__init__(**kwargs)
         self.profiles_directory = profiles_directory
         self.certificates_directory = certificates_directory
-        self.printer = ResourcePrinter(bool(json_output), self.echo)
+        self.printer = ResourcePrinter(
+            bool(json_output),
+            self.echo,
+            print_json_lines=bool(json_lines_output),
+            # Indentation only helps humans, output that is piped to other tools stays compact
+            pretty_json=sys.stdout.isatty() or not self.is_cli_invocation(),
+        )
         self._key_identifier = key_identifier
         self._issuer_id = issuer_id
         self._private_key = private_key
+        self._additional_key_identifiers = additional_key_identifiers
         self._log_requests = log_requests
         self._unauthorized_request_retries = unauthorized_request_retries
         self._server_error_retries = server_error_retries
         self._enable_jwt_cache = enable_jwt_cache
+        self._enable_response_cache = enable_response_cache
+        self._memoize_requests = memoize_requests
+        self._discard_listed_resources = False
+        self._from_mirror = from_mirror
+        self._mirror_path = mirror_path
+        self._mirror_max_age = mirror_max_age
+        self._request_metrics = ApiRequestMetrics(api_request_trace_path) if api_request_trace_path else None
 
     @classmethod
     def from_cli_args(cls, cli_args: argparse.Namespace) -> AppStoreConnect:
         key_identifier_argument = AppStoreConnectArgument.KEY_IDENTIFIER.from_args(cli_args)
         issuer_id_argument = AppStoreConnectArgument.ISSUER_ID.from_args(cli_args)
         private_key_argument = AppStoreConnectArgument.PRIVATE_KEY.from_args(cli_args)
+        additional_key_identifiers_arguments = AppStoreConnectArgument.ADDITIONAL_KEY_IDENTIFIERS.from_args(cli_args)
         unauthorized_request_retries = Types.ApiUnauthorizedRetries.resolve_value(cli_args.unauthorized_request_retries)
         server_error_retries = Types.ApiServerErrorRetries.resolve_value(cli_args.server_error_retries)
         disable_jwt_cache = AppStoreConnectArgument.DISABLE_JWT_CACHE.from_args(cli_args)
+        enable_response_cache = AppStoreConnectArgument.ENABLE_RESPONSE_CACHE.from_args(cli_args)
+        from_mirror = AppStoreConnectArgument.FROM_MIRROR.from_args(cli_args)
+        mirror_path_argument = AppStoreConnectArgument.MIRROR_PATH.from_args(cli_args)
+        mirror_max_age = Types.ResourceMirrorMaxAge.resolve_value(cli_args.mirror_max_age)
+        api_request_trace_path_argument = AppStoreConnectArgument.API_REQUEST_TRACE_PATH.from_args(cli_args)
 
         app_store_connect = AppStoreConnect(
             key_identifier=key_identifier_argument.value if key_identifier_argument else None,
             issuer_id=issuer_id_argument.value if issuer_id_argument else None,
             private_key=private_key_argument.value if private_key_argument else None,
+            additional_key_identifiers=cls._get_additional_key_identifiers(additional_key_identifiers_arguments),
             log_requests=cli_args.log_requests,
             unauthorized_request_retries=unauthorized_request_retries,
             server_error_retries=server_error_retries,
             enable_jwt_cache=not disable_jwt_cache,
+            enable_response_cache=bool(enable_response_cache),
+            from_mirror=bool(from_mirror),
+            mirror_path=mirror_path_argument.value if mirror_path_argument else None,
+            mirror_max_age=mirror_max_age,
+            api_request_trace_path=api_request_trace_path_argument.value if api_request_trace_path_argument else None,
             json_output=cli_args.json_output,
+            json_lines_output=cli_args.json_lines_output,
             profiles_directory=cli_args.profiles_directory,
             certificates_directory=cli_args.certificates_directory,
             **cls._parent_class_kwargs(cli_args),
         )
 
         cli_action = app_store_connect._get_invoked_cli_action(cli_args)
+        # Memoized responses are kept for the whole run, which pays off only for multi-step actions
+        app_store_connect._memoize_requests = cli_action.action_options.get("memoize_requests", False)
+        # Listing actions only print found resources on command line, nothing uses the returned list
+        app_store_connect._discard_listed_resources = cli_action.action_options.get("discards_listed_resources", False)
         if cli_action.action_options.get("requires_api_client", True):
             app_store_connect._assert_api_client_credentials()
 
         return app_store_connect
 
+    def _invoke_action(self, args: argparse.Namespace):
+        if self._request_metrics is None:
+            return super()._invoke_action(args)
+
+        cli_action = self._get_invoked_cli_action(args)
+        action_group = cli_action.action_group
+        action_name = f"{action_group.name} {cli_action.action_name}" if action_group else cli_action.action_name
+        self._request_metrics.action = action_name
+        try:
+            return super()._invoke_action(args)
+        finally:
+            self._request_metrics.close()
+
+    @classmethod
+    def _get_additional_key_identifiers(cls, key_identifiers_arguments) -> List[KeyIdentifier]:
+        if not key_identifiers_arguments:
+            return []
+        elif isinstance(key_identifiers_arguments, Types.AdditionalKeyIdentifiersArgument):
+            return key_identifiers_arguments.value
+        return [key_identifier for argument in key_identifiers_arguments for key_identifier in argument.value]
+
     def _assert_api_client_credentials(self, custom_error: Optional[str] = None):
         if self._issuer_id is None:
             if custom_error:
@@ -132,20 +202,29 @@ class AppStoreConnect(
         try:
             self._resolve_app_store_connect_private_key()
         except ValueError as ve:
-            custom_error = ve.args[0] if ve.args else custom_error
+            error_messages = [AppStoreConnectArgument.PRIVATE_KEY.get_missing_value_error_message(), *ve.args]
             if custom_error:
-                default_message = AppStoreConnectArgument.PRIVATE_KEY.get_missing_value_error_message()
-                AppStoreConnectArgument.PRIVATE_KEY.raise_argument_error(f"{default_message}. {custom_error}")
-            else:
-                AppStoreConnectArgument.PRIVATE_KEY.raise_argument_error()
+                error_messages.append(custom_error)
+            AppStoreConnectArgument.PRIVATE_KEY.raise_argument_error(". ".join(error_messages))
 
-    def _resolve_app_store_connect_private_key(self):
-        if self._private_key is not None:
-            return
+        for key_identifier in self._additional_key_identifiers:
+            self._find_additional_private_key(key_identifier)
+
+    @classmethod
+    def _find_private_key(cls, key_identifier: KeyIdentifier) -> str:
+        environment_variable_key = f"{Types.PrivateKeyArgument.environment_variable_key}_{key_identifier}"
+        if environment_variable_key in os.environ:
+            try:
+                return Types.PrivateKeyArgument(os.environ[environment_variable_key]).value
+            except argparse.ArgumentTypeError:
+                raise ValueError(f'Provided value in environment variable "{environment_variable_key}" is not valid')
+        return cls._find_private_key_file(key_identifier)
 
+    @classmethod
+    def _find_private_key_file(cls, key_identifier: KeyIdentifier) -> str:
         for keys_path in Types.PrivateKeyArgument.PRIVATE_KEY_LOCATIONS:
             try:
-                api_key = next(keys_path.expanduser().glob(f"AuthKey_{self._key_identifier}.p8"))
+                api_key = next(keys_path.expanduser().glob(f"AuthKey_{key_identifier}.p8"))
             except StopIteration:
                 continue
 
@@ -153,10 +232,26 @@ class AppStoreConnect(
                 private_key_argument = Types.PrivateKeyArgument(api_key.read_text())
             except ValueError:
                 raise ValueError(f"Provided value in {api_key} is not valid")
-            self._private_key = private_key_argument.value
-            break
-        else:
-            raise ValueError()
+            return private_key_argument.value
+
+        keys_paths = ", ".join(map(str, Types.PrivateKeyArgument.PRIVATE_KEY_LOCATIONS))
+        raise ValueError(
+            f"Private key for API key {key_identifier} was not found. "
+            f"Searched for file AuthKey_{key_identifier}.p8 in {keys_paths}",
+        )
+
+    @classmethod
+    def _find_additional_private_key(cls, key_identifier: KeyIdentifier) -> str:
+        try:
+            return cls._find_private_key(key_identifier)
+        except ValueError as ve:
+            AppStoreConnectArgument.ADDITIONAL_KEY_IDENTIFIERS.raise_argument_error(str(ve))
+
+    def _resolve_app_store_connect_private_key(self):
+        if self._private_key is not None:
+            return
+        assert self._key_identifier is not None
+        self._private_key = self._find_private_key_file(self._key_identifier)
 
     def _validate_api_client_key(self, client: AppStoreConnectApiClient):
         """
@@ -184,6 +279,10 @@ class AppStoreConnect(
         assert self._key_identifier is not None
         assert self._issuer_id is not None
         assert self._private_key is not None
+        additional_api_keys = [
+            ApiKey(key_identifier, self._issuer_id, self._find_additional_private_key(key_identifier))
+            for key_identifier in self._additional_key_identifiers
+        ]
         client = AppStoreConnectApiClient(
             self._key_identifier,
             self._issuer_id,
@@ -192,6 +291,10 @@ class AppStoreConnect(
             unauthorized_request_retries=self._unauthorized_request_retries,
             server_error_retries=self._server_error_retries,
             enable_jwt_cache=self._enable_jwt_cache,
+            enable_response_cache=self._enable_response_cache,
+            memoize_requests=self._memoize_requests,
+            additional_api_keys=additional_api_keys,
+            request_metrics=self._request_metrics,
         )
         self._validate_api_client_key(client)
         return client
@@ -200,6 +303,18 @@ class AppStoreConnect(
     def api_client(self) -> AppStoreConnectApiClient:
         return self._get_api_client()
 
+    @lru_cache(1)
+    def _get_resource_mirror(self) -> ApiResourceMirror:
+        if self._mirror_path:
+            database_path = self._mirror_path.expanduser()
+        else:
+            database_path = ApiResourceMirror.get_default_path(f"{self._issuer_id}/{self._key_identifier}")
+        return ApiResourceMirror(database_path, max_age=self._mirror_max_age * 60)
+
+    @property
+    def resource_mirror(self) -> ApiResourceMirror:
+        return self._get_resource_mirror()
+
 
 if __name__ == "__main__":
     AppStoreConnect.invoke_cli()
@@ -19,6 +19,7 @@ from codemagic import cli
 from codemagic.apple.app_store_connect import AppStoreConnectApiClient
 from codemagic.apple.app_store_connect import IssuerId
 from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.api_resource_mirror import MIRRORED_RESOURCE_TYPES
 from codemagic.apple.resources import AppStoreState
 from codemagic.apple.resources import BetaReviewState
 from codemagic.apple.resources import BuildProcessingState
@@ -33,6 +34,7 @@ from codemagic.apple.resources import ProfileState
 from codemagic.apple.resources import ProfileType
 from codemagic.apple.resources import ReleaseType
 from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
 from codemagic.apple.resources import ReviewSubmissionState
 from codemagic.cli import Colors
 from codemagic.models import Certificate
@@ -74,6 +76,16 @@ class Types:
         argument_type = KeyIdentifier
         environment_variable_key = "APP_STORE_CONNECT_KEY_IDENTIFIER"
 
+    class AdditionalKeyIdentifiersArgument(cli.EnvironmentArgumentValue[List[KeyIdentifier]]):
+        argument_type = List[KeyIdentifier]
+        environment_variable_key = "APP_STORE_CONNECT_ADDITIONAL_KEY_IDENTIFIERS"
+
+        def _apply_type(self, non_typed_value: str) -> List[KeyIdentifier]:
+            key_identifiers = [KeyIdentifier(key_id) for key_id in re.split(r"[\s,]+", non_typed_value) if key_id]
+            if key_identifiers:
+                return key_identifiers
+            raise argparse.ArgumentTypeError(f'Provided value "{non_typed_value}" is not valid')
+
     class PrivateKeyArgument(cli.EnvironmentArgumentValue[str]):
         PRIVATE_KEY_LOCATIONS = (
             pathlib.Path("./private_keys"),
@@ -127,6 +139,31 @@ class Types:
         argument_type = bool
         environment_variable_key = "APP_STORE_CONNECT_DISABLE_JWT_CACHE"
 
+    class AppStoreConnectEnableResponseCache(cli.TypedCliArgument[bool]):
+        argument_type = bool
+        environment_variable_key = "APP_STORE_CONNECT_ENABLE_API_RESPONSE_CACHE"
+
+    class AppStoreConnectFromMirror(cli.TypedCliArgument[bool]):
+        argument_type = bool
+        environment_variable_key = "APP_STORE_CONNECT_FROM_MIRROR"
+
+    class ResourceMirrorPath(cli.TypedCliArgument[pathlib.Path]):
+        argument_type = pathlib.Path
+        environment_variable_key = "APP_STORE_CONNECT_MIRROR_PATH"
+
+    class ResourceMirrorMaxAge(cli.TypedCliArgument[int]):
+        argument_type = int
+        environment_variable_key = "APP_STORE_CONNECT_MIRROR_MAX_AGE"
+        default_value = 60
+
+        @classmethod
+        def _is_valid(cls, value: int) -> bool:
+            return value >= 0
+
+    class ApiRequestTracePath(cli.TypedCliArgument[pathlib.Path]):
+        argument_type = pathlib.Path
+        environment_variable_key = "APP_STORE_CONNECT_API_REQUEST_TRACE"
+
     class AltoolRetriesCount(cli.TypedCliArgument[int]):
         argument_type = int
         environment_variable_key = "APP_STORE_CONNECT_ALTOOL_RETRIES"
@@ -145,6 +182,24 @@ class Types:
         def _is_valid(cls, value: float) -> bool:
             return value >= 0
 
+    class MaxConcurrentUploads(cli.TypedCliArgument[int]):
+        argument_type = int
+        environment_variable_key = "APP_STORE_CONNECT_MAX_CONCURRENT_UPLOADS"
+        default_value = 3
+
+        @classmethod
+        def _is_valid(cls, value: int) -> bool:
+            return value > 0
+
+    class MaxConcurrentRequests(cli.TypedCliArgument[int]):
+        argument_type = int
+        environment_variable_key = "APP_STORE_CONNECT_MAX_CONCURRENT_REQUESTS"
+        default_value = 8
+
+        @classmethod
+        def _is_valid(cls, value: int) -> bool:
+            return value > 0
+
     class AltoolVerboseLogging(cli.TypedCliArgument[bool]):
         argument_type = bool
         environment_variable_key = "APP_STORE_CONNECT_ALTOOL_VERBOSE_LOGGING"
@@ -467,6 +522,64 @@ class AppStoreConnectArgument(cli.Argument):
         type=Types.AppStoreConnectDisableJwtCache,
         argparse_kwargs={"required": False, "action": "store_true"},
     )
+    ENABLE_RESPONSE_CACHE = cli.ArgumentProperties(
+        key="enable_response_cache",
+        flags=("--enable-api-response-cache",),
+        description=(
+            "Turn on caching App Store Connect API responses to disk. Cached responses "
+            "are revalidated using conditional requests when possible, or otherwise reused "
+            "for a few minutes. Cached responses are invalidated when related resources "
+            "are modified. Only resources that rarely change are cached: bundle identifiers and "
+            "their capabilities, beta groups, certificates, devices and profiles."
+        ),
+        type=Types.AppStoreConnectEnableResponseCache,
+        argparse_kwargs={"required": False, "action": "store_true"},
+    )
+    FROM_MIRROR = cli.ArgumentProperties(
+        key="from_mirror",
+        flags=("--from-mirror",),
+        description=(
+            "Look up bundle identifiers, certificates, devices and profiles from the local mirror "
+            "of App Store Connect resources instead of App Store Connect API. Mirrored resources "
+            f"are refreshed automatically when they are older than {Colors.BRIGHT_BLUE('--mirror-max-age')} "
+            "or when requested resources are not found from the mirror, at most once per resource type. "
+            f"Use action {Colors.BRIGHT_BLUE('sync')} to refresh the mirror in advance."
+        ),
+        type=Types.AppStoreConnectFromMirror,
+        argparse_kwargs={"required": False, "action": "store_true"},
+    )
+    MIRROR_PATH = cli.ArgumentProperties(
+        key="mirror_path",
+        flags=("--mirror-path",),
+        type=Types.ResourceMirrorPath,
+        description=(
+            "Path to the SQLite database of the local mirror of App Store Connect resources. "
+            "By default, the mirror is kept in a temporary directory separately for every API key."
+        ),
+        argparse_kwargs={"required": False},
+    )
+    MIRROR_MAX_AGE = cli.ArgumentProperties(
+        key="mirror_max_age",
+        flags=("--mirror-max-age",),
+        type=Types.ResourceMirrorMaxAge,
+        description=(
+            "Maximum age in minutes of locally mirrored App Store Connect resources. "
+            "Older resources are refreshed from App Store Connect API before use."
+        ),
+        argparse_kwargs={"required": False},
+    )
+    API_REQUEST_TRACE_PATH = cli.ArgumentProperties(
+        key="api_request_trace_path",
+        flags=("--api-request-trace",),
+        type=Types.ApiRequestTracePath,
+        description=(
+            "Record timings, response sizes, retries and rate limits of all App Store Connect API "
+            "requests to given file and show summary of the requests once the action completes. "
+            "Requests are saved as Chrome trace if the file has .json extension, which can be "
+            "opened with Perfetto or chrome://tracing, and as JSON Lines otherwise"
+        ),
+        argparse_kwargs={"required": False},
+    )
     JSON_OUTPUT = cli.ArgumentProperties(
         key="json_output",
         flags=("--json",),
@@ -474,6 +587,17 @@ class AppStoreConnectArgument(cli.Argument):
         description="Whether to show the resource in JSON format",
         argparse_kwargs={"required": False, "action": "store_true"},
     )
+    JSON_LINES_OUTPUT = cli.ArgumentProperties(
+        key="json_lines_output",
+        flags=("--json-lines",),
+        type=bool,
+        description=(
+            "Whether to show the resources in JSON Lines format, one compact JSON object per line. "
+            "Listed resources are printed as soon as they are received. Useful for processing "
+            "large listings with tools such as jq"
+        ),
+        argparse_kwargs={"required": False, "action": "store_true"},
+    )
     ISSUER_ID = cli.ArgumentProperties(
         key="issuer_id",
         flags=("--issuer-id",),
@@ -505,6 +629,25 @@ class AppStoreConnectArgument(cli.Argument):
         ),
         argparse_kwargs={"required": False},
     )
+    ADDITIONAL_KEY_IDENTIFIERS = cli.ArgumentProperties(
+        key="additional_key_identifiers",
+        flags=("--additional-key-id",),
+        type=Types.AdditionalKeyIdentifiersArgument,
+        description=(
+            "IDs of additional App Store Connect API keys issued by the same issuer as "
+            f'{Colors.BRIGHT_BLUE("--key-id")}. If given, App Store Connect API requests are spread '
+            "over all the keys based on their remaining hourly request quota, and requests fail over "
+            "to other keys once the quota of one key is exhausted. Private key for every additional key "
+            'is read from environment variable "APP_STORE_CONNECT_PRIVATE_KEY_<key_identifier>", or '
+            'searched from the private key file "AuthKey_<key_identifier>.p8" in the same directories '
+            f'as for {Colors.BRIGHT_BLUE("--private-key")}'
+        ),
+        argparse_kwargs={
+            "required": False,
+            "nargs": "+",
+            "metavar": "KEY_ID",
+        },
+    )
     CERTIFICATES_DIRECTORY = cli.ArgumentProperties(
         key="certificates_directory",
         flags=("--certificates-dir",),
@@ -962,6 +1105,19 @@ class PublishArgument(cli.Argument):
             "action": "store_true",
         },
     )
+    MAX_CONCURRENT_UPLOADS = cli.ArgumentProperties(
+        key="max_concurrent_uploads",
+        flags=("--max-concurrent-uploads",),
+        type=Types.MaxConcurrentUploads,
+        description=(
+            "The maximum number of application packages that are uploaded to App Store Connect "
+            "at the same time when publishing multiple packages. Packages whose upload has "
+            "finished are processed further while other packages are still being uploaded."
+        ),
+        argparse_kwargs={
+            "required": False,
+        },
+    )
     LOCALE_DEFAULT = cli.ArgumentProperties(
         key="locale",
         flags=("--locale", "-l"),
@@ -1384,6 +1540,21 @@ class DeviceArgument(cli.Argument):
             "default": False,
         },
     )
+    BATCH_REGISTRATION = cli.ArgumentProperties(
+        key="batch_registration",
+        flags=("--batch",),
+        type=bool,
+        description=(
+            "Register devices in batch. Already registered devices are listed once and compared "
+            "against given UDIDs, only new devices are registered and their registrations are made "
+            "concurrently. A report of created, already registered and failed devices is shown."
+        ),
+        argparse_kwargs={
+            "required": False,
+            "action": "store_true",
+            "default": False,
+        },
+    )
 
 
 class CertificateArgument(cli.Argument):
@@ -1590,6 +1761,37 @@ class CommonArgument(cli.Argument):
             "choices": list(Platform),
         },
     )
+    DRY_RUN = cli.ArgumentProperties(
+        key="dry_run",
+        flags=("--dry-run",),
+        type=bool,
+        description="Only show which resources would be modified without making any changes to them",
+        argparse_kwargs={"required": False, "action": "store_true"},
+    )
+    MAX_CONCURRENT_REQUESTS = cli.ArgumentProperties(
+        key="max_concurrent_requests",
+        flags=("--max-concurrent-requests",),
+        type=Types.MaxConcurrentRequests,
+        description=(
+            "The maximum number of App Store Connect API requests that are made at the same time "
+            "when modifying resources in bulk. Requests are still subject to the API rate limits"
+        ),
+        argparse_kwargs={"required": False},
+    )
+
+
+class ResourceMirrorArgument(cli.Argument):
+    RESOURCE_TYPES = cli.ArgumentProperties(
+        key="resource_types",
+        flags=("--resource-type",),
+        type=ResourceType,
+        description="Types of App Store Connect resources to synchronize. By default, all supported types are synced",
+        argparse_kwargs={
+            "required": False,
+            "nargs": "+",
+            "choices": [mirrored_resource_type.resource_type for mirrored_resource_type in MIRRORED_RESOURCE_TYPES],
+        },
+    )
 
 
 class ArgumentGroups:
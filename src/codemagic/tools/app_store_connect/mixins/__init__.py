@@ -1,2 +1,7 @@
+from .bulk_mutation_mixin import BulkMutationMixin
+from .bulk_mutation_mixin import BulkMutationResult
+from .localization_sync_mixin import LocalizationSyncMixin
+from .localization_sync_mixin import LocalizationSyncResult
+from .localization_sync_mixin import LocalizationSyncStatus
 from .resource_manager_mixin import ResourceManagerMixin
 from .signing_file_saver_mixin import SigningFileSaverMixin
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Generic
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+from typing import cast
+
+from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.api_session import AppStoreConnectApiSession
+from codemagic.cli import Colors
+
+from ..errors import AppStoreConnectError
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass
+class BulkMutationResult(Generic[ItemT, ResultT]):
+    items: Sequence[ItemT]
+    results: List[ResultT] = field(default_factory=list)
+    failures: List[Tuple[ItemT, AppStoreConnectApiError]] = field(default_factory=list)
+    dry_run: bool = False
+
+
+class BulkMutationMixin:
+    logger: logging.Logger
+
+    def _run_bulk_mutation(
+        self,
+        api_session: AppStoreConnectApiSession,
+        mutate: Callable[[ItemT], ResultT],
+        items: Sequence[ItemT],
+        action: str,
+        describe_item: Callable[[ItemT], str],
+        max_concurrent_requests: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> BulkMutationResult[ItemT, ResultT]:
+        """
+        Apply `mutate` to all given items with at most `max_concurrent_requests` calls in flight.
+        Requests are made using the shared API session so that they obey its rate limiting.
+        Failure of one item does not stop the others: the progress of every item is logged as
+        it finishes, and all the failures are reported together once the whole batch is done.
+        In dry run mode only the planned operations are logged.
+        """
+        result: BulkMutationResult[ItemT, ResultT] = BulkMutationResult(items, dry_run=dry_run)
+        if dry_run:
+            for item in items:
+                self.logger.info(Colors.BLUE(f"Dry run: {action} {describe_item(item)}"))
+            self.logger.info(Colors.BLUE(f"Dry run: {len(items)} operation(s) planned, nothing was changed"))
+            return result
+
+        lock = threading.Lock()
+        finished_count = 0
+
+        def mutate_item(item: ItemT) -> Tuple[Optional[ResultT], Optional[AppStoreConnectApiError]]:
+            nonlocal finished_count
+            try:
+                item_result, item_error = mutate(item), None
+            except AppStoreConnectApiError as api_error:
+                item_result, item_error = None, api_error
+            with lock:
+                finished_count += 1
+                progress = f"[{finished_count}/{len(items)}] {action} {describe_item(item)}"
+            if item_error:
+                self.logger.warning(Colors.RED(f"{progress}: failed"))
+            else:
+                self.logger.info(Colors.GREEN(f"{progress}: done"))
+            return item_result, item_error
+
+        started_at = time.monotonic()
+        outcomes = api_session.map(mutate_item, items, max_workers=max_concurrent_requests)
+        for item, (item_result, item_error) in zip(items, outcomes):
+            if item_error:
+                result.failures.append((item, item_error))
+            else:
+                result.results.append(cast(ResultT, item_result))
+
+        elapsed_seconds = time.monotonic() - started_at
+        summary = (
+            f"{action} completed for {len(result.results)} of {len(items)} item(s) "
+            f"in {elapsed_seconds:.1f}s, {len(result.failures)} failed"
+        )
+        self.logger.info(Colors.YELLOW(summary) if result.failures else Colors.GREEN(summary))
+
+        if result.failures:
+            error_lines = [
+                f"Failed to {action.lower()} {describe_item(item)}. {api_error.error_response}"
+                for item, api_error in result.failures
+            ]
+            raise AppStoreConnectError("\n".join(error_lines))
+        return result
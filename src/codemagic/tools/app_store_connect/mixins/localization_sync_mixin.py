@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import enum
+import logging
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import TypeVar
+
+from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.api_session import AppStoreConnectApiSession
+from codemagic.apple.resources import Locale
+from codemagic.apple.resources import Resource
+from codemagic.cli import Colors
+from codemagic.utilities import case_conversion
+
+L = TypeVar("L", bound=Resource)
+
+
+class LocalizationSyncStatus(enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    FAILED = "failed"
+
+
+@dataclass
+class LocalizationSyncResult(Generic[L]):
+    locale: Locale
+    status: LocalizationSyncStatus
+    localization: Optional[L] = None
+    changed_fields: Sequence[str] = field(default_factory=list)
+    error: Optional[AppStoreConnectApiError] = None
+
+
+class LocalizationSyncMixin:
+    logger: logging.Logger
+
+    def _sync_localizations(
+        self,
+        api_session: AppStoreConnectApiSession,
+        existing_localizations: Mapping[Locale, L],
+        desired_localizations: Mapping[Locale, Mapping[str, Optional[str]]],
+        create: Callable[..., L],
+        modify: Callable[..., L],
+    ) -> List[LocalizationSyncResult[L]]:
+        """
+        Make existing localizations, which are mapped by their locales, match the desired ones.
+        Desired attribute values are given by the snake case keyword arguments of
+        `create(locale, **attributes)` and `modify(localization_id, **attributes)`, attributes
+        with `None` value are left as they are. Localizations for missing locales are created,
+        and only the attributes that differ from existing localizations are modified. All the required
+        requests are made concurrently, failures are reported in the results instead of raising errors.
+        """
+
+        def sync(locale: Locale) -> LocalizationSyncResult[L]:
+            attributes = {name: value for name, value in desired_localizations[locale].items() if value is not None}
+            existing_localization = existing_localizations.get(locale)
+            if existing_localization is None:
+                return self._create_localization(locale, attributes, create)
+
+            changed_attributes = {
+                name: value
+                for name, value in attributes.items()
+                if getattr(existing_localization.attributes, case_conversion.snake_to_camel(name), None) != value
+            }
+            if not changed_attributes:
+                return LocalizationSyncResult(locale, LocalizationSyncStatus.UNCHANGED, existing_localization)
+            return self._modify_localization(locale, existing_localization, changed_attributes, modify)
+
+        return api_session.map(sync, list(desired_localizations.keys()))
+
+    @classmethod
+    def _create_localization(
+        cls,
+        locale: Locale,
+        attributes: Dict[str, str],
+        create: Callable[..., L],
+    ) -> LocalizationSyncResult[L]:
+        changed_fields = [case_conversion.snake_to_camel(name) for name in attributes]
+        try:
+            localization = create(locale, **attributes)
+        except AppStoreConnectApiError as api_error:
+            return LocalizationSyncResult(locale, LocalizationSyncStatus.FAILED, None, changed_fields, api_error)
+        return LocalizationSyncResult(locale, LocalizationSyncStatus.CREATED, localization, changed_fields)
+
+    @classmethod
+    def _modify_localization(
+        cls,
+        locale: Locale,
+        existing_localization: L,
+        attributes: Dict[str, str],
+        modify: Callable[..., L],
+    ) -> LocalizationSyncResult[L]:
+        changed_fields = [case_conversion.snake_to_camel(name) for name in attributes]
+        try:
+            localization = modify(existing_localization.id, **attributes)
+        except AppStoreConnectApiError as api_error:
+            return LocalizationSyncResult(
+                locale,
+                LocalizationSyncStatus.FAILED,
+                existing_localization,
+                changed_fields,
+                api_error,
+            )
+        return LocalizationSyncResult(locale, LocalizationSyncStatus.UPDATED, localization, changed_fields)
+
+    def _log_localization_sync_results(self, resource_type: Type[L], results: Sequence[LocalizationSyncResult[L]]):
+        if not results:
+            return
+
+        self.logger.info(Colors.BLUE(f"\nSynchronized {resource_type.s}:"))
+        locale_width = max(len("Locale"), *(len(result.locale.value) for result in results))
+        status_width = max(len(status.value) for status in LocalizationSyncStatus)
+        self.logger.info(f"{'Locale':<{locale_width}}  {'Result':<{status_width}}  Changed fields")
+        for result in results:
+            line = (
+                f"{result.locale.value:<{locale_width}}  "
+                f"{result.status.value:<{status_width}}  "
+                f"{', '.join(result.changed_fields) or '-'}"
+            )
+            if result.status is LocalizationSyncStatus.FAILED:
+                self.logger.info(Colors.RED(line))
+            elif result.status is LocalizationSyncStatus.UNCHANGED:
+                self.logger.info(line)
+            else:
+                self.logger.info(Colors.GREEN(line))
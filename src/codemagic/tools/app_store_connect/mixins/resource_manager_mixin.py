@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import collections
+from abc import abstractmethod
 from typing import TYPE_CHECKING
 from typing import Callable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Type
 
 from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.api_resource_mirror import ApiResourceMirror
 from codemagic.apple.app_store_connect.resource_manager import R2
 from codemagic.apple.app_store_connect.resource_manager import R
 from codemagic.apple.app_store_connect.resource_manager import ResourceManager
@@ -17,6 +21,7 @@ from ..errors import AppStoreConnectError
 from ..resource_printer import ResourcePrinter
 
 if TYPE_CHECKING:
+    from codemagic.apple import AppStoreConnectApiClient
     from codemagic.apple.app_store_connect.resource_manager import CreatingResourceManager
     from codemagic.apple.app_store_connect.resource_manager import DeletingResourceManager
     from codemagic.apple.app_store_connect.resource_manager import ListingResourceManager
@@ -26,6 +31,65 @@ if TYPE_CHECKING:
 
 class ResourceManagerMixin:
     printer: ResourcePrinter
+    _discard_listed_resources: bool
+    _from_mirror: bool
+
+    @property
+    @abstractmethod
+    def api_client(self) -> AppStoreConnectApiClient:
+        ...
+
+    @property
+    @abstractmethod
+    def resource_mirror(self) -> ApiResourceMirror:
+        ...
+
+    def _sync_resource_mirror(self, resource_type: Type[R]):
+        mirrored_resource_type = ApiResourceMirror.get_resource_type(resource_type)
+        assert mirrored_resource_type is not None
+        self.printer.logger.info(f"Refresh mirrored {resource_type.s} from App Store Connect")
+        try:
+            self.resource_mirror.sync(self.api_client, [mirrored_resource_type])
+        except AppStoreConnectApiError as api_error:
+            raise AppStoreConnectError(
+                str(api_error),
+                api_error_response=api_error.error_response,
+            ) from api_error
+
+    def _invalidate_mirrored_resources(self, resource_type: Type[R]):
+        if ApiResourceMirror.is_mirrored(resource_type):
+            self.resource_mirror.invalidate(resource_type)
+
+    def _read_mirrored_resource(self, resource_type: Type[R], resource_reference: ResourceReference) -> Optional[R]:
+        if not self._from_mirror or not ApiResourceMirror.is_mirrored(resource_type):
+            return None
+
+        resource_id = Resource.get_id(resource_reference)
+        if self.resource_mirror.is_fresh(resource_type):
+            resource = self.resource_mirror.read(resource_type, resource_id)
+            if resource is not None or self.resource_mirror.is_synced_since_opened(resource_type):
+                return resource
+        # Mirror is stale, or the resource might have been created after the mirror was synced.
+        # The latter is checked at most once per resource type, further misses are trusted.
+        self._sync_resource_mirror(resource_type)
+        return self.resource_mirror.read(resource_type, resource_id)
+
+    def _list_mirrored_resources(
+        self,
+        resource_type: Type[R],
+        resource_filter: ResourceManager.Filter,
+    ) -> Optional[List[R]]:
+        if not self._from_mirror or not ApiResourceMirror.is_mirrored(resource_type):
+            return None
+
+        if self.resource_mirror.is_fresh(resource_type):
+            resources = self.resource_mirror.list(resource_type, resource_filter)
+            if resources or self.resource_mirror.is_synced_since_opened(resource_type):
+                return resources
+        # Mirror is stale, or matching resources might have been created after the mirror was synced.
+        # The latter is checked at most once per resource type, further empty listings are trusted.
+        self._sync_resource_mirror(resource_type)
+        return self.resource_mirror.list(resource_type, resource_filter)
 
     def _create_resource(
         self,
@@ -46,6 +110,7 @@ class ResourceManagerMixin:
                 api_error_response=api_error.error_response,
             ) from api_error
 
+        self._invalidate_mirrored_resources(resource_manager.resource_type)
         self.printer.print_resource(resource, should_print)
         self.printer.log_created(resource)
         return resource
@@ -57,13 +122,15 @@ class ResourceManagerMixin:
         should_print: bool,
     ) -> R:
         self.printer.log_get(resource_manager.resource_type, resource_reference)
-        try:
-            resource = resource_manager.read(resource_reference)
-        except AppStoreConnectApiError as api_error:
-            raise AppStoreConnectError(
-                str(api_error),
-                api_error_response=api_error.error_response,
-            ) from api_error
+        resource = self._read_mirrored_resource(resource_manager.resource_type, resource_reference)
+        if resource is None:
+            try:
+                resource = resource_manager.read(resource_reference)
+            except AppStoreConnectApiError as api_error:
+                raise AppStoreConnectError(
+                    str(api_error),
+                    api_error_response=api_error.error_response,
+                ) from api_error
         self.printer.print_resource(resource, should_print)
         return resource
 
@@ -73,20 +140,39 @@ class ResourceManagerMixin:
         resource_manager: ListingResourceManager[R],
         should_print: bool,
         filter_predicate: Optional[Callable[[R], bool]] = None,
+        is_result_required: bool = False,
     ) -> List[R]:
+        resources: List[R] = []
+        resources_count = 0
+        # Printed resources are not kept when nothing uses the listing afterwards
+        keep_resources = is_result_required or not self._discard_listed_resources
+        mirrored_resources = self._list_mirrored_resources(resource_manager.resource_type, resource_filter)
+
+        def iter_resources() -> Iterator[R]:
+            if mirrored_resources is None:
+                listed_resources = resource_manager.iter_list(resource_filter=resource_filter)
+            else:
+                listed_resources = iter(mirrored_resources)
+            nonlocal resources_count
+            for resource in listed_resources:
+                if filter_predicate is None or filter_predicate(resource):
+                    resources_count += 1
+                    if keep_resources:
+                        resources.append(resource)
+                    yield resource
+
+        resources_iterator = iter_resources()
         try:
-            resources = resource_manager.list(resource_filter=resource_filter)
+            # Print resources as soon as the pages arrive instead of waiting for the whole listing
+            self.printer.print_resources(resources_iterator, should_print)
+            collections.deque(resources_iterator, maxlen=0)
         except AppStoreConnectApiError as api_error:
             raise AppStoreConnectError(
                 str(api_error),
                 api_error_response=api_error.error_response,
             ) from api_error
 
-        if filter_predicate is not None:
-            resources = list(filter(filter_predicate, resources))
-
-        self.printer.log_found(resource_manager.resource_type, resources, resource_filter)
-        self.printer.print_resources(resources, should_print)
+        self.printer.log_found(resource_manager.resource_type, resources_count, resource_filter)
         return resources
 
     def _get_related_resource(
@@ -161,6 +247,7 @@ class ResourceManagerMixin:
                 ) from api_error
         else:
             self.printer.log_deleted(resource_manager.resource_type, resource_reference)
+            self._invalidate_mirrored_resources(resource_manager.resource_type)
 
     def _modify_resource(
         self,
@@ -178,6 +265,7 @@ class ResourceManagerMixin:
                 api_error_response=api_error.error_response,
             ) from api_error
 
+        self._invalidate_mirrored_resources(resource_manager.resource_type)
         self.printer.log_modified(resource_manager.resource_type, resource_reference)
         self.printer.print_resource(resource, should_print)
         return resource
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import base64
 import pathlib
 import re
 import tempfile
+from functools import lru_cache
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -16,6 +18,21 @@ from ..errors import AppStoreConnectError
 from ..resource_printer import ResourcePrinter
 
 
+@lru_cache(maxsize=512)
+def _parse_certificate(certificate_id: str, certificate_content: str) -> Certificate:
+    return Certificate.from_ans1(base64.b64decode(certificate_content))
+
+
+@lru_cache(maxsize=512)
+def _get_certificate_public_key_fingerprint(certificate_id: str, certificate_content: str) -> Optional[str]:
+    certificate = _parse_certificate(certificate_id, certificate_content)
+    try:
+        return certificate.get_public_key_fingerprint()
+    except TypeError:
+        # Certificates with unsupported public key types cannot match any private key
+        return None
+
+
 class SigningFileSaverMixin:
     certificates_directory: pathlib.Path
     printer: ResourcePrinter
@@ -36,6 +53,18 @@ class SigningFileSaverMixin:
         tf.close()
         return pathlib.Path(tf.name)
 
+    @classmethod
+    def _get_certificate(cls, certificate: SigningCertificate) -> Certificate:
+        """
+        Parsed certificate of the signing certificate resource. Certificates are parsed
+        once per certificate ID and content, and reused for key matching and exporting.
+        """
+        return _parse_certificate(certificate.id, certificate.attributes.certificateContent)
+
+    @classmethod
+    def _get_public_key_fingerprint(cls, certificate: SigningCertificate) -> Optional[str]:
+        return _get_certificate_public_key_fingerprint(certificate.id, certificate.attributes.certificateContent)
+
     def _save_profile(self, profile: Profile) -> pathlib.Path:
         profile_path = self._get_unique_path(
             f"{profile.attributes.profileType}_{profile.id}{profile.profile_extension}",
@@ -60,7 +89,7 @@ class SigningFileSaverMixin:
         else:
             certificate_path = certificate_save_path
         try:
-            p12_path = Certificate.from_ans1(certificate.asn1_content).export_p12(
+            p12_path = self._get_certificate(certificate).export_p12(
                 private_key,
                 p12_container_password,
                 export_path=certificate_path,
@@ -4,8 +4,10 @@ import enum
 import json
 import pathlib
 import shlex
+import textwrap
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import Mapping
 from typing import Optional
 from typing import Sequence
@@ -39,8 +41,24 @@ JsonSerializableT = Union[
 
 
 class ResourcePrinter:
-    def __init__(self, print_json: bool, print_function: Callable[[str], None]):
-        self.print_json = print_json
+    def __init__(
+        self,
+        print_json: bool,
+        print_function: Callable[[str], None],
+        print_json_lines: bool = False,
+        pretty_json: bool = True,
+    ):
+        """
+        :param print_json: Whether to print resources in JSON format
+        :param print_function: Function that outputs printed lines
+        :param print_json_lines: Whether to print resources as newline delimited JSON,
+                                 one compact JSON document per line
+        :param pretty_json: Whether to indent printed JSON documents. Compact
+                            output is easier to process for other tools.
+        """
+        self.print_json = print_json or print_json_lines
+        self.print_json_lines = print_json_lines
+        self.json_indent: Optional[int] = 4 if pretty_json and not print_json_lines else None
         self.logger = log.get_logger(self.__class__)
         self.print = print_function
 
@@ -49,21 +67,50 @@ class ResourcePrinter:
             return
         if self.print_json:
             if isinstance(value, JsonSerializable):
-                serialized = value.json(indent=4)
+                serialized = value.json(indent=self.json_indent)
             elif isinstance(value, DictSerializable):
-                serialized = json.dumps(value.dict(), indent=4)
+                serialized = json.dumps(value.dict(), indent=self.json_indent)
             else:
-                serialized = json.dumps(value, indent=4)
+                serialized = json.dumps(value, indent=self.json_indent)
             self.print(serialized)
         else:
             self.print(str(value))
 
-    def print_resources(self, resources: Sequence[R], should_print: bool):
+    def _print_json_lines(self, resources: Iterable[R]):
+        for resource in resources:
+            self.print(json.dumps(resource.dict()))
+
+    def _print_json_array(self, resources: Iterable[R]):
+        """
+        Print resources as a JSON array one element at a time so that output for
+        already fetched resources is visible before the listing is exhausted.
+        Indented result is identical to `json.dumps(items, indent=4)`. Without
+        indentation every element is printed on a separate line.
+        """
+        previous_item: Optional[str] = None
+        for resource in resources:
+            item = json.dumps(resource.dict(), indent=self.json_indent)
+            if self.json_indent is not None:
+                item = textwrap.indent(item, " " * self.json_indent)
+            if previous_item is None:
+                self.print("[")
+            else:
+                self.print(f"{previous_item},")
+            previous_item = item
+
+        if previous_item is None:
+            self.print("[]")
+        else:
+            self.print(previous_item)
+            self.print("]")
+
+    def print_resources(self, resources: Iterable[R], should_print: bool):
         if should_print is not True:
             return
-        if self.print_json:
-            items = [resource.dict() for resource in resources]
-            self.print(json.dumps(items, indent=4))
+        if self.print_json_lines:
+            self._print_json_lines(resources)
+        elif self.print_json:
+            self._print_json_array(resources)
         else:
             for resource in resources:
                 self.print_resource(resource, True)
@@ -72,7 +119,7 @@ class ResourcePrinter:
         if should_print is not True:
             return
         if self.print_json:
-            self.print(resource.json())
+            self.print(resource.json(indent=self.json_indent))
         else:
             header = f'-- {resource.__class__}{" (Created)" if resource.created else ""} --'
             self.print(Colors.BLUE(header))
@@ -113,7 +160,7 @@ class ResourcePrinter:
     def log_found(
         self,
         resource_type: Type[R],
-        resources: Sequence[R],
+        resources: Union[Sequence[R], int],
         resource_filter: Optional[ResourceManager.Filter] = None,
         related_resource_type: Optional[Type[R2]] = None,
         related_resource_reference: Optional[ResourceReference] = None,
@@ -130,7 +177,7 @@ class ResourcePrinter:
         else:
             suffix = ""
 
-        count = len(resources)
+        count = resources if isinstance(resources, int) else len(resources)
         name = resource_type.plural(count)
         if count == 0:
             self.logger.info(Colors.YELLOW(f"Did not find any {name}{related}{suffix}"))
@@ -138,7 +185,7 @@ class ResourcePrinter:
             self.logger.info(Colors.GREEN(f"Found {count} {name}{related}{suffix}"))
 
     def log_filtered(self, resource_type: Type[R], resources: Sequence[R], constraint: str):
-        count = len(resources)
+        count = resources if isinstance(resources, int) else len(resources)
         name = resource_type.plural(count)
         if count == 0:
             self.logger.info(Colors.YELLOW(f"Did not find any {name} {constraint}"))
@@ -0,0 +1,576 @@
+from __future__ import annotations
+
+import base64
+import io
+import itertools
+import json
+import re
+import threading
+import time
+from collections import Counter
+from collections import defaultdict
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
+from urllib import parse
+
+import jwt
+import requests
+from codemagic.apple.app_store_connect import AppStoreConnectApiClient
+from codemagic.apple.resources import ResourceType
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+Linkage = Dict[str, str]
+RelatedLinkage = Union[None, Linkage, List[Linkage]]
+
+
+class EmulatedRequest(NamedTuple):
+    method: str
+    path: str
+    params: Dict[str, str]
+    status_code: int
+    elapsed: float
+    key_identifier: Optional[str] = None
+
+
+class _Fault:
+    def __init__(
+        self,
+        status_code: int,
+        times: int,
+        method: Optional[str],
+        path_pattern: Optional[str],
+        retry_after: Optional[float],
+    ):
+        self.status_code = status_code
+        self.remaining = times
+        self.method = method.upper() if method else None
+        self.path_pattern = re.compile(path_pattern) if path_pattern else None
+        self.retry_after = retry_after
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.remaining <= 0:
+            return False
+        if self.method and self.method != method:
+            return False
+        return self.path_pattern is None or bool(self.path_pattern.search(path))
+
+
+class _ResponseBody(io.RawIOBase):
+    """
+    Raw response stream that lets go of the body once it is read, like network
+    connections do, so that it is not kept in memory next to the read content
+    """
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self._body: Optional[io.BytesIO] = io.BytesIO(body)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        if self._body is None:
+            return 0
+        size = self._body.readinto(buffer)
+        if size == 0:
+            self._body = None
+        self._position += size
+        return size
+
+
+class _EmulatorError(Exception):
+    def __init__(self, status_code: int, code: str, detail: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.payload = {
+            "errors": [
+                {
+                    "id": f"emulated-{status_code}",
+                    "status": str(status_code),
+                    "code": code,
+                    "title": HTTPStatus(status_code).phrase,
+                    "detail": detail,
+                },
+            ],
+        }
+
+
+class AppStoreConnectApiEmulator(BaseAdapter):
+    """
+    Offline emulator of the App Store Connect JSON:API surface that is used by `AppStoreConnectApiClient`.
+    It is a transport adapter for `requests` that is mounted to the session of an API client with
+    `install`, so that requests go through the same authentication, retry and rate limiting logic
+    of the session as real App Store Connect API requests, but are served from in-memory resources.
+
+    Supported are cursor based pagination, sparse fieldsets, included related resources (at most
+    50 per relationship, as on App Store Connect), filters on attributes, relationships and attributes
+    of related resources, sorting, and creating, modifying and deleting resources and relationships.
+    Failures such as expired credentials (401), exceeded rate limit (429) and server errors (5xx)
+    can be injected, and every request can be delayed by given latency.
+    """
+
+    API_URL = AppStoreConnectApiClient.API_URL
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+    MAX_INCLUDED_RELATED = 50
+
+    def __init__(self, latency: float = 0.0, rate_limit: Optional[int] = None):
+        """
+        :param latency: Number of seconds every request takes before it is served
+        :param rate_limit: Hourly request limit of every API key reported in X-Rate-Limit response header.
+                           Requests are rejected with 429 once the limit is exhausted. Not enforced if omitted.
+        """
+        super().__init__()
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.requests: List[EmulatedRequest] = []
+        self._api_path = parse.urlparse(self.API_URL).path
+        self._resources: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self._faults: List[_Fault] = []
+        self._key_request_counts: Counter[Optional[str]] = Counter()
+        self._listings: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[Dict]] = {}
+        self._resource_ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def install(self, client: AppStoreConnectApiClient):
+        client.session.mount(self.API_URL, self)
+
+    def close(self):
+        pass
+
+    def reset_requests(self):
+        with self._lock:
+            self.requests.clear()
+            self._key_request_counts.clear()
+
+    @property
+    def request_count(self) -> int:
+        return len(self.requests)
+
+    def count_requests(self, method: Optional[str] = None, path_pattern: Optional[str] = None) -> int:
+        pattern = re.compile(path_pattern) if path_pattern else None
+        return sum(
+            1
+            for request in self.requests
+            if (method is None or request.method == method.upper())
+            and (pattern is None or pattern.search(request.path))
+        )
+
+    def inject_fault(
+        self,
+        status_code: int,
+        times: int = 1,
+        method: Optional[str] = None,
+        path_pattern: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """
+        Respond with given error status to the next `times` requests that match the method and path pattern.
+        :param retry_after: Value for Retry-After response header in seconds, useful with status 429
+        """
+        with self._lock:
+            self._faults.append(_Fault(status_code, times, method, path_pattern, retry_after))
+
+    def add_resource(
+        self,
+        resource_type: ResourceType,
+        attributes: Mapping[str, Any],
+        relationships: Optional[Mapping[str, RelatedLinkage]] = None,
+        resource_id: Optional[str] = None,
+    ) -> Linkage:
+        """
+        Store resource with given attributes and relationships to other resources. Relationships are
+        not inverted automatically, both sides of the relationship need to be given explicitly.
+        """
+        resource_id = resource_id or self._get_next_resource_id()
+        resource = {
+            "type": resource_type.value,
+            "id": resource_id,
+            "attributes": dict(attributes),
+            "relationships": dict(relationships or {}),
+        }
+        with self._lock:
+            self._resources[resource_type.value][resource_id] = resource
+            self._listings.clear()
+        return {"type": resource_type.value, "id": resource_id}
+
+    def link(self, resource: Linkage, relationship: str, related: Linkage):
+        with self._lock:
+            stored_resource = self._get_resource(resource["type"], resource["id"])
+            linkage = stored_resource["relationships"].setdefault(relationship, [])
+            linkage.append(related)
+            self._listings.clear()
+
+    def get_resource(self, resource_type: ResourceType, resource_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._resources[resource_type.value].get(resource_id)
+
+    def count_resources(self, resource_type: ResourceType) -> int:
+        return len(self._resources[resource_type.value])
+
+    def send(self, request: requests.PreparedRequest, *_args, **_kwargs) -> requests.Response:
+        started_at = time.monotonic()
+        assert request.url is not None and request.method is not None
+        parsed_url = parse.urlparse(request.url)
+        params = {k: v[-1] for k, v in parse.parse_qs(parsed_url.query, keep_blank_values=True).items()}
+        method = request.method.upper()
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        headers: Dict[str, str] = {}
+        key_identifier = self._get_key_identifier(request)
+        try:
+            with self._lock:
+                self._check_authorization(request)
+                self._check_injected_faults(method, parsed_url.path)
+                headers.update(self._check_rate_limit(key_identifier))
+                status_code, payload = self._dispatch(method, parsed_url.path, params, request.body)
+                if method != "GET":
+                    self._listings.clear()
+        except _EmulatorError as error:
+            status_code, payload = error.status_code, error.payload
+            headers.update(error.headers)
+
+        elapsed = time.monotonic() - started_at
+        with self._lock:
+            request_info = EmulatedRequest(method, parsed_url.path, params, status_code, elapsed, key_identifier)
+            self.requests.append(request_info)
+        return self._build_response(request, status_code, payload, headers, elapsed)
+
+    def _get_next_resource_id(self) -> str:
+        return f"{next(self._resource_ids):010X}"
+
+    def _get_resource(self, resource_type: str, resource_id: str) -> Dict[str, Any]:
+        try:
+            return self._resources[resource_type][resource_id]
+        except KeyError:
+            detail = f"There is no resource of type '{resource_type}' with id '{resource_id}'"
+            raise _EmulatorError(404, "NOT_FOUND", detail)
+
+    @classmethod
+    def _get_key_identifier(cls, request: requests.PreparedRequest) -> Optional[str]:
+        authorization = request.headers.get("Authorization") or ""
+        try:
+            return jwt.get_unverified_header(authorization[len("Bearer ") :]).get("kid")
+        except jwt.InvalidTokenError:
+            return None
+
+    @classmethod
+    def _check_authorization(cls, request: requests.PreparedRequest):
+        authorization = request.headers.get("Authorization") or ""
+        if not authorization.startswith("Bearer ") or len(authorization) == len("Bearer "):
+            raise _EmulatorError(401, "NOT_AUTHORIZED", "Provide a properly configured and signed bearer token")
+
+    def _check_injected_faults(self, method: str, path: str):
+        fault = next((fault for fault in self._faults if fault.matches(method, path)), None)
+        if fault is None:
+            return
+        fault.remaining -= 1
+        headers = {} if fault.retry_after is None else {"Retry-After": str(fault.retry_after)}
+        if fault.status_code == 401:
+            raise _EmulatorError(401, "NOT_AUTHORIZED", "The bearer token has expired", headers)
+        elif fault.status_code == 429:
+            raise _EmulatorError(429, "RATE_LIMIT_EXCEEDED", "The request rate limit has been reached", headers)
+        raise _EmulatorError(fault.status_code, "UNEXPECTED_ERROR", "An unexpected error occurred", headers)
+
+    def _check_rate_limit(self, key_identifier: Optional[str]) -> Dict[str, str]:
+        if self.rate_limit is None:
+            return {}
+        self._key_request_counts[key_identifier] += 1
+        remaining = self.rate_limit - self._key_request_counts[key_identifier]
+        headers = {"X-Rate-Limit": f"user-hour-lim:{self.rate_limit};user-hour-rem:{max(remaining, 0)};"}
+        if remaining < 0:
+            raise _EmulatorError(429, "RATE_LIMIT_EXCEEDED", "The request rate limit has been reached", headers)
+        return headers
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        body: Optional[Union[str, bytes]],
+    ) -> Tuple[int, Optional[Dict]]:
+        if not path.startswith(f"{self._api_path}/"):
+            raise _EmulatorError(404, "NOT_FOUND", f"The URL path {path!r} is not supported")
+        segments = path[len(self._api_path) + 1 :].strip("/").split("/")
+        request_data = json.loads(body)["data"] if body else None
+
+        if len(segments) == 1 and method == "GET":
+            return 200, self._list(list(self._resources[segments[0]].values()), path, params)
+        elif len(segments) == 1 and method == "POST":
+            return 201, self._create(segments[0], request_data, params)
+        elif len(segments) == 2 and method == "GET":
+            return 200, self._read(self._get_resource(*segments), params)
+        elif len(segments) == 2 and method == "PATCH":
+            return 200, self._modify(self._get_resource(*segments), request_data, params)
+        elif len(segments) == 2 and method == "DELETE":
+            self._get_resource(*segments)
+            del self._resources[segments[0]][segments[1]]
+            return 204, None
+        elif len(segments) == 3 and method == "GET":
+            return 200, self._list_related(self._get_resource(*segments[:2]), segments[2], path, params)
+        elif len(segments) == 4 and segments[2] == "relationships":
+            resource = self._get_resource(*segments[:2])
+            return self._handle_relationship(resource, segments[3], method, request_data, path, params)
+        raise _EmulatorError(404, "NOT_FOUND", f"The URL path {path!r} is not supported for {method} requests")
+
+    def _create(self, resource_type: str, request_data: Dict, params: Dict[str, str]) -> Dict:
+        if request_data.get("type") != resource_type:
+            raise _EmulatorError(409, "ENTITY_ERROR.TYPE_MISMATCH", f"Expected resource type {resource_type!r}")
+        relationships = {
+            name: relationship.get("data") for name, relationship in (request_data.get("relationships") or {}).items()
+        }
+        linkage = self.add_resource(ResourceType(resource_type), request_data.get("attributes") or {}, relationships)
+        return self._read(self._get_resource(linkage["type"], linkage["id"]), params)
+
+    def _modify(self, resource: Dict, request_data: Dict, params: Dict[str, str]) -> Dict:
+        if request_data.get("id") != resource["id"]:
+            raise _EmulatorError(409, "ENTITY_ERROR.ID_MISMATCH", f"Expected resource id {resource['id']!r}")
+        resource["attributes"].update(request_data.get("attributes") or {})
+        for name, relationship in (request_data.get("relationships") or {}).items():
+            resource["relationships"][name] = relationship.get("data")
+        return self._read(resource, params)
+
+    def _read(self, resource: Dict, params: Dict[str, str]) -> Dict:
+        include = self._get_include(params)
+        response = {
+            "data": self._serialize(resource, params, include),
+            "links": {"self": self._get_resource_url(resource)},
+        }
+        if include:
+            response["included"] = self._get_included([resource], params, include)
+        return response
+
+    def _list_related(self, resource: Dict, relationship: str, path: str, params: Dict[str, str]) -> Dict:
+        if relationship not in resource["relationships"]:
+            raise _EmulatorError(404, "NOT_FOUND", f"Relationship {relationship!r} is not supported")
+        linkage = resource["relationships"][relationship]
+        if isinstance(linkage, list):
+            related_resources = [self._get_resource(related["type"], related["id"]) for related in linkage]
+            return self._list(related_resources, path, params)
+        elif linkage is None:
+            return {"data": None, "links": {"self": f"{self.API_URL}{path[len(self._api_path):]}"}}
+        return self._read(self._get_resource(linkage["type"], linkage["id"]), params)
+
+    def _handle_relationship(
+        self,
+        resource: Dict,
+        relationship: str,
+        method: str,
+        request_data: Optional[Union[Linkage, List[Linkage]]],
+        path: str,
+        params: Dict[str, str],
+    ) -> Tuple[int, Optional[Dict]]:
+        linkage = resource["relationships"].get(relationship)
+        if method == "GET":
+            if not isinstance(linkage, list):
+                return 200, {"data": linkage, "links": {"self": f"{self.API_URL}{path[len(self._api_path):]}"}}
+            return 200, self._paginate(linkage, [], path, params)
+        elif method == "PATCH":
+            resource["relationships"][relationship] = request_data
+            return 204, None
+        elif method in ("POST", "DELETE") and isinstance(request_data, list):
+            linkage = list(linkage or [])
+            for related in request_data:
+                if method == "POST" and related not in linkage:
+                    linkage.append(related)
+                elif method == "DELETE" and related in linkage:
+                    linkage.remove(related)
+            resource["relationships"][relationship] = linkage
+            return 204, None
+        raise _EmulatorError(405, "METHOD_NOT_ALLOWED", f"{method} is not allowed for relationship {relationship!r}")
+
+    def _list(self, resources: List[Dict], path: str, params: Dict[str, str]) -> Dict:
+        # Filter and sort the resources once for all the pages of the listing
+        listing_key = (path, tuple(sorted((k, v) for k, v in params.items() if k not in ("cursor", "limit"))))
+        if listing_key in self._listings:
+            resources = self._listings[listing_key]
+        else:
+            resources = self._filter_and_sort(resources, params)
+            self._listings[listing_key] = resources
+        include = self._get_include(params)
+        return self._paginate(
+            resources,
+            include,
+            path,
+            params,
+            serialize=lambda resource: self._serialize(resource, params, include),
+        )
+
+    def _filter_and_sort(self, resources: List[Dict], params: Dict[str, str]) -> List[Dict]:
+        filters = {
+            name[len("filter[") : -1]: set(value.split(","))
+            for name, value in params.items()
+            if name.startswith("filter[") and name.endswith("]")
+        }
+        resources = [resource for resource in resources if self._matches(resource, filters)]
+        for sort_key in reversed([key for key in params.get("sort", "").split(",") if key]):
+            attribute = sort_key.lstrip("-")
+            resources.sort(
+                key=lambda resource: self._get_sorting_key(resource["attributes"].get(attribute)),
+                reverse=sort_key.startswith("-"),
+            )
+        return resources
+
+    def _paginate(
+        self,
+        items: Sequence[Dict],
+        include: Sequence[str],
+        path: str,
+        params: Dict[str, str],
+        serialize=lambda item: item,
+    ) -> Dict:
+        try:
+            limit = int(params.get("limit", self.DEFAULT_PAGE_SIZE))
+            offset = int(base64.urlsafe_b64decode(params["cursor"]).decode()) if "cursor" in params else 0
+        except ValueError:
+            raise _EmulatorError(400, "PARAMETER_ERROR.INVALID", "Invalid limit or cursor")
+        if not 0 < limit <= self.MAX_PAGE_SIZE:
+            raise _EmulatorError(400, "PARAMETER_ERROR.INVALID", f"Limit must be between 1 and {self.MAX_PAGE_SIZE}")
+
+        page = items[offset : offset + limit]
+        url = f"{self.API_URL}{path[len(self._api_path):]}"
+        links = {"self": f"{url}?{parse.urlencode(params)}" if params else url}
+        if offset + limit < len(items):
+            cursor = base64.urlsafe_b64encode(str(offset + limit).encode()).decode()
+            links["next"] = f"{url}?{parse.urlencode({**params, 'limit': limit, 'cursor': cursor})}"
+        response = {
+            "data": [serialize(item) for item in page],
+            "links": links,
+            "meta": {"paging": {"total": len(items), "limit": limit}},
+        }
+        if include:
+            response["included"] = self._get_included(page, params, include)
+        return response
+
+    def _matches(self, resource: Dict, filters: Dict[str, Set[str]]) -> bool:
+        return all(self._matches_filter(resource, name, values) for name, values in filters.items())
+
+    def _matches_filter(self, resource: Dict, name: str, values: Set[str]) -> bool:
+        if name == "id":
+            return resource["id"] in values
+        relationship, _, related_name = name.partition(".")
+        if relationship in resource["relationships"]:
+            related_resources = self._as_list(resource["relationships"][relationship])
+            if not related_name:
+                return any(related["id"] in values for related in related_resources)
+            return any(
+                self._matches_filter(self._get_resource(related["type"], related["id"]), related_name, values)
+                for related in related_resources
+            )
+
+        value = resource["attributes"].get(name)
+        if resource["type"] == ResourceType.BUNDLE_ID.value and name == "identifier":
+            # Like App Store Connect API, match bundle identifiers by prefix
+            return isinstance(value, str) and any(value.startswith(prefix) for prefix in values)
+        elif isinstance(value, bool):
+            return self._format_value(value) in {filter_value.lower() for filter_value in values}
+        return self._format_value(value) in values
+
+    def _serialize(self, resource: Dict, params: Dict[str, str], include: Sequence[str] = ()) -> Dict:
+        fields = self._get_fields(params, resource["type"])
+        resource_url = self._get_resource_url(resource)
+        relationships = {}
+        for name, linkage in resource["relationships"].items():
+            if fields is not None and name not in fields:
+                continue
+            relationship: Dict[str, Any] = {
+                "links": {
+                    "self": f"{resource_url}/relationships/{name}",
+                    "related": f"{resource_url}/{name}",
+                },
+            }
+            if name in include and isinstance(linkage, list):
+                relationship["data"] = linkage[: self.MAX_INCLUDED_RELATED]
+                relationship["meta"] = {"paging": {"total": len(linkage), "limit": self.MAX_INCLUDED_RELATED}}
+            elif name in include:
+                relationship["data"] = linkage
+            relationships[name] = relationship
+
+        return {
+            "type": resource["type"],
+            "id": resource["id"],
+            "attributes": {
+                name: value for name, value in resource["attributes"].items() if fields is None or name in fields
+            },
+            "relationships": relationships,
+            "links": {"self": resource_url},
+        }
+
+    def _get_included(self, resources: Iterable[Dict], params: Dict[str, str], include: Sequence[str]) -> List[Dict]:
+        included: Dict[Tuple[str, str], Dict] = {}
+        for resource in resources:
+            for relationship in include:
+                linkage = self._as_list(resource["relationships"].get(relationship))
+                for related in linkage[: self.MAX_INCLUDED_RELATED]:
+                    key = (related["type"], related["id"])
+                    if key not in included:
+                        included[key] = self._serialize(self._get_resource(*key), params)
+        return list(included.values())
+
+    def _get_resource_url(self, resource: Dict) -> str:
+        return f"{self.API_URL}/{resource['type']}/{resource['id']}"
+
+    @classmethod
+    def _get_include(cls, params: Dict[str, str]) -> List[str]:
+        return [name for name in params.get("include", "").split(",") if name]
+
+    @classmethod
+    def _get_fields(cls, params: Dict[str, str], resource_type: str) -> Optional[Set[str]]:
+        fields = params.get(f"fields[{resource_type}]")
+        return None if fields is None else set(fields.split(","))
+
+    @classmethod
+    def _as_list(cls, linkage: RelatedLinkage) -> List[Linkage]:
+        if linkage is None:
+            return []
+        return linkage if isinstance(linkage, list) else [linkage]
+
+    @classmethod
+    def _format_value(cls, value: Any) -> str:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return "" if value is None else str(value)
+
+    @classmethod
+    def _get_sorting_key(cls, value: Any) -> Tuple[bool, str]:
+        return value is None, cls._format_value(value)
+
+    def _build_response(
+        self,
+        request: requests.PreparedRequest,
+        status_code: int,
+        payload: Optional[Dict],
+        headers: Dict[str, str],
+        elapsed: float,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = HTTPStatus(status_code).phrase
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", **headers})
+        # Body is read from the raw stream like in case of real responses that are streamed
+        response.raw = _ResponseBody(json.dumps(payload).encode() if payload is not None else b"")
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        response.elapsed = timedelta(seconds=elapsed)
+        response.connection = self
+        return response
@@ -0,0 +1,130 @@
+from typing import List
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.builds import Builds
+from codemagic.apple.app_store_connect.builds import BuildWaiter
+from codemagic.apple.app_store_connect.builds import BuildWaitProgress
+from codemagic.apple.app_store_connect.builds import BuildWaitState
+from codemagic.apple.resources import BuildProcessingState
+from codemagic.apple.resources import ExternalBetaState
+from codemagic.apple.resources import InternalBetaState
+from codemagic.apple.resources import ResourceId
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with mock.patch("codemagic.apple.app_store_connect.builds.build_waiter.time") as mock_time:
+        mock_time.monotonic.side_effect = fake_clock.monotonic
+        mock_time.sleep.side_effect = fake_clock.sleep
+        yield fake_clock
+
+
+@pytest.fixture
+def builds() -> Builds:
+    return Builds(mock.MagicMock())
+
+
+def _get_build(build_id: str, processing_state: BuildProcessingState = BuildProcessingState.VALID):
+    return mock.Mock(id=ResourceId(build_id), attributes=mock.Mock(processingState=processing_state))
+
+
+def _get_build_beta_detail(is_processing: bool = False):
+    beta_state = ExternalBetaState.PROCESSING if is_processing else ExternalBetaState.READY_FOR_BETA_SUBMISSION
+    internal_state = InternalBetaState.PROCESSING if is_processing else InternalBetaState.IN_BETA_TESTING
+    return mock.Mock(attributes=mock.Mock(externalBuildState=beta_state, internalBuildState=internal_state))
+
+
+def test_build_waiter_batches_processing_checks(builds, clock):
+    responses = [
+        [(_get_build("1", BuildProcessingState.PROCESSING), None), (_get_build("2"), _get_build_beta_detail(True))],
+        [(_get_build("1"), _get_build_beta_detail()), (_get_build("2"), _get_build_beta_detail())],
+    ]
+    progresses: List[BuildWaitProgress] = []
+    build_waiter = BuildWaiter(builds, on_progress=progresses.append)
+    build_waiter.add_processing("first", ResourceId("1"), timeout=60)
+    build_waiter.add_processing("second", ResourceId("2"), timeout=60)
+
+    with mock.patch.object(Builds, "iter_list_with_include", side_effect=responses) as mock_list:
+        results = build_waiter.wait()
+
+    assert mock_list.call_count == 2
+    assert all(call.args[1].id == ["1", "2"] for call in mock_list.call_args_list)
+    assert {key: progress.state for key, progress in results.items()} == {
+        "first": BuildWaitState.PROCESSED,
+        "second": BuildWaitState.PROCESSED,
+    }
+    assert [progress.state for progress in progresses] == [BuildWaitState.PROCESSING] * 2 + [
+        BuildWaitState.PROCESSED,
+    ] * 2
+    assert not build_waiter.is_waiting
+
+
+def test_build_waiter_backs_off_until_timeout(builds, clock):
+    build_waiter = BuildWaiter(builds, initial_interval=5, max_interval=30)
+    build_waiter.add_processing("build", ResourceId("1"), timeout=60)
+
+    with mock.patch.object(Builds, "iter_list_with_include") as mock_list:
+        mock_list.side_effect = lambda *_args: [(_get_build("1", BuildProcessingState.PROCESSING), None)]
+        results = build_waiter.wait()
+
+    assert clock.sleeps == [5, 10, 20, 25]
+    assert results["build"].state is BuildWaitState.TIMED_OUT
+    assert results["build"].checks == 5
+
+
+def test_build_waiter_discovery(builds, clock):
+    build = _get_build("1")
+    build_waiter = BuildWaiter(builds)
+    build_waiter.add_discovery("build", builds.Filter(app=ResourceId("app")), timeout=60)
+
+    with mock.patch.object(Builds, "list", side_effect=[[], [build]]) as mock_list:
+        results = build_waiter.wait()
+
+    assert mock_list.call_count == 2
+    assert results["build"].state is BuildWaitState.FOUND
+    assert results["build"].build is build
+
+
+@pytest.mark.parametrize(
+    "processing_state, expected_error",
+    [
+        (BuildProcessingState.FAILED, "Uploaded build 1 is failed"),
+        (BuildProcessingState.INVALID, "Uploaded build 1 is invalid"),
+    ],
+)
+def test_build_waiter_processing_failed(builds, clock, processing_state, expected_error):
+    build_waiter = BuildWaiter(builds)
+    build_waiter.add_processing("build", ResourceId("1"), timeout=60)
+
+    with mock.patch.object(Builds, "iter_list_with_include", return_value=[(_get_build("1", processing_state), None)]):
+        finished = build_waiter.check()
+
+    assert [(progress.state, progress.error) for progress in finished] == [(BuildWaitState.FAILED, expected_error)]
+
+
+def test_build_waiter_api_error(builds, clock):
+    build_waiter = BuildWaiter(builds)
+    build_waiter.add_processing("build", ResourceId("1"), timeout=60)
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=500, json=lambda: {"errors": []}))
+
+    with mock.patch.object(Builds, "iter_list_with_include", side_effect=api_error):
+        finished = build_waiter.check()
+
+    assert [progress.state for progress in finished] == [BuildWaitState.FAILED]
+    assert not build_waiter.is_waiting
@@ -1,4 +1,8 @@
+import copy
+import json
 import os
+import pathlib
+from unittest import mock
 
 import pytest
 from codemagic.apple.app_store_connect.builds import Builds
@@ -61,3 +65,34 @@ class BuildsTest(ResourceManagerTestsBase):
 def test_builds_filter(python_field_name, apple_filter_name):
     get_apple_filter_name = Builds.Filter._get_field_name
     assert get_apple_filter_name(python_field_name) == apple_filter_name
+
+
+def test_builds_list_with_included_beta_details(app_store_api_client):
+    build_payload = json.loads((pathlib.Path(__file__).parents[2] / "resources" / "mocks" / "build.json").read_text())
+    beta_detail_payload = {
+        "id": "beta-detail-id",
+        "type": "buildBetaDetails",
+        "attributes": {
+            "autoNotifyEnabled": False,
+            "internalBuildState": "PROCESSING",
+            "externalBuildState": "PROCESSING",
+        },
+        "links": {"self": "https://api.appstoreconnect.apple.com/v1/buildBetaDetails/beta-detail-id"},
+    }
+    linked_build_payload = copy.deepcopy(build_payload)
+    beta_detail_linkage = {"type": "buildBetaDetails", "id": "beta-detail-id"}
+    linked_build_payload["relationships"]["buildBetaDetail"]["data"] = beta_detail_linkage
+    response = {"data": [linked_build_payload, build_payload], "included": [beta_detail_payload], "links": {}}
+
+    with mock.patch.object(app_store_api_client.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = response
+        builds_filter = Builds.Filter(id=[ResourceId("1"), ResourceId("2")])
+        results = list(app_store_api_client.builds.iter_list_with_include(BuildBetaDetail, builds_filter))
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args[1]["params"]["filter[id]"] == "1,2"
+    assert mock_get.call_args[1]["params"]["include"] == "buildBetaDetail"
+    (_, build_beta_detail), (_, missing_build_beta_detail) = results
+    assert isinstance(build_beta_detail, BuildBetaDetail)
+    assert build_beta_detail.attributes.internalBuildState is InternalBetaState.PROCESSING
+    assert missing_build_beta_detail is None
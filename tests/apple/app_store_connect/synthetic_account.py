@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import base64
+import json
+import pathlib
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import lru_cache
+from typing import List
+from typing import NamedTuple
+
+from codemagic.apple.resources import ResourceType
+from codemagic.models import PrivateKey
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding
+from cryptography.x509.oid import NameOID
+
+from .api_emulator import AppStoreConnectApiEmulator
+from .api_emulator import Linkage
+
+_MOCKS_DIRECTORY = pathlib.Path(__file__).parent.parent.parent / "mocks"
+_RESOURCE_MOCKS_DIRECTORY = pathlib.Path(__file__).parent.parent / "resources" / "mocks"
+
+
+class SyntheticAccount(NamedTuple):
+    size: int
+    app_id: str
+    bundle_id_identifier: str
+    certificate_key: PrivateKey
+
+
+@lru_cache(1)
+def _get_signing_certificate_content() -> str:
+    return base64.b64encode((_MOCKS_DIRECTORY / "certificate.asn1").read_bytes()).decode()
+
+
+@lru_cache(1)
+def _get_other_certificate_content() -> str:
+    """Certificate that is not signed with the private key of the synthetic account"""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "iPhone Developer: Synthetic Account")])
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + timedelta(days=365))
+        .sign(private_key, hashes.SHA256())
+    )
+    return base64.b64encode(certificate.public_bytes(Encoding.DER)).decode()
+
+
+@lru_cache(1)
+def _get_profile_content() -> str:
+    profile = json.loads((_RESOURCE_MOCKS_DIRECTORY / "profile.json").read_text())
+    return profile["attributes"]["profileContent"]
+
+
+def create_synthetic_account(emulator: AppStoreConnectApiEmulator, size: int) -> SyntheticAccount:
+    """
+    Populate the emulator with an App Store Connect account that has `size` bundle IDs, devices,
+    provisioning profiles and builds of one app. Every tenth build starts a new TestFlight version,
+    and every hundredth build is submitted to App Store. Accounts can have only a limited number of
+    certificates, so up to 100 of those are created, of which the first one is signed with
+    `certificate_key`. Bundle ID `bundle_id_identifier` has an active development profile with
+    that certificate. Profile and certificate contents are shared between the resources.
+    """
+    expiration_date = (datetime.now(timezone.utc) + timedelta(days=180)).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+    bundle_id_identifier = "io.codemagic.benchmark"
+
+    devices = [
+        emulator.add_resource(
+            ResourceType.DEVICES,
+            {
+                "addedDate": "2021-03-07T13:11:26.000+0000",
+                "name": f"Synthetic iPhone {i}",
+                "deviceClass": "IPHONE",
+                "model": "iPhone 12",
+                "udid": f"{i:040x}",
+                "platform": "IOS",
+                "status": "ENABLED",
+            },
+        )
+        for i in range(size)
+    ]
+
+    certificates = [
+        emulator.add_resource(
+            ResourceType.CERTIFICATES,
+            {
+                "serialNumber": f"{i:016X}",
+                "certificateContent": (
+                    _get_signing_certificate_content() if i == 0 else _get_other_certificate_content()
+                ),
+                "displayName": f"Synthetic Developer {i}",
+                "name": f"iOS Development: Synthetic Developer {i}",
+                "csrContent": None,
+                "platform": "IOS",
+                "expirationDate": expiration_date,
+                "certificateType": "IOS_DEVELOPMENT",
+            },
+        )
+        for i in range(min(size, 100))
+    ]
+
+    bundle_ids: List[Linkage] = []
+    for i in range(size):
+        identifier = bundle_id_identifier if i == 0 else f"io.codemagic.synthetic{i}"
+        bundle_id_attributes = {
+            "identifier": identifier,
+            "name": identifier.replace(".", " "),
+            "platform": "IOS",
+            "seedId": "X8NNQ9CYL2",
+        }
+        relationships = {"profiles": [], "bundleIdCapabilities": []}
+        bundle_ids.append(emulator.add_resource(ResourceType.BUNDLE_ID, bundle_id_attributes, relationships))
+
+    for i in range(size):
+        bundle_id = bundle_ids[i % len(bundle_ids)]
+        profile = emulator.add_resource(
+            ResourceType.PROFILES,
+            {
+                "profileState": "ACTIVE",
+                "createdDate": "2021-03-07T13:11:26.000+0000",
+                "profileType": "IOS_APP_DEVELOPMENT",
+                "name": f"Synthetic profile {i}",
+                "profileContent": _get_profile_content(),
+                "uuid": f"00000000-0000-0000-0000-{i:012x}",
+                "platform": "IOS",
+                "expirationDate": expiration_date,
+            },
+            {
+                "bundleId": bundle_id,
+                "certificates": [certificates[i % len(certificates)]],
+                "devices": devices[:10],
+            },
+        )
+        emulator.link(bundle_id, "profiles", profile)
+
+    app = emulator.add_resource(
+        ResourceType.APPS,
+        {
+            "bundleId": bundle_id_identifier,
+            "name": "Synthetic App",
+            "primaryLocale": "en-US",
+            "sku": "synthetic-app",
+        },
+        {"builds": [], "preReleaseVersions": [], "appStoreVersions": []},
+    )
+
+    pre_release_version = None
+    for i in range(size):
+        build_number = i + 1
+        if i % 10 == 0:
+            pre_release_version = emulator.add_resource(
+                ResourceType.PRE_RELEASE_VERSIONS,
+                {"version": f"1.{i // 10}.0", "platform": "IOS"},
+                {"app": app, "builds": []},
+            )
+            emulator.link(app, "preReleaseVersions", pre_release_version)
+        build = emulator.add_resource(
+            ResourceType.BUILDS,
+            {
+                "version": str(build_number),
+                "uploadedDate": "2021-02-02T04:00:19-08:00",
+                "expirationDate": "2021-05-03T04:00:19-07:00",
+                "expired": i < size // 2,
+                "minOsVersion": "14.0",
+                "processingState": "VALID",
+                "usesNonExemptEncryption": False,
+            },
+            {"app": app, "preReleaseVersion": pre_release_version, "appStoreVersion": None},
+        )
+        emulator.link(app, "builds", build)
+        assert pre_release_version is not None
+        emulator.link(pre_release_version, "builds", build)
+        if i % 100 == 0:
+            app_store_version = emulator.add_resource(
+                ResourceType.APP_STORE_VERSIONS,
+                {
+                    "platform": "IOS",
+                    "versionString": f"1.{i // 10}.0",
+                    "appStoreState": "READY_FOR_SALE",
+                    "releaseType": "AFTER_APPROVAL",
+                    "createdDate": "2021-02-22T06:05:41-08:00",
+                },
+                {"app": app, "build": build},
+            )
+            emulator.link(app, "appStoreVersions", app_store_version)
+
+    return SyntheticAccount(
+        size=size,
+        app_id=app["id"],
+        bundle_id_identifier=bundle_id_identifier,
+        certificate_key=PrivateKey.from_pem((_MOCKS_DIRECTORY / "unencrypted.pem").read_bytes()),
+    )
@@ -1,2 +1,70 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+from requests import Response
+
+
 def test_auth_headers(app_store_api_client):
     assert app_store_api_client.jwt in app_store_api_client.generate_auth_headers()["Authorization"]
+
+
+def test_api_client_revoke_auth_headers(app_store_api_client):
+    with mock.patch.object(app_store_api_client, "_jwt_manager") as mock_jwt_manager:
+        app_store_api_client.revoke_auth_headers({"Authorization": "Bearer <token>"})
+        app_store_api_client.revoke_auth_headers({})
+
+    assert mock_jwt_manager.revoke.mock_calls == [mock.call("<token>"), mock.call(None)]
+
+
+def _get_page_response_mock(page_number: int, pages_count: int, page_size: int = 2):
+    next_link = {"next": f"https://example.com/v1/resources?cursor={page_number + 1}"}
+    payload = {
+        "data": [{"id": f"{page_number}-{i}"} for i in range(page_size)],
+        "included": [{"id": f"included-{page_number}"}],
+        "links": next_link if page_number + 1 < pages_count else {},
+    }
+    response = Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(payload).encode())
+    return response
+
+
+@pytest.fixture
+def mock_session_get(app_store_api_client):
+    responses = [_get_page_response_mock(page_number, 3) for page_number in range(3)]
+    with mock.patch.object(app_store_api_client.session, "get", side_effect=responses) as mock_get:
+        yield mock_get
+
+
+def test_iter_paginate_is_lazy(app_store_api_client, mock_session_get):
+    items = app_store_api_client.iter_paginate("https://example.com/v1/resources", page_size=2)
+    assert mock_session_get.call_count == 0
+
+    assert next(items) == {"id": "0-0"}
+    assert next(items) == {"id": "0-1"}
+    assert mock_session_get.call_count == 1
+
+    assert next(items) == {"id": "1-0"}
+    assert mock_session_get.call_count == 2
+
+
+def test_iter_paginate_stops_at_limit(app_store_api_client, mock_session_get):
+    items = list(app_store_api_client.iter_paginate("https://example.com/v1/resources", page_size=2, limit=3))
+    assert items == [{"id": "0-0"}, {"id": "0-1"}, {"id": "1-0"}]
+    assert mock_session_get.call_count == 2
+
+
+def test_iter_paginate_with_included(app_store_api_client, mock_session_get):
+    pages = list(app_store_api_client.iter_paginate_with_included("https://example.com/v1/resources", page_size=2))
+    assert [page.included for page in pages] == [[{"id": f"included-{i}"}] for i in range(3)]
+    assert mock_session_get.call_count == 3
+
+
+def test_paginate_with_included(app_store_api_client, mock_session_get):
+    result = app_store_api_client.paginate_with_included("https://example.com/v1/resources", params={"a": "b"})
+    assert len(result.data) == 6
+    assert len(result.included) == 3
+    mock_session_get.assert_any_call("https://example.com/v1/resources", params={"limit": 100, "a": "b"})
+    mock_session_get.assert_any_call("https://example.com/v1/resources?cursor=1", params={"a": "b"})
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pathlib
+from typing import Dict
+from typing import Tuple
+
+import pytest
+from codemagic.apple import AppStoreConnectApiError
+from codemagic.apple.app_store_connect import AppStoreConnectApiClient
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.resources import BundleIdPlatform
+from codemagic.apple.resources import ProfileState
+from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
+
+from .api_emulator import AppStoreConnectApiEmulator
+from .synthetic_account import create_synthetic_account
+
+
+@pytest.fixture
+def emulator() -> AppStoreConnectApiEmulator:
+    return AppStoreConnectApiEmulator()
+
+
+@pytest.fixture
+def api_client(emulator, monkeypatch) -> AppStoreConnectApiClient:
+    monkeypatch.setenv("PYTEST_RUN_CONFIG", "1")  # Do not save audits of injected failures
+    mock_auth_key = pathlib.Path(__file__).parent.parent.parent / "tools" / "app_store_connect" / "mocks"
+    client = AppStoreConnectApiClient(
+        KeyIdentifier("EMULATOR"),
+        IssuerId("emulator-issuer-id"),
+        (mock_auth_key / "AuthKeyMock.p8").read_text(),
+        unauthorized_request_retries=2,
+        server_error_retries=2,
+    )
+    client.session._retry_backoff_seconds = 0
+    emulator.install(client)
+    return client
+
+
+@pytest.fixture
+def account(emulator):
+    return create_synthetic_account(emulator, 120)
+
+
+def test_paginate(emulator, api_client, account):
+    devices = api_client.devices.list()
+
+    assert len(devices) == 120
+    assert len({device.id for device in devices}) == 120
+    assert emulator.count_requests("GET", r"/v1/devices$") == 2  # Page size 100
+    assert [device.attributes.name for device in devices] == sorted(device.attributes.name for device in devices)
+
+
+def test_filters_and_sparse_fields(emulator, api_client, account):
+    bundle_ids = api_client.bundle_ids.list(api_client.bundle_ids.Filter(identifier=account.bundle_id_identifier))
+    assert [bundle_id.attributes.identifier for bundle_id in bundle_ids] == [account.bundle_id_identifier]
+
+    builds_filter = api_client.builds.Filter(
+        app=ResourceId(account.app_id),
+        expired=False,
+        pre_release_version_version="1.11.0",
+    )
+    builds = api_client.builds.list(builds_filter, fields=["version"])
+    assert sorted(build.attributes.version for build in builds) == [str(n) for n in range(111, 121)]
+    assert all(build.attributes.expired is None for build in builds)
+
+    profiles_filter = api_client.profiles.Filter(profile_state=ProfileState.INVALID)
+    assert api_client.profiles.list(profiles_filter) == []
+
+
+def test_include(emulator, api_client, account):
+    bundle_id = api_client.bundle_ids.list(api_client.bundle_ids.Filter(identifier=account.bundle_id_identifier))[0]
+    included: Dict[Tuple[str, str], Dict] = {}
+    profiles_data = api_client.profiles.list(
+        api_client.profiles.Filter(id=[profile.id for profile in api_client.bundle_ids.list_profiles(bundle_id)]),
+        fields=["bundleId", "certificates", "devices"],
+        include=["bundleId", "certificates"],
+        included=included,
+    )
+
+    assert len(profiles_data) == 1
+    for profile in profiles_data:
+        assert profile.relationships.bundleId.get_linked_data()[0].id == bundle_id.id
+        assert profile.relationships.certificates.get_linked_data() is not None
+        assert profile.relationships.devices.get_linked_data() is None
+        for certificate in profile.relationships.certificates.get_linked_data():
+            assert (ResourceType.CERTIFICATES.value, certificate.id) in included
+    assert included[(ResourceType.BUNDLE_ID.value, bundle_id.id)]["attributes"]["identifier"] == (
+        account.bundle_id_identifier
+    )
+
+
+def test_create_modify_delete(emulator, api_client):
+    bundle_id = api_client.bundle_ids.create("io.codemagic.created", "Created", BundleIdPlatform.IOS)
+    assert emulator.get_resource(ResourceType.BUNDLE_ID, bundle_id.id)["attributes"]["identifier"] == (
+        "io.codemagic.created"
+    )
+
+    api_client.bundle_ids.delete(bundle_id.id)
+    assert emulator.get_resource(ResourceType.BUNDLE_ID, bundle_id.id) is None
+    with pytest.raises(AppStoreConnectApiError) as error_info:
+        api_client.bundle_ids.read(bundle_id.id)
+    assert error_info.value.status_code == 404
+
+
+@pytest.mark.parametrize("status_code", (401, 429, 500, 503))
+def test_injected_fault_is_retried(emulator, api_client, account, status_code):
+    emulator.inject_fault(status_code, method="GET", path_pattern=r"/v1/devices$", retry_after=0)
+
+    assert len(api_client.devices.list()) == 120
+    assert [request.status_code for request in emulator.requests] == [status_code, 200, 200]
+
+
+def test_injected_fault_exhausts_retries(emulator, api_client):
+    emulator.inject_fault(503, times=2)
+
+    with pytest.raises(AppStoreConnectApiError) as error_info:
+        api_client.devices.list()
+    assert error_info.value.status_code == 503
+    assert emulator.request_count == 2
+
+
+def test_rate_limit_header(api_client):
+    emulator = AppStoreConnectApiEmulator(rate_limit=3600)
+    emulator.install(api_client)
+
+    response = api_client.session.get(f"{api_client.API_URL}/devices")
+
+    assert response.headers["X-Rate-Limit"] == "user-hour-lim:3600;user-hour-rem:3599;"
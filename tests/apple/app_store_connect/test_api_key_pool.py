@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pathlib
+from collections import Counter
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import ApiKey
+from codemagic.apple.app_store_connect import AppStoreConnectApiClient
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.api_key_pool import ApiKeyPool
+from codemagic.apple.app_store_connect.api_rate_limiter import RateLimit
+
+from .api_emulator import AppStoreConnectApiEmulator
+from .synthetic_account import create_synthetic_account
+
+_MOCK_PRIVATE_KEY_PATH = pathlib.Path(__file__).parent.parent.parent / "tools" / "app_store_connect" / "mocks"
+
+
+@pytest.fixture
+def api_keys():
+    private_key = (_MOCK_PRIVATE_KEY_PATH / "AuthKeyMock.p8").read_text()
+    return [ApiKey(KeyIdentifier(f"KEY{i}"), IssuerId("issuer-id"), private_key) for i in range(1, 4)]
+
+
+@pytest.fixture
+def api_key_pool(api_keys) -> ApiKeyPool:
+    return ApiKeyPool(api_keys)
+
+
+def test_api_key_pool_requires_keys():
+    with pytest.raises(ValueError):
+        ApiKeyPool([])
+
+
+def test_select_key_takes_turns(api_key_pool):
+    selected_keys = [api_key_pool.select_key().identifier for _ in range(6)]
+    assert selected_keys == ["KEY1", "KEY2", "KEY3", "KEY1", "KEY2", "KEY3"]
+
+
+def test_select_key_with_most_remaining_requests(api_key_pool):
+    for key, remaining in zip(api_key_pool.keys, (10, 100, 50)):
+        key.rate_limiter.update(RateLimit(3600, remaining))
+
+    selected_keys = {api_key_pool.select_key().identifier for _ in range(6)}
+    assert selected_keys == {"KEY2"}
+
+
+def test_find_key(api_key_pool):
+    key = api_key_pool.get_key(KeyIdentifier("KEY2"))
+    auth_headers = api_key_pool.get_key(KeyIdentifier("KEY2")).generate_auth_headers()
+
+    assert api_key_pool.find_key(auth_headers) is key
+    assert api_key_pool.find_key({"Authorization": "Bearer <token>"}) is None
+    assert api_key_pool.find_key({}) is None
+
+
+def test_exhaust_key(api_keys):
+    api_key_pool = ApiKeyPool(api_keys[:2])
+    key_1, key_2 = api_key_pool.keys
+
+    assert api_key_pool.exhaust_key(key_1.generate_auth_headers()) is True
+    assert key_1.rate_limiter.available_requests < 1
+    assert api_key_pool.select_key() is key_2
+    assert api_key_pool.exhaust_key(key_2.generate_auth_headers()) is False
+
+
+def test_revoke_auth_headers(api_key_pool):
+    key_1, key_2, _ = api_key_pool.keys
+    token = key_1.jwt_manager.get_jwt().token
+    other_token = key_2.jwt_manager.get_jwt().token
+
+    api_key_pool.revoke_auth_headers(key_1.generate_auth_headers())
+
+    assert key_1.jwt_manager.get_jwt().token != token
+    assert key_2.jwt_manager.get_jwt().token == other_token
+
+
+@pytest.fixture
+def emulator() -> AppStoreConnectApiEmulator:
+    return AppStoreConnectApiEmulator(rate_limit=3600)
+
+
+@pytest.fixture
+def api_client(emulator, api_keys, monkeypatch) -> AppStoreConnectApiClient:
+    monkeypatch.setenv("PYTEST_RUN_CONFIG", "1")  # Do not save audits of injected failures
+    primary_key, *additional_keys = api_keys
+    client = AppStoreConnectApiClient(*primary_key, additional_api_keys=additional_keys)
+    emulator.install(client)
+    return client
+
+
+def test_requests_are_spread_over_keys(emulator, api_client):
+    create_synthetic_account(emulator, 120)
+
+    for _ in range(3):
+        assert len(api_client.devices.list()) == 120
+
+    assert Counter(request.key_identifier for request in emulator.requests) == {"KEY1": 2, "KEY2": 2, "KEY3": 2}
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_session.time.sleep")
+def test_exhausted_key_fails_over(mock_sleep, emulator, api_client):
+    create_synthetic_account(emulator, 10)
+    emulator.inject_fault(429)
+
+    api_client.devices.list()
+    api_client.devices.list()
+
+    assert [(request.key_identifier, request.status_code) for request in emulator.requests] == [
+        ("KEY1", 429),
+        ("KEY2", 200),
+        ("KEY3", 200),
+    ]
+    mock_sleep.assert_not_called()
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_rate_limiter import ApiRateLimiter
+from codemagic.apple.app_store_connect.api_rate_limiter import RateLimit
+
+
+@pytest.mark.parametrize(
+    ("header_value", "expected_rate_limit"),
+    (
+        ("user-hour-lim:3600;user-hour-rem:3545;", RateLimit(3600, 3545)),
+        ("user-hour-lim:500;user-hour-rem:0", RateLimit(500, 0)),
+        ("user-hour-lim:3600;", None),
+        ("", None),
+        (None, None),
+    ),
+)
+def test_rate_limit_from_header(header_value, expected_rate_limit):
+    assert RateLimit.from_header(header_value) == expected_rate_limit
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_rate_limiter.time")
+def test_rate_limiter_without_rate_limit_info(mock_time):
+    mock_time.monotonic.return_value = 0
+    rate_limiter = ApiRateLimiter()
+    for _ in range(100):
+        rate_limiter.acquire()
+    mock_time.sleep.assert_not_called()
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_rate_limiter.time")
+def test_rate_limiter_waits_for_refill(mock_time):
+    mock_time.monotonic.return_value = 0
+    rate_limiter = ApiRateLimiter()
+    rate_limiter.update(RateLimit(limit=360, remaining=2))
+
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    mock_time.sleep.assert_not_called()
+
+    # Bucket refills with 360 tokens per hour, that is one token in every 10 seconds
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    assert mock_time.sleep.mock_calls == [mock.call(10.0), mock.call(20.0)]
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_rate_limiter.time")
+def test_rate_limiter_refills_over_time(mock_time):
+    mock_time.monotonic.return_value = 0
+    rate_limiter = ApiRateLimiter()
+    rate_limiter.update(RateLimit(limit=360, remaining=0))
+
+    mock_time.monotonic.return_value = 30
+    for _ in range(3):
+        rate_limiter.acquire()
+    mock_time.sleep.assert_not_called()
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_rate_limiter.time")
+def test_rate_limiter_respects_server_remaining_count(mock_time):
+    mock_time.monotonic.return_value = 0
+    rate_limiter = ApiRateLimiter()
+    rate_limiter.update(RateLimit(limit=3600, remaining=3600))
+    rate_limiter.update(RateLimit(limit=3600, remaining=0))
+
+    rate_limiter.acquire()
+    mock_time.sleep.assert_called_once_with(1.0)
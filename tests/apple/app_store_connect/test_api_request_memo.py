@@ -0,0 +1,123 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_request_memo import ApiRequestMemo
+from requests import Response
+
+
+@pytest.fixture
+def request_memo() -> ApiRequestMemo:
+    return ApiRequestMemo()
+
+
+def test_memoized_response(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/apps"
+    do_request = mock.Mock(return_value=mock.Mock(spec=Response))
+
+    first_response = request_memo.get(url, {"limit": 100}, do_request)
+    second_response = request_memo.get(f"{url}?limit=100", None, do_request)
+
+    assert first_response is second_response
+    do_request.assert_called_once()
+    assert (request_memo.hits, request_memo.misses) == (1, 1)
+
+
+def test_memoized_response_params(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/apps"
+    do_request = mock.Mock(side_effect=lambda: mock.Mock(spec=Response))
+
+    request_memo.get(url, {"filter[bundleId]": "io.codemagic.app"}, do_request)
+    request_memo.get(url, {"filter[bundleId]": "io.codemagic.other"}, do_request)
+
+    assert do_request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("modified_url", "is_invalidated"),
+    (
+        ("https://api.appstoreconnect.apple.com/v1/builds/1", True),
+        ("https://api.appstoreconnect.apple.com/v1/betaGroups/2/relationships/builds", True),
+        ("https://api.appstoreconnect.apple.com/v1/devices", False),
+    ),
+)
+def test_invalidate(request_memo, modified_url, is_invalidated):
+    url = "https://api.appstoreconnect.apple.com/v1/builds/1"
+    do_request = mock.Mock(side_effect=lambda: mock.Mock(spec=Response))
+
+    request_memo.get(url, None, do_request)
+    request_memo.invalidate(modified_url)
+    request_memo.get(url, None, do_request)
+
+    assert do_request.call_count == (2 if is_invalidated else 1)
+
+
+def test_invalidate_included_resources(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/builds/1"
+    do_request = mock.Mock(side_effect=lambda: mock.Mock(spec=Response))
+
+    request_memo.get(url, {"include": "preReleaseVersion,app"}, do_request)
+    request_memo.invalidate("https://api.appstoreconnect.apple.com/v1/preReleaseVersions/2")
+    request_memo.get(url, {"include": "preReleaseVersion,app"}, do_request)
+
+    assert do_request.call_count == 2
+
+
+def test_bypass(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/builds/1"
+    responses = [mock.Mock(spec=Response), mock.Mock(spec=Response)]
+    do_request = mock.Mock(side_effect=responses)
+
+    request_memo.get(url, None, do_request)
+    with request_memo.bypass():
+        assert request_memo.get(url, None, do_request) is responses[1]
+    # Response from bypassed request is memoized for later use
+    assert request_memo.get(url, None, do_request) is responses[1]
+    assert do_request.call_count == 2
+
+
+def test_concurrent_requests_are_coalesced(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/apps/1"
+    request_started = threading.Event()
+    release_request = threading.Event()
+    response = mock.Mock(spec=Response)
+
+    def do_request():
+        request_started.set()
+        release_request.wait(timeout=5)
+        return response
+
+    do_request_mock = mock.Mock(side_effect=do_request)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first_future = executor.submit(request_memo.get, url, None, do_request_mock)
+        request_started.wait(timeout=5)
+        other_futures = [executor.submit(request_memo.get, url, None, do_request_mock) for _ in range(3)]
+        release_request.set()
+
+    assert all(future.result() is response for future in [first_future, *other_futures])
+    do_request_mock.assert_called_once()
+
+
+def test_failed_request_is_not_memoized(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/apps/1"
+    response = mock.Mock(spec=Response)
+    do_request = mock.Mock(side_effect=[IOError("Request failed"), response])
+
+    with pytest.raises(IOError):
+        request_memo.get(url, None, do_request)
+    assert request_memo.get(url, None, do_request) is response
+
+
+def test_response_in_flight_during_invalidation_is_not_memoized(request_memo):
+    url = "https://api.appstoreconnect.apple.com/v1/apps/1"
+
+    def do_request():
+        request_memo.invalidate("https://api.appstoreconnect.apple.com/v1/apps/1")
+        return mock.Mock(spec=Response)
+
+    do_request_mock = mock.Mock(side_effect=do_request)
+    request_memo.get(url, None, do_request_mock)
+    request_memo.get(url, None, do_request_mock)
+
+    assert do_request_mock.call_count == 2
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import AppStoreConnectApiClient
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.api_request_metrics import ApiRequestMetric
+from codemagic.apple.app_store_connect.api_request_metrics import ApiRequestMetrics
+from codemagic.apple.app_store_connect.api_rate_limiter import RateLimit
+
+from .api_emulator import AppStoreConnectApiEmulator
+from .synthetic_account import create_synthetic_account
+
+
+@pytest.fixture
+def emulator() -> AppStoreConnectApiEmulator:
+    emulator = AppStoreConnectApiEmulator(rate_limit=3600)
+    create_synthetic_account(emulator, 10)
+    return emulator
+
+
+def _get_api_client(emulator: AppStoreConnectApiEmulator, request_metrics: ApiRequestMetrics, monkeypatch):
+    monkeypatch.setenv("PYTEST_RUN_CONFIG", "1")  # Do not save audits of injected failures
+    mock_auth_key = pathlib.Path(__file__).parent.parent.parent / "tools" / "app_store_connect" / "mocks"
+    client = AppStoreConnectApiClient(
+        KeyIdentifier("EMULATOR"),
+        IssuerId("emulator-issuer-id"),
+        (mock_auth_key / "AuthKeyMock.p8").read_text(),
+        server_error_retries=2,
+        request_metrics=request_metrics,
+    )
+    emulator.install(client)
+    return client
+
+
+@pytest.mark.parametrize(
+    ("url", "expected_endpoint"),
+    (
+        ("https://api.appstoreconnect.apple.com/v1/devices?limit=200", "GET /v1/devices"),
+        ("https://api.appstoreconnect.apple.com/v1/apps/1496105355/builds", "GET /v1/apps/{id}/builds"),
+        ("https://api.appstoreconnect.apple.com/v1/profiles/9X8Y7Z6W5V", "GET /v1/profiles/{id}"),
+    ),
+)
+def test_metric_endpoint(url, expected_endpoint):
+    metric = ApiRequestMetric("GET", url, 200, 1, 0.0, 0.1, 0.2, None, None, None, "MainThread")
+    assert metric.endpoint == expected_endpoint
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_session.time.sleep")
+def test_requests_are_recorded(_mock_sleep, emulator, monkeypatch):
+    request_metrics = ApiRequestMetrics()
+    request_metrics.action = "devices list"
+    emulator.inject_fault(500)
+    api_client = _get_api_client(emulator, request_metrics, monkeypatch)
+
+    api_client.devices.list()
+    api_client.profiles.list()
+
+    metrics = request_metrics.metrics
+    assert [(m.endpoint, m.status_code, m.attempt) for m in metrics] == [
+        ("GET /v1/devices", 500, 1),
+        ("GET /v1/devices", 200, 2),
+        ("GET /v1/profiles", 200, 1),
+    ]
+    assert {m.action for m in metrics} == {"devices list"}
+    assert all(isinstance(m.rate_limit, RateLimit) for m in metrics if m.status_code == 200)
+    assert all(m.duration >= 0 for m in metrics)
+    assert all(m.response_size for m in metrics)
+
+
+def test_save_json_lines_trace(emulator, tmp_path: pathlib.Path, monkeypatch):
+    trace_path = tmp_path / "trace" / "requests.jsonl"
+    request_metrics = ApiRequestMetrics(trace_path)
+    api_client = _get_api_client(emulator, request_metrics, monkeypatch)
+    api_client.devices.list()
+
+    request_metrics.close()
+
+    records = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert len(records) == 1
+    assert records[0]["endpoint"] == "GET /v1/devices"
+    assert records[0]["status_code"] == 200
+    assert records[0]["rate_limit"]["limit"] == 3600
+
+
+def test_save_chrome_trace(emulator, tmp_path: pathlib.Path, monkeypatch):
+    trace_path = tmp_path / "requests.json"
+    request_metrics = ApiRequestMetrics(trace_path)
+    api_client = _get_api_client(emulator, request_metrics, monkeypatch)
+    api_client.devices.list()
+    api_client.profiles.list()
+
+    request_metrics.close()
+
+    trace = json.loads(trace_path.read_text())
+    complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete_events] == ["GET /v1/devices", "GET /v1/profiles"]
+    assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in complete_events)
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+
+def test_summary(emulator, monkeypatch):
+    request_metrics = ApiRequestMetrics()
+    api_client = _get_api_client(emulator, request_metrics, monkeypatch)
+    request_metrics.action = "devices list"
+    api_client.devices.list()
+    request_metrics.action = "profiles list"
+    api_client.profiles.list()
+    api_client.profiles.list()
+
+    summary = request_metrics.get_summary()
+
+    assert summary[0].startswith("App Store Connect API requests: 3 (0 retried)")
+    assert "  profiles list: 2" in summary
+    assert "  devices list: 1" in summary
+    assert any(line.startswith("  GET /v1/profiles: 2 requests") for line in summary)
+
+
+def test_summary_without_requests():
+    assert ApiRequestMetrics().get_summary() == ["No App Store Connect API requests were made"]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import copy
+import json
+import pathlib
+from typing import Dict
+from typing import List
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_resource_mirror import ApiResourceMirror
+from codemagic.apple.app_store_connect.api_session import AppStoreConnectApiSession
+from codemagic.apple.app_store_connect.provisioning import BundleIds
+from codemagic.apple.app_store_connect.provisioning import Profiles
+from codemagic.apple.app_store_connect.type_declarations import PaginateResult
+from codemagic.apple.resources import BundleId
+from codemagic.apple.resources import BundleIdCapability
+from codemagic.apple.resources import BundleIdPlatform
+from codemagic.apple.resources import Profile
+from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
+
+API_URL = "https://api.appstoreconnect.apple.com/v1"
+
+
+def _get_mock_resource(name: str) -> Dict:
+    mock_path = pathlib.Path(__file__).parent.parent / "resources" / "mocks" / f"{name}.json"
+    return json.loads(mock_path.read_text())
+
+
+def _get_bundle_id(resource_id: str, identifier: str, platform: str = "IOS") -> Dict:
+    bundle_id = _get_mock_resource("bundle_id")
+    bundle_id["id"] = resource_id
+    bundle_id["attributes"].update(identifier=identifier, name=identifier.rsplit(".", 1)[-1], platform=platform)
+    return bundle_id
+
+
+class FakeApiClient:
+    API_URL = API_URL
+
+    def __init__(self):
+        self.session = AppStoreConnectApiSession(dict)
+        self.resources: Dict[ResourceType, List[Dict]] = {resource_type: [] for resource_type in ResourceType}
+        self.included: Dict[ResourceType, List[Dict]] = {resource_type: [] for resource_type in ResourceType}
+        self.iter_paginate_with_included = mock.Mock(side_effect=self._iter_paginate_with_included)
+        self.iter_paginate = mock.Mock(side_effect=self._iter_paginate)
+
+    def _iter_paginate_with_included(self, url, params, page_size=None):
+        resource_type = ResourceType(url.rsplit("/", 1)[-1])
+        fields = params.get(f"fields[{resource_type.value}]")
+        data = copy.deepcopy(self.resources[resource_type])
+        for resource_data in data:
+            if fields:
+                attributes = resource_data["attributes"]
+                resource_data["attributes"] = {k: v for k, v in attributes.items() if k in fields.split(",")}
+        yield PaginateResult(data, copy.deepcopy(self.included[resource_type]))
+
+    def _iter_paginate(self, url, params, page_size=None):
+        resource_type = ResourceType(url.rsplit("/", 1)[-1])
+        resource_ids = params["filter[id]"].split(",")
+        fields = params[f"fields[{resource_type.value}]"].split(",")
+        for resource_data in self.resources[resource_type]:
+            if resource_data["id"] in resource_ids:
+                attributes = {k: v for k, v in resource_data["attributes"].items() if k in fields}
+                yield {"id": resource_data["id"], "type": resource_type.value, "attributes": attributes}
+
+
+@pytest.fixture
+def api_client() -> FakeApiClient:
+    return FakeApiClient()
+
+
+@pytest.fixture
+def resource_mirror(tmp_path: pathlib.Path) -> ApiResourceMirror:
+    resource_mirror = ApiResourceMirror(tmp_path / "mirror.sqlite3")
+    yield resource_mirror
+    resource_mirror.close()
+
+
+def test_sync_reuses_unchanged_blobs(resource_mirror, api_client):
+    profile = _get_mock_resource("profile")
+    api_client.resources[ResourceType.PROFILES] = [profile]
+
+    results = resource_mirror.sync(api_client, [ResourceType.PROFILES])
+
+    assert [(r.resource_type, r.total, r.created, r.updated, r.removed, r.reused_blobs) for r in results] == [
+        (ResourceType.PROFILES, 1, 1, 0, 0, 0),
+    ]
+    assert api_client.iter_paginate.call_count == 1
+    listing_params = api_client.iter_paginate_with_included.call_args[0][1]
+    assert "profileContent" not in listing_params["fields[profiles]"]
+    mirrored_profile = resource_mirror.read(Profile, ResourceId(profile["id"]))
+    assert mirrored_profile.attributes.profileContent == profile["attributes"]["profileContent"]
+
+    api_client.iter_paginate.reset_mock()
+    results = resource_mirror.sync(api_client, [ResourceType.PROFILES])
+
+    assert [(r.total, r.created, r.updated, r.removed, r.reused_blobs) for r in results] == [(1, 0, 0, 0, 1)]
+    api_client.iter_paginate.assert_not_called()
+
+    profile["attributes"].update(uuid="new-uuid", profileContent="bmV3IGNvbnRlbnQ=")
+    results = resource_mirror.sync(api_client, [ResourceType.PROFILES])
+
+    assert [(r.total, r.created, r.updated, r.removed, r.reused_blobs) for r in results] == [(1, 0, 1, 0, 0)]
+    api_client.iter_paginate.assert_called_once()
+    mirrored_profile = resource_mirror.read(Profile, ResourceId(profile["id"]))
+    assert mirrored_profile.attributes.profileContent == "bmV3IGNvbnRlbnQ="
+
+
+def test_sync_removes_deleted_resources(resource_mirror, api_client):
+    api_client.resources[ResourceType.BUNDLE_ID] = [
+        _get_bundle_id("first", "io.codemagic.first"),
+        _get_bundle_id("second", "io.codemagic.second"),
+    ]
+    resource_mirror.sync(api_client, [ResourceType.BUNDLE_ID])
+
+    api_client.resources[ResourceType.BUNDLE_ID].pop(0)
+    results = resource_mirror.sync(api_client, [ResourceType.BUNDLE_ID])
+
+    assert results[0].removed == 1
+    assert resource_mirror.read(BundleId, ResourceId("first")) is None
+    assert [bundle_id.id for bundle_id in resource_mirror.list(BundleId)] == ["second"]
+    assert resource_mirror.list(BundleId, BundleIds.Filter(name="first")) == []
+
+
+def test_list_with_filter(resource_mirror, api_client):
+    api_client.resources[ResourceType.BUNDLE_ID] = [
+        _get_bundle_id("app", "io.codemagic.app"),
+        _get_bundle_id("extension", "io.codemagic.app.extension"),
+        _get_bundle_id("mac-app", "io.codemagic.app", platform="MAC_OS"),
+        _get_bundle_id("other", "io.codemagic.other"),
+    ]
+    resource_mirror.sync(api_client, [ResourceType.BUNDLE_ID])
+
+    def list_ids(**filter_params) -> List[str]:
+        return [bundle_id.id for bundle_id in resource_mirror.list(BundleId, BundleIds.Filter(**filter_params))]
+
+    assert list_ids() == ["app", "extension", "mac-app", "other"]
+    assert list_ids(identifier="io.codemagic.app") == ["app", "extension", "mac-app"]
+    assert list_ids(identifier="io.codemagic.app", identifier_strict_match=True) == ["app", "mac-app"]
+    assert list_ids(identifier="io.codemagic.app", platform=BundleIdPlatform.MAC_OS) == ["mac-app"]
+    assert list_ids(name="other") == ["other"]
+    assert list_ids(id=["app", "other"]) == ["app", "other"]
+
+
+def test_sync_included_resources_and_relationships(resource_mirror, api_client):
+    bundle_id = _get_bundle_id("app", "io.codemagic.app")
+    bundle_id["relationships"]["bundleIdCapabilities"]["data"] = [{"type": "bundleIdCapabilities", "id": "cap"}]
+    capability = _get_mock_resource("bundle_id_capability")
+    capability["id"] = "cap"
+    api_client.resources[ResourceType.BUNDLE_ID] = [bundle_id]
+    api_client.included[ResourceType.BUNDLE_ID] = [capability]
+    api_client.resources[ResourceType.PROFILES] = [_get_mock_resource("profile")]
+
+    results = resource_mirror.sync(api_client)
+
+    assert {result.resource_type for result in results} == {
+        ResourceType.BUNDLE_ID,
+        ResourceType.BUNDLE_ID_CAPABILITIES,
+        ResourceType.CERTIFICATES,
+        ResourceType.DEVICES,
+        ResourceType.PROFILES,
+    }
+    assert resource_mirror.is_fresh(BundleIdCapability)
+    assert resource_mirror.read(BundleIdCapability, ResourceId("cap")).id == "cap"
+    assert resource_mirror.list_related_ids(BundleId, ResourceId("app"), "bundleIdCapabilities") == ["cap"]
+    profile_id = ResourceId("253YPL8VY6")
+    assert resource_mirror.list_related_ids(Profile, profile_id, "bundleId") == ["F88J43FA9J"]
+    assert resource_mirror.list_related_ids(Profile, profile_id, "devices") == ["8UCFZA68RK", "D9PW3SW6K2"]
+    assert resource_mirror.list(Profile, Profiles.Filter(profile_state=None, name="test profile"))[0].id == profile_id
+
+
+def test_freshness(resource_mirror, api_client, tmp_path):
+    assert not resource_mirror.is_fresh(Profile)
+    assert resource_mirror.get_synced_at(Profile) is None
+
+    resource_mirror.sync(api_client, [ResourceType.PROFILES])
+    assert resource_mirror.is_fresh(Profile)
+    assert resource_mirror.is_synced_since_opened(Profile)
+    assert not resource_mirror.is_fresh(BundleId)
+    assert not resource_mirror.is_synced_since_opened(BundleId)
+
+    stale_mirror = ApiResourceMirror(resource_mirror.database_path, max_age=0)
+    assert not stale_mirror.is_fresh(Profile)
+    assert not stale_mirror.is_synced_since_opened(Profile)
+    stale_mirror.close()
+
+    resource_mirror.invalidate(Profile)
+    assert not resource_mirror.is_fresh(Profile)
+    ApiResourceMirror(tmp_path / "missing" / "mirror.sqlite3").invalidate(Profile)
+    assert not (tmp_path / "missing").exists()
@@ -0,0 +1,148 @@
+import os
+import pathlib
+from typing import Dict
+from typing import Optional
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_response_cache import ApiResponseCache
+from requests import Response
+
+
+def _get_response(content: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    response._content = content.encode()
+    return response
+
+
+@pytest.fixture
+def response_cache(tmp_path: pathlib.Path) -> ApiResponseCache:
+    return ApiResponseCache("issuer/key", cache_directory=tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected_resource_types"),
+    (
+        ("https://api.appstoreconnect.apple.com/v1/profiles", ["profiles"]),
+        ("https://api.appstoreconnect.apple.com/v1/profiles/7G5AXY6BF8", ["profiles"]),
+        ("https://api.appstoreconnect.apple.com/v1/bundleIds/F88J43FA9J/profiles?limit=200", ["bundleIds", "profiles"]),
+        (
+            "https://api.appstoreconnect.apple.com/v1/betaGroups/9c7a52f2-8e0c-4d1e/relationships/builds",
+            ["betaGroups", "builds"],
+        ),
+    ),
+)
+def test_get_resource_types(url, expected_resource_types):
+    assert ApiResponseCache.get_resource_types(url) == expected_resource_types
+
+
+def test_get_included_resource_types():
+    url = "https://api.appstoreconnect.apple.com/v1/profiles?include=bundleId"
+    resource_types = ApiResponseCache.get_resource_types(url, {"include": "certificates,devices"})
+    assert resource_types == ["profiles", "bundleIds", "certificates", "devices"]
+
+
+@pytest.mark.parametrize(
+    ("url", "params", "expected_is_cacheable"),
+    (
+        ("https://api.appstoreconnect.apple.com/v1/devices", None, True),
+        ("https://api.appstoreconnect.apple.com/v1/bundleIds/F88J43FA9J/profiles", None, True),
+        ("https://api.appstoreconnect.apple.com/v1/profiles", {"include": "bundleId,devices"}, True),
+        ("https://api.appstoreconnect.apple.com/v1/builds", None, False),
+        ("https://api.appstoreconnect.apple.com/v1/reviewSubmissions", {"filter[app]": "1"}, False),
+        ("https://api.appstoreconnect.apple.com/v1/apps/1496105355/appStoreVersions", None, False),
+        ("https://api.appstoreconnect.apple.com/v1/bundleIds", {"include": "app"}, False),
+    ),
+)
+def test_is_cacheable(url, params, expected_is_cacheable):
+    assert ApiResponseCache.is_cacheable(url, params) is expected_is_cacheable
+
+
+def test_cache_key(response_cache):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    response_cache.put(f"{url}?limit=100", {"sort": "name"}, _get_response('{"data": []}'))
+
+    assert response_cache.get(url, {"sort": "name", "limit": 100}) is not None
+    assert response_cache.get(url, {"sort": "name"}) is None
+    assert response_cache.get(url, {"limit": 100, "sort": "-name"}) is None
+
+
+def test_cache_namespace(tmp_path):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    ApiResponseCache("issuer/key-1", cache_directory=tmp_path).put(url, None, _get_response('{"data": []}'))
+    assert ApiResponseCache("issuer/key-1", cache_directory=tmp_path).get(url, None) is not None
+    assert ApiResponseCache("issuer/key-2", cache_directory=tmp_path).get(url, None) is None
+
+
+def test_cached_response(response_cache):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    response_cache.put(url, None, _get_response('{"data": []}', {"ETag": '"abc"'}))
+
+    cached_response = response_cache.get(url, None)
+    assert cached_response.get_conditional_headers() == {"If-None-Match": '"abc"'}
+    response = cached_response.as_response()
+    assert response.ok
+    assert response.json() == {"data": []}
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_response_cache.time")
+def test_ttl_without_validators(mock_time, response_cache):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_time.time.return_value = 1000
+    response_cache.put(url, None, _get_response('{"data": []}'))
+
+    mock_time.time.return_value = 1000 + ApiResponseCache.DEFAULT_TTL
+    assert response_cache.get(url, None) is not None
+
+    mock_time.time.return_value = 1001 + ApiResponseCache.DEFAULT_TTL
+    assert response_cache.get(url, None) is None
+
+
+@mock.patch("codemagic.apple.app_store_connect.api_response_cache.time")
+def test_no_ttl_with_validators(mock_time, response_cache):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_time.time.return_value = 1000
+    response_cache.put(url, None, _get_response('{"data": []}', {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+
+    mock_time.time.return_value = 1000 + 10 * ApiResponseCache.DEFAULT_TTL
+    cached_response = response_cache.get(url, None)
+    assert cached_response.get_conditional_headers() == {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+
+def test_invalidate(response_cache):
+    api_url = "https://api.appstoreconnect.apple.com/v1"
+    for path in ("profiles", "bundleIds/F88J43FA9J/profiles", "bundleIds", "devices"):
+        response_cache.put(f"{api_url}/{path}", None, _get_response('{"data": []}'))
+
+    response_cache.invalidate(f"{api_url}/profiles/7G5AXY6BF8")
+
+    assert response_cache.get(f"{api_url}/profiles", None) is None
+    assert response_cache.get(f"{api_url}/bundleIds/F88J43FA9J/profiles", None) is None
+    assert response_cache.get(f"{api_url}/bundleIds", None) is not None
+    assert response_cache.get(f"{api_url}/devices", None) is not None
+
+
+def test_least_recently_used_eviction(tmp_path):
+    api_url = "https://api.appstoreconnect.apple.com/v1"
+    content = '{"data": "%s"}' % ("x" * 1000)
+    response_cache = ApiResponseCache("issuer/key", cache_directory=tmp_path)
+
+    for i, resource_type in enumerate(("apps", "builds", "devices")):
+        response_cache.put(f"{api_url}/{resource_type}", None, _get_response(content))
+        entry_path = response_cache._get_entry_path(f"{api_url}/{resource_type}", None)
+        os.utime(entry_path, (i, i))
+
+    # Allow only three entries to be kept in the cache
+    response_cache._max_size = 3 * entry_path.stat().st_size + 100
+
+    # Use the oldest entry so that it becomes the most recently used one
+    assert response_cache.get(f"{api_url}/apps", None) is not None
+    response_cache.put(f"{api_url}/profiles", None, _get_response(content))
+
+    assert response_cache.get(f"{api_url}/builds", None) is None
+    assert response_cache.get(f"{api_url}/apps", None) is not None
+    assert response_cache.get(f"{api_url}/devices", None) is not None
+    assert response_cache.get(f"{api_url}/profiles", None) is not None
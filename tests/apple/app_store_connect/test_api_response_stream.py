@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import io
+import json
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_response_stream import ApiResponseStream
+from requests import Response
+
+
+def _get_response(body: str) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body.encode())
+    return response
+
+
+@pytest.fixture(autouse=True, params=(1, 7, ApiResponseStream.CHUNK_SIZE))
+def chunk_size(request):
+    with mock.patch.object(ApiResponseStream, "CHUNK_SIZE", request.param):
+        yield request.param
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        {"data": [], "links": {"self": "https://example.com"}},
+        {"data": [{"id": "1"}, {"id": "2", "attributes": {"name": 'Quoted "[{name}]" \\ ä 🍏'}}], "links": {}},
+        {"links": {"next": "https://example.com?cursor=1"}, "meta": {"paging": {"total": 12345}}, "data": [1, 2.5]},
+        {"data": [{"id": "1"}], "included": [{"id": "2", "content": "A" * 1000}], "links": {}},
+    ),
+)
+def test_stream_items_and_members(document):
+    for indent in (None, 4):
+        response_stream = ApiResponseStream(_get_response(json.dumps(document, indent=indent, ensure_ascii=False)))
+
+        assert list(response_stream.iter_items()) == document["data"]
+        assert response_stream.get_members() == {k: v for k, v in document.items() if k != "data"}
+
+
+def test_stream_single_resource():
+    document = {"data": {"id": "1", "type": "profiles"}, "links": {}}
+    response_stream = ApiResponseStream(_get_response(json.dumps(document)))
+
+    assert list(response_stream.iter_items()) == [document["data"]]
+    assert response_stream.get_members() == {"links": {}}
+
+
+def test_stream_items_are_decoded_incrementally(chunk_size):
+    items = [{"id": str(i), "content": "A" * 100} for i in range(2000)]
+    body = json.dumps({"data": items, "links": {}})
+    response = _get_response(body)
+    response_stream = ApiResponseStream(response)
+
+    first_item = next(response_stream.iter_items())
+
+    assert first_item == items[0]
+    assert response.raw.tell() < len(body) // 2
+
+
+def test_stream_restored_response():
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": [{"id": "1"}], "links": {}}).encode()
+
+    response_stream = ApiResponseStream(response)
+
+    assert list(response_stream.iter_items()) == [{"id": "1"}]
+    assert response_stream.get_members() == {"links": {}}
+
+
+@pytest.mark.parametrize("body", ("", "[]", '{"data": [1, 2', '{"data": [1 2]}', '{"data": []', '{"data": [] "a": 1}'))
+def test_stream_invalid_document(body):
+    response_stream = ApiResponseStream(_get_response(body))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(response_stream.iter_items())
+        response_stream.get_members()
@@ -1,22 +1,33 @@
+import threading
+from typing import Optional
 from unittest import mock
 
 import pytest
 from codemagic.apple import AppStoreConnectApiError
 from codemagic.apple.app_store_connect import AppStoreConnectApiSession
+from codemagic.apple.app_store_connect.api_request_memo import ApiRequestMemo
+from codemagic.apple.app_store_connect.api_response_cache import ApiResponseCache
 from requests import Response
 from requests import Session
 
 
-def _get_failed_response_mock(payload: dict, status_code: int):
+def _get_failed_response_mock(payload: dict, status_code: int, headers: Optional[dict] = None):
     return mock.create_autospec(
         Response,
         instance=True,
         ok=False,
         status_code=status_code,
+        headers=headers or {},
         json=mock.Mock(return_value=payload),
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    with mock.patch("codemagic.apple.app_store_connect.api_session.time.sleep") as mock_time_sleep:
+        yield mock_time_sleep
+
+
 @pytest.fixture
 def mock_unauthorized_response():
     unauthorized_payload = {
@@ -74,7 +85,7 @@ def mock_not_found_response():
 
 @pytest.fixture
 def mock_successful_response():
-    return mock.create_autospec(Response, instance=True, ok=True, status_code=200)
+    return mock.create_autospec(Response, instance=True, ok=True, status_code=200, headers={})
 
 
 @mock.patch.object(Session, "request")
@@ -92,7 +103,7 @@ def test_unauthorized_retrying_success(mock_session, mock_successful_response, m
 
     # Check that only first call does not require JWT refresh
     assert mock_auth_headers_factory.mock_calls == [(), (), ()]
-    assert mock_revoke_auth_info.mock_calls == [(), ()]
+    assert mock_revoke_auth_info.mock_calls == [mock.call({}), mock.call({})]
     mock_unauthorized_response.assert_not_called()
     mock_successful_response.assert_has_calls([("json", (), {})])
 
@@ -143,7 +154,7 @@ def test_unauthorized_retrying_failure(mock_session, mock_unauthorized_response)
 
     # Check that only first call does not require JWT refresh
     assert mock_auth_headers_factory.mock_calls == [(), (), ()]
-    assert mock_revoke_auth_info.mock_calls == [(), (), ()]
+    assert mock_revoke_auth_info.mock_calls == [mock.call({}), mock.call({}), mock.call({})]
 
     # Finally when retries are exhausted the unauthorized error is still thrown
     assert error_info.value.response is mock_unauthorized_response
@@ -205,3 +216,275 @@ def test_http_error_not_found(mock_session, mock_successful_response, mock_not_f
 
     # Original error is raised
     assert error_info.value.response is mock_not_found_response
+
+
+def test_connection_pool_size():
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}), max_concurrent_requests=16)
+    adapter = session.get_adapter("https://api.appstoreconnect.apple.com/v1/apps")
+    assert adapter._pool_maxsize == 16
+
+
+@mock.patch.object(Session, "request")
+def test_map(mock_session, mock_successful_response):
+    mock_session.return_value = mock_successful_response
+    mock_auth_headers_factory = mock.Mock(return_value={"Authorization": "Bearer token"})
+    session = AppStoreConnectApiSession(mock_auth_headers_factory, max_concurrent_requests=4)
+
+    urls = [f"https://example.com/{i}" for i in range(10)]
+    responses = session.map(session.get, urls)
+
+    assert responses == [mock_successful_response for _ in urls]
+    assert mock_session.call_count == len(urls)
+    assert mock_auth_headers_factory.call_count == len(urls)
+    requested_urls = {call_args.args[1] for call_args in mock_session.call_args_list}
+    assert requested_urls == set(urls)
+
+
+def test_map_max_workers_over_default_limit():
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}), max_concurrent_requests=2)
+    in_flight_barrier = threading.Barrier(6, timeout=5)
+
+    # All the calls must be in flight at once for the barrier to be passed
+    assert session.map(lambda i: in_flight_barrier.wait() is not None, range(6), max_workers=6) == [True] * 6
+    adapter = session.get_adapter("https://api.appstoreconnect.apple.com/v1/apps")
+    assert adapter._pool_maxsize == 6
+
+
+def test_growing_connection_pool_closes_replaced_adapter():
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}), max_concurrent_requests=2)
+    replaced_adapter = session.get_adapter("https://api.appstoreconnect.apple.com/v1/apps")
+
+    with mock.patch.object(replaced_adapter, "close") as mock_close:
+        session._ensure_connection_pool_size(6)
+
+    mock_close.assert_called_once_with()
+    adapter = session.get_adapter("https://api.appstoreconnect.apple.com/v1/apps")
+    assert adapter is not replaced_adapter
+    assert adapter._pool_maxsize == 6
+
+
+def test_map_preserves_order():
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}))
+    assert session.map(lambda i: i * 2, range(20), max_workers=5) == [i * 2 for i in range(20)]
+
+
+@mock.patch.object(Session, "request")
+def test_map_error(mock_session, mock_successful_response, mock_not_found_response):
+    mock_session.side_effect = lambda _method, url, **_kwargs: (
+        mock_not_found_response if url.endswith("/1") else mock_successful_response
+    )
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}))
+
+    with pytest.raises(AppStoreConnectApiError) as error_info:
+        session.map(session.get, [f"https://example.com/{i}" for i in range(3)])
+
+    assert error_info.value.response is mock_not_found_response
+    assert mock_session.call_count == 3
+
+
+@pytest.fixture
+def mock_rate_limit_response():
+    rate_limit_payload = {
+        "errors": [
+            {
+                "status": "429",
+                "code": "RATE_LIMIT_EXCEEDED",
+                "title": "The request rate limit has been reached.",
+                "detail": "We've received too many requests for this API. Please wait and try again or slow down.",
+            },
+        ],
+    }
+    return _get_failed_response_mock(rate_limit_payload, 429, headers={"Retry-After": "5"})
+
+
+@mock.patch.object(Session, "request")
+def test_rate_limit_retrying_success(mock_session, mock_sleep, mock_successful_response, mock_rate_limit_response):
+    mock_session.side_effect = (mock_rate_limit_response, mock_rate_limit_response, mock_successful_response)
+
+    mock_revoke_auth_info = mock.Mock()
+    session = AppStoreConnectApiSession(
+        mock.Mock(return_value={}),
+        rate_limit_retries=3,
+        revoke_auth_info=mock_revoke_auth_info,
+    )
+    final_response = session.get("https://example.com")
+
+    # Wait as long as the server asked before trying again
+    assert mock_sleep.mock_calls == [mock.call(5.0), mock.call(5.0)]
+    assert mock_revoke_auth_info.mock_calls == []
+    assert final_response is mock_successful_response
+
+
+@mock.patch.object(Session, "request")
+def test_rate_limit_retrying_failure(mock_session, mock_rate_limit_response):
+    retries_count = 2
+    mock_session.side_effect = [mock_rate_limit_response for _ in range(retries_count + 1)]
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}), rate_limit_retries=retries_count)
+
+    with pytest.raises(AppStoreConnectApiError) as error_info:
+        session.get("https://example.com")
+
+    assert mock_session.call_count == retries_count
+    assert error_info.value.response is mock_rate_limit_response
+
+
+@mock.patch.object(Session, "request")
+def test_server_error_retrying_backoff(mock_session, mock_sleep, mock_server_error_response):
+    retries_count = 5
+    mock_session.side_effect = [mock_server_error_response for _ in range(retries_count)]
+    session = AppStoreConnectApiSession(
+        mock.Mock(return_value={}),
+        server_error_retries=retries_count,
+        retry_backoff_seconds=2,
+        max_retry_wait_seconds=10,
+    )
+
+    with pytest.raises(AppStoreConnectApiError):
+        session.get("https://example.com")
+
+    wait_times = [call_args.args[0] for call_args in mock_sleep.call_args_list]
+    upper_bounds = [2, 4, 8, 10]
+    assert len(wait_times) == len(upper_bounds)
+    assert all(0 <= wait_time <= upper_bound for wait_time, upper_bound in zip(wait_times, upper_bounds))
+
+
+@mock.patch.object(Session, "request")
+def test_rate_limit_header_throttles_requests(mock_session, mock_sleep):
+    response = mock.create_autospec(
+        Response,
+        instance=True,
+        ok=True,
+        status_code=200,
+        headers={"X-Rate-Limit": "user-hour-lim:3600;user-hour-rem:1;"},
+    )
+    mock_session.return_value = response
+    session = AppStoreConnectApiSession(mock.Mock(return_value={}))
+
+    session.get("https://example.com")
+    session.get("https://example.com")
+    mock_sleep.assert_not_called()
+
+    # Bucket is empty after the second request, so the third request has to wait for a refill
+    session.get("https://example.com")
+    mock_sleep.assert_called_once()
+    assert 0 < mock_sleep.call_args.args[0] <= 1
+
+
+@pytest.fixture
+def response_cache_session(tmp_path):
+    response_cache = ApiResponseCache("issuer/key", cache_directory=tmp_path)
+    return AppStoreConnectApiSession(mock.Mock(return_value={}), response_cache=response_cache)
+
+
+def _get_cacheable_response(status_code: int, content: bytes, headers: dict) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    response.headers.update(headers)
+    response._content = content
+    return response
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_conditional_request(mock_session, response_cache_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.side_effect = (
+        _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {"ETag": '"v1"'}),
+        _get_cacheable_response(304, b"", {"ETag": '"v1"'}),
+    )
+
+    first_response = response_cache_session.get(url, params={"limit": 100})
+    second_response = response_cache_session.get(url, params={"limit": 100})
+
+    assert first_response.json() == second_response.json() == {"data": [{"id": "1"}]}
+    assert "If-None-Match" not in mock_session.call_args_list[0].kwargs["headers"]
+    assert mock_session.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_without_validators(mock_session, response_cache_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    first_response = response_cache_session.get(url)
+    second_response = response_cache_session.get(url)
+
+    assert first_response.json() == second_response.json()
+    assert mock_session.call_count == 1
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_invalidated_by_write(mock_session, response_cache_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    response_cache_session.get(url)
+    response_cache_session.post(url, json={"data": {}})
+    response_cache_session.get(url)
+
+    assert [call_args.args[0] for call_args in mock_session.call_args_list] == ["GET", "POST", "GET"]
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_skips_volatile_resources(mock_session, response_cache_session):
+    url = "https://api.appstoreconnect.apple.com/v1/builds"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    response_cache_session.get(url)
+    response_cache_session.get(url)
+
+    assert mock_session.call_count == 2
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_fresh_responses(mock_session, response_cache_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    response_cache_session.get(url)
+    with response_cache_session.fresh_responses():
+        response_cache_session.get(url)
+    response_cache_session.get(url)
+
+    assert mock_session.call_count == 2
+
+
+@mock.patch.object(Session, "request")
+def test_response_cache_does_not_stream_cached_responses(mock_session, response_cache_session):
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    response_cache_session.get("https://api.appstoreconnect.apple.com/v1/devices", stream=True)
+    response_cache_session.get("https://api.appstoreconnect.apple.com/v1/builds", stream=True)
+
+    assert [call_args.kwargs.get("stream") for call_args in mock_session.call_args_list] == [None, True]
+
+
+@pytest.fixture
+def memoizing_session():
+    return AppStoreConnectApiSession(mock.Mock(return_value={}), request_memo=ApiRequestMemo())
+
+
+@mock.patch.object(Session, "request")
+def test_request_memo(mock_session, memoizing_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    memoizing_session.get(url)
+    memoizing_session.get(url)
+    with memoizing_session.fresh_responses():
+        memoizing_session.get(url)
+    memoizing_session.patch(f"{url}/1", json={"data": {}})
+    memoizing_session.get(url)
+
+    assert [call_args.args[0] for call_args in mock_session.call_args_list] == ["GET", "GET", "PATCH", "GET"]
+
+
+@mock.patch.object(Session, "request")
+def test_request_memo_skips_streamed_responses(mock_session, memoizing_session):
+    url = "https://api.appstoreconnect.apple.com/v1/devices"
+    mock_session.return_value = _get_cacheable_response(200, b'{"data": [{"id": "1"}]}', {})
+
+    memoizing_session.get(url, stream=True)
+    memoizing_session.get(url, stream=True)
+
+    assert mock_session.call_count == 2
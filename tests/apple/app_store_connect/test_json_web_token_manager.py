@@ -135,7 +135,9 @@ def test_cache_expired(mock_datetime, mock_jwt, api_key, sample_jwt):
 
     mock_cache_path.read_text.assert_called()  # Cached token is read
     mock_cache_path.unlink.assert_called()  # Cache is revoked because of invalid token
-    mock_cache_path.write_text.assert_called()  # New token must be cached
+    mock_cache_path.write_text.assert_not_called()  # Token is not written to cache in place
+    mock_cache_path.with_name.return_value.write_text.assert_called_with("<token>")  # New token must be cached
+    mock_cache_path.with_name.return_value.replace.assert_called_with(mock_cache_path)
 
     assert jwt.token == "<token>"
     assert jwt.expires_at == expected_expires_at
@@ -153,7 +155,8 @@ def test_cache_not_found(mock_datetime, mock_jwt, api_key, sample_jwt):
         jwt = JsonWebTokenManager(api_key, token_duration=60 * 10, enable_cache=True).get_jwt()
 
     mock_cache_path.read_text.assert_called()  # There should be an attempt to read from cache
-    mock_cache_path.write_text.assert_called()  # New token should be written to cache
+    mock_cache_path.with_name.return_value.write_text.assert_called_with(sample_jwt.token)  # New token is cached
+    mock_cache_path.with_name.return_value.replace.assert_called_with(mock_cache_path)
 
     # Check that cached token is decoded and nothing is encoded
     mock_jwt.encode.assert_called()
@@ -191,7 +194,9 @@ def test_token_expiration(mock_datetime, mock_jwt, api_key, sample_jwt):
 
     mock_cache_path.read_text.assert_called()  # Cached token is read
     mock_cache_path.unlink.assert_not_called()  # Nothing to revoke since cache does not exist
-    mock_cache_path.write_text.assert_called()  # New token must be cached
+    mock_cache_path.write_text.assert_not_called()  # Token is not written to cache in place
+    mock_cache_path.with_name.return_value.write_text.assert_called_with("<token>")  # New token must be cached
+    mock_cache_path.with_name.return_value.replace.assert_called_with(mock_cache_path)
 
     assert jwt.token == "<token>"
     assert jwt.expires_at == expected_expires_at
@@ -225,3 +230,59 @@ def test_is_expired(mock_datetime, expected_is_expired, time_difference, api_key
     expires_at = now + time_difference
     jwt_manager = JsonWebTokenManager(api_key, enable_cache=True)
     assert jwt_manager._is_expired(expires_at) is expected_is_expired
+
+
+@pytest.fixture
+def mock_cache_directory(tmp_path: pathlib.Path):
+    with mock.patch.object(JsonWebTokenManager, "_cache_directory", new_callable=PropertyMock(return_value=tmp_path)):
+        yield tmp_path
+
+
+def test_write_disk_cache(api_key, mock_cache_directory):
+    jwt_manager = JsonWebTokenManager(api_key, enable_cache=True)
+    jwt_manager._write_disk_cache("<token>")
+    jwt_manager._write_disk_cache("<new-token>")
+
+    assert jwt_manager.cache_path.read_text() == "<new-token>"
+    # Temporary files are not left behind
+    assert [p.name for p in mock_cache_directory.iterdir()] == [api_key.identifier]
+
+
+def test_revoke_by_value(api_key, sample_jwt, mock_cache_directory):
+    jwt_manager = JsonWebTokenManager(api_key, enable_cache=True)
+    jwt_manager._jwt = sample_jwt
+    jwt_manager.cache_path.write_text(sample_jwt.token)
+
+    # Token that was used for failed request was already refreshed
+    jwt_manager.revoke("<outdated-token>")
+    assert jwt_manager._jwt is sample_jwt
+    assert jwt_manager.cache_path.read_text() == sample_jwt.token
+
+    jwt_manager.revoke(sample_jwt.token)
+    assert jwt_manager._jwt is None
+    assert not jwt_manager.cache_path.exists()
+
+
+def test_revoke_without_token(api_key, sample_jwt, mock_cache_directory):
+    jwt_manager = JsonWebTokenManager(api_key, enable_cache=True)
+    jwt_manager._jwt = sample_jwt
+    jwt_manager.cache_path.write_text(sample_jwt.token)
+
+    jwt_manager.revoke()
+
+    assert jwt_manager._jwt is None
+    assert not jwt_manager.cache_path.exists()
+
+
+@mock.patch("codemagic.apple.app_store_connect.json_web_token_manager.jwt")
+@mock.patch("codemagic.apple.app_store_connect.json_web_token_manager.datetime")
+def test_token_refreshed_before_expiration(mock_datetime, mock_jwt, api_key, sample_jwt):
+    mock_datetime.now.return_value = sample_jwt.expires_at - timedelta(seconds=30)
+    mock_jwt.encode.return_value = "<token>"
+
+    jwt_manager = JsonWebTokenManager(api_key, token_refresh_margin=60, enable_cache=False)
+    jwt_manager._jwt = sample_jwt
+    jwt = jwt_manager.get_jwt()
+
+    mock_jwt.encode.assert_called_once()
+    assert jwt.token == "<token>"
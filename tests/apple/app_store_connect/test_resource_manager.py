@@ -1,11 +1,24 @@
 import enum
+import json
+import pathlib
 from dataclasses import dataclass
 from typing import List
 from typing import Optional
 from typing import Union
+from unittest import mock
 
 import pytest
+from codemagic.apple.app_store_connect.builds import Builds
+from codemagic.apple.app_store_connect.provisioning import BundleIds
+from codemagic.apple.app_store_connect.provisioning import Profiles
 from codemagic.apple.app_store_connect.resource_manager import ResourceManager
+from codemagic.apple.resources import Build
+from codemagic.apple.resources import BundleId
+from codemagic.apple.resources import BundleIdPlatform
+from codemagic.apple.resources import Profile
+from codemagic.apple.resources import ResourceType
+
+_RESOURCE_MOCKS_DIRECTORY = pathlib.Path(__file__).parent.parent / "resources" / "mocks"
 
 StubEnum = enum.Enum("StubEnum", {"A": "a", "B": "b"})
 
@@ -43,3 +56,213 @@ class StubFilter(ResourceManager.Filter):
 def test_resource_manager_filter_to_params_conversion(filter_params, expected_query_params):
     test_filter = StubFilter(**filter_params)
     assert test_filter.as_query_params() == expected_query_params
+
+
+@pytest.mark.parametrize(
+    "fields, include, expected_query_params",
+    [
+        ((), (), {}),
+        (("name",), (), {"fields[builds]": "name"}),
+        (("version", "uploadedDate"), (), {"fields[builds]": "version,uploadedDate"}),
+        ((), ("app",), {"include": "app"}),
+        (
+            ("version", "app"),
+            ("app", "preReleaseVersion"),
+            {"fields[builds]": "version,app", "include": "app,preReleaseVersion"},
+        ),
+    ],
+)
+def test_resource_manager_fieldset_params(fields, include, expected_query_params):
+    query_params = ResourceManager._get_fieldset_params(ResourceType.BUILDS, fields=fields, include=include)
+    assert query_params == expected_query_params
+
+
+def test_resource_manager_included_fieldset_params():
+    query_params = ResourceManager._get_fieldset_params(
+        ResourceType.BUILDS,
+        fields=("version", "preReleaseVersion"),
+        include=("preReleaseVersion",),
+        included_fields={ResourceType.PRE_RELEASE_VERSIONS: ("version",)},
+    )
+    assert query_params == {
+        "fields[builds]": "version,preReleaseVersion",
+        "fields[preReleaseVersions]": "version",
+        "include": "preReleaseVersion",
+    }
+
+
+def test_resource_manager_filter_batches_many_values():
+    ids = [f"id-{i}" for i in range(ResourceManager.Filter.MAX_VALUES_PER_REQUEST + 1)]
+    test_filter = StubFilter(field_one="1", maybe_list=ids + ids[:3])
+
+    batches = list(test_filter.iter_query_params())
+
+    assert batches == [
+        {"filter[fieldOne]": "1", "filter[maybeList]": ",".join(ids[:-1])},
+        {"filter[fieldOne]": "1", "filter[maybeList]": ids[-1]},
+    ]
+
+
+def test_resource_manager_filter_single_request():
+    test_filter = StubFilter(field_one="1", maybe_list=[StubEnum.A, StubEnum.B])
+    assert list(test_filter.iter_query_params()) == [test_filter.as_query_params()]
+
+
+@pytest.mark.parametrize(
+    "identifier, platform, strict_match, expected_matches",
+    [
+        ("com.example.app", None, False, {"1", "2", "3"}),
+        ("com.example.app", None, True, {"1", "3"}),
+        ("com.example.app", BundleIdPlatform.IOS, False, {"1", "2"}),
+        ("com.example.app", BundleIdPlatform.IOS, True, {"1"}),
+        ("com.example.app", BundleIdPlatform.MAC_OS, True, {"3"}),
+    ],
+)
+def test_bundle_ids_filter_local_restrictions(identifier, platform, strict_match, expected_matches):
+    bundle_ids = [
+        _get_bundle_id("1", "com.example.app", BundleIdPlatform.IOS),
+        _get_bundle_id("2", "com.example.app.extension", BundleIdPlatform.UNIVERSAL),
+        _get_bundle_id("3", "com.example.app", BundleIdPlatform.MAC_OS),
+    ]
+    bundle_id_filter = BundleIds.Filter(identifier=identifier, platform=platform, identifier_strict_match=strict_match)
+    local_field_names = bundle_id_filter.get_local_field_names()
+
+    matches = {b.id for b in bundle_ids if bundle_id_filter.matches(b, local_field_names)}
+
+    assert matches == expected_matches
+    assert "identifierStrictMatch" not in bundle_id_filter._get_restrictions()
+
+
+@pytest.mark.parametrize(
+    "version, expected_match",
+    [
+        ("67", True),
+        ("68", False),
+    ],
+)
+def test_filter_skips_related_resource_restrictions(version, expected_match):
+    build = Build(json.loads((_RESOURCE_MOCKS_DIRECTORY / "build.json").read_text()))
+    builds_filter = Builds.Filter(app="other-app", pre_release_version_version="1.0.0", version=version)
+    assert builds_filter.matches(build) is expected_match
+
+
+def test_filter_options_are_not_restrictions():
+    assert not BundleIds.Filter(identifier_strict_match=True)
+    assert BundleIds.Filter(identifier_strict_match=True).as_query_params() == {}
+
+
+def _get_bundle_id(resource_id: str, identifier: str, platform: BundleIdPlatform) -> BundleId:
+    return BundleId(
+        {
+            "id": resource_id,
+            "type": "bundleIds",
+            "attributes": {"identifier": identifier, "name": identifier, "platform": platform.value},
+            "links": {"self": f"https://api.appstoreconnect.apple.com/v1/bundleIds/{resource_id}"},
+        },
+    )
+
+
+@pytest.mark.parametrize("reverse", (False, True))
+def test_resource_manager_merges_sorted_batches(reverse):
+    batch_size = ResourceManager.Filter.MAX_VALUES_PER_REQUEST
+    bundle_ids_data = [_get_bundle_id_payload(f"id-{i}") for i in range(batch_size * 2 + 1)]
+    for i, bundle_id_data in enumerate(bundle_ids_data):
+        bundle_id_data["attributes"]["name"] = f"App {i % 7:02d} {i:03d}"
+
+    def iter_paginate(_url, params):
+        assert params["sort"] == ("-name" if reverse else "name")
+        requested_ids = params["filter[id]"].split(",")
+        batch = [data for data in bundle_ids_data if data["id"] in requested_ids]
+        yield from sorted(batch, key=lambda data: data["attributes"]["name"], reverse=reverse)
+
+    client = mock.Mock(API_URL="https://api.appstoreconnect.apple.com/v1")
+    client.iter_paginate.side_effect = iter_paginate
+    bundle_id_filter = BundleIds.Filter(id=[data["id"] for data in bundle_ids_data])
+
+    bundle_ids = list(BundleIds(client).iter_list(bundle_id_filter, reverse=reverse))
+
+    names = [bundle_id.attributes.name for bundle_id in bundle_ids]
+    assert client.iter_paginate.call_count == 3
+    assert names == sorted((data["attributes"]["name"] for data in bundle_ids_data), reverse=reverse)
+
+
+@pytest.mark.parametrize(
+    "sort, expected_reverse",
+    (
+        ("name", False),
+        ("-uploadedDate", True),
+        ("platform,name", False),
+    ),
+)
+def test_resource_manager_sort_key(sort, expected_reverse):
+    sort_key = ResourceManager._get_sort_key(sort)
+    assert sort_key is not None
+    _key, reverse = sort_key
+    assert reverse is expected_reverse
+
+
+@pytest.mark.parametrize("sort", (None, "", "preReleaseVersion.version", "name,-platform"))
+def test_resource_manager_sort_key_not_available(sort):
+    assert ResourceManager._get_sort_key(sort) is None
+
+
+def test_resource_manager_include_limit_params():
+    query_params = Profiles._get_fieldset_params(ResourceType.PROFILES, include=("bundleId", "certificates"))
+    assert query_params == {"include": "bundleId,certificates", "limit[certificates]": "50"}
+
+
+def test_bundle_ids_list_with_included_profiles(app_store_api_client):
+    api_profile = {
+        "id": "id-1",
+        "type": "profiles",
+        "attributes": {
+            "name": "Profile",
+            "platform": "IOS",
+            "uuid": "55b8fdb4-b7d2-402d-b48b-2523f7b9c384",
+            "createdDate": "2019-11-29T13:56:50.220+0000",
+            "profileState": "ACTIVE",
+            "profileType": "IOS_APP_DEVELOPMENT",
+            "expirationDate": "2020-11-28T13:56:50.220+0000",
+            "profileContent": "",
+        },
+        "links": {"self": "https://api.appstoreconnect.apple.com/v1/profiles/id-1"},
+    }
+    truncated_profiles = {"data": [{"type": "profiles", "id": "id-2"}], "meta": {"paging": {"total": 51, "limit": 50}}}
+    response = {
+        "data": [
+            _get_bundle_id_payload("1", profiles={"data": [{"type": "profiles", "id": api_profile["id"]}]}),
+            _get_bundle_id_payload("2", profiles=truncated_profiles),
+        ],
+        "included": [api_profile],
+        "links": {},
+    }
+    with mock.patch.object(app_store_api_client.session, "get") as mock_get:
+        mock_get.return_value.json.return_value = response
+        bundle_ids_filter = BundleIds.Filter(id=["1", "2"])
+        results = list(app_store_api_client.bundle_ids.iter_list_with_include(Profile, bundle_ids_filter))
+
+    mock_get.assert_called_once()
+    assert mock_get.call_args[1]["params"]["filter[id]"] == "1,2"
+    assert mock_get.call_args[1]["params"]["limit[profiles]"] == "50"
+    (bundle_id_1, profiles_1), (bundle_id_2, profiles_2) = results
+    assert bundle_id_1.id == "1"
+    assert [profile.id for profile in profiles_1] == [api_profile["id"]]
+    assert bundle_id_2.id == "2"
+    assert profiles_2 is None
+
+
+def _get_bundle_id_payload(resource_id: str, **relationships) -> dict:
+    return {
+        "id": resource_id,
+        "type": "bundleIds",
+        "attributes": {"identifier": "com.example.app", "name": "App", "platform": "IOS", "seedId": "SEED"},
+        "relationships": {
+            "profiles": {"links": {"self": "https://example.com/self", "related": "https://example.com/related"}},
+            "bundleIdCapabilities": {"links": {"self": "https://example.com/self"}},
+            **{
+                name: {"links": {"self": "https://example.com/self"}, **relationship}
+                for name, relationship in relationships.items()
+            },
+        },
+        "links": {"self": f"https://api.appstoreconnect.apple.com/v1/bundleIds/{resource_id}"},
+    }
@@ -7,3 +7,24 @@ def test_profile_initialization(api_profile):
     profile = Profile(api_profile)
     assert profile.dict() == api_profile
     assert profile.relationships.devices.data[0].id == "8UCFZA68RK"
+
+
+def test_profile_relationships_linked_data(api_profile):
+    profile = Profile(api_profile)
+    assert [data.id for data in profile.relationships.bundleId.get_linked_data()] == ["F88J43FA9J"]
+    assert [data.id for data in profile.relationships.certificates.get_linked_data()] == ["29NU422CRF"]
+
+
+def test_profile_relationships_linked_data_truncated(api_profile):
+    api_profile["relationships"]["certificates"]["meta"]["paging"] = {"total": 60, "limit": 50}
+    profile = Profile(api_profile)
+    assert profile.relationships.certificates.get_linked_data() is None
+
+
+def test_profile_relationships_linked_data_not_included(api_profile):
+    for relationship in api_profile["relationships"].values():
+        relationship.pop("data")
+        relationship.pop("meta", None)
+    profile = Profile(api_profile)
+    assert profile.relationships.bundleId.get_linked_data() is None
+    assert profile.relationships.certificates.get_linked_data() is None
@@ -5,6 +5,8 @@ from datetime import timedelta
 from datetime import timezone
 
 import pytest
+from codemagic.apple.resources import Build
+from codemagic.apple.resources import BuildProcessingState
 from codemagic.apple.resources import Profile
 from codemagic.apple.resources import Resource
 from codemagic.apple.resources.resource import PrettyNameMeta
@@ -32,12 +34,50 @@ def test_to_iso_8601(iso_8601_timestamp, expected_datetime):
             datetime(2021, 1, 28, 6, 1, 32, tzinfo=timezone(timedelta(days=-1, seconds=57600))),
         ),
         ("1970-01-01T00:00:00.000+0000", datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc)),
+        ("2020-08-04T11:44:12.5Z", datetime(2020, 8, 4, 11, 44, 12, 500000, tzinfo=timezone.utc)),
+        (
+            "2021-01-28T06:01:32.123456+05:30",
+            datetime(2021, 1, 28, 6, 1, 32, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ),
     ],
 )
 def test_from_iso_8601(given_datetime, expected_iso_8601_timestamp):
     assert Resource.from_iso_8601(given_datetime) == expected_iso_8601_timestamp
 
 
+def test_resource_lazy_decoding(api_build):
+    build = Build(api_build)
+    assert build._attributes is None
+    assert build._relationships is None
+
+    attributes = build.attributes
+    assert attributes.version == api_build["attributes"]["version"]
+    assert build.attributes is attributes
+    assert build._relationships is None
+
+    assert build.relationships is not None
+    assert build.relationships.app.links.related == api_build["relationships"]["app"]["links"]["related"]
+    assert build.dict() == api_build
+
+
+def test_resource_has_no_instance_dictionary(api_build):
+    build = Build(api_build)
+    assert not hasattr(build, "__dict__")
+    with pytest.raises(AttributeError):
+        build.unknown_attribute = True
+
+
+def test_resource_field_decoders(api_build):
+    decoders = Build.Attributes.get_field_map().decoders
+    assert decoders["processingState"] is BuildProcessingState
+    assert decoders["uploadedDate"] == Resource.from_iso_8601
+    assert "version" not in decoders
+
+    build = Build(api_build)
+    assert build.attributes.processingState is BuildProcessingState(api_build["attributes"]["processingState"])
+    assert build.attributes.uploadedDate == Resource.from_iso_8601(api_build["attributes"]["uploadedDate"])
+
+
 def test_resource_tabular_formatting(api_profile):
     expected_format = (
         "Id: 253YPL8VY6\n"
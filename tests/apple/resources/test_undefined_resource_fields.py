@@ -46,3 +46,25 @@ def test_undefined_relationship(api_mock_resource):
     }
     resource = MockResource(api_mock_resource_with_excess_relationship)
     assert resource.dict() == api_mock_resource
+
+
+def test_omitted_attribute(api_mock_resource):
+    api_mock_resource_with_sparse_fieldset = copy.deepcopy(api_mock_resource)
+    api_mock_resource_with_sparse_fieldset["attributes"].pop("name")
+    resource = MockResource(api_mock_resource_with_sparse_fieldset)
+    assert resource.attributes.name is None
+
+
+def test_omitted_attributes(api_mock_resource):
+    api_mock_resource_without_attributes = copy.deepcopy(api_mock_resource)
+    api_mock_resource_without_attributes.pop("attributes")
+    resource = MockResource(api_mock_resource_without_attributes)
+    assert resource.attributes.name is None
+
+
+def test_omitted_relationship(api_mock_resource):
+    api_mock_resource_with_sparse_fieldset = copy.deepcopy(api_mock_resource)
+    api_mock_resource_with_sparse_fieldset["relationships"].pop("parent")
+    resource = MockResource(api_mock_resource_with_sparse_fieldset)
+    assert resource.relationships is not None
+    assert resource.relationships.parent is None
@@ -0,0 +1,179 @@
+"""
+End-to-end performance benchmarks of `app-store-connect` actions against App Store Connect API emulator.
+
+For every scenario and synthetic account size the number of App Store Connect API requests, wall time
+and peak memory usage of the action are recorded. Run with
+
+    PYTHONPATH=src python -m tests.benchmarks.app_store_connect_benchmark --sizes 10 1000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.resources import ProfileType
+from codemagic.apple.resources import ResourceId
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.utilities import log
+
+from tests.apple.app_store_connect.api_emulator import AppStoreConnectApiEmulator
+from tests.apple.app_store_connect.synthetic_account import SyntheticAccount
+from tests.apple.app_store_connect.synthetic_account import create_synthetic_account
+
+_AUTH_KEY_PATH = pathlib.Path(__file__).parent.parent / "tools" / "app_store_connect" / "mocks" / "AuthKeyMock.p8"
+
+
+class BenchmarkScenario(NamedTuple):
+    name: str
+    run: Callable[[AppStoreConnect, SyntheticAccount], Any]
+
+
+class BenchmarkResult(NamedTuple):
+    scenario: str
+    size: int
+    requests: int
+    wall_time: float
+    peak_memory: int
+
+
+SCENARIOS = (
+    BenchmarkScenario(
+        "fetch-signing-files",
+        lambda app_store_connect, account: app_store_connect.fetch_signing_files(
+            account.bundle_id_identifier,
+            certificate_key=account.certificate_key,
+            profile_type=ProfileType.IOS_APP_DEVELOPMENT,
+        ),
+    ),
+    BenchmarkScenario(
+        "get-latest-build-number",
+        lambda app_store_connect, account: app_store_connect.get_latest_build_number(ResourceId(account.app_id)),
+    ),
+    BenchmarkScenario(
+        "get-latest-app-store-build-number",
+        lambda app_store_connect, account: app_store_connect.get_latest_app_store_build_number(
+            ResourceId(account.app_id),
+        ),
+    ),
+    BenchmarkScenario(
+        "builds list",
+        lambda app_store_connect, account: app_store_connect.list_builds(
+            ResourceId(account.app_id),
+            should_print=False,
+        ),
+    ),
+    BenchmarkScenario(
+        "devices list",
+        lambda app_store_connect, _account: app_store_connect.list_devices(should_print=False),
+    ),
+    BenchmarkScenario(
+        "profiles list",
+        lambda app_store_connect, _account: app_store_connect.list_profiles(should_print=False),
+    ),
+)
+
+
+def _get_app_store_connect(emulator: AppStoreConnectApiEmulator, working_directory: pathlib.Path) -> AppStoreConnect:
+    app_store_connect = AppStoreConnect(
+        key_identifier=KeyIdentifier("BENCHMARK"),
+        issuer_id=IssuerId("benchmark-issuer-id"),
+        private_key=_AUTH_KEY_PATH.read_text(),
+        profiles_directory=working_directory / "profiles",
+        certificates_directory=working_directory / "certificates",
+    )
+    emulator.install(app_store_connect.api_client)
+    return app_store_connect
+
+
+def run_benchmark(
+    scenario: BenchmarkScenario,
+    emulator: AppStoreConnectApiEmulator,
+    account: SyntheticAccount,
+    trace_memory: bool = True,
+) -> BenchmarkResult:
+    """
+    Run the scenario twice with fresh `AppStoreConnect` instances: once to count the requests and
+    measure wall time, and once with memory allocation tracing, which slows down the execution.
+    Peak memory includes the responses that are generated by the emulator. It is reported as zero
+    if memory allocations are not traced.
+    """
+    emulator.reset_requests()
+    with tempfile.TemporaryDirectory() as working_directory:
+        app_store_connect = _get_app_store_connect(emulator, pathlib.Path(working_directory))
+        started_at = time.perf_counter()
+        scenario.run(app_store_connect, account)
+        wall_time = time.perf_counter() - started_at
+    requests_count = emulator.request_count
+    if not trace_memory:
+        return BenchmarkResult(scenario.name, account.size, requests_count, wall_time, 0)
+
+    with tempfile.TemporaryDirectory() as working_directory:
+        app_store_connect = _get_app_store_connect(emulator, pathlib.Path(working_directory))
+        tracemalloc.start()
+        try:
+            scenario.run(app_store_connect, account)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(scenario.name, account.size, requests_count, wall_time, peak_memory)
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    scenarios: Sequence[BenchmarkScenario] = SCENARIOS,
+    latency: float = 0.0,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    results = []
+    for size in sizes:
+        emulator = AppStoreConnectApiEmulator(latency=latency)
+        account = create_synthetic_account(emulator, size)
+        for scenario in scenarios:
+            result = run_benchmark(scenario, emulator, account)
+            if on_result:
+                on_result(result)
+            results.append(result)
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.scenario:<36}{result.size:>8}{result.requests:>10}"
+        f"{result.wall_time:>11.3f}s{result.peak_memory / 1024 / 1024:>12.1f} MB"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark app-store-connect actions against API emulator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 50000], help="Synthetic account sizes")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Scenarios to run. All by default.",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency of emulated requests in seconds")
+    args = parser.parse_args(argv)
+
+    log.initialize_logging(stream=open(os.devnull, "w"), verbose=False, enable_logging=False)
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenarios or scenario.name in args.scenarios]
+    print(f"{'Scenario':<36}{'Size':>8}{'Requests':>10}{'Wall time':>12}{'Peak memory':>15}")
+    run_benchmarks(args.sizes, scenarios, args.latency, on_result=lambda result: print(format_result(result)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from typing import Dict
+from typing import Tuple
+
+import pytest
+
+from tests.apple.app_store_connect.api_emulator import AppStoreConnectApiEmulator
+from tests.apple.app_store_connect.synthetic_account import SyntheticAccount
+from tests.apple.app_store_connect.synthetic_account import create_synthetic_account
+
+from .app_store_connect_benchmark import SCENARIOS
+from .app_store_connect_benchmark import format_result
+from .app_store_connect_benchmark import run_benchmark
+from .app_store_connect_benchmark import run_benchmarks
+
+# Number of App Store Connect API requests made by the scenarios for synthetic accounts of 10 and 1000
+# resources. Update the numbers deliberately when the changes in request patterns are expected.
+EXPECTED_REQUEST_COUNTS = {
+    "fetch-signing-files": (4, 4),
+    "get-latest-build-number": (2, 6),
+    "get-latest-app-store-build-number": (1, 1),
+    "builds list": (1, 10),
+    "devices list": (1, 10),
+    "profiles list": (1, 10),
+}
+
+
+@pytest.fixture(scope="module")
+def synthetic_accounts() -> Dict[int, Tuple[AppStoreConnectApiEmulator, SyntheticAccount]]:
+    accounts = {}
+    for size in (10, 1000):
+        emulator = AppStoreConnectApiEmulator()
+        accounts[size] = (emulator, create_synthetic_account(emulator, size))
+    return accounts
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=[scenario.name for scenario in SCENARIOS])
+def test_request_counts(scenario, synthetic_accounts):
+    request_counts = tuple(
+        run_benchmark(scenario, emulator, account, trace_memory=False).requests
+        for emulator, account in synthetic_accounts.values()
+    )
+    assert request_counts == EXPECTED_REQUEST_COUNTS[scenario.name]
+
+
+@pytest.mark.skipif(
+    "APP_STORE_CONNECT_BENCHMARK_SIZES" not in os.environ,
+    reason="Benchmark sizes are not specified, set APP_STORE_CONNECT_BENCHMARK_SIZES=10,1000,50000",
+)
+def test_benchmark(capsys):
+    sizes = [int(size) for size in os.environ["APP_STORE_CONNECT_BENCHMARK_SIZES"].split(",")]
+    with capsys.disabled():
+        run_benchmarks(sizes, on_result=lambda result: print(format_result(result)))
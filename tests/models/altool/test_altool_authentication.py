@@ -0,0 +1,47 @@
+import os
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.models import Altool
+
+
+def test_api_key_is_shared_between_concurrent_commands(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    altool = Altool(key_identifier=KeyIdentifier("KEYID"), issuer_id=IssuerId("issuer-id"), private_key="private-key")
+    key_path = tmp_path / ".private_keys" / "AuthKey_KEYID.p8"
+    all_authenticated = threading.Barrier(4, timeout=5)
+    first_done = threading.Event()
+
+    def run_command(index: int):
+        with altool._get_authentication_flags() as auth_flags:
+            all_authenticated.wait()
+            if index > 0:
+                # Other commands keep using the key after the first one is completed
+                assert first_done.wait(timeout=5)
+                assert key_path.read_text() == "private-key"
+        if index == 0:
+            first_done.set()
+        return auth_flags
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run_command, range(4)))
+
+    assert results == [("--apiKey", "KEYID", "--apiIssuer", "issuer-id")] * 4
+    assert not key_path.exists()
+    assert Altool._api_key_users == {}
+
+
+def test_password_is_not_exposed_in_process_environment(monkeypatch):
+    monkeypatch.delenv("APP_STORE_CONNECT_PASSWORD", raising=False)
+    altool = Altool(username="user@example.com", password="abcd-abcd-abcd-abcd")
+
+    with altool._get_authentication_flags() as auth_flags:
+        assert "APP_STORE_CONNECT_PASSWORD" not in os.environ
+        command_environment = altool._get_command_environment()
+
+    assert auth_flags == ("--username", "user@example.com", "--password", "@env:APP_STORE_CONNECT_PASSWORD")
+    assert command_environment is not None
+    assert command_environment["APP_STORE_CONNECT_PASSWORD"] == "abcd-abcd-abcd-abcd"
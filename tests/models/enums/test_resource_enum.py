@@ -44,3 +44,10 @@ def test_context_manager(is_graceful_before):
         with pytest.raises(ValueError):
             MockEnum("invalid value")
     assert ResourceEnumMeta.graceful_fallback is is_graceful_before
+
+
+def test_resource_enum_graceful_fallback_is_cached():
+    ResourceEnumMeta.graceful_fallback = True
+    mock_enum = MockEnum("E")
+    assert MockEnum("E") is mock_enum
+    assert MockEnum("F") is not mock_enum
@@ -123,6 +123,13 @@ def test_certificate_does_not_have_key(certificate, encrypted_pem):
     assert certificate.is_signed_with(pk) is False
 
 
+def test_certificate_public_key_fingerprint(certificate, unencrypted_pem, encrypted_pem):
+    matching_pk = PrivateKey.from_pem(unencrypted_pem.content)
+    other_pk = PrivateKey.from_pem(encrypted_pem.content, encrypted_pem.password)
+    assert certificate.get_public_key_fingerprint() == matching_pk.get_public_key_fingerprint()
+    assert certificate.get_public_key_fingerprint() != other_pk.get_public_key_fingerprint()
+
+
 def test_p12_to_certificate(mock_certificate_p12, certificate_pem, private_key_pem):
     p12_bytes = mock_certificate_p12.read_bytes()
 
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import AppStoreConnectApiError
+from codemagic.apple.resources import ResourceId
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.tools.app_store_connect.errors import AppStoreConnectError
+
+
+@pytest.fixture
+def builds():
+    return [mock.Mock(id=ResourceId(f"build-{i}")) for i in range(7)]
+
+
+def _expire_app_builds(app_store_connect: AppStoreConnect, builds, **kwargs):
+    with mock.patch.object(AppStoreConnect, "list_builds", return_value=builds):
+        return app_store_connect.expire_app_builds(ResourceId("app-id"), **kwargs)
+
+
+def test_expire_app_builds_concurrently(app_store_connect_with_mock_client, mock_api_client, builds):
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def modify(build, expired):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        barrier.wait()
+        with lock:
+            in_flight -= 1
+        return mock.Mock(id=build.id, expired=expired)
+
+    mock_api_client.builds.modify.side_effect = modify
+    expired_builds = _expire_app_builds(
+        app_store_connect_with_mock_client,
+        builds,
+        excluded_build_id=ResourceId("build-6"),
+        max_concurrent_requests=3,
+    )
+
+    assert [build.id for build in expired_builds] == [f"build-{i}" for i in range(6)]
+    assert max_in_flight == 3
+
+
+def test_expire_app_builds_partial_failure(app_store_connect_with_mock_client, mock_api_client, builds):
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=409, json=lambda: {"errors": []}))
+
+    def modify(build, expired):
+        if build.id in ("build-1", "build-4"):
+            raise api_error
+        return build
+
+    mock_api_client.builds.modify.side_effect = modify
+    with pytest.raises(AppStoreConnectError) as error_info:
+        _expire_app_builds(app_store_connect_with_mock_client, builds)
+
+    assert mock_api_client.builds.modify.call_count == len(builds)
+    error_lines = str(error_info.value).splitlines()
+    assert len(error_lines) == 2
+    assert error_lines[0].startswith("Failed to expire Build build-1. ")
+    assert error_lines[1].startswith("Failed to expire Build build-4. ")
+
+
+def test_expire_app_builds_dry_run(app_store_connect_with_mock_client, mock_api_client, builds):
+    expired_builds = _expire_app_builds(app_store_connect_with_mock_client, builds, dry_run=True)
+
+    assert expired_builds == []
+    mock_api_client.builds.modify.assert_not_called()
+
+
+def test_cancel_review_submissions(app_store_connect_with_mock_client, mock_api_client):
+    submissions = [mock.Mock(id=ResourceId(f"submission-{i}")) for i in range(3)]
+    mock_api_client.review_submissions.modify.side_effect = lambda submission, canceled: submission
+
+    with mock.patch.object(AppStoreConnect, "list_review_submissions", return_value=submissions):
+        canceled_submissions = app_store_connect_with_mock_client.cancel_review_submissions(ResourceId("app-id"))
+
+    assert canceled_submissions == submissions
+    mock_api_client.review_submissions.modify.assert_has_calls(
+        [mock.call(submission, canceled=True) for submission in submissions],
+        any_order=True,
+    )
@@ -0,0 +1,47 @@
+import base64
+import json
+import pathlib
+
+import pytest
+from codemagic.apple.resources import SigningCertificate
+from codemagic.models import PrivateKey
+from codemagic.tools import AppStoreConnect
+
+
+@pytest.fixture
+def signing_certificates(certificate_asn1):
+    mock_path = pathlib.Path(__file__).parents[3] / "apple" / "resources" / "mocks" / "certificate.json"
+    api_certificate = json.loads(mock_path.read_text())
+    api_certificate["attributes"]["certificateContent"] = base64.b64encode(certificate_asn1).decode()
+    return [SigningCertificate({**api_certificate, "id": f"certificate-{i}"}) for i in range(20)]
+
+
+@pytest.mark.parametrize("certificates_count", (1, 20))
+def test_filter_certificates_by_private_key(
+    certificates_count,
+    signing_certificates,
+    unencrypted_pem,
+    app_store_connect_with_mock_client: AppStoreConnect,
+):
+    certificates = signing_certificates[:certificates_count]
+    private_key = PrivateKey.from_pem(unencrypted_pem.content)
+
+    matching_certificates = app_store_connect_with_mock_client._filter_certificates_by_private_key(
+        certificates,
+        private_key,
+    )
+
+    assert matching_certificates == certificates
+    parsed_certificate = app_store_connect_with_mock_client._get_certificate(certificates[0])
+    assert app_store_connect_with_mock_client._get_certificate(certificates[0]) is parsed_certificate
+
+
+def test_filter_certificates_by_private_key_no_match(
+    signing_certificates,
+    encrypted_pem,
+    app_store_connect_with_mock_client,
+):
+    private_key = PrivateKey.from_pem(encrypted_pem.content, encrypted_pem.password)
+    assert (
+        app_store_connect_with_mock_client._filter_certificates_by_private_key(signing_certificates, private_key) == []
+    )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import AppStoreConnectApiError
+from codemagic.apple.resources import BundleIdPlatform
+from codemagic.apple.resources import ResourceId
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.tools.app_store_connect.errors import AppStoreConnectError
+
+
+def _get_device(udid: str) -> mock.Mock:
+    return mock.Mock(id=ResourceId(f"device-{udid}"), attributes=mock.Mock(udid=udid))
+
+
+def _register_devices(app_store_connect: AppStoreConnect, device_udids, **kwargs):
+    return app_store_connect.register_device(
+        BundleIdPlatform.IOS,
+        "Test device",
+        device_udids=device_udids,
+        batch_registration=True,
+        should_print=False,
+        **kwargs,
+    )
+
+
+def test_register_devices_in_batch(app_store_connect_with_mock_client, mock_api_client):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def create(name, platform, udid):
+        barrier.wait()
+        return _get_device(udid)
+
+    mock_api_client.devices.list.return_value = [_get_device("AAAA"), _get_device("cccc")]
+    mock_api_client.devices.create.side_effect = create
+
+    devices = _register_devices(app_store_connect_with_mock_client, ["aaaa", "BBBB", "CCCC", "DDDD", "BBBB"])
+
+    assert [device.attributes.udid for device in devices] == ["BBBB", "DDDD", "AAAA", "cccc"]
+    mock_api_client.devices.list.assert_called_once_with()
+    mock_api_client.devices.create.assert_has_calls(
+        [
+            mock.call(name="Test device", platform=BundleIdPlatform.IOS, udid="BBBB"),
+            mock.call(name="Test device", platform=BundleIdPlatform.IOS, udid="DDDD"),
+        ],
+        any_order=True,
+    )
+    assert mock_api_client.devices.create.call_count == 2
+
+
+def test_register_devices_in_batch_report(app_store_connect_with_mock_client, mock_api_client):
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=409, json=lambda: {"errors": []}))
+
+    def create(name, platform, udid):
+        if udid == "invalid":
+            raise api_error
+        return _get_device(udid)
+
+    mock_api_client.devices.list.return_value = [_get_device("existing")]
+    mock_api_client.devices.create.side_effect = create
+
+    report = app_store_connect_with_mock_client._register_devices_in_batch(
+        BundleIdPlatform.IOS,
+        "Test device",
+        ["existing", "invalid", "new"],
+        max_concurrent_requests=2,
+    )
+
+    assert [device.attributes.udid for device in report.created] == ["new"]
+    assert [device.attributes.udid for device in report.existing] == ["existing"]
+    assert [failure.udid for failure in report.failed] == ["invalid"]
+    assert report.failed[0].error is api_error.error_response
+
+
+def test_register_devices_in_batch_failure(app_store_connect_with_mock_client, mock_api_client):
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=409, json=lambda: {"errors": []}))
+    mock_api_client.devices.list.return_value = []
+    mock_api_client.devices.create.side_effect = api_error
+
+    with pytest.raises(AppStoreConnectError) as error_info:
+        _register_devices(app_store_connect_with_mock_client, ["first", "second"])
+    assert str(error_info.value).splitlines() == [
+        "Failed to register device first: ",
+        "Failed to register device second: ",
+    ]
+
+    devices = _register_devices(
+        app_store_connect_with_mock_client,
+        ["first", "second"],
+        ignore_registration_errors=True,
+    )
+    assert devices == []
+
+
+@pytest.mark.parametrize(
+    ("discard_listed_resources", "expected_device_udids"),
+    (
+        (False, ["AAAA", "BBBB"]),
+        (True, []),
+    ),
+)
+def test_list_devices_discards_printed_devices(
+    app_store_connect_with_mock_client,
+    mock_api_client,
+    discard_listed_resources,
+    expected_device_udids,
+):
+    app_store_connect_with_mock_client._discard_listed_resources = discard_listed_resources
+    mock_api_client.devices.iter_list.return_value = iter([_get_device("AAAA"), _get_device("BBBB")])
+
+    with mock.patch.object(app_store_connect_with_mock_client.printer, "print_resource") as mock_print_resource:
+        devices = app_store_connect_with_mock_client.list_devices()
+
+    assert [device.attributes.udid for device in devices] == expected_device_udids
+    assert mock_print_resource.call_count == 2
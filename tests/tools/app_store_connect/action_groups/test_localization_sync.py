@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect import AppStoreConnectApiError
+from codemagic.apple.resources import Locale
+from codemagic.apple.resources import ResourceId
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.tools.app_store_connect.arguments import AppStoreVersionLocalizationInfo
+from codemagic.tools.app_store_connect.arguments import BetaBuildInfo
+from codemagic.tools.app_store_connect.errors import AppStoreConnectError
+from codemagic.tools.app_store_connect.mixins import LocalizationSyncStatus
+
+
+def _get_localization(locale: Locale, **attributes):
+    return mock.Mock(id=ResourceId(f"localization-{locale.value}"), attributes=mock.Mock(locale=locale, **attributes))
+
+
+def test_sync_localizations(app_store_connect_with_mock_client, mock_api_client):
+    existing_localizations = {
+        Locale.EN_US: _get_localization(Locale.EN_US, description="Description", keywords="old"),
+        Locale.DE_DE: _get_localization(Locale.DE_DE, description="Beschreibung", keywords="neu"),
+    }
+    desired_localizations = {
+        Locale.EN_US: {"description": "Description", "keywords": "new"},
+        Locale.DE_DE: {"description": "Beschreibung", "keywords": None},
+        Locale.FR_FR: {"description": "Description", "keywords": "nouveau"},
+    }
+    create, modify = mock.Mock(), mock.Mock()
+
+    results = app_store_connect_with_mock_client._sync_localizations(
+        mock_api_client.session,
+        existing_localizations,
+        desired_localizations,
+        create=create,
+        modify=modify,
+    )
+
+    assert [(result.locale, result.status, result.changed_fields) for result in results] == [
+        (Locale.EN_US, LocalizationSyncStatus.UPDATED, ["keywords"]),
+        (Locale.DE_DE, LocalizationSyncStatus.UNCHANGED, []),
+        (Locale.FR_FR, LocalizationSyncStatus.CREATED, ["description", "keywords"]),
+    ]
+    modify.assert_called_once_with("localization-en-US", keywords="new")
+    create.assert_called_once_with(Locale.FR_FR, description="Description", keywords="nouveau")
+
+
+def test_sync_localizations_failure(app_store_connect_with_mock_client, mock_api_client):
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=409, json=lambda: {"errors": []}))
+
+    results = app_store_connect_with_mock_client._sync_localizations(
+        mock_api_client.session,
+        {},
+        {Locale.EN_US: {"whats_new": "Fixes"}},
+        create=mock.Mock(side_effect=api_error),
+        modify=mock.Mock(),
+    )
+
+    assert [(result.status, result.error) for result in results] == [(LocalizationSyncStatus.FAILED, api_error)]
+
+
+def test_add_beta_test_info(app_store_connect_with_mock_client, mock_api_client):
+    mock_api_client.beta_build_localizations.list.return_value = [
+        _get_localization(Locale.EN_US, whatsNew="Bug fixes"),
+        _get_localization(Locale.DE_DE, whatsNew="Alt"),
+    ]
+    beta_build_localizations = [
+        BetaBuildInfo(whats_new="Bug fixes", locale=Locale.EN_US),
+        BetaBuildInfo(whats_new="Neu", locale=Locale.DE_DE),
+        BetaBuildInfo(whats_new="Nouveau", locale=Locale.FR_FR),
+    ]
+
+    app_store_connect_with_mock_client.add_beta_test_info(
+        ResourceId("build-id"),
+        beta_build_localizations=beta_build_localizations,
+    )
+
+    mock_api_client.beta_build_localizations.list.assert_called_once()
+    mock_api_client.builds.read_app.assert_not_called()
+    mock_api_client.beta_build_localizations.modify.assert_called_once_with("localization-de-DE", whats_new="Neu")
+    mock_api_client.beta_build_localizations.create.assert_called_once_with(
+        "build-id",
+        Locale.FR_FR,
+        whats_new="Nouveau",
+    )
+
+
+def test_add_beta_test_info_failure(app_store_connect_with_mock_client, mock_api_client):
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=409, json=lambda: {"errors": []}))
+    mock_api_client.beta_build_localizations.list.return_value = []
+    mock_api_client.beta_build_localizations.create.side_effect = api_error
+    mock_api_client.builds.read_app.return_value = mock.Mock(attributes=mock.Mock(primaryLocale=Locale.EN_GB))
+
+    with pytest.raises(AppStoreConnectError) as error_info:
+        app_store_connect_with_mock_client.add_beta_test_info(ResourceId("build-id"), whats_new="Fixes")
+
+    assert str(error_info.value).startswith("Failed to create Beta Build Localization for locale en-GB.")
+    mock_api_client.beta_build_localizations.create.assert_called_once_with("build-id", Locale.EN_GB, whats_new="Fixes")
+
+
+def test_create_or_update_app_store_version_localizations(app_store_connect_with_mock_client, mock_api_client):
+    app = mock.Mock(attributes=mock.Mock(primaryLocale=Locale.EN_US))
+    app_store_version = mock.Mock(id=ResourceId("version-id"))
+    mock_api_client.app_store_versions.list_app_store_version_localizations.return_value = [
+        _get_localization(Locale.EN_US, description="Description", whatsNew="Old"),
+    ]
+    localization_infos = [
+        AppStoreVersionLocalizationInfo(description="Description", whats_new="New"),
+        AppStoreVersionLocalizationInfo(description="Beschreibung", locale=Locale.DE_DE),
+    ]
+
+    with mock.patch.object(AppStoreConnect, "_is_first_app_store_version", return_value=False):
+        app_store_connect_with_mock_client._create_or_update_app_store_version_localizations(
+            app,
+            app_store_version,
+            localization_infos,
+        )
+
+    mock_api_client.app_store_version_localizations.modify.assert_called_once_with(
+        "localization-en-US",
+        whats_new="New",
+    )
+    mock_api_client.app_store_version_localizations.create.assert_called_once_with(
+        app_store_version,
+        Locale.DE_DE,
+        description="Beschreibung",
+    )
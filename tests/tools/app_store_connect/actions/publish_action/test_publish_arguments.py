@@ -6,6 +6,7 @@ import pathlib
 from unittest import mock
 
 import pytest
+from codemagic.apple.app_store_connect.builds import Builds
 from codemagic.apple.resources import Locale
 from codemagic.apple.resources import Platform
 from codemagic.apple.resources import ReleaseType
@@ -128,12 +129,12 @@ def test_publish_action_testflight_with_localization(publishing_namespace_kwargs
         AppStoreConnect,
         "_get_uploaded_build_application",
     ) as mock_get_app, mock.patch.object(
-        AppStoreConnect,
-        "_get_uploaded_build",
-    ) as mock_get_build, mock.patch.object(
-        AppStoreConnect,
-        "wait_until_build_is_processed",
-    ) as mock_wait_until_build_is_processed, mock.patch.object(
+        Builds,
+        "list",
+    ) as mock_list_builds, mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+    ) as mock_list_builds_with_include, mock.patch.object(
         AppStoreConnect,
         "submit_to_testflight",
     ) as mock_submit_to_testflight, mock.patch.object(
@@ -148,7 +149,8 @@ def test_publish_action_testflight_with_localization(publishing_namespace_kwargs
         mock_get_packages.return_value = [mock.create_autospec(Ipa, instance=True, path=ipa_path)]
         build = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
         mock_get_app.return_value = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
-        mock_get_build.return_value = build
+        mock_list_builds.return_value = [build]
+        mock_list_builds_with_include.return_value = [(build, mock.Mock())]
         locale = Locale("en-GB")
 
         whats_new = Types.WhatsNewArgument("What's new")
@@ -163,7 +165,7 @@ def test_publish_action_testflight_with_localization(publishing_namespace_kwargs
         mock_get_packages.assert_called_with(patterns)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
-        mock_wait_until_build_is_processed.assert_called_with(build, Types.MaxBuildProcessingWait.default_value)
+        assert mock_list_builds_with_include.call_args[0][1].id == [build.id]
         mock_submit_to_testflight.assert_called_with(
             build.id,
             expire_build_submitted_for_review=False,
@@ -196,12 +198,12 @@ def test_publish_action_app_store_submit(publishing_namespace_kwargs):
         AppStoreConnect,
         "_get_uploaded_build_application",
     ) as mock_get_app, mock.patch.object(
-        AppStoreConnect,
-        "_get_uploaded_build",
-    ) as mock_get_build, mock.patch.object(
-        AppStoreConnect,
-        "wait_until_build_is_processed",
-    ) as mock_wait_until_build_is_processed, mock.patch.object(
+        Builds,
+        "list",
+    ) as mock_list_builds, mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+    ) as mock_list_builds_with_include, mock.patch.object(
         AppStoreConnect,
         "submit_to_testflight",
     ) as mock_submit_to_testflight, mock.patch.object(
@@ -218,7 +220,8 @@ def test_publish_action_app_store_submit(publishing_namespace_kwargs):
         mock_get_packages.return_value = [mock_ipa]
         build = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
         mock_get_app.return_value = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
-        mock_get_build.return_value = build
+        mock_list_builds.return_value = [build]
+        mock_list_builds_with_include.return_value = [(build, mock.Mock())]
 
         patterns = [pathlib.Path("path.pattern")]
         AppStoreConnect.from_cli_args(cli_args).publish(
@@ -231,7 +234,7 @@ def test_publish_action_app_store_submit(publishing_namespace_kwargs):
         mock_get_packages.assert_called_with(patterns)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
-        mock_wait_until_build_is_processed.assert_called_with(build, 5)
+        assert mock_list_builds_with_include.call_args[0][1].id == [build.id]
         mock_submit_to_testflight.assert_not_called()
         mock_submit_to_app_store.assert_called_with(
             build.id,
@@ -345,18 +348,18 @@ def test_add_build_to_beta_groups(publishing_namespace_kwargs):
         AppStoreConnect,
         "_get_uploaded_build_application",
     ) as mock_get_app, mock.patch.object(
-        AppStoreConnect,
-        "_get_uploaded_build",
-    ) as mock_get_build, mock.patch.object(
+        Builds,
+        "list",
+    ) as mock_list_builds, mock.patch.object(
         AppStoreConnect,
         "submit_to_testflight",
     ) as mock_submit_to_testflight, mock.patch.object(
         AppStoreConnect,
         "submit_to_app_store",
     ) as mock_submit_to_app_store, mock.patch.object(
-        AppStoreConnect,
-        "wait_until_build_is_processed",
-    ) as mock_wait_until_build_is_processed, mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+    ) as mock_list_builds_with_include, mock.patch.object(
         AppStoreConnect,
         "add_build_to_beta_groups",
     ) as mock_add_build_to_beta_groups:
@@ -365,7 +368,8 @@ def test_add_build_to_beta_groups(publishing_namespace_kwargs):
         mock_get_packages.return_value = [mock.create_autospec(Ipa, instance=True, path=ipa_path)]
         build = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
         mock_get_app.return_value = mock.Mock(id="1525e3c9-3015-407a-9ba5-9addd2558224")
-        mock_get_build.return_value = build
+        mock_list_builds.return_value = [build]
+        mock_list_builds_with_include.return_value = [(build, mock.Mock())]
 
         beta_group_names = ["Test group 1", "Test group 2"]
         patterns = [pathlib.Path("path.pattern")]
@@ -378,7 +382,7 @@ def test_add_build_to_beta_groups(publishing_namespace_kwargs):
         mock_get_packages.assert_called_with(patterns)
         mock_validate.assert_not_called()
         mock_upload.assert_called()
-        mock_wait_until_build_is_processed.assert_called_with(build, Types.MaxBuildProcessingWait.default_value)
+        assert mock_list_builds_with_include.call_args[0][1].id == [build.id]
         mock_submit_to_testflight.assert_called_with(
             build.id,
             expire_build_submitted_for_review=False,
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pathlib
+import threading
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.builds import Builds
+from codemagic.apple.resources import BuildProcessingState
+from codemagic.models.application_package import Ipa
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.tools.app_store_connect.actions.publish_action import AddBuildToBetaGroupOptions
+from codemagic.tools.app_store_connect.actions.publish_action import _PublishingPackage
+
+
+@pytest.fixture(autouse=True)
+def mock_builds(mock_api_client) -> Builds:
+    mock_api_client.builds = Builds(mock.MagicMock())
+    return mock_api_client.builds
+
+
+@pytest.fixture(autouse=True)
+def mock_get_app():
+    with mock.patch.object(AppStoreConnect, "_get_uploaded_build_application") as mock_get_uploaded_build_application:
+        yield mock_get_uploaded_build_application
+
+
+def _get_publishing_package(path: str) -> _PublishingPackage:
+    application_package = mock.create_autospec(Ipa, instance=True, path=pathlib.Path(path), version_code=path)
+    application_package.is_for_tvos.return_value = False
+    return _PublishingPackage(
+        application_package,
+        beta_group_options=AddBuildToBetaGroupOptions(beta_group_names=["Testers"]),
+    )
+
+
+def _list_builds(builds_filter, **_kwargs):
+    return [mock.Mock(id=f"build-{builds_filter.version}")]
+
+
+def _list_builds_with_beta_details(_include_type, builds_filter):
+    return [(mock.Mock(id=build_id), mock.Mock()) for build_id in builds_filter.id]
+
+
+def _publish(app_store_connect: AppStoreConnect, publishing_packages, max_concurrent_uploads: int = 3):
+    return app_store_connect._publish_application_packages(
+        publishing_packages,
+        mock.Mock(),
+        enable_package_validation=False,
+        skip_package_upload=False,
+        altool_retries=1,
+        altool_retry_wait=0,
+        max_concurrent_uploads=max_concurrent_uploads,
+        max_find_build_minutes=1,
+        max_processing_minutes=1,
+        retry_wait_seconds=0,
+    )
+
+
+def test_publish_pipeline_isolates_failures(app_store_connect_with_mock_client):
+    publishing_packages = [_get_publishing_package(path) for path in ("a.ipa", "b.ipa", "c.ipa")]
+
+    def publish_application_package(_altool, application_package, *_args):
+        if application_package.path.name == "b.ipa":
+            raise IOError("Upload failed")
+
+    with mock.patch.object(
+        AppStoreConnect,
+        "_publish_application_package",
+        side_effect=publish_application_package,
+    ), mock.patch.object(Builds, "list", side_effect=_list_builds), mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+        side_effect=_list_builds_with_beta_details,
+    ), mock.patch.object(
+        AppStoreConnect,
+        "add_build_to_beta_groups",
+    ) as mock_add_build_to_beta_groups:
+        failed_packages = _publish(app_store_connect_with_mock_client, publishing_packages)
+
+    assert failed_packages == ["b.ipa"]
+    processed_build_ids = {call.args[0] for call in mock_add_build_to_beta_groups.call_args_list}
+    assert processed_build_ids == {"build-a.ipa", "build-c.ipa"}
+
+
+def test_publish_pipeline_post_processes_while_uploading(app_store_connect_with_mock_client):
+    fast_package, slow_package = _get_publishing_package("fast.ipa"), _get_publishing_package("slow.ipa")
+    fast_package_processed = threading.Event()
+
+    def publish_application_package(_altool, application_package, *_args):
+        if application_package.path.name == "slow.ipa" and not fast_package_processed.wait(timeout=5):
+            raise IOError("Fast package was not processed during upload")
+
+    def add_build_to_beta_groups(build_id, **_kwargs):
+        if build_id == "build-fast.ipa":
+            fast_package_processed.set()
+
+    with mock.patch.object(
+        AppStoreConnect,
+        "_publish_application_package",
+        side_effect=publish_application_package,
+    ), mock.patch.object(Builds, "list", side_effect=_list_builds), mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+        side_effect=_list_builds_with_beta_details,
+    ), mock.patch.object(
+        AppStoreConnect,
+        "add_build_to_beta_groups",
+        side_effect=add_build_to_beta_groups,
+    ):
+        failed_packages = _publish(
+            app_store_connect_with_mock_client,
+            [slow_package, fast_package],
+            max_concurrent_uploads=2,
+        )
+
+    assert failed_packages == []
+
+
+def test_publish_pipeline_waits_for_build(app_store_connect_with_mock_client):
+    publishing_package = _get_publishing_package("app.ipa")
+    processing_build = mock.Mock(id="build-id", attributes=mock.Mock(processingState=BuildProcessingState.PROCESSING))
+    build = mock.Mock(id="build-id")
+
+    with mock.patch.object(AppStoreConnect, "_publish_application_package"), mock.patch.object(
+        Builds,
+        "list",
+        side_effect=[[], [], [processing_build]],
+    ) as mock_list_builds, mock.patch.object(
+        Builds,
+        "iter_list_with_include",
+        side_effect=[[(processing_build, None)], [(build, mock.Mock())]],
+    ) as mock_list_builds_with_include, mock.patch.object(
+        AppStoreConnect,
+        "add_build_to_beta_groups",
+    ) as mock_add_build_to_beta_groups:
+        failed_packages = _publish(app_store_connect_with_mock_client, [publishing_package])
+
+    assert failed_packages == []
+    assert mock_list_builds.call_count == 3
+    assert mock_list_builds_with_include.call_count == 2
+    assert publishing_package.build is build
+    mock_add_build_to_beta_groups.assert_called_once_with(build.id, beta_group_names=["Testers"])
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from unittest import mock
+
+from codemagic.apple.app_store_connect import AppStoreConnectApiError
+from codemagic.apple.app_store_connect.api_session import AppStoreConnectApiSession
+from codemagic.apple.app_store_connect.type_declarations import PaginateResult
+from codemagic.apple.resources import ResourceId
+
+
+def _get_resource_data(resource_type: str, resource_id: str, attributes: Dict, **relationships) -> Dict:
+    return {
+        "type": resource_type,
+        "id": resource_id,
+        "attributes": attributes,
+        "relationships": {
+            name: {"data": {"type": related_type, "id": related_id} if related_id else None}
+            for name, (related_type, related_id) in relationships.items()
+        },
+    }
+
+
+def _get_builds_response(builds: List[Tuple]) -> PaginateResult:
+    pre_release_versions = {version: f"prv-{version}" for _, _, version in builds}
+    return PaginateResult(
+        data=[
+            _get_resource_data(
+                "builds",
+                build_id,
+                {"version": build_number},
+                preReleaseVersion=("preReleaseVersions", pre_release_versions[version]),
+            )
+            for build_id, build_number, version in builds
+        ],
+        included=[
+            _get_resource_data("preReleaseVersions", prv_id, {"version": version})
+            for version, prv_id in pre_release_versions.items()
+        ],
+    )
+
+
+def _get_app_store_versions_response(app_store_versions: List[Tuple[str, Optional[str], str]]) -> PaginateResult:
+    return PaginateResult(
+        data=[
+            _get_resource_data(
+                "appStoreVersions",
+                f"asv-{version}",
+                {"versionString": version},
+                build=("builds", build_id),
+            )
+            for version, build_id, _ in app_store_versions
+        ],
+        included=[
+            _get_resource_data("builds", build_id, {"version": build_number})
+            for _, build_id, build_number in app_store_versions
+            if build_id
+        ],
+    )
+
+
+def test_get_latest_testflight_build_number(app_store_connect_with_mock_client, mock_api_client):
+    mock_api_client.builds.list_data_with_included.return_value = _get_builds_response(
+        [
+            ("build-1", "5", "1.0"),
+            ("build-2", "10", "1.0"),
+            ("build-3", "99", "1.9"),
+            ("build-4", "2", "1.10"),
+            ("build-5", "3", "1.10"),
+        ],
+    )
+
+    build_number = app_store_connect_with_mock_client.get_latest_testflight_build_number(
+        ResourceId("app-id"),
+        not_expired=True,
+    )
+
+    assert build_number == "3"
+    mock_api_client.builds.list_data_with_included.assert_called_once()
+    mock_api_client.builds.Filter.assert_called_once_with(
+        app="app-id",
+        expired=False,
+        pre_release_version_version=None,
+        pre_release_version_platform=None,
+    )
+    mock_api_client.pre_release_versions.list_builds_data.assert_not_called()
+
+
+def test_get_latest_app_store_build_number(app_store_connect_with_mock_client, mock_api_client):
+    mock_api_client.apps.list_app_store_versions_data_with_included.return_value = _get_app_store_versions_response(
+        [
+            ("2.0", None, ""),
+            ("1.2", "build-2", "20"),
+            ("1.10", "build-3", "30"),
+            ("1.9", "build-1", "100"),
+        ],
+    )
+
+    build_number = app_store_connect_with_mock_client.get_latest_app_store_build_number(ResourceId("app-id"))
+
+    assert build_number == "30"
+    mock_api_client.app_store_versions.read_build_data.assert_not_called()
+
+
+def test_get_latest_build_number(app_store_connect_with_mock_client, mock_api_client):
+    mock_api_client.apps.list_app_store_versions_data_with_included.return_value = _get_app_store_versions_response(
+        [("1.0", "build-1", "10")],
+    )
+    mock_api_client.builds.list_data_with_included.return_value = _get_builds_response([("build-2", "1", "1.1")])
+
+    assert app_store_connect_with_mock_client.get_latest_build_number(ResourceId("app-id")) == "1"
+
+
+def test_get_latest_app_store_build_number_probing_fallback(app_store_connect_with_mock_client, mock_api_client):
+    mock_api_client.session = AppStoreConnectApiSession(dict, max_concurrent_requests=2)
+    api_error = AppStoreConnectApiError(mock.MagicMock(status_code=400, json=lambda: {"errors": []}))
+    mock_api_client.apps.list_app_store_versions_data_with_included.side_effect = api_error
+    mock_api_client.apps.list_app_store_versions_data.return_value = [
+        {"id": f"asv-{version}", "attributes": {"versionString": version}}
+        for version in ("1.0", "5.0", "4.0", "3.0", "2.0")
+    ]
+    builds = {"asv-3.0": {"id": "build-3", "attributes": {"version": "30"}}}
+    mock_api_client.app_store_versions.read_build_data.side_effect = lambda asv_id, **_: builds.get(asv_id)
+
+    build_number = app_store_connect_with_mock_client.get_latest_app_store_build_number(ResourceId("app-id"))
+
+    assert build_number == "30"
+    probed_versions = {call.args[0] for call in mock_api_client.app_store_versions.read_build_data.call_args_list}
+    assert probed_versions == {"asv-5.0", "asv-4.0", "asv-3.0", "asv-2.0"}
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+from codemagic.apple.resources import Platform
+from codemagic.apple.resources import ResourceId
+from codemagic.tools.app_store_connect import AppStoreConnect
+from codemagic.tools.app_store_connect.arguments import AppStoreVersionInfo
+from codemagic.tools.app_store_connect.arguments import AppStoreVersionLocalizationInfo
+from codemagic.tools.app_store_connect.errors import AppStoreConnectError
+
+
+@pytest.fixture
+def app() -> mock.Mock:
+    return mock.Mock(id=ResourceId("app-id"))
+
+
+def test_submit_to_testflight_checks_test_information_concurrently(
+    app_store_connect_with_mock_client,
+    mock_api_client,
+    app,
+):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def list_beta_app_localizations(_app):
+        barrier.wait()
+        return [mock.Mock(attributes=mock.Mock(locale=app.attributes.primaryLocale, feedbackEmail=None))]
+
+    def read_beta_app_review_detail(_app):
+        barrier.wait()
+        return mock.Mock(attributes=mock.Mock(contactPhone=None))
+
+    mock_api_client.builds.read_with_include.return_value = (mock.Mock(id=ResourceId("build-id")), app)
+    mock_api_client.apps.list_beta_app_localizations.side_effect = list_beta_app_localizations
+    mock_api_client.apps.read_beta_app_review_detail.side_effect = read_beta_app_review_detail
+
+    with pytest.raises(AppStoreConnectError) as error_info:
+        app_store_connect_with_mock_client.submit_to_testflight(
+            ResourceId("build-id"),
+            expire_build_submitted_for_review=True,
+        )
+
+    error_lines = str(error_info.value).splitlines()
+    assert "App is missing required Beta App Information: Feedback Email." in error_lines
+    assert "App is missing required Beta App Review Information: Phone Number." in error_lines
+    mock_api_client.builds.read_pre_release_version.assert_called_once_with(ResourceId("build-id"))
+    mock_api_client.beta_app_review_submissions.create.assert_not_called()
+
+
+def test_submit_to_app_store_prefetches_during_build_processing(
+    app_store_connect_with_mock_client,
+    mock_api_client,
+    app,
+):
+    build = mock.Mock(id=ResourceId("build-id"))
+    app_store_version = mock.Mock(id=ResourceId("version-id"))
+    prefetched = {
+        "pre_release_version": threading.Event(),
+        "editable_app_store_version": threading.Event(),
+        "is_first_app_store_version": threading.Event(),
+    }
+
+    def get_build_pre_release_version(*_args, **_kwargs):
+        prefetched["pre_release_version"].set()
+        return mock.Mock(attributes=mock.Mock(version="1.2.3"))
+
+    def get_editable_app_store_version(*_args):
+        prefetched["editable_app_store_version"].set()
+        return app_store_version
+
+    def is_first_app_store_version(*_args):
+        prefetched["is_first_app_store_version"].set()
+        return True
+
+    def wait_until_build_is_processed(*_args):
+        assert all(event.wait(timeout=5) for event in prefetched.values())
+        return build
+
+    mock_api_client.builds.read_with_include.return_value = (build, app)
+    localization_infos = [AppStoreVersionLocalizationInfo(whats_new="New")]
+
+    with mock.patch.multiple(
+        AppStoreConnect,
+        get_build_pre_release_version=mock.Mock(side_effect=get_build_pre_release_version),
+        _get_editable_app_store_version=mock.Mock(side_effect=get_editable_app_store_version),
+        _is_first_app_store_version=mock.Mock(side_effect=is_first_app_store_version),
+        wait_until_build_is_processed=mock.Mock(side_effect=wait_until_build_is_processed),
+        _update_existing_app_store_version=mock.DEFAULT,
+        _create_or_update_app_store_version_localizations=mock.DEFAULT,
+        _create_review_submission=mock.DEFAULT,
+        create_review_submission_item=mock.DEFAULT,
+        confirm_review_submission=mock.DEFAULT,
+    ) as mocks:
+        app_store_connect_with_mock_client._submit_to_app_store(
+            ResourceId("build-id"),
+            platform=Platform.IOS,
+            max_processing_minutes=10,
+            app_store_version_info=AppStoreVersionInfo(platform=Platform.IOS),
+            app_store_version_localization_infos=localization_infos,
+            cancel_previous_submissions=False,
+            phased_release=None,
+        )
+
+    version_info = AppStoreVersionInfo(platform=Platform.IOS, version_string="1.2.3")
+    mocks["_update_existing_app_store_version"].assert_called_once_with(app_store_version, build, version_info)
+    mocks["_create_or_update_app_store_version_localizations"].assert_called_once_with(
+        app,
+        app_store_version,
+        localization_infos,
+        True,
+    )
+
+
+def test_submit_to_app_store_reads_editable_version_after_cancellation(
+    app_store_connect_with_mock_client,
+    mock_api_client,
+    app,
+):
+    build = mock.Mock(id=ResourceId("build-id"))
+    app_store_version = mock.Mock(id=ResourceId("version-id"))
+    phased_release = mock.Mock(id=ResourceId("phased-release-id"))
+    submissions_cancelled = threading.Event()
+    phased_release_read = threading.Event()
+
+    def get_editable_app_store_version(*_args):
+        assert submissions_cancelled.is_set()
+        return app_store_version
+
+    def read_app_store_version_phased_release(*_args):
+        phased_release_read.set()
+        return phased_release
+
+    def update_existing_app_store_version(*_args):
+        assert phased_release_read.wait(timeout=5)
+
+    mock_api_client.builds.read_with_include.return_value = (build, app)
+    mock_api_client.app_store_versions.read_app_store_version_phased_release.side_effect = (
+        read_app_store_version_phased_release
+    )
+
+    with mock.patch.multiple(
+        AppStoreConnect,
+        _cancel_previous_submissions=mock.Mock(side_effect=lambda **_kwargs: submissions_cancelled.set()),
+        _get_editable_app_store_version=mock.Mock(side_effect=get_editable_app_store_version),
+        _update_existing_app_store_version=mock.Mock(side_effect=update_existing_app_store_version),
+        _create_review_submission=mock.DEFAULT,
+        create_review_submission_item=mock.DEFAULT,
+        confirm_review_submission=mock.DEFAULT,
+    ):
+        app_store_connect_with_mock_client._submit_to_app_store(
+            ResourceId("build-id"),
+            platform=Platform.IOS,
+            max_processing_minutes=0,
+            app_store_version_info=AppStoreVersionInfo(platform=Platform.IOS, version_string="1.2.3"),
+            app_store_version_localization_infos=[],
+            cancel_previous_submissions=True,
+            phased_release=True,
+        )
+
+    mock_api_client.app_store_versions.read_app_store_version_phased_release.assert_called_once_with(app_store_version)
+    mock_api_client.app_store_versions.enable_phased_release.assert_not_called()
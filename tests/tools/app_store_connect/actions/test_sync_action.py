@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from unittest import mock
+
+import pytest
+from codemagic.apple.app_store_connect.api_resource_mirror import ApiResourceMirror
+from codemagic.apple.app_store_connect.provisioning import BundleIds
+from codemagic.apple.app_store_connect.type_declarations import PaginateResult
+from codemagic.apple.resources import BundleId
+from codemagic.apple.resources import ResourceId
+from codemagic.apple.resources import ResourceType
+from codemagic.tools.app_store_connect import AppStoreConnect
+
+
+def _get_bundle_id(resource_id: str, identifier: str) -> dict:
+    mock_path = pathlib.Path(__file__).parent.parent.parent.parent / "apple" / "resources" / "mocks" / "bundle_id.json"
+    bundle_id = json.loads(mock_path.read_text())
+    bundle_id["id"] = resource_id
+    bundle_id["attributes"]["identifier"] = identifier
+    return bundle_id
+
+
+@pytest.fixture
+def api_bundle_ids() -> list:
+    return [_get_bundle_id("first", "io.codemagic.first")]
+
+
+@pytest.fixture
+def mirror_api_client(mock_api_client, api_bundle_ids) -> mock.Mock:
+    def iter_paginate_with_included(url, *_args, **_kwargs):
+        data = api_bundle_ids if url.endswith(ResourceType.BUNDLE_ID.value) else []
+        yield PaginateResult([dict(bundle_id) for bundle_id in data], [])
+
+    mock_api_client.API_URL = "https://api.appstoreconnect.apple.com/v1"
+    mock_api_client.iter_paginate_with_included.side_effect = iter_paginate_with_included
+    mock_api_client.bundle_ids = BundleIds(mock_api_client)
+    return mock_api_client
+
+
+@pytest.fixture
+def mirrored_app_store_connect(mirror_api_client, mock_api_client_property, tmp_path) -> AppStoreConnect:
+    mirrored_app_store_connect = AppStoreConnect(
+        key_identifier=None,
+        issuer_id=None,
+        private_key=None,
+        from_mirror=True,
+        mirror_path=tmp_path / "mirror.sqlite3",
+    )
+    yield mirrored_app_store_connect
+    mirrored_app_store_connect.resource_mirror.close()
+
+
+def test_sync(mirrored_app_store_connect, mirror_api_client):
+    results = mirrored_app_store_connect.sync([ResourceType.BUNDLE_ID])
+
+    assert [(result.resource_type, result.total, result.created) for result in results] == [
+        (ResourceType.BUNDLE_ID, 1, 1),
+        (ResourceType.BUNDLE_ID_CAPABILITIES, 0, 0),
+    ]
+    mirror_api_client.iter_paginate_with_included.assert_called_once()
+
+
+def _sync_in_previous_run(app_store_connect: AppStoreConnect, api_client: mock.Mock):
+    previous_mirror = ApiResourceMirror(app_store_connect._mirror_path)
+    previous_mirror.sync(api_client)
+    previous_mirror.close()
+    api_client.iter_paginate_with_included.reset_mock()
+
+
+def test_list_from_mirror(mirrored_app_store_connect, mirror_api_client, api_bundle_ids):
+    bundle_ids = mirrored_app_store_connect.list_bundle_ids("io.codemagic.first", should_print=False)
+    assert [bundle_id.id for bundle_id in bundle_ids] == ["first"]
+    assert mirror_api_client.iter_paginate_with_included.call_count == 1
+
+    bundle_ids = mirrored_app_store_connect.list_bundle_ids("io.codemagic", should_print=False)
+    assert [bundle_id.id for bundle_id in bundle_ids] == ["first"]
+    assert mirror_api_client.iter_paginate_with_included.call_count == 1
+
+    # Mirror was already refreshed in this run, trust it when matching resources are not found
+    api_bundle_ids.append(_get_bundle_id("second", "io.codemagic.second"))
+    assert mirrored_app_store_connect.list_bundle_ids("io.codemagic.second", should_print=False) == []
+    assert mirror_api_client.iter_paginate_with_included.call_count == 1
+    mirror_api_client.paginate.assert_not_called()
+    mirror_api_client.iter_paginate.assert_not_called()
+
+
+def test_list_from_mirror_synced_in_previous_run(mirrored_app_store_connect, mirror_api_client, api_bundle_ids):
+    _sync_in_previous_run(mirrored_app_store_connect, mirror_api_client)
+    api_bundle_ids.append(_get_bundle_id("second", "io.codemagic.second"))
+
+    # Refresh the mirror once when matching resources were not found
+    bundle_ids = mirrored_app_store_connect.list_bundle_ids("io.codemagic.second", should_print=False)
+    assert [bundle_id.id for bundle_id in bundle_ids] == ["second"]
+    assert mirror_api_client.iter_paginate_with_included.call_count == 1
+
+    assert mirrored_app_store_connect.list_bundle_ids("io.codemagic.third", should_print=False) == []
+    assert mirror_api_client.iter_paginate_with_included.call_count == 1
+    mirror_api_client.paginate.assert_not_called()
+    mirror_api_client.iter_paginate.assert_not_called()
+
+
+def test_get_from_mirror(mirrored_app_store_connect, mirror_api_client, api_bundle_ids):
+    _sync_in_previous_run(mirrored_app_store_connect, mirror_api_client)
+
+    assert mirrored_app_store_connect.get_bundle_id(ResourceId("first"), should_print=False).id == "first"
+    mirror_api_client.iter_paginate_with_included.assert_not_called()
+
+    api_bundle_ids.append(_get_bundle_id("second", "io.codemagic.second"))
+    assert mirrored_app_store_connect.get_bundle_id(ResourceId("second"), should_print=False).id == "second"
+    mirror_api_client.iter_paginate_with_included.assert_called_once()
+
+
+def test_delete_invalidates_mirror(mirrored_app_store_connect):
+    mirrored_app_store_connect.sync()
+    assert mirrored_app_store_connect.resource_mirror.is_fresh(BundleId)
+
+    with mock.patch.object(BundleIds, "delete") as mock_delete:
+        mirrored_app_store_connect.delete_bundle_id(ResourceId("first"))
+
+    mock_delete.assert_called_once_with(ResourceId("first"))
+    assert not mirrored_app_store_connect.resource_mirror.is_fresh(BundleId)
@@ -3,8 +3,11 @@ from __future__ import annotations
 import argparse
 import os
 import pathlib
+from typing import Iterator
+from unittest import mock
 
 import pytest
+from codemagic.apple.app_store_connect.api_session import AppStoreConnectApiSession
 from codemagic.tools.app_store_connect import AppStoreConnect
 from codemagic.tools.app_store_connect.arguments import AppStoreConnectArgument
 from codemagic.tools.app_store_connect.arguments import Types
@@ -31,12 +34,19 @@ def namespace_kwargs(mock_auth_key):
         args.PROFILES_DIRECTORY.key: args.PROFILES_DIRECTORY.get_default(),
         args.LOG_REQUESTS.key: True,
         args.JSON_OUTPUT.key: False,
+        args.JSON_LINES_OUTPUT.key: False,
         args.ISSUER_ID.key: Types.IssuerIdArgument("issuer-id"),
         args.KEY_IDENTIFIER.key: Types.KeyIdentifierArgument("key-identifier"),
         args.PRIVATE_KEY.key: Types.PrivateKeyArgument(mock_auth_key.read_text()),
+        args.ADDITIONAL_KEY_IDENTIFIERS.key: None,
         args.UNAUTHORIZED_REQUEST_RETRIES.key: 1,
         args.SERVER_ERROR_RETRIES.key: 1,
         args.DISABLE_JWT_CACHE.key: True,
+        args.ENABLE_RESPONSE_CACHE.key: False,
+        args.FROM_MIRROR.key: False,
+        args.MIRROR_PATH.key: None,
+        args.MIRROR_MAX_AGE.key: None,
+        args.API_REQUEST_TRACE_PATH.key: None,
     }
     for arg in AppStoreConnect.CLASS_ARGUMENTS:
         if not hasattr(arg.type, "environment_variable_key"):
@@ -67,3 +77,24 @@ def app_store_connect(namespace_kwargs) -> AppStoreConnect:
     }
     cli_args = argparse.Namespace(**ns)
     return AppStoreConnect.from_cli_args(cli_args)
+
+
+@pytest.fixture
+def mock_api_client() -> mock.Mock:
+    return mock.Mock(session=AppStoreConnectApiSession(dict))
+
+
+@pytest.fixture
+def mock_api_client_property(mock_api_client) -> Iterator[mock.PropertyMock]:
+    with mock.patch.object(
+        AppStoreConnect,
+        "api_client",
+        new_callable=mock.PropertyMock,
+        return_value=mock_api_client,
+    ) as api_client_property:
+        yield api_client_property
+
+
+@pytest.fixture
+def app_store_connect_with_mock_client(mock_api_client_property) -> AppStoreConnect:
+    return AppStoreConnect(key_identifier=None, issuer_id=None, private_key=None)
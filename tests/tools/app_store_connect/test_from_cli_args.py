@@ -6,6 +6,10 @@ from tempfile import NamedTemporaryFile
 from unittest import mock
 
 import pytest
+from codemagic.apple.app_store_connect import IssuerId
+from codemagic.apple.app_store_connect import KeyIdentifier
+from codemagic.apple.app_store_connect.api_request_metrics import ApiRequestMetrics
+from codemagic.cli import CliApp
 from codemagic.tools.app_store_connect import AppStoreConnect
 from codemagic.tools.app_store_connect.arguments import AppStoreConnectArgument
 from codemagic.tools.app_store_connect.arguments import Types
@@ -39,6 +43,18 @@ def test_missing_private_key_arg(namespace_kwargs):
     _test_missing_argument(AppStoreConnectArgument.PRIVATE_KEY, namespace_kwargs)
 
 
+def test_missing_private_key_file(namespace_kwargs):
+    namespace_kwargs[AppStoreConnectArgument.KEY_IDENTIFIER.key] = Types.KeyIdentifierArgument("MISSINGKEY")
+    namespace_kwargs[AppStoreConnectArgument.PRIVATE_KEY.key] = None
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    with pytest.raises(argparse.ArgumentError) as exception_info:
+        AppStoreConnect.from_cli_args(cli_args)
+    message = str(exception_info.value)
+    assert "Private key for API key MISSINGKEY was not found. Searched for file AuthKey_MISSINGKEY.p8 in" in message
+    for keys_path in Types.PrivateKeyArgument.PRIVATE_KEY_LOCATIONS:
+        assert str(keys_path) in message
+
+
 @pytest.mark.parametrize(
     "argument, api_client_arg_index",
     [
@@ -165,3 +181,104 @@ def _do_private_key_assertions(private_key_value, mock_appstore_api_client, cli_
     _, _, private_key_arg = mock_appstore_api_client.call_args[0]
     assert isinstance(private_key_arg, str)
     assert private_key_arg == private_key_value
+
+
+@mock.patch("codemagic.tools.app_store_connect.app_store_connect.AppStoreConnectApiClient")
+def test_additional_key_identifiers(mock_appstore_api_client, namespace_kwargs, mock_auth_key, monkeypatch):
+    pk = mock_auth_key.read_text()
+    monkeypatch.setenv(Types.AdditionalKeyIdentifiersArgument.environment_variable_key, "KEY2, KEY3")
+    monkeypatch.setenv(f"{Types.PrivateKeyArgument.environment_variable_key}_KEY2", pk)
+    monkeypatch.setenv(f"{Types.PrivateKeyArgument.environment_variable_key}_KEY3", pk)
+
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    _ = AppStoreConnect.from_cli_args(cli_args).api_client
+
+    additional_api_keys = mock_appstore_api_client.call_args[1]["additional_api_keys"]
+    assert [api_key.identifier for api_key in additional_api_keys] == ["KEY2", "KEY3"]
+    assert {api_key.issuer_id for api_key in additional_api_keys} == {"issuer-id"}
+    assert {api_key.private_key for api_key in additional_api_keys} == {pk}
+
+
+def test_additional_key_identifier_missing_private_key(namespace_kwargs):
+    namespace_kwargs[AppStoreConnectArgument.ADDITIONAL_KEY_IDENTIFIERS.key] = [
+        Types.AdditionalKeyIdentifiersArgument("MISSINGKEY"),
+    ]
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    with pytest.raises(argparse.ArgumentError) as exception_info:
+        AppStoreConnect.from_cli_args(cli_args)
+    keys_paths = ", ".join(map(str, Types.PrivateKeyArgument.PRIVATE_KEY_LOCATIONS))
+    assert str(exception_info.value) == (
+        "argument --additional-key-id: Private key for API key MISSINGKEY was not found. "
+        f"Searched for file AuthKey_MISSINGKEY.p8 in {keys_paths}"
+    )
+
+
+def test_additional_key_identifier_missing_private_key_from_api_client(mock_auth_key):
+    app_store_connect = AppStoreConnect(
+        key_identifier=KeyIdentifier("key-identifier"),
+        issuer_id=IssuerId("issuer-id"),
+        private_key=mock_auth_key.read_text(),
+        additional_key_identifiers=[KeyIdentifier("MISSINGKEY")],
+    )
+    with pytest.raises(argparse.ArgumentError) as exception_info:
+        _ = app_store_connect.api_client
+    assert str(exception_info.value).startswith(
+        "argument --additional-key-id: Private key for API key MISSINGKEY was not found. ",
+    )
+
+
+@mock.patch.object(CliApp, "_invoke_action")
+@mock.patch("codemagic.tools.app_store_connect.app_store_connect.AppStoreConnectApiClient")
+def test_api_request_trace(mock_appstore_api_client, mock_invoke_action, namespace_kwargs, monkeypatch, tmp_path):
+    trace_path = tmp_path / "requests.jsonl"
+    monkeypatch.setenv(Types.ApiRequestTracePath.environment_variable_key, str(trace_path))
+
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    app_store_connect = AppStoreConnect.from_cli_args(cli_args)
+    _ = app_store_connect.api_client
+    app_store_connect._invoke_action(cli_args)
+
+    request_metrics = mock_appstore_api_client.call_args[1]["request_metrics"]
+    assert isinstance(request_metrics, ApiRequestMetrics)
+    assert request_metrics.action == "devices list"
+    mock_invoke_action.assert_called_once_with(cli_args)
+    assert trace_path.is_file()
+
+
+@pytest.mark.parametrize(
+    ("action", "action_subcommand", "expected_memoize_requests"),
+    (
+        ("devices", "list", False),
+        ("builds", "submit-to-app-store", True),
+        ("publish", None, True),
+    ),
+)
+@mock.patch("codemagic.tools.app_store_connect.app_store_connect.AppStoreConnectApiClient")
+def test_memoize_requests(
+    mock_appstore_api_client,
+    action,
+    action_subcommand,
+    expected_memoize_requests,
+    namespace_kwargs,
+):
+    namespace_kwargs.update({"action": action, "action_subcommand": action_subcommand})
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    _ = AppStoreConnect.from_cli_args(cli_args).api_client
+
+    assert mock_appstore_api_client.call_args[1]["memoize_requests"] is expected_memoize_requests
+
+
+@pytest.mark.parametrize(
+    ("action", "action_subcommand", "expected_discard_listed_resources"),
+    (
+        ("devices", "list", True),
+        ("profiles", "list", True),
+        ("fetch-signing-files", None, False),
+    ),
+)
+def test_discard_listed_resources(action, action_subcommand, expected_discard_listed_resources, namespace_kwargs):
+    namespace_kwargs.update({"action": action, "action_subcommand": action_subcommand})
+    cli_args = argparse.Namespace(**namespace_kwargs)
+    app_store_connect = AppStoreConnect.from_cli_args(cli_args)
+
+    assert app_store_connect._discard_listed_resources is expected_discard_listed_resources
@@ -0,0 +1,79 @@
+import json
+import pathlib
+from typing import List
+from unittest import mock
+
+import pytest
+from codemagic.apple.resources import Device
+from codemagic.tools.app_store_connect.resource_printer import ResourcePrinter
+
+
+@pytest.fixture
+def devices() -> List[Device]:
+    mock_path = pathlib.Path(__file__).parent.parent.parent / "apple" / "resources" / "mocks" / "device.json"
+    api_device = json.loads(mock_path.read_text())
+    return [Device({**api_device, "id": f"device-{i}"}) for i in range(3)]
+
+
+@pytest.mark.parametrize("devices_count", (0, 1, 3))
+def test_print_resources_json(devices, devices_count):
+    printed_lines: List[str] = []
+    printer = ResourcePrinter(True, printed_lines.append)
+
+    printer.print_resources(iter(devices[:devices_count]), True)
+
+    expected_output = json.dumps([device.dict() for device in devices[:devices_count]], indent=4)
+    assert "\n".join(printed_lines) == expected_output
+
+
+def test_print_resources_json_is_incremental(devices):
+    print_function = mock.Mock()
+    printer = ResourcePrinter(True, print_function)
+
+    def iter_devices():
+        for i, device in enumerate(devices):
+            # Opening bracket and all but the last received device are already printed
+            assert print_function.call_count == i
+            yield device
+
+    printer.print_resources(iter_devices(), True)
+    assert print_function.call_count == len(devices) + 2
+
+
+def test_print_resources_not_printed(devices):
+    print_function = mock.Mock()
+    printer = ResourcePrinter(True, print_function)
+    printer.print_resources(devices, False)
+    print_function.assert_not_called()
+
+
+@pytest.mark.parametrize("devices_count", (0, 1, 3))
+def test_print_resources_compact_json(devices, devices_count):
+    printed_lines: List[str] = []
+    printer = ResourcePrinter(True, printed_lines.append, pretty_json=False)
+
+    printer.print_resources(iter(devices[:devices_count]), True)
+
+    assert json.loads("\n".join(printed_lines)) == [device.dict() for device in devices[:devices_count]]
+    if devices_count:
+        assert len(printed_lines) == devices_count + 2
+        assert printed_lines[1] == f"{json.dumps(devices[0].dict())}{',' if devices_count > 1 else ''}"
+
+
+def test_print_resources_json_lines(devices):
+    printed_lines: List[str] = []
+    printer = ResourcePrinter(False, printed_lines.append, print_json_lines=True)
+
+    printer.print_resources(iter(devices), True)
+
+    assert printed_lines == [json.dumps(device.dict()) for device in devices]
+
+
+def test_print_resource_json_lines(devices):
+    printed_lines: List[str] = []
+    printer = ResourcePrinter(False, printed_lines.append, print_json_lines=True)
+
+    printer.print_resource(devices[0], True)
+    printer.print_value({"build_number": 1}, True)
+
+    assert printed_lines == [devices[0].json(indent=None), '{"build_number": 1}']